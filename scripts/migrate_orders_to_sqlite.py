@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+数据迁移脚本: 将 JSON 订单存储 (YYYY-MM-DD/*.json + index.json) 导入 SQLite
+
+迁移后设置 ORDER_STORAGE_FORMAT=sqlite 启用 SQLiteOrderStore。
+原 JSON 文件保留不动，脚本可重复执行。
+
+Usage:
+    python scripts/migrate_orders_to_sqlite.py [orders_dir] [db_path]
+
+    orders_dir 默认为 OrderConfig.storage_path (data/trading/orders)
+    db_path    默认为 <orders_dir>/orders.db
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.business.trading.config.order_config import OrderConfig
+from src.business.trading.order.sqlite_store import SQLiteOrderStore
+
+
+def main():
+    config = OrderConfig.load()
+    if len(sys.argv) > 1:
+        config.storage_path = sys.argv[1]
+    db_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    orders_dir = Path(config.storage_path)
+    if not orders_dir.exists():
+        print(f"Orders directory not found: {orders_dir}")
+        sys.exit(1)
+
+    store = SQLiteOrderStore(config, db_path=db_path)
+    try:
+        count = store.import_json(orders_dir)
+    finally:
+        store.close()
+
+    print(f"\n{'='*60}")
+    print("Migration complete:")
+    print(f"  Source:   {orders_dir}")
+    print(f"  Database: {store.db_path}")
+    print(f"  Imported: {count} orders")
+    print(f"{'='*60}")
+    print("Set ORDER_STORAGE_FORMAT=sqlite to use the SQLite order store.")
+
+
+if __name__ == "__main__":
+    main()
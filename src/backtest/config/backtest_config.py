@@ -101,6 +101,8 @@ class BacktestConfig:
 
     # ========== 数据配置 ==========
     data_dir: str = "data/backtest"  # Parquet 数据目录
+    prefetch: bool = False  # 回测开始前一次性预加载整段数据 (逐日循环不再查询 DuckDB)
+    prefetch_max_dte: int | None = None  # 预加载期权的最大 DTE (None 表示全部到期日)
 
     # ========== 价格模式 ==========
     # 决定交易执行和持仓估值使用的价格
@@ -241,6 +243,8 @@ class BacktestConfig:
             "stock_commission_per_share": self.stock_commission_per_share,
             "stock_commission_min_per_order": self.stock_commission_min_per_order,
             "data_dir": self.data_dir,
+            "prefetch": self.prefetch,
+            "prefetch_max_dte": self.prefetch_max_dte,
             "price_mode": self.price_mode,
             "max_new_positions_per_day": self.max_new_positions_per_day,
             "random_seed": self.random_seed,
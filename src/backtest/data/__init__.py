@@ -11,6 +11,7 @@ from src.backtest.data.thetadata_client import (
 from src.backtest.data.schema import (
     StockDailySchema,
     OptionDailySchema,
+    get_option_parquet_files,
     get_parquet_path,
     init_duckdb_schema,
 )
@@ -24,6 +25,12 @@ from src.backtest.data.ibkr_fundamental_downloader import (
     RevenueRecord,
     DividendRecord,
 )
+from src.backtest.data.option_chain_store import (
+    OptionChainStore,
+    build_option_chain_store,
+)
+from src.backtest.data.atm_iv_daily import IVRankWindow, build_atm_iv_daily
+from src.backtest.data.shared_data import SharedDataPlane, build_shared_data
 from src.backtest.data.duckdb_provider import DuckDBProvider
 from src.backtest.data.greeks_calculator import (
     GreeksCalculator,
@@ -43,6 +50,7 @@ __all__ = [
     "StockDailySchema",
     "OptionDailySchema",
     "get_parquet_path",
+    "get_option_parquet_files",
     "init_duckdb_schema",
     # Downloader
     "DataDownloader",
@@ -58,6 +66,15 @@ __all__ = [
     "EPSRecord",
     "RevenueRecord",
     "DividendRecord",
+    # Option Chain Store
+    "OptionChainStore",
+    "build_option_chain_store",
+    # ATM IV Daily
+    "IVRankWindow",
+    "build_atm_iv_daily",
+    # Shared Data Plane
+    "SharedDataPlane",
+    "build_shared_data",
     # Provider
     "DuckDBProvider",
     # Greeks Calculator
@@ -0,0 +1,404 @@
+"""
+ATM IV Daily - 每日 ATM 隐含波动率派生数据集
+
+DuckDBProvider._calculate_iv_rank 原本每次都对所有年度期权文件做 UNION ALL +
+MEDIAN 聚合 (回溯 378 天)。本模块把这一聚合预先计算一次，写入派生数据集:
+
+    atm_iv_daily.parquet
+    ├── symbol       标的代码
+    ├── date         交易日
+    ├── atm_iv       ATM IV 中位数 (strike 在 underlying_price 95%-105%，0 < IV < 5)
+    └── iv_30d       30 天恒定期限 IV (按到期日 ATM IV 在总方差上线性插值)
+
+    atm_iv_daily.sources.json
+    └── {symbol: [期权文件最大 mtime_ns, 期权文件数]}  构建时各标的的源数据签名
+
+多个标的共用一个 Parquet 文件，只重建部分标的也会更新其修改时间，因此
+是否过期按标的比较源数据签名，而不是比较文件修改时间。
+
+atm_iv 的口径与 _calculate_iv_rank 的原始查询完全一致，IV Rank / IV Percentile
+由 IVRankWindow 在该序列上做滚动窗口查找 (二分定位窗口 + 有序窗口)。
+
+Usage:
+    build_atm_iv_daily("/Volumes/TradingData/processed")  # 增量: 只重建期权数据有更新的标的
+
+    series = load_atm_iv_series("/Volumes/TradingData/processed", "SPY")
+    window = IVRankWindow(*series)
+    iv_rank, iv_percentile = window.rank(date(2024, 6, 3), current_iv=0.18)
+"""
+
+import json
+import logging
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+ATM_IV_DAILY_FILE = "atm_iv_daily.parquet"
+ATM_IV_SOURCES_FILE = "atm_iv_daily.sources.json"
+
+# 恒定期限 IV 的目标天数
+CONSTANT_MATURITY_DAYS = 30
+
+# 计算 IV Rank 所需的最少历史天数
+MIN_IV_HISTORY_DAYS = 20
+
+ATM_IV_DAILY_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.string()),
+        ("date", pa.date32()),
+        ("atm_iv", pa.float64()),
+        ("iv_30d", pa.float64()),
+    ]
+)
+
+
+def get_atm_iv_daily_path(data_dir: Path | str) -> Path:
+    """atm_iv_daily.parquet 路径"""
+    return Path(data_dir) / ATM_IV_DAILY_FILE
+
+
+def _option_files(data_dir: Path, symbol: str) -> list[Path]:
+    option_dir = data_dir / "option_daily" / symbol
+    return sorted(option_dir.glob("*.parquet")) if option_dir.exists() else []
+
+
+def _source_signature(files: list[Path]) -> list[int]:
+    """期权文件的源数据签名: [最大 mtime_ns, 文件数]"""
+    return [max((f.stat().st_mtime_ns for f in files), default=0), len(files)]
+
+
+def _load_sources(data_dir: Path) -> dict[str, list[int]]:
+    """读取各标的构建时的源数据签名"""
+    path = data_dir / ATM_IV_SOURCES_FILE
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Failed to read {path}, treating ATM IV series as stale: {e}")
+        return {}
+
+
+def is_atm_iv_stale(data_dir: Path | str, symbol: str) -> bool:
+    """该标的的派生数据是否落后于其期权数据 (按标的比较源数据签名)"""
+    data_dir = Path(data_dir)
+    if not get_atm_iv_daily_path(data_dir).exists():
+        return True
+    symbol = symbol.upper()
+    built = _load_sources(data_dir).get(symbol)
+    return built != _source_signature(_option_files(data_dir, symbol))
+
+
+def build_atm_iv_daily(
+    data_dir: Path | str,
+    symbols: list[str] | None = None,
+    force: bool = False,
+) -> dict[str, int]:
+    """构建 (或增量更新) atm_iv_daily.parquet
+
+    Args:
+        data_dir: 数据根目录 (包含 option_daily/)
+        symbols: 要构建的标的 (None 表示 option_daily/ 下全部标的)
+        force: 为 True 时忽略源数据签名，全部重建
+
+    Returns:
+        {symbol: 行数}，只包含本次重建的标的
+    """
+    data_dir = Path(data_dir)
+    option_base = data_dir / "option_daily"
+    if not option_base.exists():
+        return {}
+
+    if symbols is None:
+        symbols = sorted(d.name for d in option_base.iterdir() if d.is_dir())
+    symbols = [s.upper() for s in symbols]
+    if not force:
+        symbols = [s for s in symbols if is_atm_iv_stale(data_dir, s)]
+    if not symbols:
+        return {}
+
+    built: dict[str, int] = {}
+    signatures: dict[str, list[int]] = {}
+    tables: list[pa.Table] = []
+    conn = duckdb.connect(":memory:")
+    try:
+        for symbol in symbols:
+            files = _option_files(data_dir, symbol)
+            if not files:
+                continue
+            # 计算前取签名: 构建期间期权文件再有更新时，下次仍判定为过期
+            signature = _source_signature(files)
+            try:
+                table = _compute_symbol_atm_iv(conn, symbol, files)
+            except Exception as e:
+                logger.warning(f"Failed to build ATM IV series for {symbol}: {e}")
+                continue
+            tables.append(table)
+            built[symbol] = table.num_rows
+            signatures[symbol] = signature
+    finally:
+        conn.close()
+
+    if not built:
+        return {}
+
+    # 与已有数据合并: 替换本次重建的标的，保留其他标的
+    path = get_atm_iv_daily_path(data_dir)
+    if path.exists():
+        existing = pq.read_table(path).cast(ATM_IV_DAILY_SCHEMA)
+        keep = pc.invert(pc.is_in(existing.column("symbol"), pa.array(list(built))))
+        tables.insert(0, existing.filter(keep))
+
+    combined = pa.concat_tables(tables).sort_by([("symbol", "ascending"), ("date", "ascending")])
+    tmp_path = path.with_suffix(".parquet.tmp")
+    pq.write_table(combined, tmp_path)
+    tmp_path.replace(path)
+
+    # 数据写入后再更新签名: 中途失败时这些标的仍判定为过期
+    sources = _load_sources(data_dir)
+    sources.update(signatures)
+    sources_path = data_dir / ATM_IV_SOURCES_FILE
+    tmp_sources = sources_path.with_suffix(".json.tmp")
+    with open(tmp_sources, "w", encoding="utf-8") as f:
+        json.dump(sources, f, indent=2, sort_keys=True)
+    tmp_sources.replace(sources_path)
+
+    logger.info(f"Built ATM IV series for {len(built)} symbols: {path}")
+    return built
+
+
+def _compute_symbol_atm_iv(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    files: list[Path],
+) -> pa.Table:
+    """计算单个标的的每日 ATM IV 与 30 天恒定期限 IV"""
+    parquet_list = ", ".join(f"'{f}'" for f in files)
+    atm_filter = (
+        "strike >= underlying_price * 0.95 AND strike <= underlying_price * 1.05 "
+        "AND implied_vol > 0 AND implied_vol < 5"
+    )
+
+    daily = conn.execute(
+        f"""
+        SELECT date, MEDIAN(implied_vol) AS atm_iv
+        FROM read_parquet([{parquet_list}])
+        WHERE {atm_filter}
+        GROUP BY date ORDER BY date
+        """
+    ).fetchall()
+
+    term = conn.execute(
+        f"""
+        SELECT date, CAST(expiration - date AS INTEGER) AS dte, MEDIAN(implied_vol) AS iv
+        FROM read_parquet([{parquet_list}])
+        WHERE {atm_filter} AND expiration > date
+        GROUP BY date, expiration ORDER BY date, expiration
+        """
+    ).fetchall()
+
+    # 按日期分组期限结构
+    term_by_date: dict[date, tuple[list[int], list[float]]] = {}
+    for d, dte, iv in term:
+        dtes, ivs = term_by_date.setdefault(d, ([], []))
+        dtes.append(dte)
+        ivs.append(iv)
+
+    iv_30d = [
+        constant_maturity_iv(*term_by_date[d]) if d in term_by_date else None
+        for d, _ in daily
+    ]
+
+    return pa.table(
+        {
+            "symbol": pa.array([symbol] * len(daily), type=pa.string()),
+            "date": pa.array([row[0] for row in daily], type=pa.date32()),
+            "atm_iv": pa.array([row[1] for row in daily], type=pa.float64()),
+            "iv_30d": pa.array(iv_30d, type=pa.float64()),
+        },
+        schema=ATM_IV_DAILY_SCHEMA,
+    )
+
+
+def constant_maturity_iv(
+    dtes: list[int],
+    ivs: list[float],
+    target_days: int = CONSTANT_MATURITY_DAYS,
+) -> float | None:
+    """按总方差 (IV² × T) 线性插值得到目标期限的 IV
+
+    目标期限落在到期日范围之外时取最近到期日的 IV (平推)。
+
+    Args:
+        dtes: 按升序排列的到期天数
+        ivs: 对应的 ATM IV
+        target_days: 目标期限 (天)
+
+    Returns:
+        恒定期限 IV，无数据时返回 None
+    """
+    if not dtes:
+        return None
+    if target_days <= dtes[0]:
+        return float(ivs[0])
+    if target_days >= dtes[-1]:
+        return float(ivs[-1])
+
+    variance = np.square(ivs) * np.asarray(dtes, dtype=np.float64)
+    total_variance = np.interp(target_days, dtes, variance)
+    return float(np.sqrt(total_variance / target_days))
+
+
+def query_mean_atm_iv(
+    conn: duckdb.DuckDBPyConnection,
+    parquet_files: list[Path],
+    closes: list[tuple[date, float]],
+) -> dict[date, float | None]:
+    """按日批量计算 ATM IV 均值 (口径同 DuckDBProvider._get_atm_implied_volatility)
+
+    ATM 范围基于当天股票收盘价: strike 在 close 的 95%-105% 之间，0 < IV < 5。
+
+    Args:
+        conn: DuckDB 连接
+        parquet_files: 期权 Parquet 文件
+        closes: [(日期, 股票收盘价), ...]
+
+    Returns:
+        {日期: ATM IV 均值}，当天无 ATM 期权时为 None
+    """
+    result: dict[date, float | None] = {d: None for d, _ in closes}
+    if not parquet_files or not closes:
+        return result
+
+    stock_closes = pa.table(
+        {
+            "close_date": pa.array([c[0] for c in closes], type=pa.date32()),
+            "close": pa.array([c[1] for c in closes], type=pa.float64()),
+        }
+    )
+    parquet_list = ", ".join(f"'{pf}'" for pf in parquet_files)
+    conn.register("atm_iv_stock_closes", stock_closes)
+    try:
+        rows = conn.execute(
+            f"""
+            SELECT o.date, LIST(o.implied_vol)
+            FROM read_parquet([{parquet_list}]) o
+            JOIN atm_iv_stock_closes s ON o.date = s.close_date
+            WHERE o.strike >= s.close * 0.95
+              AND o.strike <= s.close * 1.05
+              AND o.implied_vol > 0
+              AND o.implied_vol < 5
+            GROUP BY o.date
+            """
+        ).fetchall()
+    finally:
+        conn.unregister("atm_iv_stock_closes")
+
+    for d, ivs in rows:
+        ivs = [iv for iv in ivs if iv is not None]
+        result[d] = float(np.mean(ivs)) if ivs else None
+    return result
+
+
+def load_atm_iv_series(
+    data_dir: Path | str,
+    symbol: str,
+) -> tuple[list[date], list[float]] | None:
+    """读取某标的按日期排序的 ATM IV 序列
+
+    Returns:
+        (dates, atm_ivs)，数据集不存在或无该标的时返回 None
+    """
+    path = get_atm_iv_daily_path(data_dir)
+    if not path.exists():
+        return None
+
+    table = pq.read_table(
+        path,
+        columns=["date", "atm_iv"],
+        filters=[("symbol", "=", symbol.upper())],
+    )
+    if table.num_rows == 0:
+        return None
+
+    table = table.filter(pc.is_valid(table.column("atm_iv"))).sort_by("date")
+    return table.column("date").to_pylist(), table.column("atm_iv").to_pylist()
+
+
+class IVRankWindow:
+    """在每日 ATM IV 序列上滚动计算 IV Rank / IV Percentile
+
+    窗口为 [as_of_date - lookback_days × 1.5, as_of_date)，与
+    DuckDBProvider._calculate_iv_rank 的原始查询一致。窗口边界用二分查找定位，
+    窗口内的 IV 以有序列表维护: 回测按日期前进时只增删移入/移出窗口的几天数据，
+    min / max / 低于当前 IV 的个数都是 O(1) 或 O(log n)。
+    """
+
+    def __init__(self, dates: list[date], ivs: list[float], lookback_days: int = 252) -> None:
+        """初始化
+
+        Args:
+            dates: 按升序排列的日期
+            ivs: 对应的每日 ATM IV
+            lookback_days: 回溯天数
+        """
+        self._dates = dates
+        self._ivs = ivs
+        self._lookback = timedelta(days=int(lookback_days * 1.5))
+        self._lo = 0
+        self._hi = 0
+        self._window: list[float] = []
+
+    @property
+    def first_date(self) -> date | None:
+        """序列首日"""
+        return self._dates[0] if self._dates else None
+
+    def _advance(self, as_of_date: date) -> None:
+        """将窗口移动到 as_of_date"""
+        lo = bisect_left(self._dates, as_of_date - self._lookback)
+        hi = bisect_left(self._dates, as_of_date)
+
+        if lo >= self._lo and hi >= self._hi and lo <= self._hi:
+            # 向前滚动: 移出 [self._lo, lo)，移入 [self._hi, hi)
+            for iv in self._ivs[self._lo:lo]:
+                del self._window[bisect_left(self._window, iv)]
+            for iv in self._ivs[self._hi:hi]:
+                insort(self._window, iv)
+        else:
+            self._window = sorted(self._ivs[lo:hi])
+
+        self._lo, self._hi = lo, hi
+
+    def rank(self, as_of_date: date, current_iv: float) -> tuple[float | None, float | None]:
+        """计算 as_of_date 的 IV Rank 和 IV Percentile
+
+        Args:
+            as_of_date: 当前日期 (不含当天)
+            current_iv: 当前 IV (小数形式)
+
+        Returns:
+            (iv_rank, iv_percentile)，历史不足 MIN_IV_HISTORY_DAYS 天时返回 (None, None)
+        """
+        self._advance(as_of_date)
+        window = self._window
+        if len(window) < MIN_IV_HISTORY_DAYS:
+            return None, None
+
+        iv_min, iv_max = window[0], window[-1]
+        iv_rank = None
+        if iv_max > iv_min:
+            iv_rank = (current_iv - iv_min) / (iv_max - iv_min) * 100
+            iv_rank = max(0.0, min(100.0, iv_rank))
+
+        iv_percentile = bisect_left(window, current_iv) / len(window) * 100
+        return iv_rank, iv_percentile
@@ -20,18 +20,25 @@ Usage:
 
     # 下载期权数据
     downloader.download_options(["AAPL"], date(2020, 1, 1), date(2024, 12, 31))
+
+    # 并发下载 (多个标的同时请求，共享 client 的 rate limit 预算)
+    downloader = DataDownloader(data_dir=..., max_workers=4)
 """
 
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+from src.backtest.data.atm_iv_daily import build_atm_iv_daily, get_atm_iv_daily_path
 from src.backtest.data.schema import (
     OptionDailySchema,
     StockDailySchema,
@@ -41,10 +48,28 @@ from src.backtest.data.thetadata_client import (
     OptionEODGreeks,
     StockEOD,
     ThetaDataClient,
+    option_greeks_to_batch,
 )
 
 logger = logging.getLogger(__name__)
 
+# 期权日线的唯一键
+OPTION_KEY_COLUMNS = ["symbol", "expiration", "strike", "option_type", "date"]
+
+
+def _dedup_option_table(table: pa.Table) -> pa.Table:
+    """按 OPTION_KEY_COLUMNS 去重 (同键保留最后出现的行)，并按 date/合约排序"""
+    if table.num_rows == 0:
+        return table
+    indexed = table.append_column("__row", pa.array(range(table.num_rows), pa.int64()))
+    last_rows = indexed.group_by(OPTION_KEY_COLUMNS, use_threads=False).aggregate(
+        [("__row", "max")]
+    )["__row_max"]
+    deduped = table.take(last_rows)
+    return deduped.sort_by(
+        [(col, "ascending") for col in ["symbol", "date", "expiration", "strike", "option_type"]]
+    )
+
 
 @dataclass
 class DownloadProgress:
@@ -99,23 +124,31 @@ class DataDownloader:
     - 日期范围分块 (避免单次请求数据量过大)
     - 断点续传 (记录进度)
     - 自动 rate limit 处理
+    - 多标的并发下载 (max_workers > 1)
     """
 
     def __init__(
         self,
         data_dir: Path | str,
         client: ThetaDataClient | None = None,
+        max_workers: int = 1,
     ) -> None:
         """初始化下载器
 
         Args:
             data_dir: 数据存储目录
             client: ThetaData 客户端 (可选)
+            max_workers: 同时在途的标的数。>1 时按标的并发下载，
+                网络等待与 Parquet 写入重叠；同一标的的分块仍按顺序下载，
+                所有请求共享 client 的 rate limit 预算。
         """
         self._data_dir = Path(data_dir)
         self._data_dir.mkdir(parents=True, exist_ok=True)
 
         self._client = client or ThetaDataClient()
+        self._max_workers = max(1, max_workers)
+        # 串行化共享文件写入 (进度文件、stock_daily.parquet)
+        self._write_lock = threading.RLock()
         self._progress_file = self._data_dir / ".download_progress.json"
         self._progress: dict[str, DownloadProgress] = {}
 
@@ -137,9 +170,11 @@ class DataDownloader:
     def _save_progress(self) -> None:
         """保存下载进度"""
         try:
-            data = {k: v.to_dict() for k, v in self._progress.items()}
-            with open(self._progress_file, "w") as f:
-                json.dump(data, f, indent=2)
+            with self._write_lock:
+                # 先复制 (其他下载线程可能同时登记新标的)
+                data = {k: v.to_dict() for k, v in dict(self._progress).items()}
+                with open(self._progress_file, "w") as f:
+                    json.dump(data, f, indent=2)
         except Exception as e:
             logger.warning(f"Failed to save progress file: {e}")
 
@@ -147,6 +182,42 @@ class DataDownloader:
         """生成进度 key"""
         return f"{data_type}:{symbol}"
 
+    def _run_symbol_jobs(
+        self,
+        jobs: list[tuple[str, Callable[[], int]]],
+    ) -> Iterator[tuple[str, int | None, Exception | None]]:
+        """执行每个标的的下载任务，按完成顺序产出 (symbol, count, error)
+
+        max_workers == 1 时按顺序执行；否则用线程池保持 max_workers 个任务在途。
+        每个标的只对应一个任务，保证同一标的的文件不会被并发写入。
+        """
+        if self._max_workers == 1:
+            for symbol, job in jobs:
+                try:
+                    yield symbol, job(), None
+                except Exception as e:
+                    yield symbol, None, e
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="thetadata-download"
+        ) as executor:
+            futures = {executor.submit(job): symbol for symbol, job in jobs}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    yield symbol, future.result(), None
+                except Exception as e:
+                    yield symbol, None, e
+
+    @staticmethod
+    def _group_gaps_by_symbol(gaps: list) -> dict[str, list]:
+        """按标的分组缺口 (保持原有顺序)"""
+        grouped: dict[str, list] = {}
+        for gap in gaps:
+            grouped.setdefault(gap.symbol, []).append(gap)
+        return grouped
+
     # ========== Stock Data Download ==========
 
     def download_stocks(
@@ -170,16 +241,21 @@ class DataDownloader:
         results = {}
         total = len(symbols)
 
-        for i, symbol in enumerate(symbols):
-            if on_progress:
-                on_progress(symbol, i, total)
+        def make_job(i: int, symbol: str) -> Callable[[], int]:
+            def job() -> int:
+                if on_progress:
+                    on_progress(symbol, i, total)
+                return self._download_stock(symbol, start_date, end_date)
 
-            try:
-                count = self._download_stock(symbol, start_date, end_date)
+            return job
+
+        jobs = [(symbol, make_job(i, symbol)) for i, symbol in enumerate(symbols)]
+        for symbol, count, error in self._run_symbol_jobs(jobs):
+            if error is None:
                 results[symbol] = count
                 logger.info(f"Downloaded {count} records for {symbol}")
-            except Exception as e:
-                logger.error(f"Failed to download {symbol}: {e}")
+            else:
+                logger.error(f"Failed to download {symbol}: {error}")
                 results[symbol] = 0
 
         # 更新数据目录
@@ -253,7 +329,13 @@ class DataDownloader:
         """保存股票数据为 Parquet
 
         追加模式：如果文件存在，读取现有数据并合并去重。
+        所有标的共用一个文件，并发下载时在写锁内完成读-合并-写。
         """
+        with self._write_lock:
+            self._merge_stock_parquet(records)
+
+    def _merge_stock_parquet(self, records: list[StockEOD]) -> None:
+        """将股票记录合并写入 stock_daily.parquet (调用方持有写锁)"""
         parquet_path = get_parquet_path(self._data_dir, "stock")
 
         # 转换为 PyArrow Table
@@ -323,16 +405,19 @@ class DataDownloader:
         """
         results = {}
 
-        for symbol in symbols:
-            try:
-                count = self._download_option(
-                    symbol, start_date, end_date, max_dte, strike_range,
-                    chunk_days, on_progress
-                )
+        def make_job(symbol: str) -> Callable[[], int]:
+            return lambda: self._download_option(
+                symbol, start_date, end_date, max_dte, strike_range,
+                chunk_days, on_progress
+            )
+
+        jobs = [(symbol, make_job(symbol)) for symbol in symbols]
+        for symbol, count, error in self._run_symbol_jobs(jobs):
+            if error is None:
                 results[symbol] = count
                 logger.info(f"Downloaded {count} option records for {symbol}")
-            except Exception as e:
-                logger.error(f"Failed to download options for {symbol}: {e}")
+            else:
+                logger.error(f"Failed to download options for {symbol}: {error}")
                 results[symbol] = 0
 
         # 更新数据目录
@@ -420,8 +505,8 @@ class DataDownloader:
                     on_progress(symbol, chunk_start, chunk_idx, total_chunks)
 
                 try:
-                    # 使用日期范围请求 (CSV 流式读取)
-                    records = self._client.get_option_with_greeks(
+                    # 使用日期范围请求 (CSV 流式解码为 RecordBatch，整块按月合并写入)
+                    batches = self._client.get_option_with_greeks_batches(
                         symbol=symbol,
                         start_date=chunk_start,
                         end_date=chunk_end,
@@ -430,21 +515,12 @@ class DataDownloader:
                         strike_range=strike_range,
                     )
 
-                    if records:
-                        # 按年份分组保存
-                        records_by_year: dict[int, list] = {}
-                        for r in records:
-                            year = r.date.year
-                            if year not in records_by_year:
-                                records_by_year[year] = []
-                            records_by_year[year].append(r)
-
-                        for year, year_records in records_by_year.items():
-                            self._save_option_parquet(symbol, year, year_records)
-
-                        total_records += len(records)
+                    chunk_records = self._save_option_batches(symbol, batches)
+
+                    if chunk_records:
+                        total_records += chunk_records
                         logger.info(
-                            f"{symbol} {chunk_start} - {chunk_end}: {len(records)} contracts"
+                            f"{symbol} {chunk_start} - {chunk_end}: {chunk_records} contracts"
                         )
                     else:
                         logger.debug(f"{symbol} {chunk_start} - {chunk_end}: No data")
@@ -481,60 +557,82 @@ class DataDownloader:
         self,
         symbol: str,
         year: int,
+        month: int,
         records: list[OptionEODGreeks],
     ) -> None:
-        """保存期权数据为 Parquet (按年份分文件)
+        """保存期权数据为 Parquet (按月份分区)"""
+        self._save_option_table(
+            symbol, year, month, pa.Table.from_batches([option_greeks_to_batch(records)])
+        )
 
-        追加模式：如果文件存在，读取现有数据并合并去重。
-        """
-        parquet_path = get_parquet_path(self._data_dir, "option", symbol, year)
-        parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    def _save_option_table(self, symbol: str, year: int, month: int, table: pa.Table) -> None:
+        """将一个月的数据合并写入月度分区
 
-        # 转换为 PyArrow Table
-        data = {
-            "symbol": [r.symbol for r in records],
-            "expiration": [r.expiration for r in records],
-            "strike": [r.strike for r in records],
-            "option_type": [r.option_type for r in records],
-            "date": [r.date for r in records],
-            "open": [r.open for r in records],
-            "high": [r.high for r in records],
-            "low": [r.low for r in records],
-            "close": [r.close for r in records],
-            "volume": [r.volume for r in records],
-            "count": [r.count for r in records],
-            "bid": [r.bid for r in records],
-            "ask": [r.ask for r in records],
-            "delta": [r.delta for r in records],
-            "gamma": [r.gamma for r in records],
-            "theta": [r.theta for r in records],
-            "vega": [r.vega for r in records],
-            "rho": [r.rho for r in records],
-            "implied_vol": [r.implied_vol for r in records],
-            "underlying_price": [r.underlying_price for r in records],
-            "open_interest": [r.open_interest for r in records],
-            "iv_error": [r.iv_error for r in records],
-        }
+        追加模式：只读取并重写该月的分区文件，在 Arrow 中按
+        (symbol, expiration, strike, option_type, date) 去重 (保留最新)，
+        增量更新的开销与该月数据量成正比，而非整年。
+        旧版年度文件 ({year}.parquet) 会在首次写入该年份时拆分为月度分区。
+        """
+        self._split_legacy_option_year(symbol, year)
 
-        new_table = pa.Table.from_pydict(data)
+        parquet_path = get_parquet_path(self._data_dir, "option", symbol, year, month)
+        parquet_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 如果文件存在，合并数据
+        # 如果分区存在，合并数据
         if parquet_path.exists():
             existing_table = pq.read_table(parquet_path)
-            combined = pa.concat_tables([existing_table, new_table])
+            table = pa.concat_tables([existing_table, table], promote_options="permissive")
 
-            # 去重 (按 symbol, expiration, strike, option_type, date)
-            combined_df = combined.to_pandas()
-            combined_df = combined_df.drop_duplicates(
-                subset=["symbol", "expiration", "strike", "option_type", "date"],
-                keep="last",
-            )
-            combined_df = combined_df.sort_values(
-                ["symbol", "date", "expiration", "strike", "option_type"]
+        pq.write_table(_dedup_option_table(table), parquet_path)
+
+    def _save_option_batches(self, symbol: str, batches: Iterable[pa.RecordBatch]) -> int:
+        """将一个请求块的 RecordBatch 按月份归组，每个月度分区只合并重写一次
+
+        逐个 batch 合并会让同一分区在一个请求块内被反复读取、去重和重写，
+        开销随 batch 数成倍增长；这里先按 (year, month) 收集整块数据再写入。
+
+        Returns:
+            写入的记录数
+        """
+        by_month: dict[int, list[pa.Table]] = {}
+        num_rows = 0
+        for batch in batches:
+            if not batch.num_rows:
+                continue
+            num_rows += batch.num_rows
+            table = pa.Table.from_batches([batch])
+            months = pc.add(pc.multiply(pc.year(table["date"]), 100), pc.month(table["date"]))
+            for key in pc.unique(months).to_pylist():
+                by_month.setdefault(key, []).append(table.filter(pc.equal(months, key)))
+
+        for key in sorted(by_month):
+            self._save_option_table(
+                symbol,
+                key // 100,
+                key % 100,
+                pa.concat_tables(by_month.pop(key), promote_options="permissive"),
             )
-            new_table = pa.Table.from_pandas(combined_df, preserve_index=False)
+        return num_rows
 
-        pq.write_table(new_table, parquet_path)
+    def _split_legacy_option_year(self, symbol: str, year: int) -> None:
+        """将旧版年度文件拆分为月度分区 (每个年份只发生一次)"""
+        year_path = get_parquet_path(self._data_dir, "option", symbol, year)
+        if not year_path.exists():
+            return
+
+        table = pq.read_table(year_path)
+        months = pc.month(table["date"])
+        for month in pc.unique(months).to_pylist():
+            month_table = table.filter(pc.equal(months, month))
+            month_path = get_parquet_path(self._data_dir, "option", symbol, year, month)
+            if month_path.exists():
+                month_table = pa.concat_tables(
+                    [month_table, pq.read_table(month_path)], promote_options="permissive"
+                )
+            pq.write_table(_dedup_option_table(month_table), month_path)
+
+        year_path.unlink()
+        logger.info(f"Split {year_path} into monthly partitions")
 
     # ========== Utility Methods ==========
 
@@ -604,7 +702,8 @@ class DataDownloader:
     def update_catalog(self) -> dict:
         """更新数据目录文件
 
-        扫描所有 Parquet 文件，生成统一的数据目录。
+        先增量构建派生数据集 atm_iv_daily.parquet (只重建期权数据有更新的标的)，
+        再扫描所有 Parquet 文件，生成统一的数据目录。
         保存到 data_catalog.json。
 
         Returns:
@@ -619,6 +718,12 @@ class DataDownloader:
             "datasets": {}
         }
 
+        # 0. 派生数据: 每日 ATM IV (供 IV Rank 滚动查找)
+        try:
+            build_atm_iv_daily(self._data_dir)
+        except Exception as e:
+            logger.warning(f"Failed to build ATM IV series: {e}")
+
         conn = duckdb.connect(":memory:")
 
         # 1. Stock Data
@@ -708,7 +813,35 @@ class DataDownloader:
             except Exception as e:
                 logger.warning(f"Failed to scan macro data: {e}")
 
-        # 4. Fundamental Data
+        # 4. ATM IV Data (派生)
+        atm_iv_path = get_atm_iv_daily_path(self._data_dir)
+        if atm_iv_path.exists():
+            try:
+                rows = conn.execute(f"""
+                    SELECT symbol,
+                           MIN(date) as start_date,
+                           MAX(date) as end_date,
+                           COUNT(*) as records
+                    FROM read_parquet('{atm_iv_path}')
+                    GROUP BY symbol
+                    ORDER BY symbol
+                """).fetchall()
+
+                catalog["datasets"]["atm_iv"] = {
+                    "file": atm_iv_path.name,
+                    "symbols": {
+                        row[0]: {
+                            "start_date": str(row[1]),
+                            "end_date": str(row[2]),
+                            "records": row[3]
+                        }
+                        for row in rows
+                    }
+                }
+            except Exception as e:
+                logger.warning(f"Failed to scan ATM IV data: {e}")
+
+        # 5. Fundamental Data
         for data_type in ["eps", "revenue", "dividend"]:
             path = self._data_dir / f"fundamental_{data_type}.parquet"
             if path.exists():
@@ -787,6 +920,12 @@ class DataDownloader:
             for ind, info in datasets["macro"].get("indicators", {}).items():
                 print(f"   {ind}: {info['start_date']} ~ {info['end_date']} ({info['records']} days)")
 
+        # ATM IV
+        if "atm_iv" in datasets:
+            print("\n📉 ATM IV Data:")
+            for sym, info in datasets["atm_iv"].get("symbols", {}).items():
+                print(f"   {sym}: {info['start_date']} ~ {info['end_date']} ({info['records']} days)")
+
         # Fundamental
         for data_type in ["eps", "revenue", "dividend"]:
             key = f"fundamental_{data_type}"
@@ -819,41 +958,53 @@ class DataDownloader:
 
         results: dict[str, int] = {}
         total = len(gaps)
+        gap_index = {id(gap): i for i, gap in enumerate(gaps)}
 
-        for i, gap in enumerate(gaps):
-            if on_progress:
-                on_progress(gap.symbol, i, total)
-
-            logger.info(
-                f"Downloading stock {gap.symbol} "
-                f"{gap.missing_start} ~ {gap.missing_end} ({gap.reason})"
-            )
+        def download_symbol_gaps(symbol_gaps: list) -> int:
+            downloaded = 0
+            for gap in symbol_gaps:
+                if on_progress:
+                    on_progress(gap.symbol, gap_index[id(gap)], total)
 
-            try:
-                # 直接调用底层下载方法（不走进度检查）
-                records = self._client.get_stock_eod(
-                    gap.symbol,
-                    gap.missing_start,
-                    gap.missing_end,
+                logger.info(
+                    f"Downloading stock {gap.symbol} "
+                    f"{gap.missing_start} ~ {gap.missing_end} ({gap.reason})"
                 )
 
-                if records:
-                    self._save_stock_parquet(gap.symbol, records)
-                    count = len(records)
-                    results[gap.symbol] = results.get(gap.symbol, 0) + count
-                    logger.info(f"Downloaded {count} stock records for {gap.symbol}")
-
-                    # 更新进度（扩展现有范围）
-                    self._update_progress_range(
+                try:
+                    # 直接调用底层下载方法（不走进度检查）
+                    records = self._client.get_stock_eod(
                         gap.symbol,
-                        "stock",
                         gap.missing_start,
                         gap.missing_end,
-                        count,
                     )
 
-            except Exception as e:
-                logger.error(f"Failed to download stock {gap.symbol}: {e}")
+                    if records:
+                        self._save_stock_parquet(gap.symbol, records)
+                        count = len(records)
+                        downloaded += count
+                        logger.info(f"Downloaded {count} stock records for {gap.symbol}")
+
+                        # 更新进度（扩展现有范围）
+                        self._update_progress_range(
+                            gap.symbol,
+                            "stock",
+                            gap.missing_start,
+                            gap.missing_end,
+                            count,
+                        )
+
+                except Exception as e:
+                    logger.error(f"Failed to download stock {gap.symbol}: {e}")
+            return downloaded
+
+        jobs = [
+            (symbol, (lambda g=symbol_gaps: download_symbol_gaps(g)))
+            for symbol, symbol_gaps in self._group_gaps_by_symbol(gaps).items()
+        ]
+        for symbol, count, _ in self._run_symbol_jobs(jobs):
+            if count:
+                results[symbol] = count
 
         # 更新数据目录
         if results:
@@ -887,27 +1038,38 @@ class DataDownloader:
 
         results: dict[str, int] = {}
 
-        for gap in gaps:
-            logger.info(
-                f"Downloading option {gap.symbol} "
-                f"{gap.missing_start} ~ {gap.missing_end} ({gap.reason})"
-            )
-
-            try:
-                count = self._download_option(
-                    gap.symbol,
-                    gap.missing_start,
-                    gap.missing_end,
-                    max_dte,
-                    strike_range,
-                    chunk_days,
-                    on_progress,
+        def download_symbol_gaps(symbol_gaps: list) -> int | None:
+            downloaded = None
+            for gap in symbol_gaps:
+                logger.info(
+                    f"Downloading option {gap.symbol} "
+                    f"{gap.missing_start} ~ {gap.missing_end} ({gap.reason})"
                 )
-                results[gap.symbol] = results.get(gap.symbol, 0) + count
-                logger.info(f"Downloaded {count} option records for {gap.symbol}")
 
-            except Exception as e:
-                logger.error(f"Failed to download option {gap.symbol}: {e}")
+                try:
+                    count = self._download_option(
+                        gap.symbol,
+                        gap.missing_start,
+                        gap.missing_end,
+                        max_dte,
+                        strike_range,
+                        chunk_days,
+                        on_progress,
+                    )
+                    downloaded = (downloaded or 0) + count
+                    logger.info(f"Downloaded {count} option records for {gap.symbol}")
+
+                except Exception as e:
+                    logger.error(f"Failed to download option {gap.symbol}: {e}")
+            return downloaded
+
+        jobs = [
+            (symbol, (lambda g=symbol_gaps: download_symbol_gaps(g)))
+            for symbol, symbol_gaps in self._group_gaps_by_symbol(gaps).items()
+        ]
+        for symbol, count, _ in self._run_symbol_jobs(jobs):
+            if count is not None:
+                results[symbol] = count
 
         # 更新数据目录
         if results:
@@ -24,16 +24,35 @@ Usage:
 """
 
 import logging
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import duckdb
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 import numpy as np
 
+from src.backtest.data.atm_iv_daily import (
+    IVRankWindow,
+    is_atm_iv_stale,
+    load_atm_iv_series,
+    query_mean_atm_iv,
+)
+from src.backtest.data.option_chain_store import (
+    OPTION_CHAIN_COLUMNS,
+    OptionChainStore,
+    build_option_chain_store,
+    split_table_by_date,
+)
+from src.backtest.data.schema import get_option_parquet_files
+from src.backtest.data.shared_data import SharedDataPlane
 from src.data.models import (
     Fundamental,
     KlineBar,
@@ -44,12 +63,69 @@ from src.data.models import (
     StockVolatility,
 )
 from src.data.models.option import Greeks, OptionContract, OptionType
+from src.data.models.option_frame import OptionChainFrame
+from src.data.models.price_series import PriceSeries
 from src.data.models.stock import KlineType
 from src.data.providers.base import DataProvider
+from src.engine.position.volatility.historical import calc_hv_series
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PrefetchStats:
+    """整段回测预加载统计 (DuckDBProvider.prefetch 返回)
+
+    memory_bytes 为预加载数据结构的估算内存占用 (NumPy 数组按 nbytes，
+    Python 行元组按对象大小估算)。
+    """
+
+    symbols: list[str] = field(default_factory=list)
+    start_date: date | None = None
+    end_date: date | None = None
+    max_dte: int | None = None
+    load_time_seconds: float = 0.0
+    memory_bytes: int = 0
+    stock_rows: int = 0
+    macro_rows: int = 0
+    option_rows: int = 0
+    option_days: int = 0
+    iv_history_rows: int = 0
+    beta_rows: int = 0
+
+    @property
+    def memory_mb(self) -> float:
+        """估算内存占用 (MB)"""
+        return self.memory_bytes / (1024 * 1024)
+
+    def to_dict(self) -> dict:
+        """转换为字典 (用于序列化)"""
+        return {
+            "symbols": self.symbols,
+            "start_date": self.start_date.isoformat() if self.start_date else None,
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "max_dte": self.max_dte,
+            "load_time_seconds": self.load_time_seconds,
+            "memory_bytes": self.memory_bytes,
+            "memory_mb": self.memory_mb,
+            "stock_rows": self.stock_rows,
+            "macro_rows": self.macro_rows,
+            "option_rows": self.option_rows,
+            "option_days": self.option_days,
+            "iv_history_rows": self.iv_history_rows,
+            "beta_rows": self.beta_rows,
+        }
+
+
+def _rows_nbytes(rows: list[tuple]) -> int:
+    """估算行元组列表的内存占用 (以首行为样本)"""
+    if not rows:
+        return sys.getsizeof(rows)
+    sample = rows[0]
+    per_row = sys.getsizeof(sample) + sum(sys.getsizeof(v) for v in sample)
+    return sys.getsizeof(rows) + per_row * len(rows)
+
+
 class DuckDBProvider(DataProvider):
     """DuckDB 数据提供者
 
@@ -106,21 +182,51 @@ class DuckDBProvider(DataProvider):
         # DuckDB 连接 (lazy init)
         self._conn: duckdb.DuckDBPyConnection | None = None
 
+        # 按交易日 row group 对齐的期权链存储 (create_optimized_db 生成)
+        self._option_chain_store: OptionChainStore | None = None
+        if db_path:
+            store_dir = self.get_option_chain_store_dir(db_path)
+            if store_dir.exists():
+                self._option_chain_store = OptionChainStore(store_dir)
+
         # 缓存
         self._trading_days_cache: list[date] | None = None
         self._stock_quote_cache: dict[tuple[str, date], StockQuote | None] = {}
         self._option_chain_cache: dict[tuple[str, date], OptionChain | None] = {}
+        # (underlying, date) -> 当天全链的列式数据 (get_option_chain 的数据来源)
+        self._option_chain_frame_cache: dict[tuple[str, date], OptionChainFrame | None] = {}
+        # 预加载按 max_dte 截断时，超出截断范围的请求回退查询得到的当天全到期日期权链
+        self._full_option_chain_frame_cache: dict[tuple[str, date], OptionChainFrame | None] = {}
         self._cache_max_size = 1000  # 最大缓存条目数
 
         # 全序列缓存（不随 set_as_of_date 清除，历史数据不可变）
         self._kline_series_cache: dict[str, list[tuple]] = {}  # symbol -> [(date, open, high, low, close, volume), ...]
         self._kline_dict_cache: dict[str, dict[date, tuple]] = {}  # symbol -> {date: row}
         self._macro_series_cache: dict[str, list[tuple]] = {}  # indicator -> [(date, open, high, low, close), ...]
+        # 由上述行序列派生的列式序列 (按日期二分查找)，源行序列被替换时重建
+        self._kline_frames: dict[str, tuple[list[tuple], PriceSeries]] = {}
+        self._macro_frames: dict[str, tuple[list[tuple], PriceSeries]] = {}
         self._stock_volatility_cache: dict[tuple[str, date], StockVolatility | None] = {}  # (symbol, date) -> result
+        # (symbol, window) -> (源 PriceSeries, 滚动 HV)，源序列被替换 (prefetch) 时重建
+        self._hv_series_cache: dict[tuple[str, int], tuple[PriceSeries, np.ndarray]] = {}
         self._stock_beta_cache: dict[tuple[str, date | None], float | None] = {}  # (symbol, as_of_date) -> beta
         self._fundamental_cache: dict[tuple[str, date], Fundamental | None] = {}  # (symbol, as_of_date) -> Fundamental
         self._macro_blackout_cache: dict[date, tuple[bool, list]] = {}  # date -> (is_blackout, events)
         self._blackout_prefetched: bool = False  # 防止重复预取
+        # atm_iv_daily 派生序列与 IV Rank 滚动窗口
+        self._atm_iv_series_cache: dict[str, tuple[list[date], list[float]] | None] = {}
+        self._iv_rank_windows: dict[tuple[str, int], tuple[IVRankWindow, bool]] = {}  # (symbol, lookback) -> (窗口, 是否来自预加载)
+
+        # 整段回测预加载 (prefetch)，不随 set_as_of_date 清除
+        self._macro_prefetched: bool = False
+        self._prefetch_ranges: dict[str, tuple[date, date]] = {}  # symbol -> 已预加载日期范围
+        self._prefetch_max_dte: dict[str, int | None] = {}  # symbol -> 预加载期权的最大 DTE
+        self._prefetched_option_frames: dict[tuple[str, date], OptionChainFrame] = {}
+        self._prefetched_atm_iv: dict[tuple[str, date], float | None] = {}
+        self._prefetched_iv_history: dict[str, tuple[date, list[date], list[float]]] = {}  # symbol -> (起始日, dates, ivs)
+        self._prefetched_beta: dict[str, tuple[list[date], list[float]]] = {}  # symbol -> (dates, betas)
+        self._prefetched_static_beta: dict[str, float] | None = None
+        self._shared_data: SharedDataPlane | None = None  # 并行回测共享数据 (按天惰性构建期权链)
 
         # 已尝试下载的 symbol 缓存 (避免重复下载失败的 symbol)
         self._fundamental_download_attempted: set[str] = set()
@@ -167,19 +273,29 @@ class DuckDBProvider(DataProvider):
             # stock_volatility_cache 保留 — 按 (symbol, date) 缓存，不会有冲突
             self._stock_quote_cache.clear()
             self._option_chain_cache.clear()
+            self._option_chain_frame_cache.clear()
+            self._full_option_chain_frame_cache.clear()
             logger.debug(f"DuckDBProvider as_of_date set to {d}, cache cleared")
 
     def clear_cache(self) -> None:
         """清除所有缓存（包括全序列缓存）"""
         self._stock_quote_cache.clear()
         self._option_chain_cache.clear()
+        self._option_chain_frame_cache.clear()
+        self._full_option_chain_frame_cache.clear()
         self._trading_days_cache = None
         self._kline_series_cache.clear()
         self._kline_dict_cache.clear()
         self._macro_series_cache.clear()
+        self._kline_frames.clear()
+        self._macro_frames.clear()
         self._stock_volatility_cache.clear()
+        self._hv_series_cache.clear()
         self._macro_blackout_cache.clear()
         self._blackout_prefetched = False
+        self._atm_iv_series_cache.clear()
+        self._iv_rank_windows.clear()
+        self._clear_prefetch()
         logger.debug("DuckDBProvider all caches cleared")
 
     # ========== Fundamental Auto-Download ==========
@@ -313,17 +429,7 @@ class DuckDBProvider(DataProvider):
         # Optimization: Fetch full kline series into memory and use dictionary for O(1) lookup
         if symbol not in self._kline_series_cache:
             self._kline_series_cache[symbol] = self._load_full_kline_series(symbol)
-            
-            # 建立基于日期的 O(1) 索引字典
-            date_dict = {}
-            for row in self._kline_series_cache[symbol]:
-                date_val = row[0]
-                if isinstance(date_val, str):
-                    date_val = date.fromisoformat(date_val)
-                elif isinstance(date_val, datetime):
-                    date_val = date_val.date()
-                date_dict[date_val] = row
-            self._kline_dict_cache[symbol] = date_dict
+            self._index_kline_series(symbol)
 
         # 直接从全量内存字典中取当天数据
         row = self._kline_dict_cache[symbol].get(self._as_of_date)
@@ -342,6 +448,18 @@ class DuckDBProvider(DataProvider):
             source="duckdb",
         )
 
+    def _index_kline_series(self, symbol: str) -> None:
+        """为已加载的 kline 全序列建立基于日期的 O(1) 索引字典"""
+        date_dict = {}
+        for row in self._kline_series_cache[symbol]:
+            date_val = row[0]
+            if isinstance(date_val, str):
+                date_val = date.fromisoformat(date_val)
+            elif isinstance(date_val, datetime):
+                date_val = date_val.date()
+            date_dict[date_val] = row
+        self._kline_dict_cache[symbol] = date_dict
+
     def get_stock_quotes(self, symbols: list[str]) -> list[StockQuote]:
         """获取多只股票报价
 
@@ -418,29 +536,43 @@ class DuckDBProvider(DataProvider):
 
         symbol = symbol.upper()
 
+        series = self.get_history_series(symbol, start_date, end_date)
+        return series.to_klines(symbol, source="duckdb")
+
+    def get_history_series(
+        self,
+        symbol: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> PriceSeries:
+        """获取日线列式序列 (与 get_history_kline 同口径，不构建 KlineBar)
+
+        返回全序列缓存上的数组视图，适合只需要收盘价等数组的调用方。
+
+        Args:
+            symbol: 股票代码
+            start_date: 开始日期 (None 表示不限)
+            end_date: 结束日期 (None 表示 as_of_date)
+
+        Returns:
+            PriceSeries (日期 <= as_of_date)
+        """
+        symbol = symbol.upper()
+        effective_end = self._as_of_date if end_date is None else min(end_date, self._as_of_date)
+        return self._get_kline_frame(symbol).between(start_date, effective_end)
+
+    def _get_kline_frame(self, symbol: str) -> PriceSeries:
+        """获取 (或构建) symbol 全序列的列式视图"""
         # 首次调用时加载全序列到缓存
         if symbol not in self._kline_series_cache:
             self._kline_series_cache[symbol] = self._load_full_kline_series(symbol)
 
-        # 限制 end_date 不超过 as_of_date
-        effective_end = min(end_date, self._as_of_date)
-
-        # 在内存中按日期范围过滤
-        return [
-            KlineBar(
-                symbol=symbol,
-                timestamp=datetime.combine(row[0], datetime.min.time()),
-                ktype=KlineType.DAY,
-                open=row[1],
-                high=row[2],
-                low=row[3],
-                close=row[4],
-                volume=row[5],
-                source="duckdb",
-            )
-            for row in self._kline_series_cache[symbol]
-            if start_date <= row[0] <= effective_end
-        ]
+        rows = self._kline_series_cache[symbol]
+        cached = self._kline_frames.get(symbol)
+        if cached is None or cached[0] is not rows:
+            cached = (rows, PriceSeries.from_rows(rows))
+            self._kline_frames[symbol] = cached
+        return cached[1]
 
     # ========== Option Data Methods ==========
 
@@ -477,119 +609,28 @@ class DuckDBProvider(DataProvider):
         if expiry_max_days is not None and expiry_end is None:
             expiry_end = self._as_of_date + timedelta(days=expiry_max_days)
 
+        if self._is_prefetched(underlying) and not self._prefetch_covers(underlying, expiry_end):
+            # 超出预加载 DTE 范围 (如 LEAPS)：由当天全到期日列式链构建
+            frame = self._load_option_chain_frame(underlying, expiry_end)
+            if frame is None:
+                return None
+            return frame.filter_by_expiry_range(expiry_start, expiry_end).to_option_chain()
+
         # 检查全链缓存 (Optimization: Fetch whole chain once per day to avoid multiple DuckDB queries)
         cache_key = (underlying, self._as_of_date)
         
         chain = self._option_chain_cache.get(cache_key)
         
         if chain is None and cache_key not in self._option_chain_cache:
-            # 查找期权数据
-            option_dir = self._data_dir / "option_daily" / underlying
-            if not option_dir.exists():
-                logger.warning(f"Option data not found for {underlying}")
-                self._option_chain_cache[cache_key] = None
-                return None
-
-            # 确定要读取的 Parquet 文件
-            year = self._as_of_date.year
-            parquet_files = []
-
-            # 优先读取当年的文件
-            year_file = option_dir / f"{year}.parquet"
-            if year_file.exists():
-                parquet_files.append(year_file)
-
-            # 如果当年文件不存在，尝试读取所有文件
-            if not parquet_files:
-                parquet_files = list(option_dir.glob("*.parquet"))
-
-            if not parquet_files:
-                logger.warning(f"No parquet files found for {underlying}")
+            # expiry_end 在预加载截断范围内 (上面已分流)，直接使用预加载数据
+            frame = self._load_option_chain_frame(underlying, expiry_end)
+            if frame is None:
                 self._option_chain_cache[cache_key] = None
                 return None
 
             try:
-                # 构建查询条件: 获取当天该标的的所有期权合约（不在这里过滤日期，而在内存中过滤）
-                conditions = ["date = ?"]
-                params: list[Any] = [self._as_of_date]
-
-                where_clause = " AND ".join(conditions)
-
-                # 合并多个 Parquet 文件的查询
-                parquet_list = ", ".join([f"'{pf}'" for pf in parquet_files])
-
-                conn = self._get_conn()
-                rows = conn.execute(
-                    f"""
-                    SELECT
-                        symbol, expiration, strike, option_type, date,
-                        open, high, low, close, volume, count,
-                        bid, ask, delta, gamma, theta, vega, rho,
-                        implied_vol, underlying_price, open_interest
-                    FROM read_parquet([{parquet_list}])
-                    WHERE {where_clause}
-                    ORDER BY expiration, strike, option_type
-                    """,
-                    params,
-                ).fetchall()
-
-                if not rows:
-                    self._option_chain_cache[cache_key] = None
-                    return None
-
-                # 构建 OptionChain
-                calls: list[OptionQuote] = []
-                puts: list[OptionQuote] = []
-                expiry_dates: set[date] = set()
-
-                for row in rows:
-                    (
-                        symbol, expiration, strike, opt_type, data_date,
-                        open_price, high, low, close, volume, count,
-                        bid, ask, delta, gamma, theta, vega, rho,
-                        implied_vol, underlying_price, open_interest,
-                    ) = row
-
-                    expiry_dates.add(expiration)
-
-                    # 构建期权符号 (简化格式)
-                    option_symbol = (
-                        f"{underlying}{expiration.strftime('%y%m%d')}"
-                        f"{'C' if opt_type == 'call' else 'P'}{int(strike * 1000):08d}"
-                    )
-
-                    contract = OptionContract(
-                        symbol=option_symbol,
-                        underlying=underlying,
-                        option_type=OptionType.CALL if opt_type == "call" else OptionType.PUT,
-                        strike_price=strike,
-                        expiry_date=expiration,
-                    )
-
-                    greeks = Greeks(
-                        delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho,
-                    )
-
-                    quote = OptionQuote(
-                        contract=contract,
-                        timestamp=datetime.combine(data_date, datetime.min.time()),
-                        last_price=close,
-                        bid=bid, ask=ask, volume=volume, open_interest=open_interest,
-                        iv=implied_vol, greeks=greeks, source="duckdb",
-                        open=open_price, high=high, low=low, close=close,
-                    )
-
-                    if opt_type == "call":
-                        calls.append(quote)
-                    else:
-                        puts.append(quote)
-
-                chain = OptionChain(
-                    underlying=underlying,
-                    timestamp=datetime.combine(self._as_of_date, datetime.min.time()),
-                    expiry_dates=sorted(expiry_dates),
-                    calls=calls, puts=puts, source="duckdb",
-                )
+                # 由列式期权链一次性构建 OptionChain
+                chain = frame.to_option_chain()
 
                 # 缓存全链结果
                 if len(self._option_chain_cache) >= self._cache_max_size:
@@ -640,6 +681,181 @@ class DuckDBProvider(DataProvider):
             source=chain.source,
         )
 
+    def get_option_chain_frame(
+        self,
+        underlying: str,
+        expiry_start: date | None = None,
+        expiry_end: date | None = None,
+        expiry_min_days: int | None = None,
+        expiry_max_days: int | None = None,
+        **kwargs,  # 忽略其他参数
+    ) -> OptionChainFrame | None:
+        """获取列式期权链
+
+        与 get_option_chain 数据相同，但以 OptionChainFrame (NumPy 列数组) 返回，
+        不创建逐合约的 OptionQuote 对象。筛选方按列过滤后只为留下的行调用
+        frame.to_quote()。
+
+        Args:
+            underlying: 标的代码
+            expiry_start: 到期日开始筛选
+            expiry_end: 到期日结束筛选
+            expiry_min_days: 最小到期天数 (相对于 as_of_date)
+            expiry_max_days: 最大到期天数 (相对于 as_of_date)
+            **kwargs: 忽略其他参数 (兼容性)
+
+        Returns:
+            OptionChainFrame 或 None
+        """
+        underlying = underlying.upper()
+
+        if expiry_min_days is not None and expiry_start is None:
+            expiry_start = self._as_of_date + timedelta(days=expiry_min_days)
+        if expiry_max_days is not None and expiry_end is None:
+            expiry_end = self._as_of_date + timedelta(days=expiry_max_days)
+
+        frame = self._load_option_chain_frame(underlying, expiry_end)
+        if frame is None:
+            return None
+        return frame.filter_by_expiry_range(expiry_start, expiry_end)
+
+    def get_option_quotes_by_key(
+        self,
+        underlying: str,
+        keys: list[tuple[date, float, OptionType]],
+    ) -> list[OptionQuote | None]:
+        """按 (expiry, strike, option_type) 批量获取当天期权报价
+
+        与 get_option_chain 同源 (当天全链列式数据)，每个合约一次哈希查找，
+        只为命中的合约构建 OptionQuote。
+
+        Args:
+            underlying: 标的代码
+            keys: [(到期日, 行权价, 期权类型), ...]
+
+        Returns:
+            与 keys 一一对应的报价列表，未找到的合约为 None
+        """
+        underlying = underlying.upper()
+        expiry_end = max((expiry for expiry, _, _ in keys), default=None)
+        frame = self._load_option_chain_frame(underlying, expiry_end)
+        if frame is None:
+            return [None] * len(keys)
+        return frame.find_quotes(keys)
+
+    def _load_option_chain_frame(
+        self,
+        underlying: str,
+        expiry_end: date | None = None,
+    ) -> OptionChainFrame | None:
+        """加载当天全链 (所有到期日) 的列式数据，按 (underlying, as_of_date) 缓存
+
+        已预加载的标的直接返回预加载数据；预加载按 max_dte 截断且 expiry_end
+        超出截断范围 (None 表示全部到期日) 时回退到查询路径，避免 LEAPS 或
+        已持有的远期合约查不到报价。
+        """
+        cache_key = (underlying, self._as_of_date)
+        cache = self._option_chain_frame_cache
+        if self._is_prefetched(underlying):
+            if self._prefetch_covers(underlying, expiry_end):
+                return self._get_prefetched_frame(underlying)
+            cache = self._full_option_chain_frame_cache
+        if cache_key in cache:
+            return cache[cache_key]
+
+        # 优先从按交易日对齐的列式存储直接读取当天 row group
+        table = self._read_option_chain_from_store(underlying)
+        if table is None:
+            table = self._scan_option_chain_table(underlying)
+
+        frame = None
+        if table is not None and table.num_rows > 0:
+            try:
+                frame = OptionChainFrame.from_arrow(
+                    table,
+                    underlying=underlying,
+                    timestamp=datetime.combine(self._as_of_date, datetime.min.time()),
+                    source="duckdb",
+                )
+            except Exception as e:
+                logger.error(f"Failed to get option chain for {underlying}: {e}")
+
+        if len(cache) >= self._cache_max_size:
+            keys_to_remove = list(cache.keys())[: self._cache_max_size // 2]
+            for k in keys_to_remove:
+                del cache[k]
+
+        cache[cache_key] = frame
+        return frame
+
+    def _read_option_chain_from_store(self, underlying: str) -> pa.Table | None:
+        """从 OptionChainStore 读取当天期权链
+
+        Returns:
+            当天的 Arrow 表 (无数据时为空表)；未启用存储、标的未导入或
+            日期超出已导入范围时返回 None，由调用方回退到 Parquet 扫描
+        """
+        store = self._option_chain_store
+        if store is None:
+            return None
+
+        date_range = store.date_range(underlying)
+        if date_range is None or not date_range[0] <= self._as_of_date <= date_range[1]:
+            return None
+
+        table = store.read_day(underlying, self._as_of_date, columns=OPTION_CHAIN_COLUMNS)
+        if table is None:
+            # 范围内但无 row group → 当天无数据
+            return pa.table({})
+        return table
+
+    def _scan_option_chain_table(self, underlying: str) -> pa.Table | None:
+        """扫描 option_daily Parquet 获取当天期权链
+
+        Returns:
+            按 (expiration, strike, option_type) 排序的 Arrow 表，无数据时返回 None
+        """
+        # 查找期权数据
+        option_dir = self._data_dir / "option_daily" / underlying
+        if not option_dir.exists():
+            logger.warning(f"Option data not found for {underlying}")
+            return None
+
+        # 确定要读取的 Parquet 文件 (当天所在的年度文件/月度分区，不存在时回退到全部文件)
+        parquet_files = self._option_parquet_files(underlying, self._as_of_date, self._as_of_date)
+
+        if not parquet_files:
+            logger.warning(f"No parquet files found for {underlying}")
+            return None
+
+        try:
+            # 构建查询条件: 获取当天该标的的所有期权合约（不在这里过滤日期，而在内存中过滤）
+            conditions = ["date = ?"]
+            params: list[Any] = [self._as_of_date]
+
+            where_clause = " AND ".join(conditions)
+
+            # 合并多个 Parquet 文件的查询
+            parquet_list = ", ".join([f"'{pf}'" for pf in parquet_files])
+
+            conn = self._get_conn()
+            return conn.execute(
+                f"""
+                SELECT
+                    symbol, expiration, strike, option_type, date,
+                    open, high, low, close, volume, count,
+                    bid, ask, delta, gamma, theta, vega, rho,
+                    implied_vol, underlying_price, open_interest
+                FROM read_parquet([{parquet_list}])
+                WHERE {where_clause}
+                ORDER BY expiration, strike, option_type
+                """,
+                params,
+            ).fetch_arrow_table()
+        except Exception as e:
+            logger.error(f"Failed to get option chain for {underlying}: {e}")
+            return None
+
     def get_option_quote(self, symbol: str) -> OptionQuote | None:
         """获取单个期权合约报价
 
@@ -963,40 +1179,24 @@ class DuckDBProvider(DataProvider):
         Returns:
             MacroData 列表 (按日期升序)
         """
-        # 首次调用时加载全序列到缓存
+        # 首次调用时加载全序列到缓存 (已 prefetch 时缺失的指标即无数据)
         if indicator not in self._macro_series_cache:
-            self._macro_series_cache[indicator] = self._load_full_macro_series(indicator)
+            self._macro_series_cache[indicator] = (
+                [] if self._macro_prefetched else self._load_full_macro_series(indicator)
+            )
 
-        if not self._macro_series_cache[indicator]:
+        rows = self._macro_series_cache[indicator]
+        if not rows:
             return []
 
-        # 限制 end_date 不超过 as_of_date
-        effective_end = min(end_date, self._as_of_date)
-
-        # 在内存中按日期范围过滤
-        results = []
-        for row in self._macro_series_cache[indicator]:
-            # row: (date, open, high, low, close)
-            data_date = row[0]
-            if isinstance(data_date, str):
-                data_date = date.fromisoformat(data_date)
-            elif isinstance(data_date, datetime):
-                data_date = data_date.date()
-
-            if start_date <= data_date <= effective_end:
-                results.append(MacroData(
-                    indicator=indicator,
-                    date=data_date,
-                    value=row[4],  # close 作为 value
-                    open=row[1],
-                    high=row[2],
-                    low=row[3],
-                    close=row[4],
-                    volume=None,
-                    source="duckdb",
-                ))
+        cached = self._macro_frames.get(indicator)
+        if cached is None or cached[0] is not rows:
+            cached = (rows, PriceSeries.from_rows(rows))
+            self._macro_frames[indicator] = cached
 
-        return results
+        # 限制 end_date 不超过 as_of_date，按日期二分取区间
+        effective_end = min(end_date, self._as_of_date)
+        return cached[1].between(start_date, effective_end).to_macro_data(indicator, source="duckdb")
 
     def get_available_macro_indicators(self) -> list[str]:
         """获取可用的宏观指标列表
@@ -1137,20 +1337,34 @@ class DuckDBProvider(DataProvider):
         if self._conn:
             self._conn.close()
             self._conn = None
+        if self._option_chain_store:
+            self._option_chain_store.close()
+
+    @staticmethod
+    def get_option_chain_store_dir(db_path: str | Path) -> Path:
+        """优化数据库对应的期权链存储目录 (与数据库文件同目录)"""
+        db_path = Path(db_path)
+        return db_path.parent / f"{db_path.stem}_option_chain"
 
     def create_optimized_db(
         self,
         db_path: str | Path,
         symbols: list[str] | None = None,
+        build_chain_store: bool = True,
     ) -> Path:
         """创建优化的 DuckDB 数据库
 
         将 Parquet 数据导入 DuckDB 并创建索引，提高查询性能。
         适合需要反复查询的大规模回测场景。
 
+        build_chain_store=True 时同时生成按交易日对齐 row group 的期权链存储
+        (见 option_chain_store)，get_option_chain 可直接按 row group 读取当天数据，
+        无需对整年文件做谓词扫描。
+
         Args:
             db_path: DuckDB 数据库路径
             symbols: 要导入的标的列表 (None 表示全部)
+            build_chain_store: 是否生成期权链存储
 
         Returns:
             数据库文件路径
@@ -1165,6 +1379,12 @@ class DuckDBProvider(DataProvider):
         db_path = Path(db_path)
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # 期权链存储只依赖 Parquet 源文件，先于数据库导入生成
+        if build_chain_store:
+            build_option_chain_store(
+                self._data_dir, self.get_option_chain_store_dir(db_path), symbols
+            )
+
         # 创建新数据库
         conn = duckdb.connect(str(db_path))
 
@@ -1209,9 +1429,415 @@ class DuckDBProvider(DataProvider):
         self._db_path = str(db_path)
         self._use_duckdb = True
         self._conn = None  # Will be lazily initialized
-        self.clear_cache()
+
+        store_dir = self.get_option_chain_store_dir(db_path)
+        if store_dir.exists():
+            self.use_option_chain_store(store_dir)
+        else:
+            self.clear_cache()
         logger.info(f"Switched to optimized DuckDB: {db_path}")
 
+    def use_option_chain_store(self, store_dir: str | Path) -> None:
+        """切换到从期权链存储读取期权链
+
+        存储中未导入的标的或超出导入日期范围的日期仍回退到 Parquet 扫描。
+
+        Args:
+            store_dir: build_option_chain_store 的输出目录
+        """
+        if self._option_chain_store:
+            self._option_chain_store.close()
+        self._option_chain_store = OptionChainStore(store_dir)
+        self.clear_cache()
+        logger.info(f"Using option chain store: {store_dir}")
+
+    # ========== Prefetch (Whole-Backtest Warm Mode) ==========
+
+    def prefetch(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        max_dte: int | None = None,
+        iv_lookback_days: int = 252,
+    ) -> PrefetchStats:
+        """一次性预加载整段回测所需数据
+
+        用少量批量扫描把以下数据装入按日期索引的内存结构，之后在
+        [start_date, end_date] 内逐日 set_as_of_date 不再访问 DuckDB:
+        - 股票日线: 一次扫描 stock_daily (所有 symbols)
+        - 宏观数据: 一次扫描 macro_daily (所有指标，含 ^VIX/^TNX)
+        - 期权链: 每个标的一次扫描，按交易日切分为 OptionChainFrame
+        - ATM IV / IV Rank 历史: 每个标的各一次聚合查询
+        - Beta: stock_beta_daily / stock_beta 各一次扫描
+
+        Args:
+            symbols: 标的列表
+            start_date: 回测开始日期
+            end_date: 回测结束日期
+            max_dte: 只预加载到期天数 <= max_dte 的期权 (None 表示全部到期日)
+            iv_lookback_days: IV Rank 回溯天数 (与 _calculate_iv_rank 一致)
+
+        Returns:
+            PrefetchStats (加载耗时与估算内存占用)
+        """
+        t0 = time.perf_counter()
+        symbols = sorted({s.upper() for s in symbols})
+        stats = PrefetchStats(
+            symbols=symbols, start_date=start_date, end_date=end_date, max_dte=max_dte
+        )
+
+        stats.stock_rows = self._prefetch_stock_series(symbols)
+        stats.macro_rows = self._prefetch_macro_series()
+        stats.beta_rows = self._prefetch_beta(symbols)
+
+        iv_history_start = start_date - timedelta(days=int(iv_lookback_days * 1.5))
+        for symbol in symbols:
+            rows, days = self._prefetch_option_frames(symbol, start_date, end_date, max_dte)
+            stats.option_rows += rows
+            stats.option_days += days
+            self._prefetch_atm_iv(symbol, start_date, end_date)
+            stats.iv_history_rows += self._prefetch_iv_history(symbol, iv_history_start, end_date)
+            self._prefetch_ranges[symbol] = (start_date, end_date)
+            self._prefetch_max_dte[symbol] = max_dte
+
+        stats.memory_bytes = self._estimate_prefetch_nbytes()
+        stats.load_time_seconds = time.perf_counter() - t0
+        logger.info(
+            f"Prefetched {len(symbols)} symbols {start_date}~{end_date}: "
+            f"{stats.option_rows} option rows / {stats.option_days} days, "
+            f"{stats.memory_mb:.1f} MB in {stats.load_time_seconds:.2f}s"
+        )
+        return stats
+
+    def attach_shared_data(self, plane: SharedDataPlane) -> None:
+        """挂载父进程导出的共享数据 (并行回测 worker 使用)
+
+        效果等同于 prefetch: 日期范围内的行情、宏观与期权链不再查询 DuckDB。
+        区别在于期权链不预先构建，而是每天从内存映射的 Arrow 表零拷贝切片后
+        构建当天的 OptionChainFrame，多个 worker 共享同一份 page cache。
+
+        Args:
+            plane: SharedDataPlane
+        """
+        start_date, end_date = plane.date_range
+        self._shared_data = plane
+
+        # PriceSeries 由映射的列直接构建，不再从行元组逐行转换
+        stock_series = plane.stock_series()
+        for symbol, rows in plane.stock_rows().items():
+            self._kline_series_cache[symbol] = rows
+            self._index_kline_series(symbol)
+            if symbol in stock_series:
+                self._kline_frames[symbol] = (rows, stock_series[symbol])
+
+        macro_rows = plane.macro_rows()
+        if macro_rows is not None:
+            macro_series = plane.macro_series()
+            self._macro_series_cache.update(macro_rows)
+            for indicator, rows in macro_rows.items():
+                if indicator in macro_series:
+                    self._macro_frames[indicator] = (rows, macro_series[indicator])
+            self._macro_prefetched = True
+
+        self._prefetched_atm_iv.update(plane.atm_iv())
+        self._prefetch_beta(plane.symbols)
+        for symbol in plane.symbols:
+            if plane.has_options(symbol):
+                self._prefetch_ranges[symbol] = (start_date, end_date)
+                self._prefetch_max_dte[symbol] = plane.max_dte
+
+        logger.info(
+            f"Attached shared data plane {plane.plane_dir} "
+            f"({len(plane.symbols)} symbols, {start_date}~{end_date})"
+        )
+
+    def _get_prefetched_frame(self, underlying: str) -> OptionChainFrame | None:
+        """已预加载标的的当天期权链 (prefetch 的内存数据或共享数据)"""
+        cache_key = (underlying, self._as_of_date)
+        frame = self._prefetched_option_frames.get(cache_key)
+        if frame is not None or self._shared_data is None:
+            return frame
+
+        if cache_key in self._option_chain_frame_cache:
+            return self._option_chain_frame_cache[cache_key]
+
+        table = self._shared_data.option_day(underlying, self._as_of_date)
+        if table is not None and table.num_rows > 0:
+            frame = OptionChainFrame.from_arrow(
+                table,
+                underlying=underlying,
+                timestamp=datetime.combine(self._as_of_date, datetime.min.time()),
+                source="duckdb",
+            )
+        self._option_chain_frame_cache[cache_key] = frame
+        return frame
+
+    def _is_prefetched(self, symbol: str) -> bool:
+        """as_of_date 是否在该标的的预加载范围内"""
+        date_range = self._prefetch_ranges.get(symbol)
+        return date_range is not None and date_range[0] <= self._as_of_date <= date_range[1]
+
+    def _prefetch_covers(self, symbol: str, expiry_end: date | None) -> bool:
+        """预加载的当天期权链是否包含 expiry_end 及之前的全部到期日
+
+        Args:
+            symbol: 标的代码 (已预加载)
+            expiry_end: 请求的最晚到期日，None 表示全部到期日
+        """
+        max_dte = self._prefetch_max_dte.get(symbol)
+        if max_dte is None:
+            return True
+        return expiry_end is not None and expiry_end <= self._as_of_date + timedelta(days=max_dte)
+
+    def _clear_prefetch(self) -> None:
+        """清除预加载数据"""
+        self._macro_prefetched = False
+        self._prefetch_ranges.clear()
+        self._prefetch_max_dte.clear()
+        self._prefetched_option_frames.clear()
+        self._prefetched_atm_iv.clear()
+        self._prefetched_iv_history.clear()
+        self._iv_rank_windows = {
+            k: v for k, v in self._iv_rank_windows.items() if not v[1]
+        }
+        self._prefetched_beta.clear()
+        self._prefetched_static_beta = None
+        self._shared_data = None
+
+    def _option_parquet_files(self, symbol: str, start_date: date, end_date: date) -> list[Path]:
+        """覆盖日期范围的期权文件 (无对应文件时回退到全部文件)"""
+        return get_option_parquet_files(self._data_dir, symbol, start_date, end_date)
+
+    def _prefetch_stock_series(self, symbols: list[str]) -> int:
+        """一次扫描加载所有 symbols 的日线全序列"""
+        parquet_path = self._data_dir / "stock_daily.parquet"
+        grouped: dict[str, list[tuple]] = {s: [] for s in symbols}
+        if parquet_path.exists() and symbols:
+            try:
+                placeholders = ", ".join("?" for _ in symbols)
+                rows = self._get_conn().execute(
+                    f"""
+                    SELECT symbol, date, open, high, low, close, volume
+                    FROM read_parquet('{parquet_path}')
+                    WHERE symbol IN ({placeholders})
+                    ORDER BY symbol, date
+                    """,
+                    symbols,
+                ).fetchall()
+                for row in rows:
+                    grouped[row[0]].append(row[1:])
+            except Exception as e:
+                logger.error(f"Failed to prefetch stock series: {e}")
+
+        for symbol, series in grouped.items():
+            self._kline_series_cache[symbol] = series
+            self._index_kline_series(symbol)
+        return sum(len(series) for series in grouped.values())
+
+    def _prefetch_macro_series(self) -> int:
+        """一次扫描加载 macro_daily 中所有指标的全序列"""
+        parquet_path = self._data_dir / "macro_daily.parquet"
+        if not parquet_path.exists():
+            return 0
+        try:
+            rows = self._get_conn().execute(
+                f"""
+                SELECT indicator, date, open, high, low, close
+                FROM read_parquet('{parquet_path}')
+                ORDER BY indicator, date
+                """
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to prefetch macro series: {e}")
+            return 0
+
+        grouped: dict[str, list[tuple]] = {}
+        for row in rows:
+            grouped.setdefault(row[0], []).append(row[1:])
+        self._macro_series_cache.update(grouped)
+        self._macro_prefetched = True
+        return len(rows)
+
+    def _prefetch_option_frames(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        max_dte: int | None,
+    ) -> tuple[int, int]:
+        """一次扫描加载某标的整段期权数据，按交易日切分为 OptionChainFrame
+
+        Returns:
+            (行数, 交易日数)
+        """
+        parquet_files = self._option_parquet_files(symbol, start_date, end_date)
+        if not parquet_files:
+            return 0, 0
+
+        parquet_list = ", ".join(f"'{pf}'" for pf in parquet_files)
+        columns = ", ".join(OPTION_CHAIN_COLUMNS)
+        dte_clause = ""
+        params: list[Any] = [start_date, end_date]
+        if max_dte is not None:
+            dte_clause = "AND expiration <= date + to_days(CAST(? AS INTEGER))"
+            params.append(max_dte)
+
+        try:
+            table = self._get_conn().execute(
+                f"""
+                SELECT {columns}
+                FROM read_parquet([{parquet_list}])
+                WHERE date >= ? AND date <= ? {dte_clause}
+                ORDER BY date, expiration, strike, option_type
+                """,
+                params,
+            ).fetch_arrow_table()
+        except Exception as e:
+            logger.error(f"Failed to prefetch option chains for {symbol}: {e}")
+            return 0, 0
+
+        days = 0
+        for day, day_table in split_table_by_date(table):
+            self._prefetched_option_frames[(symbol, day)] = OptionChainFrame.from_arrow(
+                day_table,
+                underlying=symbol,
+                timestamp=datetime.combine(day, datetime.min.time()),
+                source="duckdb",
+            )
+            days += 1
+        return table.num_rows, days
+
+    def _prefetch_atm_iv(self, symbol: str, start_date: date, end_date: date) -> None:
+        """一次查询计算某标的每个交易日的 ATM IV (口径同 _get_atm_implied_volatility)"""
+        closes = [
+            (row[0], row[4])
+            for row in self._kline_series_cache.get(symbol, [])
+            if start_date <= row[0] <= end_date
+        ]
+        for d, _ in closes:
+            self._prefetched_atm_iv[(symbol, d)] = None
+
+        parquet_files = self._option_parquet_files(symbol, start_date, end_date)
+        if not parquet_files or not closes:
+            return
+
+        try:
+            atm_ivs = query_mean_atm_iv(self._get_conn(), parquet_files, closes)
+        except Exception as e:
+            logger.error(f"Failed to prefetch ATM IV for {symbol}: {e}")
+            return
+
+        for d, iv in atm_ivs.items():
+            self._prefetched_atm_iv[(symbol, d)] = iv
+
+    def _prefetch_iv_history(self, symbol: str, history_start: date, end_date: date) -> int:
+        """一次查询加载某标的每日 ATM IV 中位数序列 (口径同 _calculate_iv_rank)
+
+        atm_iv_daily 可用时直接复用，不再查询。
+        """
+        series = self._load_atm_iv_series(symbol)
+        if series is not None:
+            return len(series[0])
+
+        option_dir = self._data_dir / "option_daily" / symbol
+        parquet_files = sorted(option_dir.glob("*.parquet")) if option_dir.exists() else []
+        if not parquet_files:
+            return 0
+
+        parquet_list = ", ".join(f"'{pf}'" for pf in parquet_files)
+        try:
+            rows = self._get_conn().execute(
+                f"""
+                SELECT date, MEDIAN(implied_vol) AS daily_iv
+                FROM read_parquet([{parquet_list}])
+                WHERE date >= ? AND date < ?
+                  AND strike >= underlying_price * 0.95
+                  AND strike <= underlying_price * 1.05
+                  AND implied_vol > 0 AND implied_vol < 5
+                GROUP BY date ORDER BY date
+                """,
+                [history_start, end_date],
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to prefetch IV history for {symbol}: {e}")
+            return 0
+
+        self._prefetched_iv_history[symbol] = (
+            history_start,
+            [row[0] for row in rows],
+            [row[1] for row in rows],
+        )
+        return len(rows)
+
+    def _prefetch_beta(self, symbols: list[str]) -> int:
+        """一次扫描加载滚动 Beta 与静态 Beta"""
+        conn = self._get_conn()
+        rows_loaded = 0
+        placeholders = ", ".join("?" for _ in symbols)
+
+        rolling_beta_path = self._data_dir / "stock_beta_daily.parquet"
+        if rolling_beta_path.exists() and symbols:
+            try:
+                rows = conn.execute(
+                    f"""
+                    SELECT symbol, date, beta FROM read_parquet('{rolling_beta_path}')
+                    WHERE symbol IN ({placeholders})
+                    ORDER BY symbol, date
+                    """,
+                    symbols,
+                ).fetchall()
+                for symbol, d, beta in rows:
+                    dates, betas = self._prefetched_beta.setdefault(symbol, ([], []))
+                    dates.append(d)
+                    betas.append(float(beta))
+                rows_loaded += len(rows)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch rolling beta: {e}")
+
+        static_beta: dict[str, float] = {}
+        static_beta_path = self._data_dir / "stock_beta.parquet"
+        if static_beta_path.exists() and symbols:
+            try:
+                rows = conn.execute(
+                    f"""
+                    SELECT symbol, beta FROM read_parquet('{static_beta_path}')
+                    WHERE symbol IN ({placeholders})
+                    """,
+                    symbols,
+                ).fetchall()
+                for symbol, beta in rows:
+                    static_beta.setdefault(symbol, float(beta))
+                rows_loaded += len(rows)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch static beta: {e}")
+
+        self._prefetched_static_beta = static_beta
+        # 丢弃预加载前按 (symbol, as_of_date) 缓存的结果
+        self._stock_beta_cache.clear()
+        return rows_loaded
+
+    def _estimate_prefetch_nbytes(self) -> int:
+        """估算预加载数据结构的内存占用"""
+        total = 0
+        for frame in self._prefetched_option_frames.values():
+            total += sum(
+                value.nbytes
+                for value in vars(frame).values()
+                if isinstance(value, np.ndarray)
+            )
+        for symbol in self._prefetch_ranges:
+            total += _rows_nbytes(self._kline_series_cache.get(symbol, []))
+            total += sys.getsizeof(self._kline_dict_cache.get(symbol, {}))
+        for series in self._macro_series_cache.values():
+            total += _rows_nbytes(series)
+        for _, dates, ivs in self._prefetched_iv_history.values():
+            total += sys.getsizeof(dates) + sys.getsizeof(ivs) + 32 * len(dates) + 24 * len(ivs)
+        for dates, betas in self._prefetched_beta.values():
+            total += sys.getsizeof(dates) + sys.getsizeof(betas) + 32 * len(dates) + 24 * len(betas)
+        total += sys.getsizeof(self._prefetched_atm_iv) + sys.getsizeof(self._prefetched_option_frames)
+        return total
+
     # ========== Screening Support Methods ==========
 
     def get_option_quotes_batch(
@@ -1250,116 +1876,186 @@ class DuckDBProvider(DataProvider):
             contracts_by_underlying[underlying].append(contract)
 
         for underlying, underlying_contracts in contracts_by_underlying.items():
-            # 查找期权数据目录
-            option_dir = self._data_dir / "option_daily" / underlying
-            if not option_dir.exists():
-                logger.debug(f"Option data not found for {underlying}")
+            # 优先从当天已缓存 (或已预加载) 的列式全链中按 (expiry, strike, type) 直接查找
+            if self._is_prefetched(underlying):
+                frame = self._get_prefetched_frame(underlying)
+            else:
+                frame = self._option_chain_frame_cache.get((underlying, self._as_of_date))
+            if frame is not None:
+                # 预加载按 DTE 截断时，截断范围外的合约 (如 LEAPS) 回退到查询路径
+                beyond_prefetch: list[OptionContract] = []
+                for contract in underlying_contracts:
+                    i = frame.find(
+                        contract.expiry_date,
+                        contract.strike_price,
+                        contract.option_type == OptionType.CALL,
+                    )
+                    if i is None:
+                        if self._is_prefetched(underlying) and not self._prefetch_covers(
+                            underlying, contract.expiry_date
+                        ):
+                            beyond_prefetch.append(contract)
+                        continue
+                    volume = frame.volume[i]
+                    if min_volume is not None and (0 if np.isnan(volume) else volume) < min_volume:
+                        continue
+                    quote = frame.to_quote(i, contract=contract)
+                    quote.open_interest = quote.open_interest or 0
+                    results.append(quote)
+                if not beyond_prefetch:
+                    continue
+                underlying_contracts = beyond_prefetch
+            elif self._is_prefetched(underlying) and self._prefetch_covers(
+                underlying, max(c.expiry_date for c in underlying_contracts)
+            ):
+                # 已预加载但当天无数据
                 continue
 
-            # 确定 Parquet 文件
-            year = self._as_of_date.year
-            parquet_file = option_dir / f"{year}.parquet"
-            if not parquet_file.exists():
-                # 尝试其他年份文件
-                parquet_files = list(option_dir.glob("*.parquet"))
-                if not parquet_files:
+            # 全链未缓存：一次 JOIN 查询取回所有请求的合约
+            rows_by_index = self._query_option_contracts(underlying, underlying_contracts)
+
+            for i, contract in enumerate(underlying_contracts):
+                row = rows_by_index.get(i)
+                if row is None:
                     continue
-                parquet_file = parquet_files[0]
 
-            try:
-                conn = self._get_conn()
+                # 检查最小成交量
+                volume = row[9] or 0
+                if min_volume is not None and volume < min_volume:
+                    continue
 
-                for contract in underlying_contracts:
-                    # 转换 option_type
-                    opt_type_str = "call" if contract.option_type == OptionType.CALL else "put"
+                # 构建 OptionQuote
+                (
+                    symbol,
+                    expiration,
+                    strike,
+                    opt_type,
+                    data_date,
+                    open_price,
+                    high,
+                    low,
+                    close,
+                    volume,
+                    count,
+                    bid,
+                    ask,
+                    delta,
+                    gamma,
+                    theta,
+                    vega,
+                    rho,
+                    implied_vol,
+                    underlying_price,
+                    open_interest,
+                ) = row
+
+                greeks = Greeks(
+                    delta=delta,
+                    gamma=gamma,
+                    theta=theta,
+                    vega=vega,
+                    rho=rho,
+                )
 
-                    # 查询特定合约
-                    row = conn.execute(
-                        f"""
-                        SELECT
-                            symbol, expiration, strike, option_type, date,
-                            open, high, low, close, volume, count,
-                            bid, ask, delta, gamma, theta, vega, rho,
-                            implied_vol, underlying_price, open_interest
-                        FROM read_parquet('{parquet_file}')
-                        WHERE date = ?
-                          AND expiration = ?
-                          AND strike = ?
-                          AND option_type = ?
-                        LIMIT 1
-                        """,
-                        [
-                            self._as_of_date,
-                            contract.expiry_date,
-                            contract.strike_price,
-                            opt_type_str,
-                        ],
-                    ).fetchone()
+                quote = OptionQuote(
+                    contract=contract,
+                    timestamp=datetime.combine(data_date, datetime.min.time()),
+                    last_price=close,
+                    bid=bid,
+                    ask=ask,
+                    volume=volume,
+                    open_interest=open_interest or 0,
+                    iv=implied_vol,
+                    greeks=greeks,
+                    source="duckdb",
+                    # OHLC 价格 (用于回测 price_mode)
+                    open=open_price,
+                    high=high,
+                    low=low,
+                    close=close,
+                )
+                results.append(quote)
 
-                    if row is None:
-                        continue
+        return results
 
-                    # 检查最小成交量
-                    volume = row[9] or 0
-                    if min_volume is not None and volume < min_volume:
-                        continue
+    @staticmethod
+    def _option_contract_key(contract: OptionContract) -> tuple[date, float, str]:
+        """合约查找键: (expiry, strike, "call"/"put")"""
+        opt_type_str = "call" if contract.option_type == OptionType.CALL else "put"
+        return (contract.expiry_date, float(contract.strike_price), opt_type_str)
 
-                    # 构建 OptionQuote
-                    (
-                        symbol,
-                        expiration,
-                        strike,
-                        opt_type,
-                        data_date,
-                        open_price,
-                        high,
-                        low,
-                        close,
-                        volume,
-                        count,
-                        bid,
-                        ask,
-                        delta,
-                        gamma,
-                        theta,
-                        vega,
-                        rho,
-                        implied_vol,
-                        underlying_price,
-                        open_interest,
-                    ) = row
-
-                    greeks = Greeks(
-                        delta=delta,
-                        gamma=gamma,
-                        theta=theta,
-                        vega=vega,
-                        rho=rho,
-                    )
+    def _query_option_contracts(
+        self,
+        underlying: str,
+        contracts: list[OptionContract],
+    ) -> dict[int, tuple]:
+        """一次查询获取多个合约当天的数据
 
-                    quote = OptionQuote(
-                        contract=contract,
-                        timestamp=datetime.combine(data_date, datetime.min.time()),
-                        last_price=close,
-                        bid=bid,
-                        ask=ask,
-                        volume=volume,
-                        open_interest=open_interest or 0,
-                        iv=implied_vol,
-                        greeks=greeks,
-                        source="duckdb",
-                        # OHLC 价格 (用于回测 price_mode)
-                        open=open_price,
-                        high=high,
-                        low=low,
-                        close=close,
-                    )
-                    results.append(quote)
+        将请求的 (expiry, strike, type) 注册为临时表，与 option_daily
+        Parquet 做一次 JOIN，代替逐合约查询。
 
-            except Exception as e:
-                logger.error(f"Failed to get option quotes for {underlying}: {e}")
+        Args:
+            underlying: 标的代码
+            contracts: 请求的合约 (同一 underlying)
 
-        return results
+        Returns:
+            {请求序号: 数据行}，未找到的合约不在结果中
+        """
+        # 查找期权数据目录
+        option_dir = self._data_dir / "option_daily" / underlying
+        if not option_dir.exists():
+            logger.debug(f"Option data not found for {underlying}")
+            return {}
+
+        # 确定 Parquet 文件
+        parquet_files = self._option_parquet_files(underlying, self._as_of_date, self._as_of_date)
+        if not parquet_files:
+            return {}
+        parquet_list = ", ".join(f"'{pf}'" for pf in parquet_files)
+
+        keys = [self._option_contract_key(c) for c in contracts]
+        requested = pa.table(
+            {
+                "req_idx": pa.array(range(len(keys)), type=pa.int64()),
+                "req_expiration": pa.array([k[0] for k in keys], type=pa.date32()),
+                "req_strike": pa.array([k[1] for k in keys], type=pa.float64()),
+                "req_option_type": pa.array([k[2] for k in keys], type=pa.string()),
+            }
+        )
+
+        rows_by_index: dict[int, tuple] = {}
+        try:
+            conn = self._get_conn()
+            conn.register("requested_contracts", requested)
+            try:
+                rows = conn.execute(
+                    f"""
+                    SELECT
+                        r.req_idx,
+                        o.symbol, o.expiration, o.strike, o.option_type, o.date,
+                        o.open, o.high, o.low, o.close, o.volume, o.count,
+                        o.bid, o.ask, o.delta, o.gamma, o.theta, o.vega, o.rho,
+                        o.implied_vol, o.underlying_price, o.open_interest
+                    FROM read_parquet([{parquet_list}]) o
+                    JOIN requested_contracts r
+                      ON o.expiration = r.req_expiration
+                     AND o.strike = r.req_strike
+                     AND o.option_type = r.req_option_type
+                    WHERE o.date = ?
+                    """,
+                    [self._as_of_date],
+                ).fetchall()
+            finally:
+                conn.unregister("requested_contracts")
+        except Exception as e:
+            logger.error(f"Failed to get option quotes for {underlying}: {e}")
+            return {}
+
+        for row in rows:
+            # 与逐个查询的 LIMIT 1 语义一致：每个请求只保留一行
+            rows_by_index.setdefault(row[0], row[1:])
+
+        return rows_by_index
 
     def _prefetch_economic_calendar(
         self,
@@ -1481,6 +2177,20 @@ class DuckDBProvider(DataProvider):
         if hasattr(self, "_stock_beta_cache") and cache_key in self._stock_beta_cache:
             return self._stock_beta_cache[cache_key]
 
+        # 已预加载: 内存中二分查找 as_of_date 当天或之前最近的 Beta
+        if self._prefetched_static_beta is not None:
+            beta_val = None
+            series = self._prefetched_beta.get(symbol.upper())
+            if series:
+                dates, betas = series
+                idx = len(dates) if as_of_date is None else bisect_right(dates, as_of_date)
+                if idx > 0:
+                    beta_val = betas[idx - 1]
+            if beta_val is None:
+                beta_val = self._prefetched_static_beta.get(symbol.upper())
+            self._stock_beta_cache[cache_key] = beta_val
+            return beta_val
+
         conn = self._get_conn()
 
         # 优先使用动态滚动 Beta (stock_beta_daily.parquet)
@@ -1537,6 +2247,64 @@ class DuckDBProvider(DataProvider):
             self._stock_beta_cache[cache_key] = None
         return None
 
+    def get_atm_iv_history(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+    ) -> list[tuple[date, float]]:
+        """获取每日 ATM IV 历史 (口径同 IV Rank 使用的每日 ATM IV)
+
+        注意: 只返回 <= as_of_date 的数据 (避免未来数据泄露)
+        数据来源优先级: atm_iv_daily > prefetch 加载的历史 > 扫描期权 Parquet。
+
+        Args:
+            symbol: 股票代码
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            [(date, atm_iv), ...]，按日期升序
+        """
+        symbol = symbol.upper()
+        effective_end = min(end_date, self._as_of_date)
+
+        series = self._load_atm_iv_series(symbol)
+        if series is None:
+            prefetched = self._prefetched_iv_history.get(symbol)
+            if prefetched is not None and prefetched[0] <= start_date:
+                series = (prefetched[1], prefetched[2])
+        if series is not None:
+            dates, ivs = series
+            lo = bisect_left(dates, start_date)
+            hi = bisect_right(dates, effective_end)
+            return [(d, iv) for d, iv in zip(dates[lo:hi], ivs[lo:hi]) if iv is not None]
+
+        option_dir = self._data_dir / "option_daily" / symbol
+        parquet_files = sorted(option_dir.glob("*.parquet")) if option_dir.exists() else []
+        if not parquet_files:
+            return []
+
+        parquet_list = ", ".join(f"'{pf}'" for pf in parquet_files)
+        try:
+            rows = self._get_conn().execute(
+                f"""
+                SELECT date, MEDIAN(implied_vol) AS daily_iv
+                FROM read_parquet([{parquet_list}])
+                WHERE date >= ? AND date <= ?
+                  AND strike >= underlying_price * 0.95
+                  AND strike <= underlying_price * 1.05
+                  AND implied_vol > 0 AND implied_vol < 5
+                GROUP BY date ORDER BY date
+                """,
+                [start_date, effective_end],
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to get ATM IV history for {symbol}: {e}")
+            return []
+
+        return [(row[0], row[1]) for row in rows]
+
     def get_stock_volatility(self, symbol: str) -> StockVolatility | None:
         """获取股票波动率指标
 
@@ -1596,7 +2364,8 @@ class DuckDBProvider(DataProvider):
         """计算历史波动率 (年化)
 
         使用最近 N 天的收盘价计算日收益率标准差，再年化。
-        利用 kline 全序列缓存，避免重复查询 DuckDB。
+        每个 (symbol, N) 只在 kline 全序列上计算一次滚动 HV 序列，
+        之后按 as_of_date 二分查找取值。
 
         Args:
             symbol: 股票代码
@@ -1605,35 +2374,51 @@ class DuckDBProvider(DataProvider):
         Returns:
             年化历史波动率 (小数形式) 或 None
         """
-        # 确保 kline 缓存已加载
-        if symbol not in self._kline_series_cache:
-            self._kline_series_cache[symbol] = self._load_full_kline_series(symbol)
-
-        series = self._kline_series_cache[symbol]
-        if not series:
+        frame = self._get_kline_frame(symbol)
+        if not len(frame):
             return None
 
         try:
-            # 过滤 <= as_of_date 的数据 (series 已按日期升序)
-            eligible = [row for row in series if row[0] <= self._as_of_date]
+            hv_series = self._get_hv_series(symbol, frame, lookback_days)
+        except Exception as e:
+            logger.error(f"Failed to calculate HV for {symbol}: {e}")
+            return None
 
-            if len(eligible) < lookback_days + 1:
-                logger.debug(f"Not enough data for HV calculation: got {len(eligible)}, need {lookback_days + 1}")
-                return None
+        # 取 <= as_of_date 的最后一根
+        idx = frame.index_as_of(self._as_of_date)
+        if idx is None or idx < lookback_days:
+            got = 0 if idx is None else idx + 1
+            logger.debug(f"Not enough data for HV calculation: got {got}, need {lookback_days + 1}")
+            return None
 
-            # 取最近 N+1 天的收盘价 (close 在 index 4)
-            closes = [row[4] for row in eligible[-(lookback_days + 1):]]
+        hv = hv_series[idx]
+        return None if np.isnan(hv) else float(hv)
 
-            # 计算日收益率
-            returns = np.diff(np.log(closes))
+    def _get_hv_series(
+        self,
+        symbol: str,
+        frame: PriceSeries,
+        lookback_days: int,
+    ) -> np.ndarray:
+        """获取 (或构建) 某个 symbol 在全序列上的滚动 HV
 
-            # 年化波动率 (假设 252 个交易日)
-            hv = float(np.std(returns) * np.sqrt(252))
-            return hv
+        Args:
+            symbol: 股票代码
+            frame: kline 全序列 (列式)
+            lookback_days: 回溯天数
 
-        except Exception as e:
-            logger.error(f"Failed to calculate HV for {symbol}: {e}")
-            return None
+        Returns:
+            hv — hv[i] 为截至 frame.dates[i] 的年化 HV (不足窗口为 NaN)
+        """
+        key = (symbol, lookback_days)
+        cached = self._hv_series_cache.get(key)
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+
+        # 总体标准差 (ddof=0)，与原逐日计算口径一致
+        hv_series = calc_hv_series(frame.close, window=lookback_days, ddof=0)
+        self._hv_series_cache[key] = (frame, hv_series)
+        return hv_series
 
     def _get_atm_implied_volatility(self, symbol: str) -> float | None:
         """获取 ATM 期权的平均隐含波动率
@@ -1646,6 +2431,9 @@ class DuckDBProvider(DataProvider):
         Returns:
             平均 IV (小数形式) 或 None
         """
+        if self._is_prefetched(symbol):
+            return self._prefetched_atm_iv.get((symbol, self._as_of_date))
+
         # 获取当前股价
         stock_quote = self.get_stock_quote(symbol)
         if stock_quote is None:
@@ -1659,13 +2447,10 @@ class DuckDBProvider(DataProvider):
             return None
 
         # 确定 Parquet 文件
-        year = self._as_of_date.year
-        parquet_file = option_dir / f"{year}.parquet"
-        if not parquet_file.exists():
-            parquet_files = list(option_dir.glob("*.parquet"))
-            if not parquet_files:
-                return None
-            parquet_file = parquet_files[0]
+        parquet_files = self._option_parquet_files(symbol, self._as_of_date, self._as_of_date)
+        if not parquet_files:
+            return None
+        parquet_list = ", ".join(f"'{pf}'" for pf in parquet_files)
 
         try:
             conn = self._get_conn()
@@ -1677,7 +2462,7 @@ class DuckDBProvider(DataProvider):
             rows = conn.execute(
                 f"""
                 SELECT implied_vol
-                FROM read_parquet('{parquet_file}')
+                FROM read_parquet([{parquet_list}])
                 WHERE date = ?
                   AND strike >= ?
                   AND strike <= ?
@@ -1723,6 +2508,16 @@ class DuckDBProvider(DataProvider):
         Returns:
             (iv_rank, iv_percentile) 元组，不可用时返回 (None, None)
         """
+        # 优先在 atm_iv_daily (或预加载的) 每日 ATM IV 序列上滚动查找
+        window = self._get_iv_rank_window(symbol, lookback_days)
+        if window is not None:
+            iv_rank, iv_percentile = window.rank(self._as_of_date, current_iv)
+            if iv_rank is None and iv_percentile is None:
+                logger.debug(f"Not enough IV history for {symbol} as of {self._as_of_date}")
+            return iv_rank, iv_percentile
+
+        lookback_start = self._as_of_date - timedelta(days=int(lookback_days * 1.5))
+
         option_dir = self._data_dir / "option_daily" / symbol
         if not option_dir.exists():
             return None, None
@@ -1733,9 +2528,6 @@ class DuckDBProvider(DataProvider):
 
         try:
             conn = self._get_conn()
-            from datetime import timedelta
-
-            lookback_start = self._as_of_date - timedelta(days=int(lookback_days * 1.5))
 
             # 从所有相关 parquet 文件查询，用 underlying_price 动态计算每天的 ATM 范围
             union_parts = []
@@ -1758,31 +2550,94 @@ class DuckDBProvider(DataProvider):
                 f"GROUP BY date ORDER BY date"
             ).fetchall()
 
-            if len(rows) < 20:
-                logger.debug(
-                    f"Not enough IV history for {symbol}: {len(rows)} days, need >= 20"
-                )
-                return None, None
+            return self._iv_rank_from_history(symbol, current_iv, [row[1] for row in rows])
 
-            historical_ivs = [row[1] for row in rows if row[1] is not None]
-            if len(historical_ivs) < 20:
-                return None, None
+        except Exception as e:
+            logger.debug(f"Failed to calculate IV rank for {symbol}: {e}")
+            return None, None
 
-            iv_min = min(historical_ivs)
-            iv_max = max(historical_ivs)
+    def _get_iv_rank_window(self, symbol: str, lookback_days: int) -> IVRankWindow | None:
+        """获取 IV Rank 滚动窗口
 
-            # IV Rank
-            iv_rank = None
-            if iv_max > iv_min:
-                iv_rank = (current_iv - iv_min) / (iv_max - iv_min) * 100
-                iv_rank = max(0.0, min(100.0, iv_rank))
+        数据来源优先级: atm_iv_daily.parquet (且不落后于期权数据) > prefetch 加载的历史。
+        都不可用时返回 None，由调用方回退到全量扫描。
+        """
+        key = (symbol, lookback_days)
+        cached = self._iv_rank_windows.get(key)
+        if cached is not None:
+            window, from_prefetch = cached
+            if not from_prefetch or self._prefetched_iv_history_covers(symbol, lookback_days):
+                return window
+            return None
 
-            # IV Percentile
-            lower_count = sum(1 for h in historical_ivs if h < current_iv)
-            iv_percentile = lower_count / len(historical_ivs) * 100
+        series = self._load_atm_iv_series(symbol)
+        from_prefetch = False
+        if series is None:
+            if not self._prefetched_iv_history_covers(symbol, lookback_days):
+                return None
+            _, dates, ivs = self._prefetched_iv_history[symbol]
+            series = (dates, ivs)
+            from_prefetch = True
+
+        window = IVRankWindow(*series, lookback_days=lookback_days)
+        self._iv_rank_windows[key] = (window, from_prefetch)
+        return window
+
+    def _prefetched_iv_history_covers(self, symbol: str, lookback_days: int) -> bool:
+        """预加载的 IV 历史是否覆盖当前日期的回溯窗口"""
+        prefetched = self._prefetched_iv_history.get(symbol)
+        lookback_start = self._as_of_date - timedelta(days=int(lookback_days * 1.5))
+        return (
+            prefetched is not None
+            and self._is_prefetched(symbol)
+            and prefetched[0] <= lookback_start
+        )
 
-            return iv_rank, iv_percentile
+    def _load_atm_iv_series(self, symbol: str) -> tuple[list[date], list[float]] | None:
+        """读取 atm_iv_daily 中某标的的 ATM IV 序列 (落后于期权数据时忽略)"""
+        if symbol in self._atm_iv_series_cache:
+            return self._atm_iv_series_cache[symbol]
 
+        series = None
+        try:
+            if is_atm_iv_stale(self._data_dir, symbol):
+                logger.debug(f"atm_iv_daily missing or stale for {symbol}, using option scan")
+            else:
+                series = load_atm_iv_series(self._data_dir, symbol)
         except Exception as e:
-            logger.debug(f"Failed to calculate IV rank for {symbol}: {e}")
+            logger.warning(f"Failed to load ATM IV series for {symbol}: {e}")
+
+        self._atm_iv_series_cache[symbol] = series
+        return series
+
+    @staticmethod
+    def _iv_rank_from_history(
+        symbol: str,
+        current_iv: float,
+        daily_ivs: list[float | None],
+    ) -> tuple[float | None, float | None]:
+        """由每日 ATM IV 历史计算 IV Rank 和 IV Percentile"""
+        if len(daily_ivs) < 20:
+            logger.debug(
+                f"Not enough IV history for {symbol}: {len(daily_ivs)} days, need >= 20"
+            )
+            return None, None
+
+        historical_ivs = [iv for iv in daily_ivs if iv is not None]
+        if len(historical_ivs) < 20:
             return None, None
+
+        iv_min = min(historical_ivs)
+        iv_max = max(historical_ivs)
+
+        # IV Rank
+        iv_rank = None
+        if iv_max > iv_min:
+            iv_rank = (current_iv - iv_min) / (iv_max - iv_min) * 100
+            iv_rank = max(0.0, min(100.0, iv_rank))
+
+        # IV Percentile
+        lower_count = sum(1 for h in historical_ivs if h < current_iv)
+        iv_percentile = lower_count / len(historical_ivs) * 100
+
+        return iv_rank, iv_percentile
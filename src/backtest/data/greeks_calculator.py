@@ -5,6 +5,7 @@ Greeks Calculator - 基于 Black-Scholes 模型计算 IV 和 Greeks
 
 计算公式:
     IV: 使用 Brent 方法求解 BS_price(σ) = market_price
+        (批量: 有理近似初值 + 带区间保护的 Newton 迭代，整列同时求解)
     Delta: ∂V/∂S = N(d1) for call, N(d1) - 1 for put
     Gamma: ∂²V/∂S² = φ(d1) / (S * σ * √T)
     Theta: ∂V/∂t (time decay per day)
@@ -27,8 +28,12 @@ Usage:
     )
     print(f"IV: {result.iv:.2%}, Delta: {result.delta:.4f}")
 
+    # 批量计算 (NumPy 数组，一次求解整天/整年的期权)
+    batch = calc.calculate_batch(prices, spots, strikes, ttes, rate=0.05, is_call=is_calls)
+    print(batch.iv[batch.is_valid])
+
     # 批量计算 (从 OptionEOD + StockEOD)
-    enriched = calc.enrich_options(options_eod, stock_eod_map, rate=0.045)
+    enriched = calc.enrich_options_batch(options_eod, stock_eod_map, rate=0.045)
 """
 
 import logging
@@ -37,11 +42,21 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Literal
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 from scipy.optimize import brentq
+from scipy.special import ndtr
 from scipy.stats import norm
 
 logger = logging.getLogger(__name__)
 
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _norm_pdf(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """标准正态分布密度 φ(x) (数组版本)"""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
 
 @dataclass
 class GreeksResult:
@@ -62,6 +77,39 @@ class GreeksResult:
     error_msg: str | None = None
 
 
+@dataclass
+class BatchGreeksResult:
+    """批量 Greeks 计算结果 (每个字段与输入行一一对应)
+
+    无效行的数值字段为 0，error_msgs 给出失败原因。
+    """
+
+    iv: NDArray[np.float64]
+    delta: NDArray[np.float64]
+    gamma: NDArray[np.float64]
+    theta: NDArray[np.float64]
+    vega: NDArray[np.float64]
+    rho: NDArray[np.float64]
+    is_valid: NDArray[np.bool_]
+    error_msgs: list[str | None]
+
+    def __len__(self) -> int:
+        return len(self.iv)
+
+    def row(self, i: int) -> GreeksResult:
+        """第 i 行的 GreeksResult"""
+        return GreeksResult(
+            iv=float(self.iv[i]),
+            delta=float(self.delta[i]),
+            gamma=float(self.gamma[i]),
+            theta=float(self.theta[i]),
+            vega=float(self.vega[i]),
+            rho=float(self.rho[i]),
+            is_valid=bool(self.is_valid[i]),
+            error_msg=self.error_msgs[i],
+        )
+
+
 @dataclass
 class OptionWithGreeks:
     """期权数据 + 计算的 Greeks"""
@@ -103,6 +151,7 @@ class GreeksCalculator:
 
     Features:
         - IV 求解: Brent 方法，收敛快速稳定
+        - 批量 IV 求解: 数组化 Newton 迭代 (calculate_batch)
         - Greeks 计算: Delta, Gamma, Theta, Vega, Rho
         - 批量处理: 从 OptionEOD + StockEOD 批量计算
         - 异常处理: 深度 OTM/ITM 期权的边界情况
@@ -119,6 +168,10 @@ class GreeksCalculator:
     # 最小时间价值 (避免除零)
     MIN_TTE = 1 / 365  # 1 day
 
+    # 批量 IV 求解: 最大迭代次数与收敛精度 (与 brentq xtol 同量级)
+    BATCH_MAX_ITER = 60
+    BATCH_IV_TOL = 1e-8
+
     def __init__(self, dividend_yield: float = 0.0):
         """初始化计算器
 
@@ -239,24 +292,14 @@ class GreeksCalculator:
 
         if option_price < price_at_min:
             # 价格低于最低 IV 对应的价格
-            # 添加详细信息帮助调试
-            moneyness = spot / strike
-            intrinsic = max(0, spot - strike) if is_call else max(0, strike - spot)
-            otm_itm = "ITM" if (is_call and spot > strike) or (not is_call and spot < strike) else "OTM"
             raise ValueError(
-                f"Price too low for IV solve: price={option_price:.4f} < min_bs={price_at_min:.4f}, "
-                f"spot={spot:.2f}, strike={strike:.2f}, tte={tte:.4f}, "
-                f"{'CALL' if is_call else 'PUT'} {otm_itm}, moneyness={moneyness:.2%}, intrinsic={intrinsic:.2f}"
+                self._iv_bound_error(option_price, price_at_min, spot, strike, tte, is_call)
             )
 
         if option_price > price_at_max:
             # 价格高于最高 IV 对应的价格
-            moneyness = spot / strike
-            otm_itm = "ITM" if (is_call and spot > strike) or (not is_call and spot < strike) else "OTM"
             raise ValueError(
-                f"Price too high for IV solve: price={option_price:.4f} > max_bs={price_at_max:.4f}, "
-                f"spot={spot:.2f}, strike={strike:.2f}, tte={tte:.4f}, "
-                f"{'CALL' if is_call else 'PUT'} {otm_itm}, moneyness={moneyness:.2%}"
+                self._iv_bound_error(option_price, price_at_max, spot, strike, tte, is_call)
             )
 
         # Brent 方法求解
@@ -266,6 +309,31 @@ class GreeksCalculator:
         except ValueError as e:
             raise ValueError(f"Brent solver failed: {e}")
 
+    @staticmethod
+    def _iv_bound_error(
+        option_price: float,
+        bound_price: float,
+        spot: float,
+        strike: float,
+        tte: float,
+        is_call: bool,
+    ) -> str:
+        """价格超出 [IV_MIN, IV_MAX] 对应 BS 价格区间时的错误信息 (含调试详情)"""
+        moneyness = spot / strike
+        otm_itm = "ITM" if (is_call and spot > strike) or (not is_call and spot < strike) else "OTM"
+        if option_price < bound_price:
+            intrinsic = max(0, spot - strike) if is_call else max(0, strike - spot)
+            return (
+                f"Price too low for IV solve: price={option_price:.4f} < min_bs={bound_price:.4f}, "
+                f"spot={spot:.2f}, strike={strike:.2f}, tte={tte:.4f}, "
+                f"{'CALL' if is_call else 'PUT'} {otm_itm}, moneyness={moneyness:.2%}, intrinsic={intrinsic:.2f}"
+            )
+        return (
+            f"Price too high for IV solve: price={option_price:.4f} > max_bs={bound_price:.4f}, "
+            f"spot={spot:.2f}, strike={strike:.2f}, tte={tte:.4f}, "
+            f"{'CALL' if is_call else 'PUT'} {otm_itm}, moneyness={moneyness:.2%}"
+        )
+
     def _bs_price(
         self,
         spot: float,
@@ -382,7 +450,264 @@ class GreeksCalculator:
             "rho": rho,
         }
 
-    def enrich_option( 
+    # ========== 批量计算 (NumPy 数组) ==========
+
+    def calculate_batch(
+        self,
+        option_price: ArrayLike,
+        spot: ArrayLike,
+        strike: ArrayLike,
+        tte: ArrayLike,
+        rate: ArrayLike,
+        is_call: ArrayLike,
+    ) -> BatchGreeksResult:
+        """批量计算 IV 和 Greeks (calculate 的数组版本)
+
+        所有输入按 NumPy 规则广播，整列同时求解:
+        有理近似 (Corrado-Miller) 给出初值，再做带区间保护的 Newton 迭代，
+        牛顿步越出当前区间时退化为二分，保证每行都收敛到 [IV_MIN, IV_MAX] 内。
+        参数校验、边界检查与失败原因和 calculate 逐行一致。
+
+        Args:
+            option_price: 期权价格 (mid price)
+            spot: 标的现价
+            strike: 行权价
+            tte: 到期时间 (年化)
+            rate: 无风险利率
+            is_call: True = Call, False = Put
+
+        Returns:
+            BatchGreeksResult
+        """
+        price, s, k, t, r, call = (
+            a.ravel()
+            for a in np.broadcast_arrays(
+                np.asarray(option_price, dtype=np.float64),
+                np.asarray(spot, dtype=np.float64),
+                np.asarray(strike, dtype=np.float64),
+                np.asarray(tte, dtype=np.float64),
+                np.asarray(rate, dtype=np.float64),
+                np.asarray(is_call, dtype=bool),
+            )
+        )
+        n = price.size
+        result = BatchGreeksResult(
+            iv=np.zeros(n),
+            delta=np.zeros(n),
+            gamma=np.zeros(n),
+            theta=np.zeros(n),
+            vega=np.zeros(n),
+            rho=np.zeros(n),
+            is_valid=np.zeros(n, dtype=bool),
+            error_msgs=[None] * n,
+        )
+        pending = np.ones(n, dtype=bool)
+
+        def reject(mask: NDArray[np.bool_], message) -> None:
+            for i in np.flatnonzero(mask & pending):
+                result.error_msgs[i] = message(i)
+            pending[mask] = False
+
+        # 参数验证
+        with np.errstate(invalid="ignore"):
+            reject(~(price > 0), lambda i: "Invalid option price <= 0")
+            reject(~((s > 0) & (k > 0)), lambda i: "Invalid spot or strike <= 0")
+
+        # 确保最小 TTE
+        t = np.maximum(t, self.MIN_TTE)
+
+        # 检查套利边界
+        intrinsic = np.where(call, np.maximum(s - k, 0), np.maximum(k - s, 0))
+        time_value = price - intrinsic
+        below = (time_value < -0.01) & pending
+        result.delta[below] = np.where(call[below], 1.0, -1.0)
+        reject(below, lambda i: f"Price below intrinsic value (TV={time_value[i]:.4f})")
+
+        # 检查 IV 边界
+        idx = np.flatnonzero(pending)
+        price_at_min = np.full(n, np.nan)
+        price_at_max = np.full(n, np.nan)
+        price_at_min[idx] = self._bs_price_array(s[idx], k[idx], t[idx], r[idx], self.IV_MIN, call[idx])
+        price_at_max[idx] = self._bs_price_array(s[idx], k[idx], t[idx], r[idx], self.IV_MAX, call[idx])
+
+        def bound_error(i: int) -> str:
+            bound = price_at_min[i] if price[i] < price_at_min[i] else price_at_max[i]
+            return self._iv_bound_error(
+                float(price[i]), float(bound), float(s[i]), float(k[i]), float(t[i]), bool(call[i])
+            )
+
+        reject(pending & (price < price_at_min), bound_error)
+        reject(pending & (price > price_at_max), bound_error)
+
+        # 求解 IV
+        idx = np.flatnonzero(pending)
+        iv, converged = self._solve_iv_array(price[idx], s[idx], k[idx], t[idx], r[idx], call[idx])
+        reject(
+            np.isin(np.arange(n), idx[~converged]),
+            lambda i: f"IV solver did not converge in {self.BATCH_MAX_ITER} iterations",
+        )
+
+        # 计算 Greeks
+        idx, iv = idx[converged], iv[converged]
+        greeks = self._calculate_greeks_array(s[idx], k[idx], t[idx], r[idx], iv, call[idx])
+        result.iv[idx] = iv
+        for name, values in greeks.items():
+            getattr(result, name)[idx] = values
+        result.is_valid[idx] = True
+
+        return result
+
+    def _solve_iv_array(
+        self,
+        option_price: NDArray[np.float64],
+        spot: NDArray[np.float64],
+        strike: NDArray[np.float64],
+        tte: NDArray[np.float64],
+        rate: NDArray[np.float64],
+        is_call: NDArray[np.bool_],
+    ) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        """带区间保护的批量 Newton 求解 IV
+
+        调用前需保证 BS(IV_MIN) <= price <= BS(IV_MAX)。每轮迭代用当前点的符号
+        收紧 [lo, hi]，牛顿步落在区间外 (或 vega 过小) 时改用二分。
+        只对未收敛的行继续计算。
+
+        Returns:
+            (iv, converged)
+        """
+        n = option_price.size
+        lo = np.full(n, self.IV_MIN)
+        hi = np.full(n, self.IV_MAX)
+        vol = np.clip(
+            self._iv_initial_guess(option_price, spot, strike, tte, rate, is_call),
+            self.IV_MIN,
+            self.IV_MAX,
+        )
+        converged = np.zeros(n, dtype=bool)
+        active = np.arange(n)
+
+        for _ in range(self.BATCH_MAX_ITER):
+            if active.size == 0:
+                break
+            a = active
+            v = vol[a]
+            diff = self._bs_price_array(spot[a], strike[a], tte[a], rate[a], v, is_call[a]) - option_price[a]
+            vega = self._vega_array(spot[a], strike[a], tte[a], rate[a], v)
+
+            # 收紧区间: BS 价格随 σ 单调递增
+            above = diff > 0
+            hi[a] = np.where(above, v, hi[a])
+            lo[a] = np.where(above, lo[a], v)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                newton = v - diff / vega
+            use_bisect = ~np.isfinite(newton) | (newton <= lo[a]) | (newton >= hi[a])
+            new = np.where(use_bisect, 0.5 * (lo[a] + hi[a]), newton)
+
+            exact = diff == 0
+            new = np.where(exact, v, new)
+            done = exact | (np.abs(new - v) < self.BATCH_IV_TOL) | (hi[a] - lo[a] < self.BATCH_IV_TOL)
+
+            vol[a] = new
+            converged[a[done]] = True
+            active = a[~done]
+
+        return vol, converged
+
+    def _iv_initial_guess(
+        self,
+        option_price: NDArray[np.float64],
+        spot: NDArray[np.float64],
+        strike: NDArray[np.float64],
+        tte: NDArray[np.float64],
+        rate: NDArray[np.float64],
+        is_call: NDArray[np.bool_],
+    ) -> NDArray[np.float64]:
+        """Corrado-Miller 有理近似初值 (Put 先经平价关系换算为 Call 价格)"""
+        fwd_spot = spot * np.exp(-self.q * tte)
+        disc_strike = strike * np.exp(-rate * tte)
+        call_price = np.where(is_call, option_price, option_price + fwd_spot - disc_strike)
+
+        x = call_price - (fwd_spot - disc_strike) / 2
+        disc = np.maximum(x * x - (fwd_spot - disc_strike) ** 2 / np.pi, 0.0)
+        guess = np.sqrt(2 * np.pi / tte) / (fwd_spot + disc_strike) * (x + np.sqrt(disc))
+        return np.where(np.isfinite(guess) & (guess > 0), guess, 0.3)
+
+    def _bs_price_array(
+        self,
+        spot: NDArray[np.float64],
+        strike: NDArray[np.float64],
+        tte: NDArray[np.float64],
+        rate: NDArray[np.float64],
+        vol: ArrayLike,
+        is_call: NDArray[np.bool_],
+    ) -> NDArray[np.float64]:
+        """Black-Scholes 期权定价 (数组版本，含股息率)"""
+        d1, d2 = self._d1_d2_array(spot, strike, tte, rate, vol)
+        sign = np.where(is_call, 1.0, -1.0)
+        return sign * (
+            spot * np.exp(-self.q * tte) * ndtr(sign * d1)
+            - strike * np.exp(-rate * tte) * ndtr(sign * d2)
+        )
+
+    def _vega_array(
+        self,
+        spot: NDArray[np.float64],
+        strike: NDArray[np.float64],
+        tte: NDArray[np.float64],
+        rate: NDArray[np.float64],
+        vol: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """∂V/∂σ (未缩放，用于 Newton 迭代)"""
+        d1, _ = self._d1_d2_array(spot, strike, tte, rate, vol)
+        return spot * np.exp(-self.q * tte) * _norm_pdf(d1) * np.sqrt(tte)
+
+    def _d1_d2_array(
+        self,
+        spot: NDArray[np.float64],
+        strike: NDArray[np.float64],
+        tte: NDArray[np.float64],
+        rate: NDArray[np.float64],
+        vol: ArrayLike,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """计算 d1 和 d2 (数组版本)"""
+        sqrt_t = np.sqrt(tte)
+        d1 = (np.log(spot / strike) + (rate - self.q + 0.5 * np.square(vol)) * tte) / (vol * sqrt_t)
+        return d1, d1 - vol * sqrt_t
+
+    def _calculate_greeks_array(
+        self,
+        spot: NDArray[np.float64],
+        strike: NDArray[np.float64],
+        tte: NDArray[np.float64],
+        rate: NDArray[np.float64],
+        vol: NDArray[np.float64],
+        is_call: NDArray[np.bool_],
+    ) -> dict[str, NDArray[np.float64]]:
+        """计算所有 Greeks (数组版本，口径同 _calculate_greeks)"""
+        d1, d2 = self._d1_d2_array(spot, strike, tte, rate, vol)
+        sqrt_t = np.sqrt(tte)
+        sign = np.where(is_call, 1.0, -1.0)
+        div = np.exp(-self.q * tte)
+        disc = np.exp(-rate * tte)
+        phi_d1 = _norm_pdf(d1)
+        # Call: N(d1), N(d2)；Put: N(-d1), N(-d2)
+        n_d1 = ndtr(sign * d1)
+        n_d2 = ndtr(sign * d2)
+
+        return {
+            "delta": sign * div * n_d1,
+            "gamma": div * phi_d1 / (spot * vol * sqrt_t),
+            "theta": (
+                -spot * div * phi_d1 * vol / (2 * sqrt_t)
+                - sign * rate * strike * disc * n_d2
+                + sign * self.q * spot * div * n_d1
+            ) / 365,
+            "vega": spot * div * phi_d1 * sqrt_t / 100,
+            "rho": sign * strike * tte * disc * n_d2 / 100,
+        }
+
+    def enrich_option(
         self,
         option_price: float,
         spot: float,
@@ -465,14 +790,12 @@ class GreeksCalculator:
         Returns:
             OptionWithGreeks 列表 (过滤掉计算失败的)
         """
-        results = []
-        failed_count = 0
-
+        # 先筛出可计算的行，再整列求解 IV / Greeks
+        rows = []
         for opt in options:
             # 获取对应日期的标的价格
             spot = stock_prices.get(opt.date)
             if spot is None:
-                failed_count += 1
                 continue
 
             # 计算 mid price
@@ -481,29 +804,51 @@ class GreeksCalculator:
             elif opt.close > 0:
                 mid_price = opt.close
             else:
-                failed_count += 1
                 continue
 
-            # 计算 Greeks
-            enriched = self.enrich_option(
-                option_price=mid_price,
-                spot=spot,
-                strike=opt.strike,
-                expiration=opt.expiration,
-                as_of_date=opt.date,
-                rate=rate,
-                is_call=(opt.option_type == "call"),
-                symbol=opt.symbol,
-                bid=opt.bid,
-                ask=opt.ask,
-                volume=opt.volume,
-            )
+            dte = (opt.expiration - opt.date).days
+            if dte <= 0:
+                continue
 
-            if enriched:
-                results.append(enriched)
-            else:
-                failed_count += 1
+            rows.append((opt, spot, mid_price, dte))
 
+        results = []
+        if rows:
+            batch = self.calculate_batch(
+                option_price=[r[2] for r in rows],
+                spot=[r[1] for r in rows],
+                strike=[r[0].strike for r in rows],
+                tte=[r[3] / 365.0 for r in rows],
+                rate=rate,
+                is_call=[r[0].option_type == "call" for r in rows],
+            )
+            for i in np.flatnonzero(batch.is_valid):
+                opt, spot, mid_price, dte = rows[i]
+                results.append(
+                    OptionWithGreeks(
+                        symbol=opt.symbol,
+                        expiration=opt.expiration,
+                        strike=opt.strike,
+                        option_type="call" if opt.option_type == "call" else "put",
+                        date=opt.date,
+                        bid=opt.bid,
+                        ask=opt.ask,
+                        close=mid_price,
+                        volume=opt.volume,
+                        underlying_price=spot,
+                        iv=float(batch.iv[i]),
+                        delta=float(batch.delta[i]),
+                        gamma=float(batch.gamma[i]),
+                        theta=float(batch.theta[i]),
+                        vega=float(batch.vega[i]),
+                        rho=float(batch.rho[i]),
+                        mid_price=mid_price,
+                        dte=dte,
+                        moneyness=spot / opt.strike,
+                    )
+                )
+
+        failed_count = len(options) - len(results)
         if failed_count > 0:
             logger.info(
                 f"Greeks calculation: {len(results)} success, {failed_count} failed"
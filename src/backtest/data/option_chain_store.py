@@ -0,0 +1,283 @@
+"""
+Option Chain Store - 按交易日对齐 row group 的期权链列式存储
+
+option_daily/<SYM>/<year>.parquet 不保证按日期排序，DuckDBProvider 每个交易日都要
+对整年文件做一次 `WHERE date = ?` 谓词扫描。本模块提供一次性的导入步骤，把期权数据
+重写为:
+
+- 按 (date, expiration, strike, option_type) 排序
+- 每个交易日恰好一个 row group
+- 旁路 JSON 索引: 日期 -> row group 序号
+
+读取某天的期权链只需一次字典查找 + 一次 `ParquetFile.read_row_group`，
+与文件大小 (历史年数) 无关。
+
+存储路径:
+    store_dir/
+    ├── SPY.parquet         # 排序后的期权数据，每个交易日一个 row group
+    ├── SPY.index.json      # {"symbol": ..., "num_rows": ..., "row_groups": {"2024-01-02": 0, ...}}
+    └── ...
+
+Usage:
+    build_option_chain_store("/Volumes/TradingData/processed", "/tmp/chain_store", ["SPY"])
+
+    store = OptionChainStore("/tmp/chain_store")
+    table = store.read_day("SPY", date(2024, 1, 2))  # pyarrow.Table 或 None
+"""
+
+import json
+import logging
+from datetime import date
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# 期权链排序键 (与 DuckDBProvider.get_option_chain 的 ORDER BY 一致)
+OPTION_CHAIN_SORT_KEYS = ("date", "expiration", "strike", "option_type")
+
+# DuckDBProvider 构建 OptionQuote 所需的列 (顺序即行元组顺序)
+OPTION_CHAIN_COLUMNS = (
+    "symbol", "expiration", "strike", "option_type", "date",
+    "open", "high", "low", "close", "volume", "count",
+    "bid", "ask", "delta", "gamma", "theta", "vega", "rho",
+    "implied_vol", "underlying_price", "open_interest",
+)
+
+
+def get_store_paths(store_dir: Path | str, symbol: str) -> tuple[Path, Path]:
+    """获取某标的的数据文件与索引文件路径
+
+    Args:
+        store_dir: 存储目录
+        symbol: 标的代码
+
+    Returns:
+        (parquet 路径, 索引 JSON 路径)
+    """
+    store_dir = Path(store_dir)
+    symbol = symbol.upper()
+    return store_dir / f"{symbol}.parquet", store_dir / f"{symbol}.index.json"
+
+
+def build_option_chain_store(
+    data_dir: Path | str,
+    store_dir: Path | str,
+    symbols: list[str] | None = None,
+) -> list[str]:
+    """将 option_daily Parquet 重写为按交易日对齐 row group 的存储
+
+    Args:
+        data_dir: 数据根目录 (包含 option_daily/)
+        store_dir: 输出目录
+        symbols: 要导入的标的列表 (None 表示全部)
+
+    Returns:
+        成功导入的标的列表
+    """
+    option_base = Path(data_dir) / "option_daily"
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    if not option_base.exists():
+        logger.warning(f"Option data directory not found: {option_base}")
+        return []
+
+    if symbols:
+        symbol_dirs = [option_base / s.upper() for s in symbols]
+        symbol_dirs = [d for d in symbol_dirs if d.exists()]
+    else:
+        symbol_dirs = sorted(d for d in option_base.iterdir() if d.is_dir())
+
+    built: list[str] = []
+    conn = duckdb.connect()
+    try:
+        for symbol_dir in symbol_dirs:
+            parquet_files = sorted(symbol_dir.glob("*.parquet"))
+            if not parquet_files:
+                continue
+            if _build_symbol_store(conn, symbol_dir.name, parquet_files, store_dir):
+                built.append(symbol_dir.name)
+    finally:
+        conn.close()
+
+    logger.info(f"Built option chain store for {len(built)} symbols at {store_dir}")
+    return built
+
+
+def _build_symbol_store(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    parquet_files: list[Path],
+    store_dir: Path,
+) -> bool:
+    """导入单个标的: 逐文件排序后按交易日写 row group"""
+    data_path, index_path = get_store_paths(store_dir, symbol)
+    tmp_path = data_path.with_suffix(".parquet.tmp")
+    order_by = ", ".join(OPTION_CHAIN_SORT_KEYS)
+
+    row_groups: dict[str, int] = {}
+    num_rows = 0
+    schema: pa.Schema | None = None
+    writer: pq.ParquetWriter | None = None
+
+    try:
+        # 年度文件按文件名 (年份) 顺序处理，每次只在内存中保留一个文件
+        for pf in parquet_files:
+            table = conn.execute(
+                f"SELECT * FROM read_parquet('{pf}') ORDER BY {order_by}"
+            ).fetch_arrow_table()
+            if table.num_rows == 0:
+                continue
+
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(tmp_path, schema)
+            else:
+                table = table.select(schema.names).cast(schema)
+
+            for day, day_table in split_table_by_date(table):
+                key = day.isoformat()
+                if key in row_groups:
+                    logger.warning(f"{symbol}: duplicate date {key} in {pf.name}, skipped")
+                    continue
+                # row_group_size = 当天行数 → 每个交易日恰好一个 row group
+                writer.write_table(day_table, row_group_size=day_table.num_rows)
+                row_groups[key] = len(row_groups)
+                num_rows += day_table.num_rows
+    except Exception as e:
+        logger.error(f"Failed to build option chain store for {symbol}: {e}")
+        if writer is not None:
+            writer.close()
+        tmp_path.unlink(missing_ok=True)
+        return False
+
+    if writer is None:
+        return False
+
+    writer.close()
+    tmp_path.replace(data_path)
+    index_path.write_text(
+        json.dumps({"symbol": symbol, "num_rows": num_rows, "row_groups": row_groups})
+    )
+    logger.debug(f"{symbol}: {len(row_groups)} trading days, {num_rows} rows")
+    return True
+
+
+def split_table_by_date(table: pa.Table):
+    """按 date 列切分已排序的表，逐日产出 (date, 子表)"""
+    days = table.column("date").to_numpy()
+    # 排序后日期变化的位置即为每个交易日的起点
+    starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+    ends = np.r_[starts[1:], len(days)]
+    for start, end in zip(starts, ends):
+        day = days[start].astype("datetime64[D]").item()
+        yield day, table.slice(int(start), int(end - start))
+
+
+class OptionChainStore:
+    """按交易日 row group 读取期权链
+
+    每个标的的索引与 ParquetFile 句柄在首次访问时加载并缓存，
+    之后读取任意一天都是 O(1) 查找 + 单个 row group 读取。
+    """
+
+    def __init__(self, store_dir: Path | str) -> None:
+        """初始化
+
+        Args:
+            store_dir: build_option_chain_store 的输出目录
+        """
+        self._store_dir = Path(store_dir)
+        # symbol -> {date: row_group}，None 表示该标的不在存储中
+        self._indexes: dict[str, dict[date, int] | None] = {}
+        # symbol -> (首日, 末日)，随索引一起加载
+        self._ranges: dict[str, tuple[date, date]] = {}
+        self._files: dict[str, pq.ParquetFile] = {}
+
+    @property
+    def store_dir(self) -> Path:
+        """存储目录"""
+        return self._store_dir
+
+    def _get_index(self, symbol: str) -> dict[date, int] | None:
+        """加载并缓存某标的的日期索引"""
+        symbol = symbol.upper()
+        if symbol in self._indexes:
+            return self._indexes[symbol]
+
+        data_path, index_path = get_store_paths(self._store_dir, symbol)
+        index: dict[date, int] | None = None
+        if data_path.exists() and index_path.exists():
+            try:
+                raw = json.loads(index_path.read_text())
+                index = {
+                    date.fromisoformat(d): rg for d, rg in raw["row_groups"].items()
+                }
+            except Exception as e:
+                logger.warning(f"Invalid option chain index for {symbol}: {e}")
+
+        self._indexes[symbol] = index
+        if index:
+            self._ranges[symbol] = (min(index), max(index))
+        return index
+
+    def has_symbol(self, symbol: str) -> bool:
+        """该标的是否已导入"""
+        return self._get_index(symbol) is not None
+
+    def date_range(self, symbol: str) -> tuple[date, date] | None:
+        """该标的已导入数据的日期范围
+
+        Returns:
+            (首日, 末日)，未导入时返回 None
+        """
+        if not self._get_index(symbol):
+            return None
+        return self._ranges[symbol.upper()]
+
+    def read_day(
+        self,
+        symbol: str,
+        d: date,
+        columns: list[str] | tuple[str, ...] | None = None,
+    ) -> pa.Table | None:
+        """读取某标的某天的全部期权数据
+
+        Args:
+            symbol: 标的代码
+            d: 数据日期
+            columns: 要读取的列 (None 表示全部)
+
+        Returns:
+            按 (expiration, strike, option_type) 排序的 pyarrow.Table，
+            该天无数据时返回 None
+        """
+        symbol = symbol.upper()
+        index = self._get_index(symbol)
+        if index is None:
+            return None
+
+        rg = index.get(d)
+        if rg is None:
+            return None
+
+        pf = self._files.get(symbol)
+        if pf is None:
+            data_path, _ = get_store_paths(self._store_dir, symbol)
+            pf = pq.ParquetFile(data_path)
+            self._files[symbol] = pf
+
+        return pf.read_row_group(rg, columns=list(columns) if columns else None)
+
+    def close(self) -> None:
+        """释放文件句柄与索引"""
+        for pf in self._files.values():
+            pf.close()
+        self._files.clear()
+        self._indexes.clear()
+        self._ranges.clear()
@@ -12,11 +12,15 @@ DuckDB Schema - 回测数据表结构定义
     ├── stock_daily.parquet         # 所有股票的日线数据
     └── option_daily/               # 按标的分区的期权数据
         ├── AAPL/
-        │   ├── 2020.parquet
-        │   ├── 2021.parquet
+        │   ├── 2020.parquet        # 旧版: 按年一个文件
+        │   ├── 2024-01.parquet     # 新版: 按月分区 (增量写入只重写涉及的月份)
+        │   ├── 2024-02.parquet
         │   └── ...
         └── MSFT/
             └── ...
+
+同一年份不会同时存在年度文件和月度分区: 写入某年数据时，
+旧版年度文件会先被拆分为月度分区 (见 DataDownloader._save_option_parquet)。
 """
 
 from dataclasses import dataclass
@@ -212,6 +216,7 @@ def get_parquet_path(
     data_type: Literal["stock", "option"],
     symbol: str | None = None,
     year: int | None = None,
+    month: int | None = None,
 ) -> Path:
     """获取 Parquet 文件路径
 
@@ -220,6 +225,7 @@ def get_parquet_path(
         data_type: 数据类型 ("stock" 或 "option")
         symbol: 标的代码 (option 必须)
         year: 年份 (option 可选)
+        month: 月份 (option 可选，需同时指定 year，返回月度分区路径)
 
     Returns:
         Parquet 文件路径
@@ -230,6 +236,9 @@ def get_parquet_path(
 
         >>> get_parquet_path("/data", "option", "AAPL", 2024)
         Path("/data/option_daily/AAPL/2024.parquet")
+
+        >>> get_parquet_path("/data", "option", "AAPL", 2024, 3)
+        Path("/data/option_daily/AAPL/2024-03.parquet")
     """
     data_dir = Path(data_dir)
 
@@ -242,7 +251,9 @@ def get_parquet_path(
 
         option_dir = data_dir / "option_daily" / symbol.upper()
 
-        if year:
+        if year and month:
+            return option_dir / f"{year}-{month:02d}.parquet"
+        elif year:
             return option_dir / f"{year}.parquet"
         else:
             return option_dir
@@ -251,6 +262,50 @@ def get_parquet_path(
         raise ValueError(f"Unknown data_type: {data_type}")
 
 
+def get_option_parquet_files(
+    data_dir: Path | str,
+    symbol: str,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> list[Path]:
+    """获取覆盖日期范围的期权 Parquet 文件 (兼容年度文件和月度分区)
+
+    Args:
+        data_dir: 数据根目录
+        symbol: 标的代码
+        start_date: 开始日期 (None 表示不限)
+        end_date: 结束日期 (None 表示不限)
+
+    Returns:
+        按文件名排序的路径列表。范围内没有匹配文件时回退到该标的全部文件
+        (与旧版 "当年文件不存在则读全部" 的行为一致)。
+    """
+    option_dir = Path(data_dir) / "option_daily" / symbol.upper()
+    if not option_dir.exists():
+        return []
+
+    all_files = sorted(option_dir.glob("*.parquet"))
+    if start_date is None and end_date is None:
+        return all_files
+
+    lo = (start_date.year, start_date.month) if start_date else (0, 0)
+    hi = (end_date.year, end_date.month) if end_date else (9999, 12)
+
+    files = []
+    for path in all_files:
+        year_str, _, month_str = path.stem.partition("-")
+        if not year_str.isdigit():
+            continue
+        year = int(year_str)
+        if month_str.isdigit():
+            if lo <= (year, int(month_str)) <= hi:
+                files.append(path)
+        elif lo[0] <= year <= hi[0]:
+            files.append(path)
+
+    return files or all_files
+
+
 def init_duckdb_schema(conn) -> None:
     """初始化 DuckDB 表结构
 
@@ -0,0 +1,353 @@
+"""
+Shared Data Plane - 并行回测的只读共享数据
+
+ParallelBacktestRunner 的每个 worker 进程原本各自创建 DuckDBProvider，
+同一份期权 Parquet 被读取、解码 N 次，K 线/宏观缓存也各存一份。
+
+本模块由父进程一次性把回测区间内所需数据导出为未压缩的 Arrow IPC 文件，
+worker 通过内存映射 (memory map) 零拷贝挂载: 所有进程共享操作系统 page cache
+中的同一份数据，每个 worker 只为当天用到的期权链构建 OptionChainFrame。
+
+K 线/宏观的 PriceSeries 直接由映射的列构建 (无空值的浮点列零拷贝)。
+限制: DuckDBProvider 的按日报价与预加载仍以行元组为单位，stock_rows /
+macro_rows 会在每个 worker 中把日线转换为 Python 元组各存一份；日线数据量
+远小于期权数据，这部分内存未共享。
+
+目录结构:
+    plane_dir/
+    ├── manifest.json          # 标的、日期范围、每个标的期权数据的按日偏移
+    ├── stock_daily.arrow      # symbol, date, open, high, low, close, volume
+    ├── macro_daily.arrow      # indicator, date, open, high, low, close
+    ├── atm_iv.arrow           # symbol, date, atm_iv (口径同 _get_atm_implied_volatility)
+    └── option_<SYM>.arrow     # OPTION_CHAIN_COLUMNS，按 (date, expiration, strike, option_type) 排序
+
+Usage:
+    # 父进程
+    build_shared_data(data_dir, plane_dir, ["SPY", "QQQ"], start, end)
+
+    # worker 进程
+    provider = DuckDBProvider(data_dir=data_dir, as_of_date=start)
+    provider.attach_shared_data(SharedDataPlane(plane_dir))
+"""
+
+import json
+import logging
+from datetime import date
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+
+from src.backtest.data.atm_iv_daily import query_mean_atm_iv
+from src.backtest.data.option_chain_store import OPTION_CHAIN_COLUMNS, split_table_by_date
+from src.backtest.data.schema import get_option_parquet_files
+from src.data.models.price_series import PriceSeries
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _write_ipc(table: pa.Table, path: Path) -> None:
+    """写入未压缩的 Arrow IPC 文件 (可内存映射零拷贝读取)"""
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _option_files(data_dir: Path, symbol: str, start_date: date, end_date: date) -> list[Path]:
+    """覆盖日期范围的期权文件 (无对应文件时回退到全部文件)"""
+    return get_option_parquet_files(data_dir, symbol, start_date, end_date)
+
+
+def build_shared_data(
+    data_dir: Path | str,
+    plane_dir: Path | str,
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    max_dte: int | None = None,
+) -> dict:
+    """导出回测区间内的共享数据 (在父进程中调用一次)
+
+    Args:
+        data_dir: 数据根目录
+        plane_dir: 输出目录
+        symbols: 标的列表
+        start_date: 开始日期
+        end_date: 结束日期
+        max_dte: 只导出到期天数 <= max_dte 的期权 (None 表示全部到期日)
+
+    Returns:
+        manifest 字典
+    """
+    data_dir = Path(data_dir)
+    plane_dir = Path(plane_dir)
+    plane_dir.mkdir(parents=True, exist_ok=True)
+    symbols = sorted({s.upper() for s in symbols})
+
+    manifest: dict = {
+        "data_dir": str(data_dir),
+        "symbols": symbols,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "max_dte": max_dte,
+        "options": {},
+    }
+
+    conn = duckdb.connect(":memory:")
+    try:
+        # 1. 股票日线 (全序列: 波动率等指标需要回溯历史)
+        stock_path = data_dir / "stock_daily.parquet"
+        stock_table = None
+        if stock_path.exists() and symbols:
+            placeholders = ", ".join("?" for _ in symbols)
+            stock_table = conn.execute(
+                f"""
+                SELECT symbol, date, open, high, low, close, volume
+                FROM read_parquet('{stock_path}')
+                WHERE symbol IN ({placeholders})
+                ORDER BY symbol, date
+                """,
+                symbols,
+            ).fetch_arrow_table()
+            _write_ipc(stock_table, plane_dir / "stock_daily.arrow")
+
+        # 2. 宏观数据 (全部指标)
+        macro_path = data_dir / "macro_daily.parquet"
+        if macro_path.exists():
+            macro_table = conn.execute(
+                f"""
+                SELECT indicator, date, open, high, low, close
+                FROM read_parquet('{macro_path}')
+                ORDER BY indicator, date
+                """
+            ).fetch_arrow_table()
+            _write_ipc(macro_table, plane_dir / "macro_daily.arrow")
+
+        # 3. 期权链 (每个标的一个文件) + 每日 ATM IV
+        columns = ", ".join(OPTION_CHAIN_COLUMNS)
+        atm_iv_rows: list[tuple[str, date, float | None]] = []
+        for symbol in symbols:
+            files = _option_files(data_dir, symbol, start_date, end_date)
+            if not files:
+                continue
+
+            parquet_list = ", ".join(f"'{pf}'" for pf in files)
+            dte_clause = ""
+            params: list = [start_date, end_date]
+            if max_dte is not None:
+                dte_clause = "AND expiration <= date + to_days(CAST(? AS INTEGER))"
+                params.append(max_dte)
+
+            table = conn.execute(
+                f"""
+                SELECT {columns}
+                FROM read_parquet([{parquet_list}])
+                WHERE date >= ? AND date <= ? {dte_clause}
+                ORDER BY date, expiration, strike, option_type
+                """,
+                params,
+            ).fetch_arrow_table()
+            if table.num_rows == 0:
+                continue
+
+            days: dict[str, list[int]] = {}
+            offset = 0
+            for day, day_table in split_table_by_date(table):
+                days[day.isoformat()] = [offset, day_table.num_rows]
+                offset += day_table.num_rows
+
+            file_name = f"option_{symbol}.arrow"
+            _write_ipc(table, plane_dir / file_name)
+            manifest["options"][symbol] = {"file": file_name, "days": days}
+
+            if stock_table is not None:
+                closes = [
+                    (d, c)
+                    for s, d, c in zip(
+                        stock_table.column("symbol").to_pylist(),
+                        stock_table.column("date").to_pylist(),
+                        stock_table.column("close").to_pylist(),
+                    )
+                    if s == symbol and start_date <= d <= end_date
+                ]
+                for d, iv in query_mean_atm_iv(conn, files, closes).items():
+                    atm_iv_rows.append((symbol, d, iv))
+
+        _write_ipc(
+            pa.table(
+                {
+                    "symbol": pa.array([r[0] for r in atm_iv_rows], type=pa.string()),
+                    "date": pa.array([r[1] for r in atm_iv_rows], type=pa.date32()),
+                    "atm_iv": pa.array([r[2] for r in atm_iv_rows], type=pa.float64()),
+                }
+            ),
+            plane_dir / "atm_iv.arrow",
+        )
+    finally:
+        conn.close()
+
+    (plane_dir / MANIFEST_FILE).write_text(json.dumps(manifest))
+    logger.info(
+        f"Built shared data plane for {len(symbols)} symbols "
+        f"{start_date}~{end_date} at {plane_dir}"
+    )
+    return manifest
+
+
+class SharedDataPlane:
+    """只读挂载 build_shared_data 导出的数据
+
+    所有 Arrow 表都通过内存映射读取，底层缓冲区直接指向 page cache，
+    按日切片 (Table.slice) 也不复制数据。
+    """
+
+    def __init__(self, plane_dir: Path | str) -> None:
+        """初始化
+
+        Args:
+            plane_dir: build_shared_data 的输出目录
+        """
+        self._plane_dir = Path(plane_dir)
+        self._manifest = json.loads((self._plane_dir / MANIFEST_FILE).read_text())
+        self._tables: dict[str, pa.Table | None] = {}
+
+    @property
+    def plane_dir(self) -> Path:
+        """共享数据目录"""
+        return self._plane_dir
+
+    @property
+    def symbols(self) -> list[str]:
+        """已导出的标的"""
+        return list(self._manifest["symbols"])
+
+    @property
+    def date_range(self) -> tuple[date, date]:
+        """已导出的日期范围"""
+        return (
+            date.fromisoformat(self._manifest["start_date"]),
+            date.fromisoformat(self._manifest["end_date"]),
+        )
+
+    @property
+    def max_dte(self) -> int | None:
+        """导出期权的最大 DTE"""
+        return self._manifest.get("max_dte")
+
+    def _table(self, file_name: str) -> pa.Table | None:
+        """内存映射读取 IPC 文件 (缓存)"""
+        if file_name not in self._tables:
+            path = self._plane_dir / file_name
+            table = None
+            if path.exists():
+                source = pa.memory_map(str(path), "r")
+                table = pa.ipc.open_file(source).read_all()
+            self._tables[file_name] = table
+        return self._tables[file_name]
+
+    def stock_rows(self) -> dict[str, list[tuple]]:
+        """{symbol: [(date, open, high, low, close, volume), ...]}"""
+        return self._group_rows("stock_daily.arrow", self.symbols)
+
+    def macro_rows(self) -> dict[str, list[tuple]] | None:
+        """{indicator: [(date, open, high, low, close), ...]}，未导出宏观数据时返回 None"""
+        if self._table("macro_daily.arrow") is None:
+            return None
+        return self._group_rows("macro_daily.arrow", [])
+
+    def _group_rows(self, file_name: str, keys: list[str]) -> dict[str, list[tuple]]:
+        """按首列分组为行元组 (首列不包含在行内)"""
+        grouped: dict[str, list[tuple]] = {k: [] for k in keys}
+        table = self._table(file_name)
+        if table is None:
+            return grouped
+        columns = [table.column(i).to_pylist() for i in range(table.num_columns)]
+        for key, *row in zip(*columns):
+            grouped.setdefault(key, []).append(tuple(row))
+        return grouped
+
+    def stock_series(self) -> dict[str, PriceSeries]:
+        """{symbol: PriceSeries}，直接由内存映射的列构建"""
+        return self._group_series("stock_daily.arrow")
+
+    def macro_series(self) -> dict[str, PriceSeries]:
+        """{indicator: PriceSeries}，直接由内存映射的列构建"""
+        return self._group_series("macro_daily.arrow")
+
+    def _group_series(self, file_name: str) -> dict[str, PriceSeries]:
+        """按首列切分为 PriceSeries (表已按 (首列, date) 排序，每个键是连续的一段)"""
+        table = self._table(file_name)
+        if table is None or table.num_rows == 0:
+            return {}
+
+        def column(name: str) -> np.ndarray:
+            if name not in table.column_names:
+                return np.full(table.num_rows, np.nan)
+            # 空值转为 NaN；无空值的 float64 列直接引用映射的缓冲区
+            return table.column(name).cast(pa.float64()).to_numpy()
+
+        keys = table.column(0)
+        codes = keys.combine_chunks().dictionary_encode().indices.to_numpy()
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        starts = [0, *bounds.tolist()]
+        ends = [*bounds.tolist(), table.num_rows]
+
+        dates = table.column("date").to_numpy()
+        fields = ("open", "high", "low", "close", "volume")
+        values = {name: column(name) for name in fields}
+        return {
+            keys[lo].as_py(): PriceSeries(
+                dates=dates[lo:hi],
+                open=values["open"][lo:hi],
+                high=values["high"][lo:hi],
+                low=values["low"][lo:hi],
+                close=values["close"][lo:hi],
+                volume=values["volume"][lo:hi],
+            )
+            for lo, hi in zip(starts, ends)
+        }
+
+    def atm_iv(self) -> dict[tuple[str, date], float | None]:
+        """{(symbol, date): ATM IV}"""
+        table = self._table("atm_iv.arrow")
+        if table is None:
+            return {}
+        return {
+            (s, d): iv
+            for s, d, iv in zip(
+                table.column("symbol").to_pylist(),
+                table.column("date").to_pylist(),
+                table.column("atm_iv").to_pylist(),
+            )
+        }
+
+    def has_options(self, symbol: str) -> bool:
+        """是否导出了该标的的期权数据"""
+        return symbol.upper() in self._manifest["options"]
+
+    def option_day(self, symbol: str, d: date) -> pa.Table | None:
+        """某标的某天的期权链 (零拷贝切片)
+
+        Returns:
+            按 (expiration, strike, option_type) 排序的表，当天无数据时返回 None
+        """
+        entry = self._manifest["options"].get(symbol.upper())
+        if entry is None:
+            return None
+        span = entry["days"].get(d.isoformat())
+        if span is None:
+            return None
+        table = self._table(entry["file"])
+        return table.slice(span[0], span[1]) if table is not None else None
+
+    def covers(self, d: date) -> bool:
+        """日期是否在导出范围内"""
+        start, end = self.date_range
+        return start <= d <= end
+
+    def close(self) -> None:
+        """释放内存映射"""
+        self._tables.clear()
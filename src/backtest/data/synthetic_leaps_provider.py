@@ -5,6 +5,9 @@ synthetic LEAPS contracts using Black-Scholes pricing. All other methods
 delegate to the base provider.
 
 IV estimation uses VIX + term structure decay + moneyness skew.
+The whole expiry × strike surface is priced in one NumPy pass and kept as an
+OptionChainFrame; OptionQuote objects are only built when a caller asks for
+the object-based OptionChain.
 Useful for backtesting LEAPS strategies over 10+ years where historical
 option chain data is unavailable (ThetaData free tier only covers 2023-06+).
 """
@@ -13,19 +16,21 @@ import logging
 import math
 from datetime import date, datetime, timedelta
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from src.data.models.option import (
-    Greeks,
     OptionChain,
-    OptionContract,
     OptionQuote,
     OptionType,
 )
-from src.engine.bs.core import calc_bs_price
-from src.engine.bs.greeks import calc_bs_greeks
-from src.engine.models.bs_params import BSParams
+from src.data.models.option_frame import OptionChainFrame
+from src.engine.bs.vectorized import calc_bs_greeks_array
 
 logger = logging.getLogger(__name__)
 
+# Per-row columns of a synthetic surface (see _generate_synthetic_grid)
+SyntheticGrid = dict[str, NDArray]
 
 
 class SyntheticLeapsProvider:
@@ -57,6 +62,11 @@ class SyntheticLeapsProvider:
         # Per-day cache: (symbol, as_of_date) → full OptionChain (all expiries)
         # Cleared when as_of_date changes via set_as_of_date()
         self._chain_cache: dict[tuple[str, date], OptionChain | None] = {}
+        # Columnar full chain; the OptionChain above is materialized from it
+        self._frame_cache: dict[tuple[str, date], OptionChainFrame | None] = {}
+        # Priced surface per (as_of_date, spot, vix, rate), shared by symbols
+        # that happen to have identical inputs
+        self._grid_cache: dict[tuple[date, float, float, float], SyntheticGrid] = {}
         # Cache VIX/TNX per date to avoid repeated macro lookups
         self._vix_cache: dict[date, float] = {}
         self._tnx_cache: dict[date, float] = {}
@@ -77,6 +87,8 @@ class SyntheticLeapsProvider:
         # Clear date-sensitive caches when date changes
         if d != self._base._as_of_date:
             self._chain_cache.clear()
+            self._frame_cache.clear()
+            self._grid_cache.clear()
         return self._base.set_as_of_date(d)
 
     def get_stock_quote(self, symbol: str):
@@ -139,10 +151,13 @@ class SyntheticLeapsProvider:
         if expiry_max_days is not None and expiry_end is None:
             expiry_end = as_of_date + timedelta(days=expiry_max_days)
 
-        # Look up full chain from cache (or generate once)
+        # Look up full chain from cache (or materialize once from the frame)
         cache_key = (underlying, as_of_date)
         if cache_key not in self._chain_cache:
-            self._chain_cache[cache_key] = self._build_full_chain(underlying, as_of_date)
+            frame = self._get_full_frame(underlying, as_of_date)
+            self._chain_cache[cache_key] = (
+                frame.to_option_chain() if frame is not None else None
+            )
 
         full_chain = self._chain_cache[cache_key]
         if full_chain is None:
@@ -171,8 +186,53 @@ class SyntheticLeapsProvider:
             source=full_chain.source,
         )
 
-    def _build_full_chain(self, underlying: str, as_of_date: date) -> OptionChain | None:
-        """Build the full synthetic chain for all expiries (cached once per day)."""
+    def get_option_chain_frame(
+        self,
+        underlying: str,
+        expiry_start: date | None = None,
+        expiry_end: date | None = None,
+        expiry_min_days: int | None = None,
+        expiry_max_days: int | None = None,
+        **kwargs,
+    ) -> OptionChainFrame | None:
+        """Columnar counterpart of get_option_chain().
+
+        Returns the same synthetic contracts as an OptionChainFrame so that
+        screening can filter by column and materialize only the survivors.
+        """
+        underlying = underlying.upper()
+        as_of_date = self._base._as_of_date
+
+        if expiry_min_days is not None and expiry_start is None:
+            expiry_start = as_of_date + timedelta(days=expiry_min_days)
+        if expiry_max_days is not None and expiry_end is None:
+            expiry_end = as_of_date + timedelta(days=expiry_max_days)
+
+        frame = self._get_full_frame(underlying, as_of_date)
+        if frame is None:
+            return None
+        return frame.filter_by_expiry_range(expiry_start, expiry_end)
+
+    def get_option_quotes_by_key(
+        self,
+        underlying: str,
+        keys: list[tuple[date, float, OptionType]],
+    ) -> list[OptionQuote | None]:
+        """Synthetic quotes for (expiry, strike, type) keys, None when absent."""
+        frame = self.get_option_chain_frame(underlying)
+        if frame is None:
+            return [None] * len(keys)
+        return frame.find_quotes(keys)
+
+    def _get_full_frame(self, underlying: str, as_of_date: date) -> OptionChainFrame | None:
+        """Full synthetic chain frame for all expiries (cached once per day)."""
+        cache_key = (underlying, as_of_date)
+        if cache_key not in self._frame_cache:
+            self._frame_cache[cache_key] = self._build_full_frame(underlying, as_of_date)
+        return self._frame_cache[cache_key]
+
+    def _build_full_frame(self, underlying: str, as_of_date: date) -> OptionChainFrame | None:
+        """Build the full synthetic chain for all expiries."""
         stock_quote = self._base.get_stock_quote(underlying)
         if stock_quote is None:
             logger.warning(f"No stock quote for {underlying} on {as_of_date}")
@@ -182,146 +242,139 @@ class SyntheticLeapsProvider:
         vix = self._get_vix(as_of_date)
         risk_free_rate = self._get_risk_free_rate(as_of_date)
 
-        # Generate wide range: 30 to 600 days out (covers all possible queries)
-        expiry_start = as_of_date + timedelta(days=30)
-        expiry_end = as_of_date + timedelta(days=600)
-
-        return self._generate_synthetic_chain(
-            underlying=underlying,
-            spot=spot,
-            vix=vix,
-            risk_free_rate=risk_free_rate,
-            as_of_date=as_of_date,
-            expiry_start=expiry_start,
-            expiry_end=expiry_end,
-        )
-
-    def _generate_synthetic_chain(
+        grid_key = (as_of_date, spot, vix, risk_free_rate)
+        grid = self._grid_cache.get(grid_key)
+        if grid is None:
+            # Generate wide range: 30 to 600 days out (covers all possible queries)
+            grid = self._generate_synthetic_grid(
+                spot=spot,
+                vix=vix,
+                risk_free_rate=risk_free_rate,
+                as_of_date=as_of_date,
+                expiry_start=as_of_date + timedelta(days=30),
+                expiry_end=as_of_date + timedelta(days=600),
+            )
+            self._grid_cache[grid_key] = grid
+
+        return self._grid_to_frame(underlying, as_of_date, grid)
+
+    def _generate_synthetic_grid(
         self,
-        underlying: str,
         spot: float,
         vix: float,
         risk_free_rate: float,
         as_of_date: date,
         expiry_start: date,
         expiry_end: date,
-    ) -> OptionChain:
-        """Generate synthetic LEAPS call option chain."""
-        # Generate expiry dates (monthly 3rd Friday)
-        expiries = self._generate_monthly_expiries(as_of_date, expiry_start, expiry_end)
+    ) -> SyntheticGrid:
+        """Price the synthetic LEAPS call surface (expiry × strike) in one pass.
 
+        Rows are ordered expiry-major, strike-minor; cells whose B-S price is
+        not positive are dropped.
+        """
+        # Generate expiry dates (monthly 3rd Friday)
+        expiries = [
+            e
+            for e in self._generate_monthly_expiries(as_of_date, expiry_start, expiry_end)
+            if e > as_of_date
+        ]
         # Generate strike grid
-        strikes = self._generate_strike_grid(spot)
-
-        calls: list[OptionQuote] = []
-        expiry_dates: list[date] = []
-        timestamp = datetime.combine(as_of_date, datetime.min.time())
-
-        for expiry in expiries:
-            dte = (expiry - as_of_date).days
-            if dte <= 0:
-                continue
-
-            T = dte / 365.0
-            # Dividend-adjusted spot for B-S pricing
-            spot_adj = spot * math.exp(-self._dividend_yield * T)
-
-            for strike in strikes:
-                moneyness = strike / spot
-                iv = self._estimate_iv(vix, dte, moneyness)
-
-                params = BSParams(
-                    spot_price=spot_adj,
-                    strike_price=strike,
-                    risk_free_rate=risk_free_rate,
-                    volatility=iv,
-                    time_to_expiry=T,
-                    is_call=True,
-                )
-
-                price = calc_bs_price(params)
-                if price is None or price <= 0:
-                    continue
-
-                greeks_dict = calc_bs_greeks(params)
-
-                # Build bid/ask with realistic spread
-                spread = self._estimate_spread(price, moneyness, dte)
-                bid = max(0.01, price - spread / 2)
-                ask = price + spread / 2
-
-                # Generate option symbol: UNDERLYING_YYMMDD_C_STRIKE
-                symbol = (
-                    f"{underlying}_{expiry.strftime('%y%m%d')}_C_"
-                    f"{strike:.0f}"
-                )
-
-                contract = OptionContract(
-                    symbol=symbol,
-                    underlying=underlying,
-                    option_type=OptionType.CALL,
-                    strike_price=strike,
-                    expiry_date=expiry,
-                    lot_size=100,
-                )
-
-                quote = OptionQuote(
-                    contract=contract,
-                    timestamp=timestamp,
-                    last_price=price,
-                    bid=bid,
-                    ask=ask,
-                    volume=500,
-                    open_interest=1000,
-                    iv=iv,
-                    greeks=Greeks(
-                        delta=greeks_dict.get("delta"),
-                        gamma=greeks_dict.get("gamma"),
-                        theta=greeks_dict.get("theta"),
-                        vega=greeks_dict.get("vega"),
-                        rho=greeks_dict.get("rho"),
-                    ),
-                    source="synthetic_bs",
-                    open=price,
-                    high=price * 1.01,
-                    low=price * 0.99,
-                    close=price,
-                )
-
-                calls.append(quote)
-
-            expiry_dates.append(expiry)
+        strikes = np.asarray(self._generate_strike_grid(spot), dtype=np.float64)
+
+        expiry = np.array(expiries, dtype="datetime64[D]")
+        dte = (expiry - np.datetime64(as_of_date, "D")).astype(np.int64)[:, None]
+        t = dte / 365.0
+        # Dividend-adjusted spot for B-S pricing
+        spot_adj = spot * np.exp(-self._dividend_yield * t)
+
+        moneyness = strikes[None, :] / spot
+        iv = self._estimate_iv(vix, dte, moneyness)
+        greeks = calc_bs_greeks_array(
+            spot=spot_adj,
+            strike=strikes[None, :],
+            rate=risk_free_rate,
+            vol=iv,
+            t=t,
+            is_call=True,
+        )
+        price = greeks["price"]
+        with np.errstate(invalid="ignore"):
+            keep = np.isfinite(price) & (price > 0)
+
+        # Build bid/ask with realistic spread
+        spread = self._estimate_spread(price, moneyness, dte)
+        shape = price.shape
+        grid: SyntheticGrid = {
+            "expiry": np.broadcast_to(expiry[:, None], shape)[keep],
+            "strike": np.broadcast_to(strikes[None, :], shape)[keep],
+            "price": price[keep],
+            "bid": np.maximum(0.01, price - spread / 2)[keep],
+            "ask": (price + spread / 2)[keep],
+            "iv": np.broadcast_to(iv, shape)[keep],
+        }
+        for name in ("delta", "gamma", "theta", "vega", "rho"):
+            grid[name] = greeks[name][keep]
+        return grid
 
-        return OptionChain(
+    @staticmethod
+    def _grid_to_frame(underlying: str, as_of_date: date, grid: SyntheticGrid) -> OptionChainFrame:
+        """Wrap a priced surface as an OptionChainFrame for one underlying."""
+        n = len(grid["strike"])
+        price = grid["price"]
+        # Option symbol: UNDERLYING_YYMMDD_C_STRIKE
+        symbols = np.array(
+            [
+                f"{underlying}_{e.strftime('%y%m%d')}_C_{k:.0f}"
+                for e, k in zip(grid["expiry"].tolist(), grid["strike"].tolist())
+            ],
+            dtype=object,
+        )
+        return OptionChainFrame(
             underlying=underlying,
-            timestamp=timestamp,
-            expiry_dates=sorted(expiry_dates),
-            calls=calls,
-            puts=[],  # LEAPS strategy only needs calls
+            timestamp=datetime.combine(as_of_date, datetime.min.time()),
+            expiry=grid["expiry"],
+            strike=grid["strike"],
+            is_call=np.ones(n, dtype=bool),
+            open=price,
+            high=price * 1.01,
+            low=price * 0.99,
+            close=price,
+            bid=grid["bid"],
+            ask=grid["ask"],
+            volume=np.full(n, 500.0),
+            open_interest=np.full(n, 1000.0),
+            iv=grid["iv"],
+            delta=grid["delta"],
+            gamma=grid["gamma"],
+            theta=grid["theta"],
+            vega=grid["vega"],
+            rho=grid["rho"],
+            underlying_price=np.full(n, np.nan),
+            symbols=symbols,
             source="synthetic_bs",
         )
 
     # --- IV Estimation ---
 
-    def _estimate_iv(self, vix: float, dte: int, moneyness: float) -> float:
+    def _estimate_iv(self, vix: float, dte: ArrayLike, moneyness: ArrayLike) -> float | NDArray:
         """Estimate implied volatility from VIX.
 
         Args:
             vix: Current VIX value (already decimal, e.g. 0.20 for VIX=20)
-            dte: Days to expiration
-            moneyness: strike / spot (< 1 = ITM call)
+            dte: Days to expiration (scalar or array)
+            moneyness: strike / spot (< 1 = ITM call), broadcast against dte
 
         Returns:
-            Annualized implied volatility as decimal
+            Annualized implied volatility as decimal (array for array inputs)
         """
         # 1. Term structure decay: long-dated IV < short-dated VIX
         #    Empirically, 1Y IV ≈ 85% of VIX for equity indices
-        term_factor = 1.0 - 0.15 * (1 - math.exp(-dte / 180))
+        term_factor = 1.0 - 0.15 * (1 - np.exp(-np.asarray(dte) / 180))
         base_iv = vix * term_factor
 
         # 2. Moneyness skew: ITM calls (low moneyness) have slightly higher IV
         #    Deep ITM call (moneyness=0.85) → skew ≈ +2.25%
-        skew = 0.15 * (1.0 - moneyness)
+        skew = 0.15 * (1.0 - np.asarray(moneyness))
 
         return base_iv * (1.0 + skew)
 
@@ -417,22 +470,23 @@ class SyntheticLeapsProvider:
 
         return strikes
 
-    def _estimate_spread(self, price: float, moneyness: float, dte: int) -> float:
+    def _estimate_spread(
+        self, price: ArrayLike, moneyness: ArrayLike, dte: ArrayLike
+    ) -> float | NDArray:
         """Estimate bid-ask spread for synthetic quote.
 
         LEAPS have wider spreads than short-dated options.
         Deep ITM options have tighter spreads relative to price.
+        Accepts scalars or broadcastable arrays.
         """
-        # Base spread: ~2% of price for ATM, wider for OTM
-        base_pct = 0.02
-        if moneyness > 1.05:  # OTM
-            base_pct = 0.04
-        elif moneyness < 0.90:  # Deep ITM
-            base_pct = 0.015
+        moneyness = np.asarray(moneyness)
+        # Base spread: ~2% of price for ATM, wider for OTM (> 1.05),
+        # tighter for deep ITM (< 0.90)
+        base_pct = np.where(moneyness > 1.05, 0.04, np.where(moneyness < 0.90, 0.015, 0.02))
 
         # LEAPS spread widening: longer-dated = wider
-        dte_factor = 1.0 + 0.3 * min(dte / 365, 1.5)
+        dte_factor = 1.0 + 0.3 * np.minimum(np.asarray(dte) / 365, 1.5)
 
-        spread = price * base_pct * dte_factor
+        spread = np.asarray(price) * base_pct * dte_factor
         # Minimum spread: $0.05
-        return max(0.05, spread)
+        return np.maximum(0.05, spread)
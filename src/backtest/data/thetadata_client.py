@@ -24,15 +24,24 @@ Rate Limits:
 
 import csv
 import io
+import itertools
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Iterator, Literal
 
 import httpx
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import requests
 
+if TYPE_CHECKING:
+    from src.backtest.data.greeks_calculator import GreeksCalculator
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,6 +158,96 @@ class OptionEODGreeks:
     iv_error: float | None = None
 
 
+# OptionEODGreeks 的 Arrow 表示 (列顺序与 option_daily/ Parquet 文件一致)
+OPTION_GREEKS_ARROW_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.string()),
+        ("expiration", pa.date32()),
+        ("strike", pa.float64()),
+        ("option_type", pa.string()),
+        ("date", pa.date32()),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.int64()),
+        ("count", pa.int64()),
+        ("bid", pa.float64()),
+        ("ask", pa.float64()),
+        ("delta", pa.float64()),
+        ("gamma", pa.float64()),
+        ("theta", pa.float64()),
+        ("vega", pa.float64()),
+        ("rho", pa.float64()),
+        ("implied_vol", pa.float64()),
+        ("underlying_price", pa.float64()),
+        ("open_interest", pa.int64()),
+        ("iv_error", pa.float64()),
+    ]
+)
+
+# /option/history/eod CSV 列类型 (日期列按字符串读入，再统一解析)
+_OPTION_EOD_CSV_TYPES = {
+    "symbol": pa.string(),
+    "expiration": pa.string(),
+    "strike": pa.float64(),
+    "right": pa.string(),
+    "created": pa.string(),
+    "open": pa.float64(),
+    "high": pa.float64(),
+    "low": pa.float64(),
+    "close": pa.float64(),
+    "volume": pa.int64(),
+    "count": pa.int64(),
+    "bid": pa.float64(),
+    "ask": pa.float64(),
+}
+
+# /option/history/greeks/eod CSV 列类型 (日期列为 timestamp)
+_OPTION_GREEKS_NUMERIC_COLUMNS = (
+    "delta", "gamma", "theta", "vega", "rho", "implied_vol", "underlying_price",
+)
+_OPTION_GREEKS_CSV_TYPES = {
+    **{k: v for k, v in _OPTION_EOD_CSV_TYPES.items() if k != "created"},
+    "timestamp": pa.string(),
+    **{name: pa.float64() for name in _OPTION_GREEKS_NUMERIC_COLUMNS},
+    "iv_error": pa.float64(),
+}
+
+# CSV 流式解码的块大小 (每个 RecordBatch 约对应这么多字节的响应)
+CSV_BLOCK_SIZE = 8 << 20
+
+
+def option_greeks_to_batch(records: list[OptionEODGreeks]) -> pa.RecordBatch:
+    """OptionEODGreeks 列表 → RecordBatch (OPTION_GREEKS_ARROW_SCHEMA)"""
+    return pa.RecordBatch.from_pydict(
+        {name: [getattr(r, name) for r in records] for name in OPTION_GREEKS_ARROW_SCHEMA.names},
+        schema=OPTION_GREEKS_ARROW_SCHEMA,
+    )
+
+
+class _ByteChunkReader(io.RawIOBase):
+    """把 bytes 块迭代器包装成可读文件对象，供 pyarrow.csv 流式读取"""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
 class ThetaDataError(Exception):
     """ThetaData API 错误"""
 
@@ -186,8 +285,9 @@ class ThetaDataClient:
         self._session = requests.Session()
         self._session.headers.update({"Accept": "application/json"})
 
-        # Rate limiting (sliding window)
+        # Rate limiting (sliding window)，多线程下载时共享同一预算
         self._request_timestamps: list[float] = []
+        self._rate_lock = threading.Lock()
 
         # Stock data cache (避免重复请求)
         self._stock_cache: dict[tuple, dict[date, float]] = {}
@@ -197,43 +297,45 @@ class ThetaDataClient:
 
         使用滑动窗口算法，确保在 rate_limit_period 秒内不超过 rate_limit_requests 次请求。
         同时强制执行最小请求间隔（FREE tier: 4s）。
+        线程安全：并发请求在锁内依次领取时间槽，等待期间其他线程不会越过预算。
         """
-        now = time.time()
-
-        # 1. 强制最小请求间隔
-        if self._request_timestamps and self._config.min_request_interval > 0:
-            last_request = self._request_timestamps[-1]
-            elapsed = now - last_request
-            if elapsed < self._config.min_request_interval:
-                wait_time = self._config.min_request_interval - elapsed
-                logger.debug(f"Enforcing min interval, waiting {wait_time:.1f}s")
-                time.sleep(wait_time)
-                now = time.time()
-
-        # 2. 滑动窗口 rate limit
-        window_start = now - self._config.rate_limit_period
-
-        # 清除过期的时间戳
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if ts > window_start
-        ]
+        with self._rate_lock:
+            now = time.time()
+
+            # 1. 强制最小请求间隔
+            if self._request_timestamps and self._config.min_request_interval > 0:
+                last_request = self._request_timestamps[-1]
+                elapsed = now - last_request
+                if elapsed < self._config.min_request_interval:
+                    wait_time = self._config.min_request_interval - elapsed
+                    logger.debug(f"Enforcing min interval, waiting {wait_time:.1f}s")
+                    time.sleep(wait_time)
+                    now = time.time()
+
+            # 2. 滑动窗口 rate limit
+            window_start = now - self._config.rate_limit_period
+
+            # 清除过期的时间戳
+            self._request_timestamps = [
+                ts for ts in self._request_timestamps if ts > window_start
+            ]
+
+            # 如果达到限制，等待最早的请求过期
+            if len(self._request_timestamps) >= self._config.rate_limit_requests:
+                oldest = self._request_timestamps[0]
+                wait_time = oldest + self._config.rate_limit_period - now
+                if wait_time > 0:
+                    logger.info(f"Rate limit reached, waiting {wait_time:.1f}s")
+                    time.sleep(wait_time)
+                    # 清除过期的时间戳
+                    now = time.time()
+                    window_start = now - self._config.rate_limit_period
+                    self._request_timestamps = [
+                        ts for ts in self._request_timestamps if ts > window_start
+                    ]
 
-        # 如果达到限制，等待最早的请求过期
-        if len(self._request_timestamps) >= self._config.rate_limit_requests:
-            oldest = self._request_timestamps[0]
-            wait_time = oldest + self._config.rate_limit_period - now
-            if wait_time > 0:
-                logger.info(f"Rate limit reached, waiting {wait_time:.1f}s")
-                time.sleep(wait_time)
-                # 清除过期的时间戳
-                now = time.time()
-                window_start = now - self._config.rate_limit_period
-                self._request_timestamps = [
-                    ts for ts in self._request_timestamps if ts > window_start
-                ]
-
-        # 记录本次请求时间
-        self._request_timestamps.append(time.time())
+            # 记录本次请求时间
+            self._request_timestamps.append(time.time())
 
     def _request(
         self,
@@ -394,21 +496,112 @@ class ThetaDataClient:
                 logger.debug(f"CSV stream received {len(results)} records")
                 return results
 
-            except httpx.TimeoutException:
+            except httpx.TimeoutException as e:
                 logger.warning(f"CSV request timeout, attempt {attempt + 1}")
                 if attempt < self._config.max_retries - 1:
                     time.sleep(self._config.retry_delay)
                     continue
-                raise ThetaDataError(f"CSV request timeout after {self._config.max_retries} attempts")
+                raise ThetaDataError(
+                    f"CSV request timeout after {self._config.max_retries} attempts"
+                ) from e
 
             except httpx.ConnectError as e:
                 raise ThetaDataError(
                     f"Connection error: {e}. "
                     f"Is ThetaData Terminal running on {self._config.host}:{self._config.port}?"
-                )
+                ) from e
 
             except httpx.HTTPStatusError as e:
-                raise ThetaDataError(f"HTTP error: {e}")
+                raise ThetaDataError(f"HTTP error: {e}") from e
+
+        raise ThetaDataError("Max retries exceeded (CSV)")
+
+    def _request_csv_batches(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        column_types: dict[str, pa.DataType] | None = None,
+        block_size: int = CSV_BLOCK_SIZE,
+    ) -> Iterator[pa.RecordBatch]:
+        """CSV 流式请求，响应字节直接解码为带类型的 RecordBatch
+
+        与 _request_csv_stream 相同的重试/错误语义，但不构造逐行 dict：
+        内存占用以一个 block 为上限。已产出数据后出错不会重试 (避免重复数据)。
+
+        Args:
+            endpoint: API 端点
+            params: 请求参数
+            column_types: 列类型 (未指定的列由 pyarrow 推断)
+            block_size: 每个 RecordBatch 对应的 CSV 字节数
+
+        Yields:
+            RecordBatch (列名统一为小写)
+        """
+        self._check_rate_limit()
+
+        url = f"{self._config.base_url}{endpoint}"
+        params = params or {}
+        params["format"] = "csv"
+
+        logger.debug(f"CSV Batch Request: {endpoint} params={params}")
+
+        yielded = False
+        for attempt in range(self._config.max_retries):
+            try:
+                with httpx.stream(
+                    "GET",
+                    url,
+                    params=params,
+                    timeout=httpx.Timeout(self._config.timeout, read=120.0),
+                ) as response:
+                    if response.status_code == 429:
+                        wait_time = self._config.retry_delay * (attempt + 1)
+                        logger.warning(f"Rate limit exceeded (429), waiting {wait_time}s")
+                        time.sleep(wait_time)
+                        continue
+
+                    if response.status_code == 472:
+                        logger.debug("ThetaData 472: No data found (CSV)")
+                        return
+
+                    response.raise_for_status()
+
+                    try:
+                        reader = pacsv.open_csv(
+                            io.BufferedReader(_ByteChunkReader(response.iter_bytes())),
+                            read_options=pacsv.ReadOptions(block_size=block_size),
+                            convert_options=pacsv.ConvertOptions(
+                                column_types=column_types or {}
+                            ),
+                        )
+                    except pa.ArrowInvalid as e:
+                        # 空响应 (无 header)
+                        logger.debug(f"Empty CSV response: {e}")
+                        return
+
+                    names = [name.strip().lower() for name in reader.schema.names]
+                    for batch in reader:
+                        yielded = True
+                        yield pa.RecordBatch.from_arrays(batch.columns, names=names)
+                return
+
+            except httpx.TimeoutException as e:
+                logger.warning(f"CSV request timeout, attempt {attempt + 1}")
+                if not yielded and attempt < self._config.max_retries - 1:
+                    time.sleep(self._config.retry_delay)
+                    continue
+                raise ThetaDataError(
+                    f"CSV request timeout after {attempt + 1} attempts"
+                ) from e
+
+            except httpx.ConnectError as e:
+                raise ThetaDataError(
+                    f"Connection error: {e}. "
+                    f"Is ThetaData Terminal running on {self._config.host}:{self._config.port}?"
+                ) from e
+
+            except httpx.HTTPStatusError as e:
+                raise ThetaDataError(f"HTTP error: {e}") from e
 
         raise ThetaDataError("Max retries exceeded (CSV)")
 
@@ -979,9 +1172,6 @@ class ThetaDataClient:
 
         # 获取股票 EOD (使用缓存避免重复请求)
         cache_key = (symbol, start_date, end_date)
-        if not hasattr(self, "_stock_cache"):
-            self._stock_cache: dict[tuple, dict[date, float]] = {}
-
         if cache_key not in self._stock_cache:
             stocks = self.get_stock_eod(symbol, start_date, end_date)
             if not stocks:
@@ -998,6 +1188,7 @@ class ThetaDataClient:
         results: list[OptionEODGreeks] = []
 
         itm_filtered = 0
+        rows = []
         for opt in options:
             spot = stock_prices.get(opt.date)
             if spot is None:
@@ -1028,46 +1219,48 @@ class ThetaDataClient:
             if dte <= 0:
                 continue
 
-            tte = dte / 365.0
+            rows.append((opt, spot, mid_price, dte / 365.0))
 
-            # 计算 Greeks
-            greeks = calc.calculate(
-                option_price=mid_price,
-                spot=spot,
-                strike=opt.strike,
-                tte=tte,
+        # 计算 Greeks (整列一次求解)
+        if rows:
+            greeks = calc.calculate_batch(
+                option_price=[r[2] for r in rows],
+                spot=[r[1] for r in rows],
+                strike=[r[0].strike for r in rows],
+                tte=[r[3] for r in rows],
                 rate=calc_rate,
-                is_call=(opt.option_type == "call"),
+                is_call=[r[0].option_type == "call" for r in rows],
             )
 
-            if not greeks.is_valid:
-                continue
+            for i, (opt, spot, _, _) in enumerate(rows):
+                if not greeks.is_valid[i]:
+                    continue
 
-            # 转换为 OptionEODGreeks
-            results.append(
-                OptionEODGreeks(
-                    symbol=opt.symbol,
-                    expiration=opt.expiration,
-                    strike=opt.strike,
-                    option_type=opt.option_type,
-                    date=opt.date,
-                    open=opt.open,
-                    high=opt.high,
-                    low=opt.low,
-                    close=opt.close,
-                    volume=opt.volume,
-                    count=opt.count,
-                    bid=opt.bid,
-                    ask=opt.ask,
-                    delta=greeks.delta,
-                    gamma=greeks.gamma,
-                    theta=greeks.theta,
-                    vega=greeks.vega,
-                    rho=greeks.rho,
-                    implied_vol=greeks.iv,
-                    underlying_price=spot,
+                # 转换为 OptionEODGreeks
+                results.append(
+                    OptionEODGreeks(
+                        symbol=opt.symbol,
+                        expiration=opt.expiration,
+                        strike=opt.strike,
+                        option_type=opt.option_type,
+                        date=opt.date,
+                        open=opt.open,
+                        high=opt.high,
+                        low=opt.low,
+                        close=opt.close,
+                        volume=opt.volume,
+                        count=opt.count,
+                        bid=opt.bid,
+                        ask=opt.ask,
+                        delta=float(greeks.delta[i]),
+                        gamma=float(greeks.gamma[i]),
+                        theta=float(greeks.theta[i]),
+                        vega=float(greeks.vega[i]),
+                        rho=float(greeks.rho[i]),
+                        implied_vol=float(greeks.iv[i]),
+                        underlying_price=spot,
+                    )
                 )
-            )
 
         if itm_filtered > 0:
             logger.info(
@@ -1081,3 +1274,277 @@ class ThetaDataClient:
             )
 
         return results
+
+    # ========== Arrow 流式接口 ==========
+
+    def _option_params(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        expiration: date | None = None,
+        strike: float | None = None,
+        right: Literal["call", "put"] | None = None,
+        max_dte: int | None = None,
+        strike_range: int | None = None,
+    ) -> dict[str, Any]:
+        """构造期权历史请求参数"""
+        params: dict[str, Any] = {
+            "symbol": symbol.upper(),
+            "start_date": self._format_date(start_date),
+            "end_date": self._format_date(end_date),
+            "expiration": self._format_date(expiration) if expiration else "*",
+        }
+        if strike is not None:
+            params["strike"] = f"{strike:.3f}"
+        if right:
+            params["right"] = right.lower()
+        if max_dte is not None:
+            params["max_dte"] = max_dte
+        if strike_range is not None:
+            params["strike_range"] = strike_range
+        return params
+
+    @staticmethod
+    def _normalize_option_eod_batch(
+        batch: pa.RecordBatch,
+        symbol: str,
+        date_column: str = "created",
+        with_greeks: bool = False,
+    ) -> pa.RecordBatch:
+        """CSV 原始 batch → 标准化期权 EOD 列 (与 _parse_option_eod_csv 规则一致)
+
+        丢弃 right 非 CALL/PUT、日期/expiration 为空的行；
+        date 取 date_column 的 YYYY-MM-DD 部分；缺失的数值列填 0。
+
+        with_greeks=True 时 (Greeks 端点，date_column="timestamp") 同时带出 Greeks 列，
+        返回 OPTION_GREEKS_ARROW_SCHEMA batch，规则与 get_option_eod_greeks 一致
+        (iv_error 为 0 或缺失时为 null)。
+        """
+        n = batch.num_rows
+        names = batch.schema.names
+
+        def column(name: str, dtype: pa.DataType, default) -> pa.Array:
+            if name not in names:
+                return pa.array([default] * n, dtype)
+            return pc.fill_null(pc.cast(batch.column(name), dtype), default)
+
+        right = pc.utf8_upper(column("right", pa.string(), ""))
+        created = column(date_column, pa.string(), "")
+        expiration = column("expiration", pa.string(), "")
+        mask = pc.and_(
+            pc.is_in(right, value_set=pa.array(["CALL", "PUT"])),
+            pc.and_(
+                pc.greater_equal(pc.utf8_length(created), 10),
+                pc.greater_equal(pc.utf8_length(expiration), 10),
+            ),
+        )
+
+        def to_date(values: pa.Array) -> pa.Array:
+            ts = pc.strptime(pc.utf8_slice_codeunits(values, 0, 10), format="%Y-%m-%d", unit="s")
+            return pc.cast(ts, pa.date32())
+
+        created = created.filter(mask)
+        expiration = expiration.filter(mask)
+        right = right.filter(mask)
+        arrays = {
+            "symbol": pc.utf8_upper(column("symbol", pa.string(), symbol).filter(mask)),
+            "expiration": to_date(expiration),
+            "strike": column("strike", pa.float64(), 0.0).filter(mask),
+            "option_type": pc.utf8_lower(right),
+            "date": to_date(created),
+        }
+        for name in ("open", "high", "low", "close"):
+            arrays[name] = column(name, pa.float64(), 0.0).filter(mask)
+        arrays["volume"] = column("volume", pa.int64(), 0).filter(mask)
+        arrays["count"] = column("count", pa.int64(), 0).filter(mask)
+        arrays["bid"] = column("bid", pa.float64(), 0.0).filter(mask)
+        arrays["ask"] = column("ask", pa.float64(), 0.0).filter(mask)
+        if not with_greeks:
+            return pa.RecordBatch.from_pydict(arrays)
+
+        kept = len(right)
+        for name in _OPTION_GREEKS_NUMERIC_COLUMNS:
+            arrays[name] = column(name, pa.float64(), 0.0).filter(mask)
+        arrays["open_interest"] = pa.nulls(kept, pa.int64())
+        if "iv_error" in names:
+            iv_error = pc.cast(batch.column("iv_error"), pa.float64()).filter(mask)
+            arrays["iv_error"] = pc.if_else(
+                pc.equal(pc.fill_null(iv_error, 0.0), 0.0), pa.scalar(None, pa.float64()), iv_error
+            )
+        else:
+            arrays["iv_error"] = pa.nulls(kept, pa.float64())
+        return pa.RecordBatch.from_pydict(arrays, schema=OPTION_GREEKS_ARROW_SCHEMA)
+
+    def get_option_eod_batches(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        expiration: date | None = None,
+        strike: float | None = None,
+        right: Literal["call", "put"] | None = None,
+        max_dte: int | None = None,
+        strike_range: int | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """流式获取期权 EOD 数据 (get_option_eod 的 Arrow 版本)
+
+        Yields:
+            RecordBatch，列为 OPTION_GREEKS_ARROW_SCHEMA 的前 13 列 (symbol ... ask)
+        """
+        params = self._option_params(
+            symbol, start_date, end_date, expiration, strike, right, max_dte, strike_range
+        )
+        for batch in self._request_csv_batches(
+            "/option/history/eod", params, column_types=_OPTION_EOD_CSV_TYPES
+        ):
+            normalized = self._normalize_option_eod_batch(batch, symbol)
+            if normalized.num_rows:
+                yield normalized
+
+    def get_option_with_greeks_batches(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        expiration: date | None = None,
+        strike: float | None = None,
+        right: Literal["call", "put"] | None = None,
+        max_dte: int | None = None,
+        strike_range: int | None = None,
+        rate: float | None = None,
+        otm_only: bool = True,
+    ) -> Iterator[pa.RecordBatch]:
+        """流式获取期权数据 (含 Greeks)，get_option_with_greeks 的 Arrow 版本
+
+        Greeks API 可用时直接流式解码 Greeks 端点的 CSV；否则 EOD CSV 按块解码，
+        每块整列计算 Greeks 后立即产出。两种路径内存都以一个块为上限。
+        过滤规则 (OTM、mid price、DTE、IV 求解失败) 与 get_option_with_greeks 一致。
+
+        Yields:
+            RecordBatch (OPTION_GREEKS_ARROW_SCHEMA)
+        """
+        if not self._config.skip_greeks_api:
+            params = self._option_params(
+                symbol, start_date, end_date, expiration, strike, right, max_dte, strike_range
+            )
+            yielded = False
+            try:
+                for batch in self._request_csv_batches(
+                    "/option/history/greeks/eod", params, column_types=_OPTION_GREEKS_CSV_TYPES
+                ):
+                    normalized = self._normalize_option_eod_batch(
+                        batch, symbol, date_column="timestamp", with_greeks=True
+                    )
+                    if normalized.num_rows:
+                        yielded = True
+                        yield normalized
+                return
+            except ThetaDataError as e:
+                # 已产出数据后不再回退，避免重复数据
+                if yielded or "403" not in str(e):
+                    raise
+                logger.info("Greeks API not available (FREE tier), falling back to calculation")
+
+        from src.backtest.data.greeks_calculator import GreeksCalculator
+
+        batches = self.get_option_eod_batches(
+            symbol, start_date, end_date, expiration, strike, right, max_dte, strike_range
+        )
+        first = next(batches, None)
+        if first is None:
+            return
+
+        cache_key = (symbol, start_date, end_date)
+        if cache_key not in self._stock_cache:
+            stocks = self.get_stock_eod(symbol, start_date, end_date)
+            if not stocks:
+                logger.warning(f"No stock data for {symbol}, cannot calculate Greeks")
+                return
+            self._stock_cache[cache_key] = {d.date: d.close for d in stocks}
+        stock_prices = self._stock_cache[cache_key]
+
+        epoch = date(1970, 1, 1)
+        stock_days = np.array([(d - epoch).days for d in stock_prices], dtype=np.int64)
+        stock_close = np.array(list(stock_prices.values()), dtype=np.float64)
+        order = np.argsort(stock_days)
+        stock_days, stock_close = stock_days[order], stock_close[order]
+
+        calc = GreeksCalculator()
+        calc_rate = rate if rate is not None else 0.045
+        total = kept = 0
+
+        for batch in itertools.chain([first], batches):
+            total += batch.num_rows
+            result = self._greeks_for_eod_batch(
+                batch, stock_days, stock_close, calc, calc_rate, otm_only
+            )
+            if result.num_rows:
+                kept += result.num_rows
+                yield result
+
+        logger.info(
+            f"Calculated Greeks for {kept}/{total} options (rate={calc_rate:.2%}, streaming)"
+        )
+
+    @staticmethod
+    def _greeks_for_eod_batch(
+        batch: pa.RecordBatch,
+        stock_days: np.ndarray,
+        stock_close: np.ndarray,
+        calc: "GreeksCalculator",
+        rate: float,
+        otm_only: bool,
+    ) -> pa.RecordBatch:
+        """对一个标准化 EOD batch 整列计算 Greeks，返回 OPTION_GREEKS_ARROW_SCHEMA batch"""
+        days = pc.cast(batch.column("date"), pa.int32()).to_numpy().astype(np.int64)
+        exp_days = pc.cast(batch.column("expiration"), pa.int32()).to_numpy().astype(np.int64)
+        strike = batch.column("strike").to_numpy(zero_copy_only=False)
+        bid = batch.column("bid").to_numpy(zero_copy_only=False)
+        ask = batch.column("ask").to_numpy(zero_copy_only=False)
+        close = batch.column("close").to_numpy(zero_copy_only=False)
+        is_call = pc.equal(batch.column("option_type"), "call").to_numpy(zero_copy_only=False)
+
+        # 标的价格 (按日期对齐)
+        pos = np.clip(np.searchsorted(stock_days, days), 0, max(len(stock_days) - 1, 0))
+        has_spot = (
+            stock_days[pos] == days if len(stock_days) else np.zeros(len(days), dtype=bool)
+        )
+        spot = np.where(has_spot, stock_close[pos] if len(stock_close) else 0.0, np.nan)
+
+        keep = has_spot
+        if otm_only:
+            keep &= np.where(is_call, strike > spot, strike < spot)
+
+        mid = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, close)
+        dte = exp_days - days
+        keep &= (mid > 0) & (dte > 0)
+
+        idx = np.flatnonzero(keep)
+        if idx.size == 0:
+            return option_greeks_to_batch([])
+
+        greeks = calc.calculate_batch(
+            option_price=mid[idx],
+            spot=spot[idx],
+            strike=strike[idx],
+            tte=dte[idx] / 365.0,
+            rate=rate,
+            is_call=is_call[idx],
+        )
+        valid = np.asarray(greeks.is_valid, dtype=bool)
+        idx = idx[valid]
+
+        arrays = [batch.column(name).take(pa.array(idx)) for name in batch.schema.names]
+        arrays += [
+            pa.array(np.asarray(greeks.delta)[valid], pa.float64()),
+            pa.array(np.asarray(greeks.gamma)[valid], pa.float64()),
+            pa.array(np.asarray(greeks.theta)[valid], pa.float64()),
+            pa.array(np.asarray(greeks.vega)[valid], pa.float64()),
+            pa.array(np.asarray(greeks.rho)[valid], pa.float64()),
+            pa.array(np.asarray(greeks.iv)[valid], pa.float64()),
+            pa.array(spot[idx], pa.float64()),
+            pa.nulls(idx.size, pa.int64()),
+            pa.nulls(idx.size, pa.float64()),
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=OPTION_GREEKS_ARROW_SCHEMA)
@@ -168,6 +168,7 @@ class BacktestResult:
     execution_time_seconds: float = 0.0
     trading_days: int = 0
     errors: list[str] = field(default_factory=list)
+    prefetch_stats: dict | None = None  # 预加载统计 (未启用预加载时为 None)
 
     def to_dict(self, include_details: bool = False) -> dict:
         """转换为字典 (用于序列化)
@@ -195,6 +196,7 @@ class BacktestResult:
             "execution_time_seconds": self.execution_time_seconds,
             "trading_days": self.trading_days,
             "errors": self.errors,
+            "prefetch_stats": self.prefetch_stats,
         }
         if include_details:
             result["trade_records"] = [t.to_dict() for t in self.trade_records]
@@ -237,6 +239,7 @@ class BacktestExecutor:
             data_dir=config.data_dir,
             as_of_date=config.start_date,
         )
+        self._prefetch_stats: dict | None = None
 
         # ========================================
         # 三层组件 (平等对待，BacktestExecutor 直接访问)
@@ -343,6 +346,10 @@ class BacktestExecutor:
 
         logger.info(f"Trading days: {len(trading_days)}")
 
+        # 预加载整段回测数据
+        if self._config.prefetch:
+            self._prefetch_data(trading_days[0], trading_days[-1])
+
         # 逐日执行
         total_days = len(trading_days)
         for i, current_date in enumerate(trading_days):
@@ -380,6 +387,33 @@ class BacktestExecutor:
 
         return result
 
+    def _prefetch_data(self, start_date: date, end_date: date) -> None:
+        """一次性预加载回测区间内的行情、期权链与宏观数据
+
+        Args:
+            start_date: 首个交易日
+            end_date: 最后一个交易日
+        """
+        prefetch = getattr(self._data_provider, "prefetch", None)
+        if prefetch is None:
+            logger.warning(
+                f"{type(self._data_provider).__name__} does not support prefetch, skipped"
+            )
+            return
+
+        symbols = list(dict.fromkeys([*self._config.symbols, self._config.benchmark_symbol]))
+        stats = prefetch(
+            symbols,
+            start_date,
+            end_date,
+            max_dte=self._config.prefetch_max_dte,
+        )
+        self._prefetch_stats = stats.to_dict()
+        logger.info(
+            f"Prefetched {len(symbols)} symbols in {stats.load_time_seconds:.1f}s "
+            f"({stats.option_rows} option rows, {stats.memory_mb:.1f} MB)"
+        )
+
     @property
     def attribution_collector(self) -> Any | None:
         """获取归因数据采集器"""
@@ -1669,6 +1703,7 @@ class BacktestExecutor:
             trading_days=len(trading_days),
             errors=self._errors,
             open_positions=self._snapshot_open_positions(),
+            prefetch_stats=self._prefetch_stats,
         )
 
     def _build_empty_result(self, start_time: datetime) -> BacktestResult:
@@ -37,8 +37,8 @@ from src.backtest.engine.account_simulator import (
 )
 from src.backtest.engine.trade_simulator import TradeExecution
 from src.business.monitoring.models import PositionData
-from src.data.models import OptionChain, StockQuote
-from src.data.models.option import OptionType
+from src.data.models import StockQuote
+from src.data.models.option import OptionQuote, OptionType
 from src.data.providers.base import DataProvider
 from src.engine.models.enums import StrategyType
 
@@ -427,45 +427,109 @@ class PositionManager:
                     self.update_position_market_data(pos)
                 continue
 
-            # 计算需要的 expiry 范围
-            expirations = {pos.expiration for pos in pos_list if pos.expiration}
-            if not expirations:
+            # 一次批量获取该 underlying 下所有持仓合约的报价 (每个合约一次哈希查找)
+            pos_list = [pos for pos in pos_list if pos.expiration]
+            if not pos_list:
                 continue
-
-            # 获取期权链（一次查询覆盖所有到期日，DuckDBProvider 会缓存全链）
-            chain = self._data_provider.get_option_chain(
-                underlying=underlying,
-                expiry_start=min(expirations),
-                expiry_end=max(expirations),
+            quotes = self._fetch_option_quotes(
+                underlying,
+                [(pos.expiration, pos.strike, pos.option_type) for pos in pos_list],
             )
 
-            # 从 chain 中提取每个持仓的价格
-            for pos in pos_list:
-                self._update_position_from_chain(
-                    pos, chain, underlying_price, stock_quote
-                )
+            for pos, quote in zip(pos_list, quotes):
+                self._update_position_from_quote(pos, quote, underlying_price)
 
         # 处理股票持仓（数量通常较少，逐个处理即可）
         for pos in stock_positions:
             self.update_position_market_data(pos)
 
-    def _update_position_from_chain(
+    def _fetch_option_quotes(
+        self,
+        underlying: str,
+        keys: list[tuple[date, float, OptionType]],
+    ) -> list[OptionQuote | None]:
+        """批量获取期权报价
+
+        优先使用 provider 的 get_option_quotes_by_key (按合约哈希查找)；
+        不支持时回退到获取期权链并在链的合约索引中查找。
+
+        Args:
+            underlying: 标的代码
+            keys: [(到期日, 行权价, 期权类型), ...]
+
+        Returns:
+            与 keys 一一对应的报价列表，未找到的合约为 None
+        """
+        fetch = getattr(self._data_provider, "get_option_quotes_by_key", None)
+        if fetch is not None:
+            return fetch(underlying, keys)
+
+        expirations = [key[0] for key in keys]
+        chain = self._data_provider.get_option_chain(
+            underlying=underlying,
+            expiry_start=min(expirations),
+            expiry_end=max(expirations),
+        )
+        if chain is None:
+            return [None] * len(keys)
+        return [
+            chain.find_quote(option_type, strike, expiry)
+            for expiry, strike, option_type in keys
+        ]
+
+    def _extract_option_price(self, quote: OptionQuote) -> float | None:
+        """根据 price_mode 从期权报价中提取价格，并记录价格统计
+
+        Returns:
+            有效价格 (> 0)，缺失或无效时返回 None
+        """
+        if self._price_mode == PriceMode.OPEN:
+            open_price = getattr(quote, "open", None)
+            if open_price is not None and open_price > 0:
+                price = open_price
+            else:
+                price = quote.last_price or quote.close
+
+        elif self._price_mode == PriceMode.MID:
+            if (
+                quote.bid
+                and quote.ask
+                and quote.bid > 0
+                and quote.ask > 0
+            ):
+                price = (quote.bid + quote.ask) / 2
+            else:
+                price = getattr(quote, "close", None) or quote.last_price
+
+        else:  # CLOSE
+            close_price = getattr(quote, "close", None)
+            if close_price is not None and close_price > 0:
+                price = close_price
+            else:
+                price = quote.last_price
+
+        # 价格 <= 0 视为无效，返回 None 以触发内在价值兜底
+        if price is not None and price <= 0:
+            self._price_stats.invalid += 1
+            return None
+        if price is not None:
+            self._price_stats.successful += 1
+        else:
+            self._price_stats.missing += 1
+        return price
+
+    def _update_position_from_quote(
         self,
         position: SimulatedPosition,
-        chain: OptionChain | None,
+        quote: OptionQuote | None,
         underlying_price: float,
-        stock_quote: StockQuote | None,
     ) -> None:
-        """从预取的期权链更新持仓市场数据
+        """用预取的期权报价更新持仓市场数据
 
         Args:
             position: 持仓
-            chain: 期权链（可能为 None）
+            quote: 该持仓合约的报价（未找到时为 None）
             underlying_price: 标的价格
-            stock_quote: 标的报价（用于错误信息）
-
-        Raises:
-            DataNotFoundError: 当期权数据缺失且无法使用内在价值时
         """
         # 断言：期权持仓的必要字段
         assert position.underlying is not None, "Option position must have underlying"
@@ -476,54 +540,8 @@ class PositionManager:
         self._price_stats.total_queries += 1
 
         option_price: float | None = None
-
-        if chain is not None:
-            contracts = chain.puts if position.option_type == OptionType.PUT else chain.calls
-
-            for quote in contracts:
-                if (
-                    quote.contract.strike_price == position.strike
-                    and quote.contract.expiry_date == position.expiration
-                ):
-                    # 根据 price_mode 提取价格
-                    if self._price_mode == PriceMode.OPEN:
-                        open_price = getattr(quote, "open", None)
-                        if open_price is not None and open_price > 0:
-                            option_price = open_price
-                        else:
-                            option_price = quote.last_price or quote.close
-
-                    elif self._price_mode == PriceMode.MID:
-                        if (
-                            quote.bid
-                            and quote.ask
-                            and quote.bid > 0
-                            and quote.ask > 0
-                        ):
-                            option_price = (quote.bid + quote.ask) / 2
-                        else:
-                            option_price = getattr(quote, "close", None) or quote.last_price
-
-                    else:  # CLOSE
-                        close_price = getattr(quote, "close", None)
-                        if close_price is not None and close_price > 0:
-                            option_price = close_price
-                        else:
-                            option_price = quote.last_price
-
-                    # 检查价格有效性
-                    if option_price is not None and option_price <= 0:
-                        self._price_stats.invalid += 1
-                        option_price = None
-                    elif option_price is not None:
-                        self._price_stats.successful += 1
-                    else:
-                        self._price_stats.missing += 1
-
-                    break
-            else:
-                # 未在链中找到合约
-                self._price_stats.missing += 1
+        if quote is not None:
+            option_price = self._extract_option_price(quote)
         else:
             self._price_stats.missing += 1
 
@@ -562,66 +580,14 @@ class PositionManager:
         strike: float,
         expiration: date,
     ) -> float | None:
-        """从期权链获取期权价格"""
+        """获取单个合约的期权价格"""
         self._price_stats.total_queries += 1
         try:
-            chain = self._data_provider.get_option_chain(
-                underlying=underlying,
-                expiry_start=expiration,
-                expiry_end=expiration,
-            )
-
-            if chain is None:
+            quote = self._fetch_option_quotes(underlying, [(expiration, strike, option_type)])[0]
+            if quote is None:
                 self._price_stats.missing += 1
                 return None
-
-            contracts = chain.puts if option_type == OptionType.PUT else chain.calls
-
-            for quote in contracts:
-                if (
-                    quote.contract.strike_price == strike
-                    and quote.contract.expiry_date == expiration
-                ):
-                    price = None
-                    if self._price_mode == PriceMode.OPEN:
-                        open_price = getattr(quote, "open", None)
-                        if open_price is not None and open_price > 0:
-                            price = open_price
-                        else:
-                            price = quote.last_price or quote.close
-
-                    elif self._price_mode == PriceMode.MID:
-                        if (
-                            quote.bid
-                            and quote.ask
-                            and quote.bid > 0
-                            and quote.ask > 0
-                        ):
-                            price = (quote.bid + quote.ask) / 2
-                        else:
-                            price = getattr(quote, "close", None) or quote.last_price
-
-                    else:  # CLOSE
-                        close_price = getattr(quote, "close", None)
-                        if close_price is not None and close_price > 0:
-                            price = close_price
-                        else:
-                            price = quote.last_price
-
-                    # 如果获取到的价格 <= 0，认为无效，返回 None 以触发内在价值兜底
-                    if price is not None and price <= 0:
-                        # 除非是到期日当天，可以等于0
-                        self._price_stats.invalid += 1
-                        price = None
-                    elif price is not None:
-                        self._price_stats.successful += 1
-                    else:
-                        self._price_stats.missing += 1
-
-                    return price
-
-            self._price_stats.missing += 1
-            return None
+            return self._extract_option_price(quote)
 
         except Exception as e:
             self._price_stats.missing += 1
@@ -859,36 +825,23 @@ class PositionManager:
     ) -> tuple[float | None, float | None, float | None, float | None, float | None]:
         """获取持仓的 Greeks"""
         try:
-            chain = self._data_provider.get_option_chain(
-                underlying=position.underlying,
-                expiry_start=position.expiration,
-                expiry_end=position.expiration,
-            )
-
-            if chain is None:
-                return None, None, None, None, None
-
-            contracts = (
-                chain.puts if position.option_type == OptionType.PUT else chain.calls
-            )
-
-            for quote in contracts:
-                if (
-                    quote.contract.strike_price == position.strike
-                    and quote.contract.expiry_date == position.expiration
-                ):
-                    greeks = quote.greeks if hasattr(quote, "greeks") else None
-                    if greeks:
-                        # Return raw per-share Greeks (without quantity multiplication).
-                        # The engine layer's calc_portfolio_*() functions handle
-                        # quantity × contract_multiplier correctly.
-                        return (
-                            greeks.delta,
-                            greeks.gamma,
-                            greeks.theta,
-                            greeks.vega,
-                            quote.iv,
-                        )
+            quote = self._fetch_option_quotes(
+                position.underlying,
+                [(position.expiration, position.strike, position.option_type)],
+            )[0]
+
+            greeks = quote.greeks if quote is not None else None
+            if greeks:
+                # Return raw per-share Greeks (without quantity multiplication).
+                # The engine layer's calc_portfolio_*() functions handle
+                # quantity × contract_multiplier correctly.
+                return (
+                    greeks.delta,
+                    greeks.gamma,
+                    greeks.theta,
+                    greeks.vega,
+                    quote.iv,
+                )
 
             return None, None, None, None, None
 
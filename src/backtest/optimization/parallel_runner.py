@@ -8,15 +8,22 @@ Features:
 - 进度追踪
 - 结果聚合
 - 资源管理
+- 共享数据模式: 父进程一次性导出数据，worker 内存映射零拷贝挂载
 
 Usage:
     from src.backtest.optimization import ParallelBacktestRunner
 
     runner = ParallelBacktestRunner(max_workers=4)
     results = runner.run_multi_symbol(config, symbols)
+
+    # 参数扫描: 所有 worker 共享同一份行情/期权数据
+    runner = ParallelBacktestRunner(max_workers=8, shared_data=True)
+    results = runner.run_multi_config(configs)
 """
 
 import logging
+import shutil
+import tempfile
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import date
@@ -85,39 +92,29 @@ def _run_single_backtest(args: tuple) -> tuple[str, BacktestResult | None, str |
     """单个回测任务 (用于进程池)
 
     Args:
-        args: (task_id, config_dict, data_dir)
+        args: (task_id, config_dict, data_dir, shared_data_dir)
+            shared_data_dir 为 None 时 worker 自行从 Parquet 读取数据
 
     Returns:
         (task_id, result, error)
     """
-    task_id, config_dict, data_dir_str = args
+    task_id, config_dict, data_dir_str, shared_data_dir = args
 
     try:
         # 重建配置 (因为跨进程序列化)
         from src.backtest.config.backtest_config import BacktestConfig
         from src.backtest.data.duckdb_provider import DuckDBProvider
+        from src.backtest.data.shared_data import SharedDataPlane
         from src.backtest.engine.backtest_executor import BacktestExecutor
-        from src.engine.models.enums import StrategyType
-
-        config = BacktestConfig(
-            name=config_dict["name"],
-            start_date=date.fromisoformat(config_dict["start_date"]),
-            end_date=date.fromisoformat(config_dict["end_date"]),
-            symbols=config_dict["symbols"],
-            strategy_type=StrategyType(config_dict["strategy_type"]),
-            initial_capital=config_dict.get("initial_capital", 100000.0),
-            max_margin_utilization=config_dict.get("max_margin_utilization", 0.70),
-            max_position_pct=config_dict.get("max_position_pct", 0.10),
-            max_positions=config_dict.get("max_positions", 10),
-            slippage_pct=config_dict.get("slippage_pct", 0.001),
-            commission_per_contract=config_dict.get("commission_per_contract", 0.65),
-            data_dir=Path(data_dir_str),
-        )
+
+        config = BacktestConfig.from_dict({**config_dict, "data_dir": data_dir_str})
 
         provider = DuckDBProvider(
             data_dir=config.data_dir,
             as_of_date=config.start_date,
         )
+        if shared_data_dir is not None:
+            provider.attach_shared_data(SharedDataPlane(shared_data_dir))
 
         executor = BacktestExecutor(config=config, data_provider=provider)
         result = executor.run()
@@ -147,17 +144,23 @@ class ParallelBacktestRunner:
         self,
         max_workers: int | None = None,
         use_processes: bool = True,
+        shared_data: bool = False,
+        shared_data_dir: Path | str | None = None,
     ) -> None:
         """初始化并行执行器
 
         Args:
             max_workers: 最大并行数 (默认 CPU 核心数)
             use_processes: 使用多进程 (True) 或多线程 (False)
+            shared_data: 父进程一次性导出所有任务需要的数据，worker 内存映射挂载
+            shared_data_dir: 共享数据的临时目录位置 (默认 /dev/shm，不存在时用系统临时目录)
         """
         import os
 
         self._max_workers = max_workers or min(os.cpu_count() or 4, 8)
         self._use_processes = use_processes
+        self._shared_data = shared_data
+        self._shared_data_dir = shared_data_dir
 
     def run_multi_symbol(
         self,
@@ -198,6 +201,7 @@ class ParallelBacktestRunner:
                 "max_positions": base_config.max_positions,
                 "slippage_pct": base_config.slippage_pct,
                 "commission_per_contract": base_config.commission_per_contract,
+                "benchmark_symbol": base_config.benchmark_symbol,
             }
             tasks.append((symbol, config_dict, str(base_config.data_dir)))
 
@@ -242,6 +246,7 @@ class ParallelBacktestRunner:
                 "max_positions": config.max_positions,
                 "slippage_pct": config.slippage_pct,
                 "commission_per_contract": config.commission_per_contract,
+                "benchmark_symbol": config.benchmark_symbol,
             }
             tasks.append((config.name, config_dict, str(config.data_dir)))
 
@@ -270,6 +275,72 @@ class ParallelBacktestRunner:
         if not tasks:
             return result
 
+        # 共享数据模式: 按 data_dir 分组，每组导出一次
+        shared_dirs: dict[str, Path] = {}
+        if self._shared_data:
+            shared_dirs = self._build_shared_data(tasks)
+        tasks = [(*task, shared_dirs.get(task[2])) for task in tasks]
+
+        try:
+            self._execute(tasks, result, progress_callback)
+        finally:
+            for plane_dir in shared_dirs.values():
+                shutil.rmtree(plane_dir, ignore_errors=True)
+
+        return result
+
+    def _build_shared_data(self, tasks: list[tuple]) -> dict[str, Path]:
+        """为任务导出共享数据
+
+        覆盖所有任务的标的 (含基准) 与日期范围的并集。同时增量构建
+        atm_iv_daily，使 worker 计算 IV Rank 时不必扫描期权文件。
+
+        Args:
+            tasks: 任务列表 [(task_id, config_dict, data_dir), ...]
+
+        Returns:
+            {data_dir: 共享数据目录}
+        """
+        from src.backtest.data.atm_iv_daily import build_atm_iv_daily
+        from src.backtest.data.shared_data import build_shared_data
+
+        base_dir = self._shared_data_dir
+        if base_dir is None and Path("/dev/shm").is_dir():
+            base_dir = "/dev/shm"
+
+        tasks_by_dir: dict[str, list[dict]] = {}
+        for _, config_dict, data_dir, *_ in tasks:
+            tasks_by_dir.setdefault(data_dir, []).append(config_dict)
+
+        shared_dirs: dict[str, Path] = {}
+        for data_dir, config_dicts in tasks_by_dir.items():
+            symbols: set[str] = set()
+            for config_dict in config_dicts:
+                symbols.update(config_dict["symbols"])
+                symbols.add(config_dict.get("benchmark_symbol", "QQQ"))
+            start = min(date.fromisoformat(c["start_date"]) for c in config_dicts)
+            end = max(date.fromisoformat(c["end_date"]) for c in config_dicts)
+
+            plane_dir = None
+            try:
+                build_atm_iv_daily(data_dir, sorted(symbols))
+                plane_dir = Path(tempfile.mkdtemp(prefix="backtest_shared_", dir=base_dir))
+                build_shared_data(data_dir, plane_dir, sorted(symbols), start, end)
+                shared_dirs[data_dir] = plane_dir
+            except Exception as e:
+                if plane_dir is not None:
+                    shutil.rmtree(plane_dir, ignore_errors=True)
+                logger.warning(f"Failed to build shared data for {data_dir}, workers will read Parquet: {e}")
+
+        return shared_dirs
+
+    def _execute(
+        self,
+        tasks: list[tuple],
+        result: ParallelRunResult,
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> None:
+        """提交任务并收集结果"""
         # 选择执行器
         executor_class = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
 
@@ -302,8 +373,6 @@ class ParallelBacktestRunner:
                 if progress_callback:
                     progress_callback(completed, len(tasks))
 
-        return result
-
     def run_sequential(
         self,
         configs: list[BacktestConfig],
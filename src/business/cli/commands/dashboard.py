@@ -130,6 +130,152 @@ def dashboard(
         sys.exit(1)
 
 
+class DashboardSession:
+    """仪表盘长连接会话
+
+    在自动刷新模式下跨多次刷新复用券商连接、UnifiedDataProvider、
+    MonitoringDataBridge（含按 TTL 过期的标的数据缓存）和 MonitoringPipeline，
+    每次刷新只重新拉取持仓与账户数据，不再重复连接/握手。
+
+    连接断开时（IBKR 心跳失败 / Futu 断开）在下一次刷新时自动重建。
+
+    Usage:
+        >>> with DashboardSession("paper") as session:
+        ...     result = session.refresh()
+    """
+
+    def __init__(
+        self,
+        account_type: Optional[str],
+        ibkr_only: bool = False,
+        futu_only: bool = False,
+    ) -> None:
+        """初始化会话（连接在首次刷新时建立）
+
+        Args:
+            account_type: 账户类型，None 表示使用示例数据
+            ibkr_only: 仅IBKR
+            futu_only: 仅Futu
+        """
+        self._account_type = account_type
+        self._ibkr_only = ibkr_only
+        self._futu_only = futu_only
+
+        self._conn = None
+        self._aggregator = None
+        self._bridge = None
+        self._pipeline: Optional[MonitoringPipeline] = None
+
+    def __enter__(self) -> "DashboardSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def refresh(self) -> MonitorResult:
+        """获取一次监控结果（复用会话内的连接与缓存）
+
+        Returns:
+            MonitorResult 监控结果
+        """
+        if self._account_type:
+            position_list, capital_metrics = self.load_positions()
+        else:
+            # 使用示例数据
+            position_list = _get_sample_positions()
+            capital_metrics = _get_sample_capital()
+
+        if self._pipeline is None:
+            self._pipeline = MonitoringPipeline()
+        return self._pipeline.run(
+            positions=position_list,
+            capital_metrics=capital_metrics,
+        )
+
+    def load_positions(self) -> tuple[list[PositionData], CapitalMetrics]:
+        """从真实账户加载持仓数据
+
+        Returns:
+            (持仓列表, 资金指标)
+        """
+        from src.data.models.account import AccountType as AccType
+        from src.engine.account.metrics import calc_capital_metrics
+
+        self._ensure_connected()
+
+        # 获取合并后的组合
+        acc_type = AccType.PAPER if self._account_type == "paper" else AccType.LIVE
+        portfolio = self._aggregator.get_consolidated_portfolio(account_type=acc_type)
+
+        # 使用 DataBridge 转换持仓（标的补充数据按 TTL 缓存）
+        position_list = self._bridge.convert_positions(portfolio)
+
+        # 调用 engine 层计算 CapitalMetrics
+        capital_metrics = calc_capital_metrics(portfolio)
+
+        return position_list, capital_metrics
+
+    def _ensure_connected(self) -> None:
+        """首次调用或连接失效时建立连接并构建 provider/bridge"""
+        if self._conn is not None and self._is_healthy():
+            return
+        if self._conn is not None:
+            logger.warning("券商连接已失效，重新连接")
+            self.close()
+
+        from src.data.providers.broker_manager import BrokerManager
+        from src.data.providers.unified_provider import UnifiedDataProvider
+        from src.business.monitoring.data_bridge import MonitoringDataBridge
+
+        # 使用 BrokerManager 统一连接
+        manager = BrokerManager(account_type=self._account_type)
+        conn = manager.connect(ibkr=not self._futu_only, futu=not self._ibkr_only)
+
+        # 记录连接状态
+        if conn.ibkr:
+            logger.info("IBKR 连接成功")
+        elif conn.ibkr_error and not self._futu_only:
+            logger.warning(f"IBKR 连接失败: {conn.ibkr_error}")
+
+        if conn.futu:
+            logger.info("Futu 连接成功")
+        elif conn.futu_error and not self._ibkr_only:
+            logger.warning(f"Futu 连接失败: {conn.futu_error}")
+
+        if not conn.any_connected:
+            raise click.ClickException("无法连接任何券商账户")
+
+        self._conn = conn
+        self._aggregator = conn.get_aggregator()
+        unified_provider = UnifiedDataProvider(
+            ibkr_provider=conn.ibkr,
+            futu_provider=conn.futu,
+        )
+        self._bridge = MonitoringDataBridge(
+            data_provider=unified_provider,
+            ibkr_provider=conn.ibkr,
+            futu_provider=conn.futu,
+        )
+
+    def _is_healthy(self) -> bool:
+        """已连接的券商是否仍然可用"""
+        providers = [p for p in (self._conn.ibkr, self._conn.futu) if p is not None]
+        return all(p.is_available for p in providers)
+
+    def close(self) -> None:
+        """断开券商连接并释放会话资源"""
+        if self._conn is not None:
+            for provider in (self._conn.ibkr, self._conn.futu):
+                if provider:
+                    try:
+                        provider.disconnect()
+                    except Exception:
+                        pass
+        self._conn = None
+        self._aggregator = None
+        self._bridge = None
+
+
 def _run_refresh_loop(
     renderer: DashboardRenderer,
     account_type: Optional[str],
@@ -139,6 +285,8 @@ def _run_refresh_loop(
 ) -> None:
     """运行自动刷新循环
 
+    整个循环共用一个 DashboardSession，连接只在启动（或断线）时建立。
+
     Args:
         renderer: Dashboard渲染器
         account_type: 账户类型
@@ -149,19 +297,24 @@ def _run_refresh_loop(
     click.echo(f"🔄 自动刷新模式，间隔 {interval} 秒（按 Ctrl+C 退出）")
     click.echo()
 
-    while True:
-        # 清屏
-        os.system("clear" if os.name == "posix" else "cls")
-
-        try:
-            result = _get_monitor_result(account_type, ibkr_only, futu_only)
-            output = renderer.render(result)
-            click.echo(output)
-            click.echo(f"\n⏱️ 下次刷新: {interval}秒后")
-        except Exception as e:
-            click.echo(f"⚠️ 刷新出错: {e}")
-
-        time.sleep(interval)
+    with DashboardSession(account_type, ibkr_only, futu_only) as session:
+        while True:
+            started = time.monotonic()
+            try:
+                result = session.refresh()
+                output = renderer.render(result)
+                # 数据就绪后再清屏，避免刷新期间白屏
+                os.system("clear" if os.name == "posix" else "cls")
+                click.echo(output)
+                click.echo(
+                    f"\n⏱️ 刷新耗时 {time.monotonic() - started:.1f}秒，下次刷新: {interval}秒后"
+                )
+            except click.ClickException as e:
+                click.echo(f"⚠️ 刷新出错: {e.message}")
+            except Exception as e:
+                click.echo(f"⚠️ 刷新出错: {e}")
+
+            time.sleep(interval)
 
 
 def _get_monitor_result(
@@ -169,7 +322,7 @@ def _get_monitor_result(
     ibkr_only: bool,
     futu_only: bool,
 ) -> MonitorResult:
-    """获取监控结果
+    """获取监控结果（单次：用完即断开连接）
 
     Args:
         account_type: 账户类型
@@ -179,101 +332,8 @@ def _get_monitor_result(
     Returns:
         MonitorResult 监控结果
     """
-    if account_type:
-        position_list, capital_metrics = _load_from_account(
-            account_type, ibkr_only, futu_only
-        )
-    else:
-        # 使用示例数据
-        position_list = _get_sample_positions()
-        capital_metrics = _get_sample_capital()
-
-    # 创建监控管道并运行
-    pipeline = MonitoringPipeline()
-    result = pipeline.run(
-        positions=position_list,
-        capital_metrics=capital_metrics,
-    )
-
-    return result
-
-
-def _load_from_account(
-    account_type: str,
-    ibkr_only: bool,
-    futu_only: bool,
-) -> tuple[list[PositionData], CapitalMetrics]:
-    """从真实账户加载持仓数据
-
-    Args:
-        account_type: "paper" 或 "live"
-        ibkr_only: 仅使用 IBKR
-        futu_only: 仅使用 Futu
-
-    Returns:
-        (持仓列表, 资金指标)
-    """
-    from src.data.models.account import AccountType as AccType
-    from src.data.providers.broker_manager import BrokerManager
-    from src.data.providers.unified_provider import UnifiedDataProvider
-    from src.business.monitoring.data_bridge import MonitoringDataBridge
-    from src.engine.account.metrics import calc_capital_metrics
-
-    # 使用 BrokerManager 统一连接
-    manager = BrokerManager(account_type=account_type)
-    conn = manager.connect(ibkr=not futu_only, futu=not ibkr_only)
-
-    # 记录连接状态
-    if conn.ibkr:
-        logger.info("IBKR 连接成功")
-    elif conn.ibkr_error and not futu_only:
-        logger.warning(f"IBKR 连接失败: {conn.ibkr_error}")
-
-    if conn.futu:
-        logger.info("Futu 连接成功")
-    elif conn.futu_error and not ibkr_only:
-        logger.warning(f"Futu 连接失败: {conn.futu_error}")
-
-    if not conn.any_connected:
-        raise click.ClickException("无法连接任何券商账户")
-
-    try:
-        # 获取聚合器
-        aggregator = conn.get_aggregator()
-
-        # 获取合并后的组合
-        acc_type = AccType.PAPER if account_type == "paper" else AccType.LIVE
-        portfolio = aggregator.get_consolidated_portfolio(account_type=acc_type)
-
-        # 使用 DataBridge 转换持仓
-        unified_provider = UnifiedDataProvider(
-            ibkr_provider=conn.ibkr,
-            futu_provider=conn.futu,
-        )
-        bridge = MonitoringDataBridge(
-            data_provider=unified_provider,
-            ibkr_provider=conn.ibkr,
-            futu_provider=conn.futu,
-        )
-        position_list = bridge.convert_positions(portfolio)
-
-        # 调用 engine 层计算 CapitalMetrics
-        capital_metrics = calc_capital_metrics(portfolio)
-
-        return position_list, capital_metrics
-
-    finally:
-        # 清理连接
-        if conn.ibkr:
-            try:
-                conn.ibkr.disconnect()
-            except Exception:
-                pass
-        if conn.futu:
-            try:
-                conn.futu.disconnect()
-            except Exception:
-                pass
+    with DashboardSession(account_type, ibkr_only, futu_only) as session:
+        return session.refresh()
 
 
 def _get_sample_positions() -> list[PositionData]:
@@ -9,10 +9,15 @@
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Any
 
 from src.business.monitoring.models import PositionData
 from src.data.models.account import AccountPosition, AssetType, ConsolidatedPortfolio
+from src.data.models.enums import DataType
 from src.data.models.fundamental import Fundamental
 from src.data.models.stock import StockVolatility
 from src.data.models.technical import TechnicalData
@@ -30,6 +35,17 @@ from src.engine.pricing.factory import (
 
 logger = logging.getLogger(__name__)
 
+# 预获取的数据类型 -> 路由用的 DataType（volatility 只由 IBKR 提供，不走路由）
+_PREFETCH_KINDS: dict[str, DataType | None] = {
+    "volatility": None,
+    "technical": DataType.HISTORY_KLINE,
+    "fundamental": DataType.FUNDAMENTAL,
+}
+
+# 并发预获取时每个 provider 的最大并发数
+# Futu/Yahoo 请求间隔仍由各自的 _check_rate_limit 控制
+DEFAULT_PREFETCH_CONCURRENCY = {"futu": 2, "yahoo": 4}
+
 
 class MonitoringDataBridge:
     """数据转换桥接器
@@ -47,6 +63,7 @@ class MonitoringDataBridge:
         ibkr_provider: IBKRProvider | None = None,
         futu_provider: FutuProvider | None = None,
         cache_ttl_seconds: int = 300,
+        prefetch_concurrency: dict[str, int] | None = None,
     ):
         """初始化数据转换器
 
@@ -55,16 +72,28 @@ class MonitoringDataBridge:
             ibkr_provider: IBKR 提供者，用于获取 HV 数据计算 SAS
             futu_provider: Futu 提供者，用于 HK 股票价格 fallback
             cache_ttl_seconds: 缓存有效期（秒），默认 5 分钟
+            prefetch_concurrency: 每个 provider 的预获取并发上限，
+                默认 DEFAULT_PREFETCH_CONCURRENCY
         """
         self._provider = data_provider
         self._ibkr_provider = ibkr_provider
         self._futu_provider = futu_provider
         self._cache_ttl = cache_ttl_seconds
+        self._prefetch_concurrency = dict(prefetch_concurrency or DEFAULT_PREFETCH_CONCURRENCY)
 
-        # 数据缓存（按 symbol 存储）
+        # 数据缓存（按 symbol 存储），超过 cache_ttl_seconds 后重新获取
         self._volatility_cache: dict[str, StockVolatility] = {}
         self._technical_cache: dict[str, TechnicalData] = {}
         self._fundamental_cache: dict[str, Fundamental] = {}
+        self._fetched_at: dict[str, float] = {}  # symbol -> 上次获取时间 (monotonic)
+
+        # 最近一次预获取每个请求的耗时（秒），key 为 (symbol, kind)
+        self._prefetch_latency: dict[tuple[str, str], float] = {}
+
+    @property
+    def prefetch_latency(self) -> dict[tuple[str, str], float]:
+        """最近一次预获取每个 (symbol, kind) 请求的耗时（秒）"""
+        return dict(self._prefetch_latency)
 
     def convert_positions(
         self,
@@ -122,6 +151,13 @@ class MonitoringDataBridge:
     def _prefetch_data(self, symbols: set[str]) -> None:
         """批量预获取补充数据
 
+        所有 (symbol × 数据类型) 请求同时发出，按服务该请求的 provider 分组：
+        - Futu / Yahoo：各自一个线程池，并发数受 prefetch_concurrency 限制
+        - IBKR：ib_insync 的事件循环绑定在连接线程上，因此在调用线程上
+          顺序执行（与其他 provider 的请求并行）
+
+        总耗时约为最慢一组的耗时，而不是所有请求耗时之和。
+
         Args:
             symbols: 需要获取数据的 symbols
         """
@@ -129,39 +165,125 @@ class MonitoringDataBridge:
             logger.debug("No data provider configured, skipping prefetch")
             return
 
+        # 长连接会话中 bridge 跨多次刷新复用：只重新获取过期或新出现的 symbol
+        now = time.monotonic()
+        symbols = {
+            s for s in symbols
+            if now - self._fetched_at.get(s, float("-inf")) >= self._cache_ttl
+        }
+        if not symbols:
+            return
+
         logger.debug(f"_prefetch_data: Fetching data for symbols: {symbols}")
 
-        for symbol in symbols:
-            # Volatility data
-            if symbol not in self._volatility_cache:
-                try:
-                    vol = self._provider.get_stock_volatility(symbol)
-                    if vol:
-                        self._volatility_cache[symbol] = vol
-                except Exception as e:
-                    logger.warning(f"Failed to get volatility for {symbol}: {e}")
-
-            # Technical data (from K-lines)
-            if symbol not in self._technical_cache:
-                try:
-                    klines = self._provider.get_history_kline(symbol)
-                    if klines:
-                        tech_data = TechnicalData.from_klines(klines)
-                        self._technical_cache[symbol] = tech_data
-                except Exception as e:
-                    logger.warning(f"Failed to get technical data for {symbol}: {e}")
-
-            # Fundamental data
-            if symbol not in self._fundamental_cache:
-                try:
-                    fund = self._provider.get_fundamental(symbol)
-                    if fund:
-                        self._fundamental_cache[symbol] = fund
-                        logger.debug(f"_prefetch_data: Got fundamental for {symbol}, beta={fund.beta}")
-                    else:
-                        logger.debug(f"_prefetch_data: No fundamental returned for {symbol}")
-                except Exception as e:
-                    logger.warning(f"Failed to get fundamental for {symbol}: {e}")
+        # Step 1: 按 provider 分组（None 表示在调用线程上执行）
+        lanes: dict[str | None, list[tuple[str, str]]] = {}
+        for symbol in sorted(symbols):
+            for kind in _PREFETCH_KINDS:
+                lanes.setdefault(self._prefetch_lane(symbol, kind), []).append((symbol, kind))
+
+        # Step 2: 线程池 lane 先提交，再在调用线程上执行其余请求
+        started = time.monotonic()
+        executors: list[ThreadPoolExecutor] = []
+        futures: list[tuple[str, str, Future]] = []
+        results: list[tuple[str, str, Any, float, bool]] = []
+        try:
+            for lane, tasks in lanes.items():
+                if lane is None:
+                    continue
+                executor = ThreadPoolExecutor(
+                    max_workers=max(1, min(self._prefetch_concurrency.get(lane, 1), len(tasks))),
+                    thread_name_prefix=f"prefetch-{lane}",
+                )
+                executors.append(executor)
+                for symbol, kind in tasks:
+                    futures.append((symbol, kind, executor.submit(self._fetch_one, symbol, kind)))
+
+            for symbol, kind in lanes.get(None, []):
+                results.append((symbol, kind, *self._fetch_one(symbol, kind)))
+
+            for symbol, kind, future in futures:
+                results.append((symbol, kind, *future.result()))
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+        # Step 3: 在调用线程上写入缓存（获取失败时保留上一次的值）
+        # 只有所有请求都成功的 symbol 才记录获取时间，失败的下次刷新重试
+        self._prefetch_latency = {}
+        failed: set[str] = set()
+        for symbol, kind, value, elapsed, ok in results:
+            self._prefetch_latency[(symbol, kind)] = elapsed
+            if not ok:
+                failed.add(symbol)
+            if value is None:
+                continue
+            if kind == "volatility":
+                self._volatility_cache[symbol] = value
+            elif kind == "technical":
+                self._technical_cache[symbol] = value
+            else:
+                self._fundamental_cache[symbol] = value
+
+        for symbol in symbols - failed:
+            self._fetched_at[symbol] = now
+
+        if self._prefetch_latency:
+            (slow_symbol, slow_kind), slowest = max(
+                self._prefetch_latency.items(), key=lambda item: item[1]
+            )
+            logger.info(
+                f"Prefetched {len(results)} requests for {len(symbols)} symbols in "
+                f"{time.monotonic() - started:.2f}s "
+                f"(sum {sum(self._prefetch_latency.values()):.2f}s, "
+                f"slowest {slow_symbol}/{slow_kind} {slowest:.2f}s)"
+            )
+
+    def _prefetch_lane(self, symbol: str, kind: str) -> str | None:
+        """返回执行该请求的线程池 lane（provider 名称），None 表示调用线程
+
+        路由中包含 IBKR 的请求（包括 fallback）都留在调用线程上。
+        """
+        data_type = _PREFETCH_KINDS[kind]
+        if data_type is None:
+            return None
+        names = list(self._provider.route_names(data_type, symbol))
+        if not names or "ibkr" in names:
+            return None
+        return names[0]
+
+    def _fetch_one(self, symbol: str, kind: str) -> tuple[Any, float, bool]:
+        """获取单个 (symbol, kind) 数据，返回 (结果或 None, 耗时秒数, 是否成功)
+
+        provider 正常返回空数据也算成功，只有抛出异常才视为失败。
+        """
+        started = time.monotonic()
+        value: Any = None
+        ok = True
+        try:
+            if kind == "volatility":
+                value = self._provider.get_stock_volatility(symbol) or None
+            elif kind == "technical":
+                # Technical data (from K-lines)
+                klines = self._provider.get_history_kline(symbol)
+                if klines:
+                    value = TechnicalData.from_klines(klines)
+            else:
+                value = self._provider.get_fundamental(symbol) or None
+                if value:
+                    logger.debug(f"_prefetch_data: Got fundamental for {symbol}, beta={value.beta}")
+                else:
+                    logger.debug(f"_prefetch_data: No fundamental returned for {symbol}")
+        except Exception as e:
+            logger.warning(f"Failed to get {kind} data for {symbol}: {e}")
+            value = None
+            ok = False
+        elapsed = time.monotonic() - started
+        logger.debug(
+            f"_prefetch_data: {symbol}/{kind} {elapsed:.2f}s "
+            f"({threading.current_thread().name})"
+        )
+        return value, elapsed, ok
 
     def _convert_position(
         self,
@@ -488,3 +610,4 @@ class MonitoringDataBridge:
         self._volatility_cache.clear()
         self._technical_cache.clear()
         self._fundamental_cache.clear()
+        self._fetched_at.clear()
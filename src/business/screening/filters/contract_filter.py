@@ -20,6 +20,8 @@ import logging
 from datetime import date
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from src.business.config.screening_config import (
     ContractFilterConfig,
     LiquidityConfig,
@@ -33,6 +35,7 @@ from src.business.screening.models import (
     ContractOpportunity,
     UnderlyingScore,
 )
+from src.data.models.option_frame import OptionChainFrame
 from src.data.providers.base import DataProvider
 from src.data.providers.unified_provider import UnifiedDataProvider
 from src.engine.contract.liquidity import (
@@ -45,6 +48,7 @@ from src.engine.contract.metrics import (
 )
 from src.engine.bs.greeks import calc_bs_greeks
 from src.engine.models import BSParams
+from src.engine.pricing.chain import ChainPricingInput, calc_short_option_chain_metrics
 from src.engine.pricing.short_call import ShortCallPricer
 from src.engine.pricing.short_put import ShortPutPricer
 
@@ -266,99 +270,24 @@ class ContractFilter:
         """
         symbol = score.symbol
 
-        # 1. 从 data_layer 获取期权链（利用 API 层过滤，大幅减少返回数据量）
+        # 1-3. 从 data_layer 获取期权链并做应用层预过滤
         dte_min, dte_max = filter_config.dte_range
-        delta_min, delta_max = filter_config.delta_range
-        liquidity_config = filter_config.liquidity
         today = self._get_reference_date()
 
         # 确定 option_type 参数（单一类型时传入，否则 None 获取全部）
         types_to_eval = option_types or ["put", "call"]
         api_option_type = types_to_eval[0] if len(types_to_eval) == 1 else None
 
-        # 调用 UnifiedDataProvider，利用 API 原生过滤能力：
-        # - Futu: option_type, option_cond_type, open_interest 原生支持
-        # - IBKR: expiry_min/max_days, strike_range_pct 原生支持，其他后处理
-        # 注意：delta 过滤保留在应用层，因为配置是 |Delta| 绝对值，而 API 需要考虑正负号
-        #       PUT delta 是负数，CALL delta 是正数，无法用单一 min/max 表达
-        # OTM% 范围过滤 (前置过滤，大幅减少合约数量)
-        otm_min, otm_max = filter_config.otm_range
-
-        chain = self.provider.get_option_chain(
-            symbol,
-            expiry_min_days=dte_min,
-            expiry_max_days=dte_max,
-            option_type=api_option_type,
-            option_cond_type="otm",  # 关键：直接排除 ITM
-            open_interest_min=liquidity_config.min_open_interest,  # Futu 原生支持
-            otm_pct_min=otm_min,  # OTM% 下限 (如 0.05 = 5%)
-            otm_pct_max=otm_max,  # OTM% 上限 (如 0.15 = 15%)
-        )
-
-        if chain is None:
-            logger.warning(f"{symbol} 无期权链数据")
-            return []
-
-        # 2. 根据 option_types 决定评估哪些合约
-        all_chain_quotes: list[tuple] = []  # (quote, option_type)
-
-        if "put" in types_to_eval and chain.puts:
-            for q in chain.puts:
-                all_chain_quotes.append((q, "put"))
-
-        if "call" in types_to_eval and chain.calls:
-            for q in chain.calls:
-                all_chain_quotes.append((q, "call"))
-
-        if not all_chain_quotes:
-            logger.warning(f"{symbol} 无符合条件的合约（API 层过滤后为空）")
-            return []
-
-        # ============================================================
-        # 3. 应用层精细过滤（API 不支持或需要更精确检查的条件）
-        # 注意：大部分过滤已在 API 层完成，此处仅做补充检查
-        # ============================================================
-        pre_filtered: list[tuple] = []
-        stats = {
-            "total": len(all_chain_quotes),
-            "dte_fail": 0,  # API 层已过滤，这里做双重检查
-            "delta_fail": 0,  # IBKR 不支持 delta 过滤，需要应用层检查
-            "oi_fail": 0,  # IBKR 不支持 OI 过滤，需要应用层检查
-        }
-
-        for q, opt_type in all_chain_quotes:
-            contract = q.contract
-
-            # DTE 双重检查（API 层已过滤，这里确保精确）
-            dte = (contract.expiry_date - today).days
-            if not (dte_min <= dte <= dte_max):
-                stats["dte_fail"] += 1
-                continue
-
-            # Delta 精细检查（IBKR 不支持 delta 过滤，需要应用层检查）
-            # 只在有值时检查，无值则跳过（让评估阶段处理）
-            greeks = q.greeks if hasattr(q, "greeks") else None
-            delta = greeks.delta if greeks else None
-            if delta is not None:
-                abs_delta = abs(delta)
-                if not (delta_min <= abs_delta <= delta_max):
-                    stats["delta_fail"] += 1
-                    continue
-
-            # OI 精细检查（IBKR 不支持 OI 过滤，需要应用层检查）
-            oi = q.open_interest if hasattr(q, "open_interest") else None
-            if oi is not None and oi < liquidity_config.min_open_interest:
-                stats["oi_fail"] += 1
-                continue
-
-            pre_filtered.append((q, opt_type))
-
-        passed = len(pre_filtered)
-        logger.info(
-            f"{symbol} API过滤后={stats['total']} -> 应用层精细过滤: "
-            f"DTE淘汰{stats['dte_fail']}/Delta淘汰{stats['delta_fail']}/OI淘汰{stats['oi_fail']} -> "
-            f"{passed}个通过"
-        )
+        # 回测 Provider 提供列式期权链时按列预过滤，只为通过的合约创建 OptionQuote
+        chain_frame = self._get_option_chain_frame(symbol, dte_min, dte_max)
+        if chain_frame is not None:
+            pre_filtered = self._prefilter_chain_frame(
+                symbol, chain_frame, types_to_eval, filter_config, today
+            )
+        else:
+            pre_filtered = self._prefilter_chain(
+                symbol, types_to_eval, api_option_type, filter_config, today
+            )
 
         if not pre_filtered:
             return []
@@ -385,8 +314,8 @@ class ContractFilter:
 
         logger.info(f"{symbol} 获取 {len(quotes)} 个报价，开始评估")
 
-        # 5. 评估每个合约（收集所有结果，包括被拒绝的）
-        all_evaluated: list[ContractOpportunity] = []
+        # 5. 补算 Greeks 并整条链一次性向量化计算策略指标
+        evaluation_inputs: list[tuple] = []  # (quote, option_type, greeks)
         for quote in quotes:
             # 确定 option_type
             contract = quote.contract
@@ -396,6 +325,20 @@ class ContractFilter:
                 # 从 contract.option_type 推断
                 opt_type = "put" if str(contract.option_type).lower() in ["put", "p"] else "call"
 
+            dte = (contract.expiry_date - today).days
+            greeks = self._resolve_greeks(quote, score.current_price, dte, opt_type)
+            evaluation_inputs.append((quote, opt_type, greeks))
+
+        batch_metrics = self._calc_strategy_metrics_batch(
+            [
+                self._build_pricing_inputs(quote, score, opt_type, greeks, today)
+                for quote, opt_type, greeks in evaluation_inputs
+            ]
+        )
+
+        # 6. 评估每个合约（收集所有结果，包括被拒绝的）
+        all_evaluated: list[ContractOpportunity] = []
+        for (quote, opt_type, greeks), metrics in zip(evaluation_inputs, batch_metrics):
             opp = self._evaluate_contract(
                 quote,
                 score,
@@ -403,6 +346,8 @@ class ContractFilter:
                 dte_min,
                 dte_max,
                 option_type=opt_type,
+                greeks=greeks,
+                metrics=metrics,
             )
             # 输出详细评估日志
             #self._log_contract_evaluation(opp)
@@ -429,6 +374,8 @@ class ContractFilter:
         dte_min: int,
         dte_max: int,
         option_type: str,
+        greeks: tuple | None = None,
+        metrics: dict | None = None,
     ) -> ContractOpportunity:
         """评估单个合约
 
@@ -446,6 +393,8 @@ class ContractFilter:
             dte_min: DTE 最小值
             dte_max: DTE 最大值
             option_type: 期权类型 ("put" 或 "call")
+            greeks: 已补算的 (delta, gamma, theta, vega)，None 则在此补算
+            metrics: 批量计算的策略指标，None 则单独计算
         """
         contract = quote.contract
         symbol = contract.underlying
@@ -459,12 +408,6 @@ class ContractFilter:
         today = self._get_reference_date()
         dte = (expiry - today).days
 
-        # 获取 Greeks
-        greeks = quote.greeks if hasattr(quote, "greeks") else None
-        delta = greeks.delta if greeks else None
-        gamma = greeks.gamma if greeks else None
-        theta = greeks.theta if greeks else None
-        vega = greeks.vega if greeks else None
         iv = quote.iv
 
         # 获取价格信息
@@ -477,48 +420,10 @@ class ContractFilter:
         # 获取标的价格
         underlying_price = underlying_score.current_price
 
-        # ============================================================
-        # 用 BS 模型补算缺失或无效的 Greeks（gamma/theta）
-        # 条件：gamma 或 theta 为 None 或 0（Futu API 可能返回 0 而非 None）
-        # ============================================================
-        gamma_missing = gamma is None or gamma == 0
-        theta_missing = theta is None or theta == 0
-
-        if iv and iv > 0 and underlying_price and dte > 0:
-            if gamma_missing or theta_missing:
-                try:
-                    bs_params = BSParams(
-                        spot_price=underlying_price,
-                        strike_price=strike,
-                        risk_free_rate=0.03,
-                        volatility=iv,
-                        time_to_expiry=dte / 365,
-                        is_call=(option_type == "call"),
-                    )
-                    bs_greeks = calc_bs_greeks(bs_params)
-
-                    old_gamma, old_theta = gamma, theta
-                    if gamma_missing and bs_greeks.get("gamma") is not None:
-                        gamma = bs_greeks["gamma"]
-                    if theta_missing and bs_greeks.get("theta") is not None:
-                        theta = bs_greeks["theta"]
-                    if (delta is None or delta == 0) and bs_greeks.get("delta") is not None:
-                        delta = bs_greeks["delta"]
-                    if (vega is None or vega == 0) and bs_greeks.get("vega") is not None:
-                        vega = bs_greeks["vega"]
-
-                    logger.debug(
-                        f"{symbol} {strike}{option_type[0].upper()}: "
-                        f"BS补算 gamma={old_gamma}->{gamma:.6f}, theta={old_theta}->{theta:.6f}"
-                    )
-                except Exception as e:
-                    logger.debug(f"BS Greeks 补算失败: {e}")
-        else:
-            if gamma_missing or theta_missing:
-                logger.debug(
-                    f"{symbol} {strike}{option_type[0].upper()}: "
-                    f"无法BS补算 (iv={iv}, price={underlying_price}, dte={dte})"
-                )
+        # 获取 Greeks（缺失或无效时用 BS 模型补算）
+        if greeks is None:
+            greeks = self._resolve_greeks(quote, underlying_price, dte, option_type)
+        delta, gamma, theta, vega = greeks
 
         # ============================================================
         # 阶段 1: P1 基础条件检查（快速检查，早退出）
@@ -574,25 +479,13 @@ class ContractFilter:
         # Theta/Premium 比率
         theta_prem_ratio = calc_theta_premium_ratio(theta, mid_price)
 
-        # 提取真实保证金 per-share（如果有）
-        margin_per_share = quote.margin.initial_margin if quote.margin else None
-
-        # 策略指标
-        metrics = self._calc_strategy_metrics(
-            spot_price=underlying_price or 0,
-            strike_price=strike,
-            premium=mid_price or 0,
-            volatility=iv or underlying_score.current_iv or 0.20,
-            time_to_expiry=dte / 365 if dte > 0 else 0.01,
-            hv=underlying_score.hv_20 or 0.20,
-            dte=dte,
-            delta=delta,
-            gamma=gamma,
-            theta=theta,
-            vega=vega,
-            option_type=option_type,
-            margin_per_share=margin_per_share,
-        )
+        # 策略指标（批量路径已预先计算）
+        if metrics is None:
+            metrics = self._calc_strategy_metrics(
+                **self._build_pricing_inputs(
+                    quote, underlying_score, option_type, greeks, today
+                )
+            )
 
         # 使用策略类计算的 ROC 指标（基于 IBKR margin 公式）
         annual_roc = metrics.get("roc")  # 年化 Premium ROC
@@ -706,6 +599,186 @@ class ContractFilter:
             recommended_position=recommended_position,
         )
 
+    def _prefilter_chain(
+        self,
+        symbol: str,
+        types_to_eval: list[str],
+        api_option_type: str | None,
+        filter_config: ContractFilterConfig,
+        today: date,
+    ) -> list[tuple]:
+        """获取期权链并做应用层预过滤（逐个 OptionQuote）
+
+        Returns:
+            通过预过滤的 (quote, option_type) 列表
+        """
+        dte_min, dte_max = filter_config.dte_range
+        delta_min, delta_max = filter_config.delta_range
+        liquidity_config = filter_config.liquidity
+
+        # 调用 UnifiedDataProvider，利用 API 原生过滤能力：
+        # - Futu: option_type, option_cond_type, open_interest 原生支持
+        # - IBKR: expiry_min/max_days, strike_range_pct 原生支持，其他后处理
+        # 注意：delta 过滤保留在应用层，因为配置是 |Delta| 绝对值，而 API 需要考虑正负号
+        #       PUT delta 是负数，CALL delta 是正数，无法用单一 min/max 表达
+        # OTM% 范围过滤 (前置过滤，大幅减少合约数量)
+        otm_min, otm_max = filter_config.otm_range
+
+        chain = self.provider.get_option_chain(
+            symbol,
+            expiry_min_days=dte_min,
+            expiry_max_days=dte_max,
+            option_type=api_option_type,
+            option_cond_type="otm",  # 关键：直接排除 ITM
+            open_interest_min=liquidity_config.min_open_interest,  # Futu 原生支持
+            otm_pct_min=otm_min,  # OTM% 下限 (如 0.05 = 5%)
+            otm_pct_max=otm_max,  # OTM% 上限 (如 0.15 = 15%)
+        )
+
+        if chain is None:
+            logger.warning(f"{symbol} 无期权链数据")
+            return []
+
+        # 2. 根据 option_types 决定评估哪些合约
+        all_chain_quotes: list[tuple] = []  # (quote, option_type)
+
+        if "put" in types_to_eval and chain.puts:
+            for q in chain.puts:
+                all_chain_quotes.append((q, "put"))
+
+        if "call" in types_to_eval and chain.calls:
+            for q in chain.calls:
+                all_chain_quotes.append((q, "call"))
+
+        if not all_chain_quotes:
+            logger.warning(f"{symbol} 无符合条件的合约（API 层过滤后为空）")
+            return []
+
+        # ============================================================
+        # 3. 应用层精细过滤（API 不支持或需要更精确检查的条件）
+        # 注意：大部分过滤已在 API 层完成，此处仅做补充检查
+        # ============================================================
+        pre_filtered: list[tuple] = []
+        stats = {
+            "total": len(all_chain_quotes),
+            "dte_fail": 0,  # API 层已过滤，这里做双重检查
+            "delta_fail": 0,  # IBKR 不支持 delta 过滤，需要应用层检查
+            "oi_fail": 0,  # IBKR 不支持 OI 过滤，需要应用层检查
+        }
+
+        for q, opt_type in all_chain_quotes:
+            contract = q.contract
+
+            # DTE 双重检查（API 层已过滤，这里确保精确）
+            dte = (contract.expiry_date - today).days
+            if not (dte_min <= dte <= dte_max):
+                stats["dte_fail"] += 1
+                continue
+
+            # Delta 精细检查（IBKR 不支持 delta 过滤，需要应用层检查）
+            # 只在有值时检查，无值则跳过（让评估阶段处理）
+            greeks = q.greeks if hasattr(q, "greeks") else None
+            delta = greeks.delta if greeks else None
+            if delta is not None:
+                abs_delta = abs(delta)
+                if not (delta_min <= abs_delta <= delta_max):
+                    stats["delta_fail"] += 1
+                    continue
+
+            # OI 精细检查（IBKR 不支持 OI 过滤，需要应用层检查）
+            oi = q.open_interest if hasattr(q, "open_interest") else None
+            if oi is not None and oi < liquidity_config.min_open_interest:
+                stats["oi_fail"] += 1
+                continue
+
+            pre_filtered.append((q, opt_type))
+
+        passed = len(pre_filtered)
+        logger.info(
+            f"{symbol} API过滤后={stats['total']} -> 应用层精细过滤: "
+            f"DTE淘汰{stats['dte_fail']}/Delta淘汰{stats['delta_fail']}/OI淘汰{stats['oi_fail']} -> "
+            f"{passed}个通过"
+        )
+
+        return pre_filtered
+
+    def _get_option_chain_frame(
+        self,
+        symbol: str,
+        dte_min: int,
+        dte_max: int,
+    ) -> OptionChainFrame | None:
+        """获取列式期权链（仅回测 Provider 支持，实盘 Provider 返回 None）"""
+        get_frame = getattr(self.provider, "get_option_chain_frame", None)
+        if get_frame is None:
+            return None
+        frame = get_frame(symbol, expiry_min_days=dte_min, expiry_max_days=dte_max)
+        return frame if isinstance(frame, OptionChainFrame) else None
+
+    def _prefilter_chain_frame(
+        self,
+        symbol: str,
+        frame: OptionChainFrame,
+        types_to_eval: list[str],
+        filter_config: ContractFilterConfig,
+        today: date,
+    ) -> list[tuple]:
+        """列式期权链的应用层预过滤
+
+        与 _prefilter_chain 的 DTE/Delta/OI 检查规则与统计口径一致，
+        但整条链以数组掩码计算，只为通过的合约创建 OptionQuote。
+
+        Returns:
+            通过预过滤的 (quote, option_type) 列表，PUT 在前
+        """
+        dte_min, dte_max = filter_config.dte_range
+        delta_min, delta_max = filter_config.delta_range
+        min_oi = filter_config.liquidity.min_open_interest
+
+        is_put = ~frame.is_call
+        type_mask = np.zeros(len(frame), dtype=bool)
+        if "put" in types_to_eval:
+            type_mask |= is_put
+        if "call" in types_to_eval:
+            type_mask |= frame.is_call
+
+        total = int(type_mask.sum())
+        if total == 0:
+            logger.warning(f"{symbol} 无符合条件的合约（API 层过滤后为空）")
+            return []
+
+        dte = frame.dte(today)
+        dte_ok = (dte >= dte_min) & (dte <= dte_max)
+
+        # Delta / OI 无值 (NaN) 时跳过检查，与逐合约路径一致
+        abs_delta = np.abs(frame.delta)
+        oi = frame.open_interest
+        with np.errstate(invalid="ignore"):
+            delta_ok = np.isnan(abs_delta) | ((abs_delta >= delta_min) & (abs_delta <= delta_max))
+            oi_ok = np.isnan(oi) | (oi >= min_oi)
+
+        after_dte = type_mask & dte_ok
+        after_delta = after_dte & delta_ok
+        passed_mask = after_delta & oi_ok
+
+        dte_fail = total - int(after_dte.sum())
+        delta_fail = int(after_dte.sum()) - int(after_delta.sum())
+        oi_fail = int(after_delta.sum()) - int(passed_mask.sum())
+        passed = int(passed_mask.sum())
+        logger.info(
+            f"{symbol} API过滤后={total} -> 应用层精细过滤: "
+            f"DTE淘汰{dte_fail}/Delta淘汰{delta_fail}/OI淘汰{oi_fail} -> "
+            f"{passed}个通过"
+        )
+
+        pre_filtered: list[tuple] = []
+        for opt_type, side_mask in (("put", is_put), ("call", frame.is_call)):
+            if opt_type not in types_to_eval:
+                continue
+            for i in np.flatnonzero(passed_mask & side_mask):
+                pre_filtered.append((frame.to_quote(int(i)), opt_type))
+        return pre_filtered
+
     def _check_liquidity_with_reasons(
         self,
         bid: float | None,
@@ -772,6 +845,166 @@ class ContractFilter:
             min_volume=config.min_volume,
         )
 
+    def _resolve_greeks(
+        self,
+        quote,
+        underlying_price: float | None,
+        dte: int,
+        option_type: str,
+    ) -> tuple[float | None, float | None, float | None, float | None]:
+        """获取合约 Greeks，缺失或无效时用 BS 模型补算
+
+        条件：gamma 或 theta 为 None 或 0（Futu API 可能返回 0 而非 None）
+
+        Returns:
+            (delta, gamma, theta, vega)
+        """
+        contract = quote.contract
+        symbol = contract.underlying
+        strike = contract.strike_price
+        iv = quote.iv
+
+        greeks = quote.greeks if hasattr(quote, "greeks") else None
+        delta = greeks.delta if greeks else None
+        gamma = greeks.gamma if greeks else None
+        theta = greeks.theta if greeks else None
+        vega = greeks.vega if greeks else None
+
+        gamma_missing = gamma is None or gamma == 0
+        theta_missing = theta is None or theta == 0
+
+        if iv and iv > 0 and underlying_price and dte > 0:
+            if gamma_missing or theta_missing:
+                try:
+                    bs_params = BSParams(
+                        spot_price=underlying_price,
+                        strike_price=strike,
+                        risk_free_rate=0.03,
+                        volatility=iv,
+                        time_to_expiry=dte / 365,
+                        is_call=(option_type == "call"),
+                    )
+                    bs_greeks = calc_bs_greeks(bs_params)
+
+                    old_gamma, old_theta = gamma, theta
+                    if gamma_missing and bs_greeks.get("gamma") is not None:
+                        gamma = bs_greeks["gamma"]
+                    if theta_missing and bs_greeks.get("theta") is not None:
+                        theta = bs_greeks["theta"]
+                    if (delta is None or delta == 0) and bs_greeks.get("delta") is not None:
+                        delta = bs_greeks["delta"]
+                    if (vega is None or vega == 0) and bs_greeks.get("vega") is not None:
+                        vega = bs_greeks["vega"]
+
+                    logger.debug(
+                        f"{symbol} {strike}{option_type[0].upper()}: "
+                        f"BS补算 gamma={old_gamma}->{gamma:.6f}, theta={old_theta}->{theta:.6f}"
+                    )
+                except Exception as e:
+                    logger.debug(f"BS Greeks 补算失败: {e}")
+        else:
+            if gamma_missing or theta_missing:
+                logger.debug(
+                    f"{symbol} {strike}{option_type[0].upper()}: "
+                    f"无法BS补算 (iv={iv}, price={underlying_price}, dte={dte})"
+                )
+
+        return delta, gamma, theta, vega
+
+    def _build_pricing_inputs(
+        self,
+        quote,
+        underlying_score: UnderlyingScore,
+        option_type: str,
+        greeks: tuple,
+        today: date,
+    ) -> dict:
+        """构造 _calc_strategy_metrics 的参数（单个/批量路径共用）"""
+        contract = quote.contract
+        dte = (contract.expiry_date - today).days
+        bid, ask = quote.bid, quote.ask
+        mid_price = (bid + ask) / 2 if bid and ask else quote.last_price
+        delta, gamma, theta, vega = greeks
+
+        return {
+            "spot_price": underlying_score.current_price or 0,
+            "strike_price": contract.strike_price,
+            "premium": mid_price or 0,
+            "volatility": quote.iv or underlying_score.current_iv or 0.20,
+            "time_to_expiry": dte / 365 if dte > 0 else 0.01,
+            "hv": underlying_score.hv_20 or 0.20,
+            "dte": dte,
+            "delta": delta,
+            "gamma": gamma,
+            "theta": theta,
+            "vega": vega,
+            "option_type": option_type,
+            # 真实保证金 per-share（如果有）
+            "margin_per_share": quote.margin.initial_margin if quote.margin else None,
+        }
+
+    def _calc_strategy_metrics_batch(self, inputs: list[dict]) -> list[dict]:
+        """批量计算策略指标（整条期权链一次向量化计算）
+
+        与逐个调用 _calc_strategy_metrics 结果一致，使用 engine_layer 的
+        calc_short_option_chain_metrics 一次性计算所有合约。
+
+        Args:
+            inputs: 每个合约的 _calc_strategy_metrics 参数
+
+        Returns:
+            与 inputs 一一对应的指标字典列表（输入无效的合约返回空字典）
+        """
+        results: list[dict] = [{} for _ in inputs]
+        rows = [
+            i for i, row in enumerate(inputs)
+            if row["volatility"] > 0 and row["time_to_expiry"] > 0
+        ]
+        if not rows:
+            return results
+
+        try:
+            chain_input = ChainPricingInput.from_columns(
+                spot_price=[inputs[i]["spot_price"] for i in rows],
+                strike_price=[inputs[i]["strike_price"] for i in rows],
+                premium=[inputs[i]["premium"] for i in rows],
+                volatility=[inputs[i]["volatility"] for i in rows],
+                time_to_expiry=[inputs[i]["time_to_expiry"] for i in rows],
+                is_call=[inputs[i]["option_type"] == "call" for i in rows],
+                hv=[inputs[i]["hv"] for i in rows],
+                dte=[inputs[i]["dte"] for i in rows],
+                delta=[inputs[i]["delta"] for i in rows],
+                gamma=[inputs[i]["gamma"] for i in rows],
+                theta=[inputs[i]["theta"] for i in rows],
+                vega=[inputs[i]["vega"] for i in rows],
+                margin_per_share=[inputs[i]["margin_per_share"] for i in rows],
+            )
+            chain_metrics = calc_short_option_chain_metrics(chain_input)
+        except Exception as e:
+            logger.debug(f"批量计算策略指标失败，回退逐个计算: {e}")
+            return [self._calc_strategy_metrics(**row) for row in inputs]
+
+        for j, i in enumerate(rows):
+            sm = chain_metrics.to_pricing_metrics(j)
+            results[i] = {
+                "expected_return": sm.expected_return,
+                "return_std": sm.return_std,
+                "sharpe_ratio": sm.sharpe_ratio,
+                "sharpe_ratio_annual": sm.sharpe_ratio_annual,
+                "win_probability": sm.win_probability,
+                "kelly_fraction": sm.kelly_fraction,
+                "prei": sm.prei,
+                "sas": sm.sas,
+                "tgr": sm.tgr,
+                "roc": sm.roc,
+                "expected_roc": sm.expected_roc,
+                "premium_rate": sm.premium_rate,
+                "theta_margin_ratio": sm.theta_margin_ratio,
+            }
+
+        logger.debug(f"批量计算策略指标: {len(rows)} 个合约")
+        return results
+
     def _calc_strategy_metrics(
         self,
         spot_price: float,
@@ -0,0 +1,74 @@
+"""Shared helper: per-symbol IndicatorEngine cache for daily-signal strategies.
+
+Strategies that recompute SMA/momentum from a fresh kline window every day
+build one IndicatorEngine per symbol instead: the first call loads the full
+lookback window, later days only fetch bars newer than the engine's last bar
+and append them (O(1) per bar).
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from src.engine.position.technical.indicator_engine import IndicatorEngine
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorCache:
+    """Per-symbol IndicatorEngine kept in sync with the backtest date.
+
+    Args:
+        **engine_kwargs: Passed to IndicatorEngine (sma_periods, ...)
+    """
+
+    def __init__(self, **engine_kwargs: Any) -> None:
+        self._engine_kwargs = engine_kwargs
+        self._engines: Dict[str, "IndicatorEngine"] = {}
+
+    def get(
+        self,
+        symbol: str,
+        current_date: date,
+        data_provider: Any,
+        lookback_days: int,
+    ) -> Optional["IndicatorEngine"]:
+        """Return the engine for symbol with all bars up to current_date.
+
+        Rebuilds from a `lookback_days` window on first use or when the date
+        moves backwards; otherwise fetches only the bars after the last one.
+        Returns None when the provider has no data.
+        """
+        from src.data.models.stock import KlineType
+        from src.engine.position.technical.indicator_engine import IndicatorEngine
+
+        engine = self._engines.get(symbol)
+        if engine is None or engine.last_date is None or current_date < engine.last_date:
+            klines = data_provider.get_history_kline(
+                symbol=symbol,
+                ktype=KlineType.DAY,
+                start_date=current_date - timedelta(days=lookback_days),
+                end_date=current_date,
+            )
+            if not klines:
+                self._engines.pop(symbol, None)
+                return None
+            engine = IndicatorEngine.from_klines(klines, **self._engine_kwargs)
+            self._engines[symbol] = engine
+            return engine
+
+        if engine.last_date < current_date:
+            klines = data_provider.get_history_kline(
+                symbol=symbol,
+                ktype=KlineType.DAY,
+                start_date=engine.last_date + timedelta(days=1),
+                end_date=current_date,
+            )
+            if klines:
+                added = engine.extend(klines)
+                logger.debug(f"IndicatorCache: {symbol} +{added} bars → {engine.last_date}")
+        return engine
+
+    def clear(self) -> None:
+        self._engines.clear()
@@ -5,6 +5,7 @@ Extracted from SpyLeapsOnlyVolTarget and SpyMomentumLevVolTarget to eliminate
 
 Provides:
 - _compute_signal: 7-point momentum score + vol_scalar risk adjustment
+  (SMA/momentum looked up from a per-symbol IndicatorEngine)
 - _get_vix: VIX data retrieval with fallback
 - _is_leaps: LEAPS position identification
 - _select_best_contract: Best-match LEAPS contract selection
@@ -20,6 +21,7 @@ from typing import Any, List, Optional
 
 from src.business.monitoring.models import PositionData
 from src.business.strategy.models import MarketContext
+from src.business.strategy.versions._indicator_cache import IndicatorCache
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,7 @@ class MomentumVolTargetMixin:
       target_dte, decision_frequency, min_rebalance_interval
     - self._signal_computed_for_date, self._current_target_pct, self._last_signal_detail
     - self._trading_day_count, self._last_rebalance_day, self._last_nlv
+    - self._indicator_cache (None until the first signal computation)
     """
 
     _signal_log_prefix: str = "MomVol"
@@ -70,34 +73,26 @@ class MomentumVolTargetMixin:
 
         symbol = symbols[0]
 
-        from src.data.models.stock import KlineType
-        from src.engine.position.technical.moving_average import calc_sma_series
-
         max_sma = max(cfg.sma_periods)
         lookback_days = max(max_sma, cfg.momentum_lookback_long) * 2 + 50
-        lookback_start = context.current_date - timedelta(days=lookback_days)
-        klines = data_provider.get_history_kline(
-            symbol=symbol,
-            ktype=KlineType.DAY,
-            start_date=lookback_start,
-            end_date=context.current_date,
+        if self._indicator_cache is None:
+            self._indicator_cache = IndicatorCache(sma_periods=cfg.sma_periods, ema_periods=())
+        engine = self._indicator_cache.get(
+            symbol, context.current_date, data_provider, lookback_days
         )
 
-        if not klines or len(klines) < max_sma:
+        n_bars = engine.bars_as_of(context.current_date) if engine else 0
+        if n_bars < max_sma:
             logger.info(
-                f"{self._signal_log_prefix}: insufficient price data "
-                f"({len(klines) if klines else 0} < {max_sma})"
+                f"{self._signal_log_prefix}: insufficient price data ({n_bars} < {max_sma})"
             )
             self._current_target_pct = 0.0
             self._signal_computed_for_date = context.current_date
             return 0.0
 
-        prices = [k.close for k in klines]
-
-        sma_values = {}
-        for period in cfg.sma_periods:
-            series = calc_sma_series(prices, period)
-            sma_values[period] = series[-1] if series and series[-1] is not None else None
+        sma_values = {
+            period: engine.sma(period, context.current_date) for period in cfg.sma_periods
+        }
 
         sma20 = sma_values.get(20)
         sma50 = sma_values.get(50)
@@ -108,7 +103,9 @@ class MomentumVolTargetMixin:
             self._signal_computed_for_date = context.current_date
             return 0.0
 
-        close = prices[-1]
+        close = engine.close(context.current_date)
+        close_short = engine.close(context.current_date, cfg.momentum_lookback_short)
+        close_long = engine.close(context.current_date, cfg.momentum_lookback_long)
 
         # === 7-point momentum score ===
         score = 0
@@ -122,9 +119,9 @@ class MomentumVolTargetMixin:
             score += 1
         if sma50 > sma200:
             score += 1
-        if len(prices) > cfg.momentum_lookback_short and close > prices[-1 - cfg.momentum_lookback_short]:
+        if close_short is not None and close > close_short:
             score += 1
-        if len(prices) > cfg.momentum_lookback_long and close > prices[-1 - cfg.momentum_lookback_long]:
+        if close_long is not None and close > close_long:
             score += 1
 
         target_pct = cfg.position_map.get(score, 0.0)
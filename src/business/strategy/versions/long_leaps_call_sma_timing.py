@@ -20,6 +20,7 @@ from src.business.monitoring.models import PositionData
 from src.business.screening.models import ContractOpportunity
 from src.business.strategy.base import BaseTradeStrategy
 from src.business.strategy.models import MarketContext, TradeSignal
+from src.business.strategy.versions._indicator_cache import IndicatorCache
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,7 @@ class LongLeapsCallSmaTiming(BaseTradeStrategy):
         # SMA 信号状态
         self._signal_invested: bool = False
         self._signal_computed_for_date: Optional[date] = None
+        self._indicator_cache: Optional[IndicatorCache] = None  # 按 symbol 的 SMA 序列
 
         # 跨方法协调标志
         self._pending_roll: bool = False
@@ -144,40 +146,32 @@ class LongLeapsCallSmaTiming(BaseTradeStrategy):
 
         symbol = symbols[0]
 
-        from src.data.models.stock import KlineType
-
-        # 需要足够多的历史数据来计算 SMA
-        lookback_start = context.current_date - timedelta(days=cfg.sma_period * 2)
-        klines = data_provider.get_history_kline(
-            symbol=symbol,
-            ktype=KlineType.DAY,
-            start_date=lookback_start,
-            end_date=context.current_date,
+        # 首次加载 lookback 窗口，之后只追加新 bar
+        if self._indicator_cache is None:
+            self._indicator_cache = IndicatorCache(sma_periods=(cfg.sma_period,), ema_periods=())
+        engine = self._indicator_cache.get(
+            symbol, context.current_date, data_provider, cfg.sma_period * 2
         )
 
-        if not klines or len(klines) < cfg.sma_period:
+        n_bars = engine.bars_as_of(context.current_date) if engine else 0
+        if n_bars < cfg.sma_period:
             logger.info(
-                f"SMA: insufficient data ({len(klines) if klines else 0} bars < {cfg.sma_period}), defaulting to CASH"
+                f"SMA: insufficient data ({n_bars} bars < {cfg.sma_period}), defaulting to CASH"
             )
             self._signal_invested = False
             self._signal_computed_for_date = context.current_date
             return False
 
-        # 提取收盘价序列 (oldest → newest)
-        prices = [k.close for k in klines]
-
-        from src.engine.position.technical.moving_average import calc_sma
-
-        sma_value = calc_sma(prices, cfg.sma_period)
+        sma_value = engine.sma(cfg.sma_period, context.current_date)
 
         if sma_value is None:
             self._signal_invested = False
             self._signal_computed_for_date = context.current_date
             return False
 
-        # 用前一交易日 (即 klines[-1]) 的收盘价与 SMA 比较
+        # 用前一交易日 (即最后一根 bar) 的收盘价与 SMA 比较
         # klines 数据截至 as_of_date，最后一条是最近的交易日
-        last_close = prices[-1]
+        last_close = engine.close(context.current_date)
         self._signal_invested = last_close > sma_value
 
         logger.debug(
@@ -25,6 +25,7 @@ from src.business.monitoring.models import PositionData
 from src.business.screening.models import ContractOpportunity
 from src.business.strategy.base import BaseTradeStrategy
 from src.business.strategy.models import MarketContext, TradeSignal
+from src.business.strategy.versions._indicator_cache import IndicatorCache
 from src.business.strategy.versions._momentum_vol_mixin import (
     DEFAULT_POSITION_MAP,
     MomentumVolTargetMixin,
@@ -100,6 +101,7 @@ class SpyMomentumLevVolTarget(BaseTradeStrategy, MomentumVolTargetMixin):
         self._signal_computed_for_date: Optional[date] = None
         self._current_target_pct: float = 0.0
         self._last_signal_detail: dict = {}  # 信号元数据（供可视化/调试）
+        self._indicator_cache: Optional[IndicatorCache] = None  # 按 symbol 的指标序列
 
         # 跨方法协调标志
         self._pending_rebalance: bool = False
@@ -6,16 +6,19 @@ Daily Trade Limits - 每日交易限额管理
 
 Usage:
     tracker = DailyTradeTracker(order_store, config)
+    order_manager.add_order_listener(tracker.record_order)  # 订单变化时增量更新
     allowed, reason = tracker.check_limits("AAPL", quantity=-2, value=5000.0, nlv=100000.0)
 """
 
+import json
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime
+from pathlib import Path
 from typing import Any
 
-from src.business.trading.order.store import OrderStore
+from src.business.trading.order.store import OPEN_STATUSES, OrderStore, normalize_underlying
 from src.business.trading.models.order import OrderRecord, OrderStatus
 
 logger = logging.getLogger(__name__)
@@ -158,14 +161,58 @@ class DailyStats:
     roll_quantity: int = 0   # ROLL 类型订单数量
 
 
+@dataclass(frozen=True)
+class _OrderEntry:
+    """单个订单对当日统计的贡献（数量/市值均为绝对值）"""
+
+    underlying: str  # normalize_underlying 后的标的
+    decision_type: str
+    quantity: int
+    value: float
+    status: OrderStatus
+
+    @classmethod
+    def from_record(cls, record: OrderRecord) -> "_OrderEntry":
+        order = record.order
+        qty = abs(order.quantity)
+        price = order.limit_price or 0.0
+        multiplier = order.contract_multiplier or 100
+        return cls(
+            underlying=normalize_underlying(order.underlying or order.symbol),
+            decision_type=order.decision_type or "",
+            quantity=qty,
+            value=qty * price * multiplier,
+            status=order.status,
+        )
+
+
+@dataclass
+class _DayLedger:
+    """单日台账：每个订单的贡献 + 按 underlying 的运行计数"""
+
+    date: date
+    entries: dict[str, _OrderEntry] = field(default_factory=dict)
+    stats: dict[str, DailyStats] = field(default_factory=dict)
+    total_value: float = 0.0  # 计入全账户限额的总市值
+
+
 class DailyTradeTracker:
     """每日交易限额追踪器
 
     追踪每个 underlying 当日已提交的交易量/金额，
     在新开仓前检查是否超过限额。
 
+    统计以按日台账维护：某日首次查询时从 OrderStore 加载一次（或从持久化的
+    台账文件恢复，恢复前与 OrderStore 的订单状态比对），之后由 record_order()
+    在订单提交/状态同步时 O(1) 更新，check_limits / filter_opportunities
+    不再逐次扫描订单存储。
+
+    注意: 未经过已注册 OrderManager 写入的订单不会反映到台账中，
+    此时调用 invalidate_cache() 从 OrderStore 重新加载。
+
     Usage:
         tracker = DailyTradeTracker(order_store, config)
+        order_manager.add_order_listener(tracker.record_order)
 
         # 检查是否允许新开仓
         allowed, reason = tracker.check_limits("AAPL", quantity=-2, value=5000.0, nlv=100000.0)
@@ -178,27 +225,200 @@ class DailyTradeTracker:
         self,
         order_store: OrderStore,
         config: DailyLimitsConfig | None = None,
+        state_dir: str | Path | None = None,
     ) -> None:
         """初始化
 
         Args:
             order_store: 订单存储
             config: 每日限额配置
+            state_dir: 台账持久化目录（每日一个 YYYY-MM-DD.jsonl 追加日志），
+                None 表示只保存在内存中
         """
         self._store = order_store
         self._config = config or DailyLimitsConfig.load()
+        self._state_dir = Path(state_dir) if state_dir else None
 
-        # 缓存当日统计，避免重复查询
-        self._cache: dict[str, DailyStats] = {}
+        # 按日期的台账
+        self._ledgers: dict[date, _DayLedger] = {}
         self._cache_date: date | None = None
 
-    def _invalidate_cache_if_needed(self) -> None:
-        """如果日期变更则清除缓存"""
+    # ========== Ledger ==========
+
+    def _counts_for_underlying(self, status: OrderStatus) -> bool:
+        """订单是否计入单标的统计（与 get_daily_orders_by_underlying 一致）"""
+        if self._config.include_pending_orders:
+            return status in OPEN_STATUSES or status == OrderStatus.FILLED
+        return status in (OrderStatus.FILLED, OrderStatus.PARTIAL_FILLED)
+
+    def _counts_for_total(self, status: OrderStatus) -> bool:
+        """订单是否计入全账户总市值"""
+        if self._config.include_pending_orders:
+            return True
+        return status in (OrderStatus.FILLED, OrderStatus.PARTIAL_FILLED)
+
+    def _apply(self, ledger: _DayLedger, entry: _OrderEntry, sign: int) -> None:
+        """将订单贡献加入 (sign=1) 或移出 (sign=-1) 台账"""
+        if self._counts_for_total(entry.status):
+            ledger.total_value += sign * entry.value
+
+        if not self._counts_for_underlying(entry.status):
+            return
+
+        stats = ledger.stats.get(entry.underlying)
+        if stats is None:
+            stats = DailyStats(
+                underlying=entry.underlying,
+                date=ledger.date,
+                total_quantity=0,
+                total_value=0.0,
+                order_count=0,
+            )
+            ledger.stats[entry.underlying] = stats
+
+        stats.total_quantity += sign * entry.quantity
+        stats.total_value += sign * entry.value
+        stats.order_count += sign
+        # 按类型统计，adjust/hedge 等计入 total，不单独限制
+        if entry.decision_type == "open":
+            stats.open_quantity += sign * entry.quantity
+        elif entry.decision_type == "close":
+            stats.close_quantity += sign * entry.quantity
+        elif entry.decision_type == "roll":
+            stats.roll_quantity += sign * entry.quantity
+
+    def _upsert(self, ledger: _DayLedger, order_id: str, entry: _OrderEntry) -> None:
+        """替换订单在台账中的贡献"""
+        old = ledger.entries.get(order_id)
+        if old is not None:
+            self._apply(ledger, old, -1)
+        ledger.entries[order_id] = entry
+        self._apply(ledger, entry, 1)
+
+    def _ledger(self, target_date: date) -> _DayLedger:
+        """获取某日台账，首次访问时从持久化文件或 OrderStore 加载"""
         today = date.today()
         if self._cache_date != today:
-            self._cache.clear()
+            # 日期变更时丢弃历史台账，避免内存无限增长
+            self._ledgers = {d: ledger for d, ledger in self._ledgers.items() if d >= today}
             self._cache_date = today
 
+        ledger = self._ledgers.get(target_date)
+        if ledger is not None:
+            return ledger
+
+        ledger = _DayLedger(date=target_date)
+        if not self._load_state(ledger):
+            for record in self._load_orders(target_date):
+                self._upsert(ledger, record.order.order_id, _OrderEntry.from_record(record))
+            self._write_state(target_date, ledger.entries, mode="w")
+
+        self._ledgers[target_date] = ledger
+        logger.debug(
+            f"Daily ledger loaded for {target_date}: {len(ledger.entries)} orders"
+        )
+        return ledger
+
+    def _load_orders(self, target_date: date) -> list[OrderRecord]:
+        """从 OrderStore 读取某日的所有订单（每个日期只读取一次）"""
+        days = (date.today() - target_date).days + 1
+        if days < 1:
+            return []
+        return [
+            record for record in self._store.get_recent(days=days)
+            if record.order.created_at.date() == target_date
+        ]
+
+    def record_order(self, record: OrderRecord) -> None:
+        """订单保存后的增量更新（注册为 OrderManager 的订单监听器）
+
+        Args:
+            record: 刚保存的订单记录
+        """
+        target_date = record.order.created_at.date()
+        entry = _OrderEntry.from_record(record)
+        ledger = self._ledgers.get(target_date)
+        if ledger is None:
+            # 本进程未加载该日台账（如只做状态同步的进程）：追加到已有的台账文件，
+            # 使其他进程恢复时看到最新状态；没有文件时首次查询会从 OrderStore 重建
+            path = self._state_path(target_date)
+            if path is not None and path.exists():
+                self._write_state(target_date, {record.order.order_id: entry}, mode="a")
+            return
+
+        self._upsert(ledger, record.order.order_id, entry)
+        self._write_state(target_date, {record.order.order_id: entry}, mode="a")
+
+    # ========== Persistence ==========
+
+    def _state_path(self, target_date: date) -> Path | None:
+        if self._state_dir is None:
+            return None
+        return self._state_dir / f"{target_date.isoformat()}.jsonl"
+
+    def _load_state(self, ledger: _DayLedger) -> bool:
+        """从追加日志恢复台账（同一订单以最后一行为准）
+
+        恢复后与 OrderStore 当日的订单状态比对（只读取状态，不加载订单），
+        订单集合或任一状态不一致（如其他进程绕过监听器写入）时返回 False，
+        由调用方从 OrderStore 重建。
+        """
+        path = self._state_path(ledger.date)
+        if path is None or not path.exists():
+            return False
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    row = json.loads(line)
+                    entry = _OrderEntry(
+                        underlying=row["underlying"],
+                        decision_type=row["decision_type"],
+                        quantity=row["quantity"],
+                        value=row["value"],
+                        status=OrderStatus(row["status"]),
+                    )
+                    self._upsert(ledger, row["order_id"], entry)
+
+            statuses = {order_id: entry.status for order_id, entry in ledger.entries.items()}
+            if statuses != self._store.get_daily_statuses(ledger.date):
+                raise ValueError("ledger is out of sync with the order store")
+        except Exception as e:
+            logger.warning(f"Failed to load daily ledger {path}, rebuilding: {e}")
+            ledger.entries.clear()
+            ledger.stats.clear()
+            ledger.total_value = 0.0
+            return False
+        return True
+
+    def _write_state(
+        self, target_date: date, entries: dict[str, _OrderEntry], mode: str
+    ) -> None:
+        """写入台账日志（mode="w" 全量快照，"a" 追加单条）"""
+        path = self._state_path(target_date)
+        if path is None:
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, mode, encoding="utf-8") as f:
+                for order_id, entry in entries.items():
+                    row = {
+                        "order_id": order_id,
+                        "underlying": entry.underlying,
+                        "decision_type": entry.decision_type,
+                        "quantity": entry.quantity,
+                        "value": entry.value,
+                        "status": entry.status.value,
+                    }
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        except Exception as e:
+            logger.warning(f"Failed to persist daily ledger {path}: {e}")
+
+    # ========== Queries ==========
+
     def get_daily_stats(
         self,
         underlying: str,
@@ -214,69 +434,18 @@ class DailyTradeTracker:
             DailyStats 统计信息
         """
         target_date = target_date or date.today()
-        self._invalidate_cache_if_needed()
-
-        # 检查缓存
-        cache_key = f"{underlying}:{target_date.isoformat()}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        # 查询订单
-        orders = self._store.get_daily_orders_by_underlying(
-            underlying=underlying,
-            target_date=target_date,
-            include_pending=self._config.include_pending_orders,
-        )
-
-        # 计算统计（使用绝对值！）
-        total_quantity = 0
-        total_value = 0.0
-        open_qty = 0
-        close_qty = 0
-        roll_qty = 0
-
-        for record in orders:
-            order = record.order
-            # 使用绝对值
-            qty = abs(order.quantity)
-            total_quantity += qty
-
-            # 按类型统计
-            dtype = order.decision_type or ""
-            if dtype == "open":
-                open_qty += qty
-            elif dtype == "close":
-                close_qty += qty
-            elif dtype == "roll":
-                roll_qty += qty
-            # adjust/hedge 等计入 total，不单独限制
-
-            # 计算订单市值 = |quantity| * price * multiplier
-            price = order.limit_price or 0.0
-            multiplier = order.contract_multiplier or 100
-            value = qty * price * multiplier
-            total_value += value
-
-        stats = DailyStats(
-            underlying=underlying,
-            date=target_date,
-            total_quantity=total_quantity,
-            total_value=total_value,
-            order_count=len(orders),
-            open_quantity=open_qty,
-            close_quantity=close_qty,
-            roll_quantity=roll_qty,
-        )
-
-        # 缓存结果
-        self._cache[cache_key] = stats
-
-        logger.debug(
-            f"Daily stats for {underlying}: qty={total_quantity}, "
-            f"value=${total_value:.2f}, orders={len(orders)}"
-        )
+        ledger = self._ledger(target_date)
 
-        return stats
+        stats = ledger.stats.get(normalize_underlying(underlying))
+        if stats is None:
+            return DailyStats(
+                underlying=underlying,
+                date=target_date,
+                total_quantity=0,
+                total_value=0.0,
+                order_count=0,
+            )
+        return replace(stats, underlying=underlying)
 
     def get_total_daily_value(self, target_date: date | None = None) -> float:
         """获取当日所有 underlying 的总交易市值
@@ -288,30 +457,7 @@ class DailyTradeTracker:
             总市值（绝对值累加）
         """
         target_date = target_date or date.today()
-
-        # 获取当日所有订单
-        orders = self._store.get_recent(days=1)
-
-        total_value = 0.0
-        for record in orders:
-            order = record.order
-            # 只计入目标日期的订单
-            if order.created_at.date() != target_date:
-                continue
-            # 如果不计入 pending 订单，检查状态
-            if not self._config.include_pending_orders:
-                if order.status not in (
-                    OrderStatus.FILLED,
-                    OrderStatus.PARTIAL_FILLED,
-                ):
-                    continue
-
-            qty = abs(order.quantity)
-            price = order.limit_price or 0.0
-            multiplier = order.contract_multiplier or 100
-            total_value += qty * price * multiplier
-
-        return total_value
+        return self._ledger(target_date).total_value
 
     def check_limits(
         self,
@@ -494,27 +640,14 @@ class DailyTradeTracker:
         Returns:
             {underlying: {qty_used, qty_limit, value_used, value_limit, value_pct}}
         """
-        today = date.today()
-        orders = self._store.get_recent(days=1)
+        ledger = self._ledger(date.today())
 
-        # 按 underlying 分组统计
+        # 按 underlying 分组统计（所有状态的订单）
         by_underlying: dict[str, dict[str, float]] = {}
-
-        for record in orders:
-            order = record.order
-            if order.created_at.date() != today:
-                continue
-
-            underlying = order.underlying or order.symbol
-            if underlying not in by_underlying:
-                by_underlying[underlying] = {"qty": 0, "value": 0.0}
-
-            by_underlying[underlying]["qty"] += abs(order.quantity)
-            price = order.limit_price or 0.0
-            multiplier = order.contract_multiplier or 100
-            by_underlying[underlying]["value"] += (
-                abs(order.quantity) * price * multiplier
-            )
+        for entry in ledger.entries.values():
+            stats = by_underlying.setdefault(entry.underlying, {"qty": 0, "value": 0.0})
+            stats["qty"] += entry.quantity
+            stats["value"] += entry.value
 
         # 构造汇总
         summary = {}
@@ -522,7 +655,7 @@ class DailyTradeTracker:
             value_pct = (stats["value"] / nlv * 100) if nlv > 0 else 0.0
             summary[underlying] = {
                 "qty_used": int(stats["qty"]),
-                "qty_limit": self._config.max_quantity_per_underlying,
+                "qty_limit": self._config.max_open_quantity_per_underlying,
                 "value_used": stats["value"],
                 "value_limit_pct": self._config.max_value_pct_per_underlying,
                 "value_pct": value_pct,
@@ -531,5 +664,12 @@ class DailyTradeTracker:
         return summary
 
     def invalidate_cache(self) -> None:
-        """手动清除缓存（在订单提交后调用）"""
-        self._cache.clear()
+        """丢弃台账，下次查询时从 OrderStore 重新加载
+
+        订单经由未注册监听器的途径写入时调用。
+        """
+        for target_date in self._ledgers:
+            path = self._state_path(target_date)
+            if path is not None and path.exists():
+                path.unlink()
+        self._ledgers.clear()
@@ -3,11 +3,14 @@
 from src.business.trading.order.generator import OrderGenerator
 from src.business.trading.order.manager import OrderManager
 from src.business.trading.order.risk_checker import RiskChecker
-from src.business.trading.order.store import OrderStore
+from src.business.trading.order.sqlite_store import SQLiteOrderStore
+from src.business.trading.order.store import OrderStore, create_order_store
 
 __all__ = [
     "OrderManager",
     "OrderGenerator",
     "RiskChecker",
     "OrderStore",
+    "SQLiteOrderStore",
+    "create_order_store",
 ]
@@ -11,7 +11,7 @@ Order Manager - 订单管理器
 
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 
 from src.business.trading.config.order_config import OrderConfig
 from src.business.trading.config.risk_config import RiskConfig
@@ -25,7 +25,7 @@ from src.business.trading.models.order import (
 from src.business.trading.models.trading import TradingResult
 from src.business.trading.order.generator import OrderGenerator
 from src.business.trading.order.risk_checker import RiskChecker
-from src.business.trading.order.store import OrderStore
+from src.business.trading.order.store import OrderStore, create_order_store
 from src.business.trading.provider.base import TradingProvider
 
 logger = logging.getLogger(__name__)
@@ -67,17 +67,37 @@ class OrderManager:
         self._risk_config = risk_config or RiskConfig.load()
 
         self._provider = trading_provider
-        self._store = order_store or OrderStore(self._config)
+        self._store = order_store or create_order_store(self._config)
         self._risk_checker = risk_checker or RiskChecker(self._risk_config)
         self._generator = order_generator or OrderGenerator(self._config)
 
         # 通知器 (延迟导入以避免循环依赖)
         self._notifier: Any = None
 
+        # 订单保存后的回调 (如 DailyTradeTracker.record_order)
+        self._order_listeners: list[Callable[[OrderRecord], None]] = []
+
     def set_trading_provider(self, provider: TradingProvider) -> None:
         """设置交易提供者"""
         self._provider = provider
 
+    def add_order_listener(self, listener: Callable[[OrderRecord], None]) -> None:
+        """注册订单监听器，每次订单记录保存（提交/取消/状态同步）后调用
+
+        Args:
+            listener: 回调函数，参数为刚保存的订单记录
+        """
+        self._order_listeners.append(listener)
+
+    def _save_record(self, record: OrderRecord) -> None:
+        """保存订单记录并通知监听器"""
+        self._store.save(record)
+        for listener in self._order_listeners:
+            try:
+                listener(record)
+            except Exception as e:
+                logger.warning(f"Order listener failed for {record.order.order_id}: {e}")
+
     def create_order(self, decision: TradingDecision) -> OrderRequest:
         """从决策创建订单
 
@@ -215,7 +235,7 @@ class OrderManager:
             self._notify_order_error(record)
 
         # 保存订单记录
-        self._store.save(record)
+        self._save_record(record)
 
         return record
 
@@ -305,7 +325,7 @@ class OrderManager:
             record.add_status_history(OrderStatus.CANCELLED, "Cancelled before submission")
             record.is_complete = True
             record.completion_time = datetime.now()
-            self._store.save(record)
+            self._save_record(record)
             return True
 
         # 调用券商取消
@@ -316,7 +336,7 @@ class OrderManager:
             record.add_status_history(OrderStatus.CANCELLED, "Cancelled at broker")
             record.is_complete = True
             record.completion_time = datetime.now()
-            self._store.save(record)
+            self._save_record(record)
             logger.info(f"Order {order_id} cancelled")
             return True
         else:
@@ -384,7 +404,7 @@ class OrderManager:
             record.average_fill_price = query_result.average_price
 
         record.broker_status = query_result.status
-        self._store.save(record)
+        self._save_record(record)
 
         return record
 
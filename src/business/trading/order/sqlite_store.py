@@ -0,0 +1,303 @@
+"""
+SQLite Order Store - SQLite 订单存储
+
+与 OrderStore 接口一致，订单记录存放在单个 SQLite 数据库 (WAL 模式) 中，
+按状态、决策 ID、(underlying, 日期) 建索引，查询不再扫描目录或重写 index.json。
+
+文件结构:
+    data/trading/orders/
+    └── orders.db
+
+启用方式: OrderConfig.storage_format = "sqlite" (或 ORDER_STORAGE_FORMAT=sqlite)
+已有 JSON 订单可通过 import_json() 或 scripts/migrate_orders_to_sqlite.py 迁移。
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+from src.business.trading.config.order_config import OrderConfig
+from src.business.trading.models.order import OrderRecord, OrderStatus
+from src.business.trading.order.store import (
+    OPEN_STATUSES,
+    OrderStore,
+    normalize_underlying,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_id TEXT PRIMARY KEY,
+    decision_id TEXT,
+    symbol TEXT NOT NULL,
+    underlying TEXT NOT NULL,
+    status TEXT NOT NULL,
+    decision_type TEXT,
+    created_at TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    is_complete INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_orders_status ON orders (status);
+CREATE INDEX IF NOT EXISTS idx_orders_decision ON orders (decision_id);
+CREATE INDEX IF NOT EXISTS idx_orders_underlying_date ON orders (underlying, trade_date);
+CREATE INDEX IF NOT EXISTS idx_orders_created ON orders (created_at);
+"""
+
+_UPSERT = """
+INSERT OR REPLACE INTO orders (
+    order_id, decision_id, symbol, underlying, status, decision_type,
+    created_at, trade_date, is_complete, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _to_row(record: OrderRecord) -> tuple:
+    """订单记录 -> orders 表的一行"""
+    order = record.order
+    return (
+        order.order_id,
+        order.decision_id,
+        order.symbol,
+        normalize_underlying(order.underlying or order.symbol),
+        order.status.value,
+        order.decision_type,
+        order.created_at.isoformat(),
+        order.created_at.strftime("%Y-%m-%d"),
+        int(record.is_complete),
+        json.dumps(record.to_dict(), ensure_ascii=False),
+    )
+
+
+class SQLiteOrderStore(OrderStore):
+    """SQLite 订单存储
+
+    单个数据库文件保存所有订单，完整记录以 JSON 存在 data 列，
+    查询用到的字段单独成列并建索引。线程安全（单连接 + 锁）。
+
+    Usage:
+        store = SQLiteOrderStore()
+        store.save(order_record)
+        record = store.get("order_123")
+    """
+
+    DB_FILENAME = "orders.db"
+
+    def __init__(
+        self,
+        config: OrderConfig | None = None,
+        db_path: str | Path | None = None,
+    ) -> None:
+        """初始化订单存储
+
+        Args:
+            config: 订单配置
+            db_path: 数据库文件路径，默认 storage_path/orders.db
+        """
+        super().__init__(config)
+        self._db_path = Path(db_path) if db_path else self._base_path / self.DB_FILENAME
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    @property
+    def db_path(self) -> Path:
+        """数据库文件路径"""
+        return self._db_path
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> list[OrderRecord]:
+        """执行查询并反序列化 data 列"""
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        results = []
+        for (data,) in rows:
+            try:
+                results.append(OrderRecord.from_dict(json.loads(data)))
+            except Exception as e:
+                logger.warning(f"Failed to load order row: {e}")
+        return results
+
+    def save(self, record: OrderRecord) -> None:
+        """保存订单记录（存在则覆盖）
+
+        Args:
+            record: 订单记录
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(_UPSERT, _to_row(record))
+            logger.debug(f"Order saved: {record.order.order_id} -> {self._db_path}")
+        except Exception as e:
+            logger.error(f"Failed to save order {record.order.order_id}: {e}")
+            raise
+
+    def get(self, order_id: str) -> OrderRecord | None:
+        """获取订单记录
+
+        Args:
+            order_id: 订单 ID
+
+        Returns:
+            订单记录，不存在则返回 None
+        """
+        records = self._query("SELECT data FROM orders WHERE order_id = ?", (order_id,))
+        return records[0] if records else None
+
+    def get_by_status(self, status: OrderStatus) -> list[OrderRecord]:
+        """按状态获取订单
+
+        Args:
+            status: 订单状态
+
+        Returns:
+            符合条件的订单列表
+        """
+        return self._query(
+            "SELECT data FROM orders WHERE status = ? ORDER BY created_at",
+            (status.value,),
+        )
+
+    def get_open_orders(self) -> list[OrderRecord]:
+        """获取所有未完成订单"""
+        placeholders = ", ".join("?" for _ in OPEN_STATUSES)
+        return self._query(
+            f"SELECT data FROM orders WHERE status IN ({placeholders}) ORDER BY created_at",
+            tuple(s.value for s in OPEN_STATUSES),
+        )
+
+    def get_recent(self, days: int = 7) -> list[OrderRecord]:
+        """获取最近的订单
+
+        与 JSON 存储一致：包含日期 (00:00) 不早于 now - days 的所有交易日。
+
+        Args:
+            days: 天数
+
+        Returns:
+            最近 N 天的订单列表（按创建时间倒序）
+        """
+        cutoff = datetime.now() - timedelta(days=days)
+        first_day = cutoff.date()
+        if cutoff.time() != time.min:
+            first_day += timedelta(days=1)
+
+        return self._query(
+            "SELECT data FROM orders WHERE trade_date >= ? ORDER BY created_at DESC",
+            (first_day.isoformat(),),
+        )
+
+    def get_daily_statuses(self, target_date: date) -> dict[str, OrderStatus]:
+        """获取某日创建的所有订单状态（不反序列化订单数据）
+
+        Args:
+            target_date: 订单创建日期
+
+        Returns:
+            {order_id: status}
+        """
+        start = target_date.isoformat()
+        end = (target_date + timedelta(days=1)).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT order_id, status FROM orders WHERE created_at >= ? AND created_at < ?",
+                (start, end),
+            ).fetchall()
+        return {order_id: OrderStatus(status) for order_id, status in rows}
+
+    def get_by_decision(self, decision_id: str) -> list[OrderRecord]:
+        """按决策 ID 获取订单
+
+        Args:
+            decision_id: 决策 ID
+
+        Returns:
+            关联的订单列表
+        """
+        return self._query(
+            "SELECT data FROM orders WHERE decision_id = ? ORDER BY created_at",
+            (decision_id,),
+        )
+
+    def get_daily_orders_by_underlying(
+        self,
+        underlying: str,
+        target_date: date | None = None,
+        include_pending: bool = True,
+    ) -> list[OrderRecord]:
+        """获取指定 underlying 当日的订单列表
+
+        Args:
+            underlying: 标的代码 (e.g., "AAPL", "TQQQ")
+            target_date: 目标日期，默认今天
+            include_pending: 是否包含 pending 状态的订单
+
+        Returns:
+            符合条件的订单列表
+        """
+        if target_date is None:
+            target_date = date.today()
+        elif isinstance(target_date, datetime):
+            target_date = target_date.date()
+
+        if include_pending:
+            statuses = (*OPEN_STATUSES, OrderStatus.FILLED)
+        else:
+            statuses = (OrderStatus.FILLED, OrderStatus.PARTIAL_FILLED)
+
+        placeholders = ", ".join("?" for _ in statuses)
+        return self._query(
+            "SELECT data FROM orders WHERE underlying = ? AND trade_date = ? "
+            f"AND status IN ({placeholders}) ORDER BY created_at",
+            (
+                normalize_underlying(underlying),
+                target_date.strftime("%Y-%m-%d"),
+                *(s.value for s in statuses),
+            ),
+        )
+
+    # ========== Migration ==========
+
+    def import_json(self, json_path: str | Path | None = None) -> int:
+        """从 JSON 存储目录导入订单（可重复执行，已存在的订单会被覆盖）
+
+        Args:
+            json_path: JSON 存储根目录 (含 YYYY-MM-DD 子目录)，默认 storage_path
+
+        Returns:
+            导入的订单数
+        """
+        root = Path(json_path) if json_path else self._base_path
+        if not root.exists():
+            return 0
+
+        rows = []
+        for date_dir in sorted(root.iterdir()):
+            if not date_dir.is_dir() or date_dir.name == "archive":
+                continue
+            for order_file in sorted(date_dir.glob("*.json")):
+                try:
+                    with open(order_file, "r", encoding="utf-8") as f:
+                        rows.append(_to_row(OrderRecord.from_dict(json.load(f))))
+                except Exception as e:
+                    logger.warning(f"Failed to import order {order_file}: {e}")
+
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+
+        logger.info(f"Imported {len(rows)} orders from {root} into {self._db_path}")
+        return len(rows)
@@ -9,6 +9,8 @@ Order Store - 订单存储
     │   ├── order_001.json
     │   └── order_002.json
     └── index.json  # 订单索引
+
+OrderConfig.storage_format = "sqlite" 时使用 SQLiteOrderStore (见 create_order_store)。
 """
 
 import json
@@ -22,6 +24,39 @@ from src.business.trading.models.order import OrderRecord, OrderStatus
 
 logger = logging.getLogger(__name__)
 
+# 未完成（pending）的订单状态
+OPEN_STATUSES = (
+    OrderStatus.PENDING_VALIDATION,
+    OrderStatus.APPROVED,
+    OrderStatus.SUBMITTED,
+    OrderStatus.ACKNOWLEDGED,
+    OrderStatus.PARTIAL_FILLED,
+)
+
+
+def normalize_underlying(underlying: str) -> str:
+    """统一 underlying 格式用于比较 (US.AAPL / aapl -> AAPL)"""
+    if "." in underlying:
+        underlying = underlying.split(".")[-1]
+    return underlying.upper()
+
+
+def create_order_store(config: OrderConfig | None = None) -> "OrderStore":
+    """按 storage_format 创建订单存储
+
+    Args:
+        config: 订单配置
+
+    Returns:
+        "sqlite" -> SQLiteOrderStore，其余 -> OrderStore (JSON)
+    """
+    config = config or OrderConfig.load()
+    if config.storage_format == "sqlite":
+        from src.business.trading.order.sqlite_store import SQLiteOrderStore
+
+        return SQLiteOrderStore(config)
+    return OrderStore(config)
+
 
 class OrderStore:
     """订单存储
@@ -190,16 +225,8 @@ class OrderStore:
 
     def get_open_orders(self) -> list[OrderRecord]:
         """获取所有未完成订单"""
-        open_statuses = [
-            OrderStatus.PENDING_VALIDATION,
-            OrderStatus.APPROVED,
-            OrderStatus.SUBMITTED,
-            OrderStatus.ACKNOWLEDGED,
-            OrderStatus.PARTIAL_FILLED,
-        ]
-
         results = []
-        for status in open_statuses:
+        for status in OPEN_STATUSES:
             results.extend(self.get_by_status(status))
 
         return results
@@ -241,6 +268,37 @@ class OrderStore:
         results.sort(key=lambda r: r.order.created_at, reverse=True)
         return results
 
+    def get_daily_statuses(self, target_date: date) -> dict[str, OrderStatus]:
+        """获取某日创建的所有订单状态
+
+        只读取 index.json，不加载订单文件（用于校验按日缓存的统计）。
+
+        Args:
+            target_date: 订单创建日期
+
+        Returns:
+            {order_id: status}
+        """
+        results: dict[str, OrderStatus] = {}
+        index_path = self._base_path / "index.json"
+
+        if not index_path.exists():
+            return results
+
+        date_str = target_date.strftime("%Y-%m-%d")
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+
+            for order_id, info in index.get("orders", {}).items():
+                if info.get("created_at", "").startswith(date_str):
+                    results[order_id] = OrderStatus(info["status"])
+
+        except Exception as e:
+            logger.error(f"Failed to get order statuses for {date_str}: {e}")
+
+        return results
+
     def get_by_decision(self, decision_id: str) -> list[OrderRecord]:
         """按决策 ID 获取订单
 
@@ -299,17 +357,9 @@ class OrderStore:
         if not date_dir.exists():
             return results
 
-        # 定义哪些状态算作 "pending"
-        pending_statuses = {
-            OrderStatus.PENDING_VALIDATION,
-            OrderStatus.APPROVED,
-            OrderStatus.SUBMITTED,
-            OrderStatus.ACKNOWLEDGED,
-            OrderStatus.PARTIAL_FILLED,
-        }
-
-        # 定义哪些状态算作 "有效" (包含成交)
-        valid_statuses = pending_statuses | {OrderStatus.FILLED}
+        # 定义哪些状态算作 "有效" (pending + 成交)
+        valid_statuses = {*OPEN_STATUSES, OrderStatus.FILLED}
+        underlying_check = normalize_underlying(underlying)
 
         try:
             for order_file in date_dir.glob("*.json"):
@@ -320,17 +370,9 @@ class OrderStore:
                     record = OrderRecord.from_dict(data)
                     order = record.order
 
-                    # 检查 underlying 匹配
-                    order_underlying = order.underlying or order.symbol
-                    # 处理可能的格式差异 (US.AAPL vs AAPL)
-                    if "." in order_underlying:
-                        order_underlying = order_underlying.split(".")[-1]
-                    if "." in underlying:
-                        underlying_check = underlying.split(".")[-1]
-                    else:
-                        underlying_check = underlying
-
-                    if order_underlying.upper() != underlying_check.upper():
+                    # 检查 underlying 匹配（处理可能的格式差异 US.AAPL vs AAPL）
+                    order_underlying = normalize_underlying(order.underlying or order.symbol)
+                    if order_underlying != underlying_check:
                         continue
 
                     # 检查状态
@@ -11,6 +11,7 @@ Usage:
 
 import logging
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from src.business.monitoring.models import MonitorResult
@@ -79,7 +80,10 @@ class TradingPipeline:
         self._daily_tracker = DailyTradeTracker(
             order_store=self._order_manager._store,
             config=self._daily_limits_config,
+            state_dir=Path(self._order_config.storage_path) / "daily_limits",
         )
+        # 订单提交/同步后增量更新每日统计
+        self._order_manager.add_order_listener(self._daily_tracker.record_order)
 
         self._provider = trading_provider
         self._connected = False
@@ -234,9 +238,6 @@ class TradingPipeline:
                         batch_values.get(underlying, 0.0) + value
                     )
 
-                    # 清除缓存，让后续检查能看到新订单
-                    self._daily_tracker.invalidate_cache()
-
             except Exception as e:
                 logger.error(
                     f"Failed to execute decision {decision.decision_id}: {e}"
@@ -24,6 +24,8 @@ from src.data.models.margin import (
     calc_reg_t_margin_short_put,
 )
 from src.data.models.option import OptionChain, OptionContract, OptionQuote
+from src.data.models.option_frame import OptionChainFrame
+from src.data.models.price_series import PriceSeries
 from src.data.models.stock import KlineBar, StockQuote, StockVolatility
 from src.data.models.technical import TechnicalData
 
@@ -41,11 +43,13 @@ __all__ = [
     # Stock models
     "StockQuote",
     "KlineBar",
+    "PriceSeries",
     "StockVolatility",
     "TechnicalData",
     # Option models
     "OptionQuote",
     "OptionChain",
+    "OptionChainFrame",
     "OptionContract",
     # Event models
     "EconomicEvent",
@@ -224,6 +224,27 @@ class OptionChain:
     calls: list[OptionQuote] = field(default_factory=list)
     puts: list[OptionQuote] = field(default_factory=list)
     source: str = "unknown"
+    _index: dict[tuple[date, float, OptionType], OptionQuote] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def find_quote(
+        self, option_type: OptionType, strike: float, expiry: date
+    ) -> OptionQuote | None:
+        """Look up a contract by (type, strike, expiry).
+
+        The index is built on first use; duplicate contracts resolve to the
+        first quote in list order. Mutating calls/puts afterwards is not
+        reflected in the index.
+        """
+        if self._index is None:
+            index: dict[tuple[date, float, OptionType], OptionQuote] = {}
+            for quote in (*self.puts, *self.calls):
+                contract = quote.contract
+                key = (contract.expiry_date, float(contract.strike_price), contract.option_type)
+                index.setdefault(key, quote)
+            self._index = index
+        return self._index.get((expiry, float(strike), option_type))
 
     def filter_by_expiry(self, expiry: date) -> "OptionChain":
         """Filter options by expiry date."""
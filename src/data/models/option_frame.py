@@ -0,0 +1,328 @@
+"""Columnar option chain model.
+
+``OptionChainFrame`` holds one underlying's option chain for a single day as
+NumPy struct-of-arrays. Filters (DTE, delta, open interest, ...) run as array
+masks over the whole chain, and ``OptionQuote`` objects are created only for
+the rows that survive.
+
+Missing values are stored as NaN in the float columns and converted back to
+None when quotes are materialized.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.data.models.option import (
+    Greeks,
+    OptionChain,
+    OptionContract,
+    OptionQuote,
+    OptionType,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Per-row float columns copied by OptionChainFrame.filter
+_FLOAT_COLUMNS = (
+    "open", "high", "low", "close", "bid", "ask", "volume", "open_interest",
+    "iv", "delta", "gamma", "theta", "vega", "rho", "underlying_price",
+)
+
+
+def _to_float(value: float) -> float | None:
+    """NaN -> None, otherwise a Python float."""
+    return None if value != value else float(value)
+
+
+def _to_int(value: float) -> int | None:
+    """NaN -> None, otherwise a Python int."""
+    return None if value != value else int(value)
+
+
+@dataclass
+class OptionChainFrame:
+    """Option chain stored as column arrays (one row per contract).
+
+    Attributes:
+        underlying: Underlying symbol
+        timestamp: Quote timestamp shared by all rows
+        expiry: Expiry dates (datetime64[D])
+        strike: Strike prices
+        is_call: True for calls, False for puts
+        symbols: Optional per-row option symbols; generated on demand when None
+        source: Data source name
+        lot_size: Shares per contract
+    """
+
+    underlying: str
+    timestamp: datetime
+    expiry: NDArray[np.datetime64]
+    strike: NDArray[np.float64]
+    is_call: NDArray[np.bool_]
+    open: NDArray[np.float64]
+    high: NDArray[np.float64]
+    low: NDArray[np.float64]
+    close: NDArray[np.float64]
+    bid: NDArray[np.float64]
+    ask: NDArray[np.float64]
+    volume: NDArray[np.float64]
+    open_interest: NDArray[np.float64]
+    iv: NDArray[np.float64]
+    delta: NDArray[np.float64]
+    gamma: NDArray[np.float64]
+    theta: NDArray[np.float64]
+    vega: NDArray[np.float64]
+    rho: NDArray[np.float64]
+    underlying_price: NDArray[np.float64]
+    symbols: NDArray[np.object_] | None = None
+    source: str = "unknown"
+    lot_size: int = 100
+    _lookup: dict[tuple[date, float, bool], int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # ========== Construction ==========
+
+    @classmethod
+    def from_arrow(
+        cls,
+        table: pa.Table,
+        underlying: str,
+        timestamp: datetime,
+        source: str = "unknown",
+    ) -> OptionChainFrame:
+        """Build a frame from an option_daily Arrow table.
+
+        Expects the option_daily column names (expiration, strike,
+        option_type, open, ..., implied_vol, underlying_price, open_interest).
+        Null values become NaN.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        def col(name: str) -> NDArray[np.float64]:
+            return np.asarray(
+                table.column(name).cast(pa.float64()).to_numpy(), dtype=np.float64
+            )
+
+        return cls(
+            underlying=underlying,
+            timestamp=timestamp,
+            expiry=np.asarray(
+                table.column("expiration").cast(pa.date32()).to_numpy(),
+                dtype="datetime64[D]",
+            ),
+            strike=col("strike"),
+            is_call=np.asarray(
+                pc.equal(table.column("option_type"), "call").to_numpy(), dtype=bool
+            ),
+            open=col("open"),
+            high=col("high"),
+            low=col("low"),
+            close=col("close"),
+            bid=col("bid"),
+            ask=col("ask"),
+            volume=col("volume"),
+            open_interest=col("open_interest"),
+            iv=col("implied_vol"),
+            delta=col("delta"),
+            gamma=col("gamma"),
+            theta=col("theta"),
+            vega=col("vega"),
+            rho=col("rho"),
+            underlying_price=col("underlying_price"),
+            source=source,
+        )
+
+    @classmethod
+    def from_chain(cls, chain: OptionChain) -> OptionChainFrame:
+        """Build a frame from an OptionChain (puts first, then calls)."""
+        quotes = [*chain.puts, *chain.calls]
+
+        def col(getter) -> NDArray[np.float64]:
+            return np.array(
+                [np.nan if (v := getter(q)) is None else v for q in quotes],
+                dtype=np.float64,
+            )
+
+        return cls(
+            underlying=chain.underlying,
+            timestamp=chain.timestamp,
+            expiry=np.array(
+                [q.contract.expiry_date for q in quotes], dtype="datetime64[D]"
+            ),
+            strike=col(lambda q: q.contract.strike_price),
+            is_call=np.array(
+                [q.contract.option_type == OptionType.CALL for q in quotes], dtype=bool
+            ),
+            open=col(lambda q: q.open),
+            high=col(lambda q: q.high),
+            low=col(lambda q: q.low),
+            close=col(lambda q: q.close if q.close is not None else q.last_price),
+            bid=col(lambda q: q.bid),
+            ask=col(lambda q: q.ask),
+            volume=col(lambda q: q.volume),
+            open_interest=col(lambda q: q.open_interest),
+            iv=col(lambda q: q.iv),
+            delta=col(lambda q: q.greeks.delta),
+            gamma=col(lambda q: q.greeks.gamma),
+            theta=col(lambda q: q.greeks.theta),
+            vega=col(lambda q: q.greeks.vega),
+            rho=col(lambda q: q.greeks.rho),
+            underlying_price=np.full(len(quotes), np.nan),
+            symbols=np.array([q.contract.symbol for q in quotes], dtype=object),
+            source=chain.source,
+            lot_size=quotes[0].contract.lot_size if quotes else 100,
+        )
+
+    # ========== Column helpers ==========
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    @property
+    def expiry_dates(self) -> list[date]:
+        """Sorted unique expiry dates."""
+        return [d.item() for d in np.unique(self.expiry)]
+
+    def dte(self, ref_date: date) -> NDArray[np.int64]:
+        """Days to expiry of every row relative to ref_date."""
+        return (self.expiry - np.datetime64(ref_date, "D")).astype(np.int64)
+
+    def filter(self, selector: NDArray[np.bool_] | NDArray[np.intp]) -> OptionChainFrame:
+        """Return a new frame with the rows selected by a mask or index array."""
+        kwargs: dict[str, Any] = {
+            "underlying": self.underlying,
+            "timestamp": self.timestamp,
+            "source": self.source,
+            "lot_size": self.lot_size,
+            "expiry": self.expiry[selector],
+            "strike": self.strike[selector],
+            "is_call": self.is_call[selector],
+            "symbols": None if self.symbols is None else self.symbols[selector],
+        }
+        for name in _FLOAT_COLUMNS:
+            kwargs[name] = getattr(self, name)[selector]
+        return OptionChainFrame(**kwargs)
+
+    def filter_by_expiry_range(
+        self,
+        expiry_start: date | None = None,
+        expiry_end: date | None = None,
+    ) -> OptionChainFrame:
+        """Keep rows with expiry_start <= expiry <= expiry_end (bounds optional)."""
+        if expiry_start is None and expiry_end is None:
+            return self
+        mask = np.ones(len(self), dtype=bool)
+        if expiry_start is not None:
+            mask &= self.expiry >= np.datetime64(expiry_start, "D")
+        if expiry_end is not None:
+            mask &= self.expiry <= np.datetime64(expiry_end, "D")
+        return self.filter(mask)
+
+    def find(self, expiry: date, strike: float, is_call: bool) -> int | None:
+        """Row index of a contract, or None if not in the chain.
+
+        The (expiry, strike, type) index is built on first use; duplicate
+        keys resolve to the first row.
+        """
+        if self._lookup is None:
+            lookup: dict[tuple[date, float, bool], int] = {}
+            keys = zip(self.expiry.tolist(), self.strike.tolist(), self.is_call.tolist())
+            for i, key in enumerate(keys):
+                lookup.setdefault(key, i)
+            self._lookup = lookup
+        return self._lookup.get((expiry, float(strike), bool(is_call)))
+
+    def find_quotes(
+        self, keys: list[tuple[date, float, OptionType]]
+    ) -> list[OptionQuote | None]:
+        """Materialize the quotes for (expiry, strike, type) keys.
+
+        Returns one entry per key, None for contracts not in the chain.
+        """
+        quotes: list[OptionQuote | None] = []
+        for expiry, strike, option_type in keys:
+            i = self.find(expiry, strike, option_type == OptionType.CALL)
+            quotes.append(None if i is None else self.to_quote(i))
+        return quotes
+
+    # ========== Materialization ==========
+
+    def option_symbol(self, i: int) -> str:
+        """Option symbol of row i (UNDERLYING + YYMMDD + C/P + strike×1000)."""
+        if self.symbols is not None:
+            return self.symbols[i]
+        expiry = self.expiry[i].item()
+        return (
+            f"{self.underlying}{expiry.strftime('%y%m%d')}"
+            f"{'C' if self.is_call[i] else 'P'}{int(self.strike[i] * 1000):08d}"
+        )
+
+    def to_quote(self, i: int, contract: OptionContract | None = None) -> OptionQuote:
+        """Materialize row i as an OptionQuote.
+
+        Args:
+            i: Row index
+            contract: Contract to attach instead of building one from the row
+        """
+        if contract is None:
+            contract = OptionContract(
+                symbol=self.option_symbol(i),
+                underlying=self.underlying,
+                option_type=OptionType.CALL if self.is_call[i] else OptionType.PUT,
+                strike_price=float(self.strike[i]),
+                expiry_date=self.expiry[i].item(),
+                lot_size=self.lot_size,
+            )
+        close = _to_float(self.close[i])
+        return OptionQuote(
+            contract=contract,
+            timestamp=self.timestamp,
+            last_price=close,
+            bid=_to_float(self.bid[i]),
+            ask=_to_float(self.ask[i]),
+            volume=_to_int(self.volume[i]),
+            open_interest=_to_int(self.open_interest[i]),
+            iv=_to_float(self.iv[i]),
+            greeks=Greeks(
+                delta=_to_float(self.delta[i]),
+                gamma=_to_float(self.gamma[i]),
+                theta=_to_float(self.theta[i]),
+                vega=_to_float(self.vega[i]),
+                rho=_to_float(self.rho[i]),
+            ),
+            source=self.source,
+            open=_to_float(self.open[i]),
+            high=_to_float(self.high[i]),
+            low=_to_float(self.low[i]),
+            close=close,
+        )
+
+    def to_quotes(self, indices: NDArray[np.intp] | list[int] | None = None) -> list[OptionQuote]:
+        """Materialize the given rows (all rows when None) as OptionQuotes."""
+        if indices is None:
+            indices = range(len(self))
+        return [self.to_quote(int(i)) for i in indices]
+
+    def to_option_chain(self) -> OptionChain:
+        """Materialize the whole frame as an OptionChain (row order preserved)."""
+        calls: list[OptionQuote] = []
+        puts: list[OptionQuote] = []
+        for i in range(len(self)):
+            (calls if self.is_call[i] else puts).append(self.to_quote(i))
+        return OptionChain(
+            underlying=self.underlying,
+            timestamp=self.timestamp,
+            expiry_dates=self.expiry_dates,
+            calls=calls,
+            puts=puts,
+            source=self.source,
+        )
@@ -0,0 +1,175 @@
+"""Columnar daily price series model.
+
+``PriceSeries`` holds one symbol's (or macro indicator's) daily OHLCV bars as
+NumPy struct-of-arrays sorted by date. Date-range and as-of queries are
+answered with ``np.searchsorted`` and return array views; ``KlineBar`` /
+``MacroData`` objects are created only for the rows a caller asks for.
+
+Missing values are stored as NaN and converted back to None when rows are
+materialized.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.data.models.macro import MacroData
+from src.data.models.stock import KlineBar, KlineType
+
+
+def _to_float(value: float) -> float | None:
+    """NaN -> None, otherwise a Python float."""
+    return None if value != value else float(value)
+
+
+def _to_int(value: float) -> int | None:
+    """NaN -> None, otherwise a Python int."""
+    return None if value != value else int(value)
+
+
+def _to_date(value: date | datetime | str) -> date:
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _column(rows: Sequence[tuple], index: int) -> NDArray[np.float64]:
+    return np.array(
+        [np.nan if row[index] is None else row[index] for row in rows], dtype=np.float64
+    )
+
+
+@dataclass
+class PriceSeries:
+    """Daily bars stored as column arrays (one row per date, ascending).
+
+    Attributes:
+        dates: Bar dates (datetime64[D], strictly ascending)
+        open: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes (NaN when unavailable)
+    """
+
+    dates: NDArray[np.datetime64]
+    open: NDArray[np.float64]
+    high: NDArray[np.float64]
+    low: NDArray[np.float64]
+    close: NDArray[np.float64]
+    volume: NDArray[np.float64]
+
+    # ========== Construction ==========
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> PriceSeries:
+        """Build from (date, open, high, low, close[, volume]) rows sorted by date.
+
+        Dates may be date, datetime or ISO strings; None values become NaN.
+        """
+        rows = list(rows)
+        return cls(
+            dates=np.array([_to_date(row[0]) for row in rows], dtype="datetime64[D]"),
+            open=_column(rows, 1),
+            high=_column(rows, 2),
+            low=_column(rows, 3),
+            close=_column(rows, 4),
+            volume=(
+                _column(rows, 5)
+                if rows and len(rows[0]) > 5
+                else np.full(len(rows), np.nan)
+            ),
+        )
+
+    # ========== Lookups ==========
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def range_slice(self, start_date: date | None, end_date: date | None) -> slice:
+        """Row slice for start_date <= date <= end_date (None = unbounded)."""
+        lo = (
+            0 if start_date is None
+            else int(np.searchsorted(self.dates, np.datetime64(start_date, "D"), "left"))
+        )
+        hi = (
+            len(self.dates) if end_date is None
+            else int(np.searchsorted(self.dates, np.datetime64(end_date, "D"), "right"))
+        )
+        return slice(lo, max(lo, hi))
+
+    def between(self, start_date: date | None, end_date: date | None) -> PriceSeries:
+        """Rows within [start_date, end_date] as views (no copy)."""
+        s = self.range_slice(start_date, end_date)
+        return PriceSeries(
+            dates=self.dates[s],
+            open=self.open[s],
+            high=self.high[s],
+            low=self.low[s],
+            close=self.close[s],
+            volume=self.volume[s],
+        )
+
+    def index_as_of(self, as_of: date) -> int | None:
+        """Index of the last row dated on or before as_of (None if none)."""
+        i = int(np.searchsorted(self.dates, np.datetime64(as_of, "D"), "right")) - 1
+        return i if i >= 0 else None
+
+    def date_at(self, index: int) -> date:
+        return self.dates[index].item()
+
+    # ========== Materialization ==========
+
+    def to_klines(self, symbol: str, source: str = "unknown") -> list[KlineBar]:
+        """Materialize every row as a daily KlineBar."""
+        return [
+            KlineBar(
+                symbol=symbol,
+                timestamp=datetime.combine(d, datetime.min.time()),
+                ktype=KlineType.DAY,
+                open=_to_float(o),
+                high=_to_float(h),
+                low=_to_float(lo),
+                close=_to_float(c),
+                volume=_to_int(v),
+                source=source,
+            )
+            for d, o, h, lo, c, v in zip(
+                self.dates.tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+            )
+        ]
+
+    def to_macro_data(self, indicator: str, source: str = "unknown") -> list[MacroData]:
+        """Materialize every row as MacroData (close is the value)."""
+        return [
+            MacroData(
+                indicator=indicator,
+                date=d,
+                value=_to_float(c),
+                open=_to_float(o),
+                high=_to_float(h),
+                low=_to_float(lo),
+                close=_to_float(c),
+                volume=None,
+                source=source,
+            )
+            for d, o, h, lo, c in zip(
+                self.dates.tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+            )
+        ]
@@ -124,6 +124,7 @@ class FutuProvider(DataProvider, AccountProvider):
         # Rate limiting with sliding window
         # Each operation tracks timestamps of recent requests in a deque
         self._request_timestamps: dict[str, deque[float]] = {}
+        self._rate_limit_lock = Lock()  # Guards the windows; never held while sleeping
         self._rate_limits = {
             "quote": (60, 30),  # 60 requests per 30 seconds
             "option_chain": (10, 30),  # 10 requests per 30 seconds
@@ -204,36 +205,33 @@ class FutuProvider(DataProvider, AccountProvider):
         if operation not in self._rate_limits:
             return
 
+        # Callers may run on several threads (concurrent prefetch); the lock only
+        # guards the window bookkeeping, waiting happens outside it so other
+        # operations (and their windows) are never blocked by a sleeping caller
         max_requests, period = self._rate_limits[operation]
-        current_time = time.time()
-
-        # Initialize deque for this operation if not exists
-        if operation not in self._request_timestamps:
-            self._request_timestamps[operation] = deque()
+        while True:
+            with self._rate_limit_lock:
+                current_time = time.time()
+                timestamps = self._request_timestamps.setdefault(operation, deque())
 
-        timestamps = self._request_timestamps[operation]
+                # Remove timestamps older than the rate limit period
+                while timestamps and timestamps[0] < current_time - period:
+                    timestamps.popleft()
 
-        # Remove timestamps older than the rate limit period
-        while timestamps and timestamps[0] < current_time - period:
-            timestamps.popleft()
+                # Record this request if the window has room
+                if len(timestamps) < max_requests:
+                    timestamps.append(current_time)
+                    return
 
-        # If we've hit the limit, wait until the oldest request expires
-        while len(timestamps) >= max_requests:
-            oldest = timestamps[0]
-            wait_time = oldest + period - current_time + 0.1  # +0.1s buffer
-            if wait_time > 0:
-                logger.debug(
-                    f"Rate limit reached for {operation}: {len(timestamps)}/{max_requests} "
-                    f"in last {period}s, sleeping {wait_time:.2f}s"
-                )
-                time.sleep(wait_time)
-                current_time = time.time()
-            # Remove expired timestamps after waiting
-            while timestamps and timestamps[0] < current_time - period:
-                timestamps.popleft()
+                # Otherwise wait until the oldest request expires
+                wait_time = timestamps[0] + period - current_time + 0.1  # +0.1s buffer
+                count = len(timestamps)
 
-        # Record this request
-        timestamps.append(time.time())
+            logger.debug(
+                f"Rate limit reached for {operation}: {count}/{max_requests} "
+                f"in last {period}s, sleeping {wait_time:.2f}s"
+            )
+            time.sleep(wait_time)
 
     def _ensure_connected(self) -> None:
         """Ensure connection is established."""
@@ -361,6 +361,21 @@ class UnifiedDataProvider:
 
         return providers
 
+    def route_names(self, data_type: DataType, symbol: str) -> list[str]:
+        """Names of the available providers a request would try, in order.
+
+        Lets callers that issue requests concurrently group them by the
+        provider that will serve them.
+
+        Args:
+            data_type: Type of data being requested.
+            symbol: Symbol for market detection.
+
+        Returns:
+            Provider names in fallback order (empty if none available).
+        """
+        return [provider.name for provider in self._route(data_type, symbol)]
+
     def _execute_with_fallback(
         self,
         providers: list[DataProvider],
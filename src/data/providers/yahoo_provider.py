@@ -3,6 +3,7 @@
 import logging
 import time
 from datetime import date, datetime
+from threading import Lock
 from typing import Any
 
 import yfinance as yf
@@ -62,6 +63,7 @@ class YahooProvider(DataProvider):
         """
         self._rate_limit = rate_limit
         self._last_request_time = 0.0
+        self._rate_limit_lock = Lock()
 
     @property
     def name(self) -> str:
@@ -74,15 +76,20 @@ class YahooProvider(DataProvider):
         return True
 
     def _check_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
+        """Enforce rate limiting between requests.
 
-        if elapsed < self._rate_limit:
-            sleep_time = self._rate_limit - elapsed
-            time.sleep(sleep_time)
+        Thread-safe: concurrent callers are spaced rate_limit seconds apart
+        (the requests themselves may still overlap).
+        """
+        with self._rate_limit_lock:
+            current_time = time.time()
+            elapsed = current_time - self._last_request_time
+
+            if elapsed < self._rate_limit:
+                sleep_time = self._rate_limit - elapsed
+                time.sleep(sleep_time)
 
-        self._last_request_time = time.time()
+            self._last_request_time = time.time()
 
     def _retry_with_backoff(
         self,
@@ -0,0 +1,17 @@
+"""Market reference data (beta, benchmark price, FX) with TTL caching."""
+
+from src.data.reference.market_reference import (
+    MarketReferenceCache,
+    ReferenceBackend,
+    YFinanceReferenceBackend,
+    get_market_reference_cache,
+    set_market_reference_cache,
+)
+
+__all__ = [
+    "MarketReferenceCache",
+    "ReferenceBackend",
+    "YFinanceReferenceBackend",
+    "get_market_reference_cache",
+    "set_market_reference_cache",
+]
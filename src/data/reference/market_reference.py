@@ -0,0 +1,262 @@
+"""Process-wide market reference data cache.
+
+Caches slowly-changing reference values used by portfolio aggregation
+(stock beta, SPY price, FX rates) with per-kind TTLs, so a monitor run over
+a large book does not issue one blocking HTTP request per position.
+
+The network access sits behind a small backend protocol; the default
+backend uses yfinance, tests can plug in a local stub.
+
+Example:
+    >>> cache = get_market_reference_cache()
+    >>> cache.prefetch_betas(["AAPL", "NVDA", "9988"])  # one batch
+    >>> cache.get_beta("AAPL")
+    >>> cache.get_price("SPY")
+    >>> cache.get_fx_rate("USD", "HKD")
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Default TTL values in seconds
+DEFAULT_BETA_TTL = 86400  # beta changes daily at most
+DEFAULT_PRICE_TTL = 15
+DEFAULT_FX_TTL = 60
+
+
+def normalize_yf_symbol(symbol: str) -> str:
+    """Normalize a ticker for yfinance ("9988" -> "9988.HK", "700" -> "0700.HK")."""
+    yf_symbol = symbol.upper()
+    if yf_symbol.isdigit():
+        yf_symbol = yf_symbol.zfill(4) + ".HK"
+    return yf_symbol
+
+
+class ReferenceBackend(Protocol):
+    """Source of market reference data."""
+
+    def fetch_betas(self, symbols: list[str]) -> dict[str, float | None]:
+        """Fetch betas for several symbols in one batch.
+
+        None means the symbol has no beta; symbols whose request failed are
+        omitted so the cache retries them instead of storing a miss.
+        """
+        ...
+
+    def fetch_price(self, symbol: str) -> float | None:
+        """Fetch the latest price of a symbol."""
+        ...
+
+    def fetch_fx_rate(self, from_currency: str, to_currency: str) -> float | None:
+        """Fetch the rate such that 1 from_currency = rate to_currency."""
+        ...
+
+
+class YFinanceReferenceBackend:
+    """Reference backend backed by yfinance.
+
+    Yahoo has no batched beta endpoint, so fetch_betas resolves one batch
+    with a bounded thread pool instead of sequential blocking calls.
+
+    Args:
+        max_workers: Maximum concurrent beta requests per batch
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        self._max_workers = max_workers
+        self._converter = None
+
+    def fetch_betas(self, symbols: list[str]) -> dict[str, float | None]:
+        import yfinance as yf
+
+        _failed = object()
+
+        def fetch(symbol: str) -> float | None | object:
+            try:
+                beta = yf.Ticker(normalize_yf_symbol(symbol)).info.get("beta")
+                return float(beta) if beta is not None else None
+            except Exception as e:
+                logger.debug(f"Failed to fetch beta for {symbol}: {e}")
+                return _failed
+
+        if not symbols:
+            return {}
+        workers = max(1, min(self._max_workers, len(symbols)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = dict(zip(symbols, pool.map(fetch, symbols)))
+        return {s: beta for s, beta in results.items() if beta is not _failed}
+
+    def fetch_price(self, symbol: str) -> float | None:
+        import yfinance as yf
+
+        price = yf.Ticker(normalize_yf_symbol(symbol)).fast_info.get("lastPrice")
+        return float(price) if price and price > 0 else None
+
+    def fetch_fx_rate(self, from_currency: str, to_currency: str) -> float | None:
+        # One shared converter (it refreshes rates itself and falls back to defaults)
+        if self._converter is None:
+            from src.data.currency import CurrencyConverter
+
+            self._converter = CurrencyConverter()
+        return self._converter.get_rate(from_currency, to_currency)
+
+
+class MarketReferenceCache:
+    """Thread-safe TTL cache for beta, price and FX reference data.
+
+    Missing values (None) are cached too, so a symbol without beta is not
+    re-requested until its TTL expires. Failed requests are not cached.
+
+    Args:
+        backend: Reference data source (defaults to YFinanceReferenceBackend)
+        beta_ttl: Beta TTL in seconds
+        price_ttl: Price TTL in seconds
+        fx_ttl: FX rate TTL in seconds
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        backend: ReferenceBackend | None = None,
+        beta_ttl: float = DEFAULT_BETA_TTL,
+        price_ttl: float = DEFAULT_PRICE_TTL,
+        fx_ttl: float = DEFAULT_FX_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend or YFinanceReferenceBackend()
+        self._ttl = {"beta": beta_ttl, "price": price_ttl, "fx": fx_ttl}
+        self._clock = clock
+        self._entries: dict[tuple[str, str], tuple[float | None, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> ReferenceBackend:
+        return self._backend
+
+    # ========== Internal ==========
+
+    def _lookup(self, kind: str, key: str) -> tuple[bool, float | None]:
+        with self._lock:
+            entry = self._entries.get((kind, key))
+        if entry is None or entry[1] <= self._clock():
+            return False, None
+        return True, entry[0]
+
+    def _store(self, kind: str, key: str, value: float | None) -> None:
+        with self._lock:
+            self._entries[(kind, key)] = (value, self._clock() + self._ttl[kind])
+
+    # ========== Beta ==========
+
+    def get_beta(self, symbol: str) -> float | None:
+        """Get beta for a symbol (fetched on miss or expiry)."""
+        symbol = symbol.upper()
+        hit, value = self._lookup("beta", symbol)
+        if hit:
+            return value
+        return self.prefetch_betas([symbol]).get(symbol)
+
+    def prefetch_betas(self, symbols: Iterable[str]) -> dict[str, float | None]:
+        """Fetch all missing/expired betas in one backend batch.
+
+        Returns:
+            Beta for every requested symbol (cached or freshly fetched).
+        """
+        result: dict[str, float | None] = {}
+        missing: list[str] = []
+        for symbol in dict.fromkeys(s.upper() for s in symbols):
+            hit, value = self._lookup("beta", symbol)
+            if hit:
+                result[symbol] = value
+            else:
+                missing.append(symbol)
+
+        if missing:
+            try:
+                fetched = self._backend.fetch_betas(missing)
+            except Exception as e:
+                # Not cached, retried on the next call
+                logger.warning(f"Failed to fetch betas for {len(missing)} symbols: {e}")
+                result.update(dict.fromkeys(missing))
+                return result
+            failed = [s for s in missing if s not in fetched]
+            for symbol in missing:
+                value = fetched.get(symbol)
+                if symbol in fetched:
+                    self._store("beta", symbol, value)
+                result[symbol] = value
+            if failed:
+                # Omitted by the backend: not cached, retried on the next call
+                logger.warning(f"Failed to fetch betas for {failed}")
+            logger.debug(f"Prefetched betas for {len(missing)} symbols")
+        return result
+
+    # ========== Price / FX ==========
+
+    def get_price(self, symbol: str) -> float | None:
+        """Get the latest price of a symbol (short TTL)."""
+        symbol = symbol.upper()
+        hit, value = self._lookup("price", symbol)
+        if hit:
+            return value
+        try:
+            value = self._backend.fetch_price(symbol)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {symbol} price: {e}")
+            return None  # not cached, retried on the next call
+        self._store("price", symbol, value)
+        return value
+
+    def get_fx_rate(self, from_currency: str, to_currency: str = "USD") -> float | None:
+        """Get the rate such that 1 from_currency = rate to_currency."""
+        from_currency, to_currency = from_currency.upper(), to_currency.upper()
+        if from_currency == to_currency:
+            return 1.0
+        key = f"{from_currency}/{to_currency}"
+        hit, value = self._lookup("fx", key)
+        if hit:
+            return value
+        try:
+            value = self._backend.fetch_fx_rate(from_currency, to_currency)
+        except Exception as e:
+            logger.warning(f"Failed to fetch FX rate {key}: {e}")
+            return None
+        self._store("fx", key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global singleton for convenience
+_default_cache: MarketReferenceCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_market_reference_cache() -> MarketReferenceCache:
+    """Get or create the process-wide reference cache.
+
+    Returns:
+        Global MarketReferenceCache instance
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = MarketReferenceCache()
+        return _default_cache
+
+
+def set_market_reference_cache(cache: MarketReferenceCache | None) -> None:
+    """Replace the process-wide reference cache (None resets to default on next use)."""
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
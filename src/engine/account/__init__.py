@@ -6,12 +6,13 @@ This module provides calculations at the account/fund level:
 - Capital management (ROC)
 - Market sentiment (VIX, Trend, PCR)
 - Unified capital metrics entry point (calc_capital_metrics)
+- Stress test scenario grid (calc_stress_test_grid)
 """
 
 from src.engine.account.capital import calc_roc
 from src.engine.account.margin import calc_margin_utilization
-from src.engine.account.metrics import calc_capital_metrics
-from src.engine.models.capital import CapitalMetrics
+from src.engine.account.metrics import calc_capital_metrics, calc_stress_test_grid
+from src.engine.models.capital import CapitalMetrics, StressTestGrid
 from src.engine.account.position_sizing import (
     calc_fractional_kelly,
     calc_half_kelly,
@@ -41,8 +42,11 @@ from src.engine.account.sentiment import (
 __all__ = [
     # Models
     "CapitalMetrics",
+    "StressTestGrid",
     # Unified entry point
     "calc_capital_metrics",
+    # Stress test
+    "calc_stress_test_grid",
     # Margin
     "calc_margin_utilization",
     # Position sizing
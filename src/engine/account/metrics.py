@@ -23,13 +23,21 @@ import logging
 import math
 from datetime import datetime
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from src.data.models.account import AssetType, ConsolidatedPortfolio
-from src.engine.models.capital import CapitalMetrics
+from src.engine.bs.vectorized import calc_bs_price_array
+from src.engine.models.capital import CapitalMetrics, StressTestGrid
 
 logger = logging.getLogger(__name__)
 
+# Default stress grid: spot -30%..+20%, IV -20%..+100%
+DEFAULT_SPOT_SHOCKS = (-0.30, -0.20, -0.15, -0.10, -0.05, 0.0, 0.05, 0.10, 0.20)
+DEFAULT_IV_SHOCKS = (-0.20, 0.0, 0.20, 0.40, 0.60, 1.00)
+
 
-def _is_valid_number(value) -> bool:
+def is_valid_number(value) -> bool:
     """Check if value is a valid number (not None, not nan, not inf)."""
     if value is None:
         return False
@@ -147,47 +155,56 @@ def calc_gross_leverage(
     return gross_notional / nlv
 
 
-def calc_stress_test_loss(
+def calc_stress_test_grid(
     portfolio: ConsolidatedPortfolio,
-    current_nlv: float,
-    cash_balance: float,
-    spot_shock: float = -0.15,
-    iv_shock: float = 0.40,
+    spot_shocks: ArrayLike = DEFAULT_SPOT_SHOCKS,
+    iv_shocks: ArrayLike = DEFAULT_IV_SHOCKS,
+    days_forward: ArrayLike = (0,),
     risk_free_rate: float = 0.05,
-) -> float | None:
-    """Calculate stress test loss under extreme scenario (tail risk metric).
+) -> StressTestGrid:
+    """Revalue the whole book across a spot × IV × time shock grid.
 
-    Stress Test Loss = (Current_NLV - Stressed_NLV) / Current_NLV
-
-    Default scenario: "Stock crash + panic"
-        - Spot price drops by 15%
-        - IV increases by 40%
+    All option positions with complete B-S inputs are priced in a single
+    vectorized Black-Scholes pass over a (position, days, spot, IV) array,
+    so a full risk surface costs about as much as one scalar scenario.
 
-    Uses Black-Scholes full revaluation for options.
-
-    Physical meaning:
-        - Predicts drawdown under Black Swan events
-        - < 10% is safe, > 20% is dangerous
+    Revaluation rules (identical to the single-scenario stress test):
+        - Stock: Qty × Price × (1 + spot_shock)
+        - Option with strike/IV/spot/expiry: B-S full revaluation, with
+          time to expiry reduced by days_forward (floored at 1 day)
+        - Option with missing B-S inputs: delta approximation on notional
+        - B-S failure (invalid inputs): current market value
 
     Args:
         portfolio: Consolidated portfolio with positions.
-        current_nlv: Current Net Liquidation Value.
-        cash_balance: Current cash balance.
-        spot_shock: Spot price change (default -0.15 for -15%).
-        iv_shock: IV relative increase (default 0.40 for +40%).
+        spot_shocks: Relative spot moves (e.g., -0.15 for -15%).
+        iv_shocks: Relative IV changes (e.g., 0.40 for +40%).
+        days_forward: Calendar days elapsed before revaluation.
         risk_free_rate: Risk-free rate for B-S pricing.
 
     Returns:
-        Stress loss as decimal (e.g., 0.15 for 15% loss), or None if invalid.
+        StressTestGrid with aggregate and per-underlying P&L surfaces
+        of shape (len(days_forward), len(spot_shocks), len(iv_shocks)).
     """
-    if current_nlv is None or current_nlv <= 0:
-        return None
-
-    # Import B-S functions here to avoid circular imports
-    from src.engine.bs.core import calc_bs_price
-    from src.engine.models.bs_params import BSParams
+    spot = np.atleast_1d(np.asarray(spot_shocks, dtype=np.float64))
+    vol = np.atleast_1d(np.asarray(iv_shocks, dtype=np.float64))
+    days = np.atleast_1d(np.asarray(days_forward, dtype=np.int64))
+    shape = (len(days), len(spot), len(vol))
+    # Spot-linear term: value = base + coef × spot_shock
+    spot_term = spot[None, :, None]
+
+    pnl_by_underlying: dict[str, NDArray[np.float64]] = {}
+    base_value = 0.0
+
+    def add_pnl(key: str, pnl: NDArray[np.float64]) -> None:
+        if key in pnl_by_underlying:
+            pnl_by_underlying[key] = pnl_by_underlying[key] + pnl
+        else:
+            pnl_by_underlying[key] = np.broadcast_to(pnl, shape).copy()
 
-    stressed_portfolio_value = 0.0
+    # Options priced by B-S, collected as columns for the vectorized pass
+    bs_keys: list[str] = []
+    bs_rows: list[tuple[float, float, float, int, bool, float, float]] = []
 
     for pos in portfolio.positions:
         # Get FX rate for currency conversion
@@ -195,106 +212,150 @@ def calc_stress_test_loss(
         if pos.currency != "USD" and pos.currency in portfolio.exchange_rates:
             fx_rate = portfolio.exchange_rates[pos.currency]
 
+        key = pos.underlying or pos.symbol
+        current_value = pos.market_value * fx_rate
+
         if pos.asset_type == AssetType.STOCK:
+            base_value += current_value
             # Stock revaluation: simply apply spot shock
             price = pos.underlying_price
-            if not _is_valid_number(price) and pos.quantity != 0:
+            if not is_valid_number(price) and pos.quantity != 0:
                 # Fallback: derive price from market_value
                 price = abs(pos.market_value / pos.quantity)
-            if _is_valid_number(price):
-                stressed_price = price * (1 + spot_shock)
-                stressed_value = pos.quantity * stressed_price * fx_rate
-                stressed_portfolio_value += stressed_value
+            if is_valid_number(price):
+                value = pos.quantity * price * fx_rate
             else:
                 # Fallback: use current market value with spot shock
                 logger.debug(
                     f"Stock {pos.symbol}: missing price, using market_value fallback"
                 )
-                stressed_portfolio_value += pos.market_value * (1 + spot_shock) * fx_rate
+                value = current_value
+            add_pnl(key, value * (1 + spot_term) - current_value)
 
         elif pos.asset_type == AssetType.OPTION:
-            # Option revaluation using B-S model
+            base_value += current_value
             # Check all required fields are valid numbers (not None, not nan)
             has_valid_data = all([
-                _is_valid_number(pos.strike),
-                _is_valid_number(pos.iv),
-                _is_valid_number(pos.underlying_price),
+                is_valid_number(pos.strike),
+                is_valid_number(pos.iv),
+                is_valid_number(pos.underlying_price),
                 pos.expiry is not None,
             ])
 
             if not has_valid_data:
                 # Missing data for B-S, use delta approximation for stress
-                # Short put/call: approximate loss using delta × spot_shock × notional
                 # Conservative fallback: assume delta ≈ 0.3 for OTM options
-                delta = pos.delta if _is_valid_number(pos.delta) else 0.3
+                delta = pos.delta if is_valid_number(pos.delta) else 0.3
                 notional = (pos.strike or 0) * (pos.contract_multiplier or 100) * abs(pos.quantity)
 
-                # For short options (qty < 0): spot drop hurts short puts, helps short calls
-                # Simplified: apply delta-based approximation
+                # Position delta: long call / short put gain when spot rises,
+                # short call / long put gain when spot drops
+                position_delta = abs(delta) * (1 if pos.quantity > 0 else -1)
                 if pos.option_type and pos.option_type.lower() == "put":
-                    # Short put loses when spot drops: loss ≈ |delta| × spot_drop × notional
-                    delta_loss = abs(delta) * abs(spot_shock) * notional
-                    stressed_value = pos.market_value - delta_loss * (1 if pos.quantity < 0 else -1)
-                else:
-                    # Short call gains when spot drops (usually)
-                    delta_loss = abs(delta) * abs(spot_shock) * notional
-                    stressed_value = pos.market_value + delta_loss * (1 if pos.quantity < 0 else -1)
-
-                stressed_portfolio_value += stressed_value * fx_rate
+                    position_delta = -position_delta
+                add_pnl(key, position_delta * notional * fx_rate * spot_term)
                 logger.warning(
                     f"Option {pos.symbol}: missing data for B-S, using delta approximation "
                     f"(delta={delta:.2f}, notional={notional:.0f})"
                 )
                 continue
 
-            # Calculate stressed parameters
-            stressed_spot = pos.underlying_price * (1 + spot_shock)
-            stressed_iv = pos.iv * (1 + iv_shock)
+            bs_keys.append(key)
+            bs_rows.append((
+                pos.underlying_price,
+                pos.strike,
+                pos.iv,
+                calc_dte_days(pos.expiry),
+                pos.option_type is not None and pos.option_type.lower() == "call",
+                pos.contract_multiplier * pos.quantity * fx_rate,
+                current_value,
+            ))
+
+    if bs_rows:
+        underlying_price, strike, iv, dte, is_call, scale, current = (
+            np.array(col) for col in zip(*bs_rows)
+        )
+        # (position, days, spot, iv)
+        t = np.maximum(dte[:, None] - days[None, :], 1) / 365
+        prices = calc_bs_price_array(
+            spot=underlying_price[:, None, None, None] * (1 + spot[None, None, :, None]),
+            strike=strike[:, None, None, None],
+            rate=risk_free_rate,
+            vol=iv[:, None, None, None] * (1 + vol[None, None, None, :]),
+            t=t[:, :, None, None],
+            is_call=is_call[:, None, None, None],
+        )
+        stressed = prices * scale[:, None, None, None]
+        # B-S calculation failed: keep current value
+        current = current[:, None, None, None]
+        pnl = np.where(np.isfinite(stressed), stressed - current, 0.0)
+        for key, position_pnl in zip(bs_keys, pnl):
+            add_pnl(key, position_pnl)
+
+    total = np.zeros(shape)
+    for pnl in pnl_by_underlying.values():
+        total += pnl
+
+    return StressTestGrid(
+        spot_shocks=spot,
+        iv_shocks=vol,
+        days_forward=days,
+        base_value=base_value,
+        pnl=total,
+        pnl_by_underlying=pnl_by_underlying,
+    )
 
-            # Calculate time to expiry in years
-            dte_years = _calc_dte_years(pos.expiry)
-            if dte_years <= 0:
-                dte_years = 1 / 365  # Minimum 1 day
 
-            # Determine option type
-            is_call = pos.option_type is not None and pos.option_type.lower() == "call"
+def calc_stress_test_loss(
+    portfolio: ConsolidatedPortfolio,
+    current_nlv: float,
+    cash_balance: float,
+    spot_shock: float = -0.15,
+    iv_shock: float = 0.40,
+    risk_free_rate: float = 0.05,
+) -> float | None:
+    """Calculate stress test loss under extreme scenario (tail risk metric).
 
-            # Create B-S params for stressed scenario
-            try:
-                bs_params = BSParams(
-                    spot_price=stressed_spot,
-                    strike_price=pos.strike,
-                    risk_free_rate=risk_free_rate,
-                    volatility=stressed_iv,
-                    time_to_expiry=dte_years,
-                    is_call=is_call,
-                )
+    Stress Test Loss = (Current_NLV - Stressed_NLV) / Current_NLV
 
-                # Calculate stressed option price (per share)
-                stressed_option_price = calc_bs_price(bs_params)
-                if stressed_option_price is None:
-                    # B-S calculation failed, use current value
-                    stressed_portfolio_value += pos.market_value * fx_rate
-                    continue
-
-                # Option value = Price × Multiplier × Qty
-                # Note: qty can be negative for short positions
-                stressed_option_value = (
-                    stressed_option_price * pos.contract_multiplier * pos.quantity
-                )
-                stressed_portfolio_value += stressed_option_value * fx_rate
+    Default scenario: "Stock crash + panic"
+        - Spot price drops by 15%
+        - IV increases by 40%
 
-            except Exception as e:
-                logger.warning(
-                    f"B-S revaluation failed for {pos.symbol}: {e}, using current value"
-                )
-                stressed_portfolio_value += pos.market_value * fx_rate
+    Uses Black-Scholes full revaluation for options (a 1×1 grid of
+    calc_stress_test_grid).
+
+    Physical meaning:
+        - Predicts drawdown under Black Swan events
+        - < 10% is safe, > 20% is dangerous
+
+    Args:
+        portfolio: Consolidated portfolio with positions.
+        current_nlv: Current Net Liquidation Value.
+        cash_balance: Current cash balance.
+        spot_shock: Spot price change (default -0.15 for -15%).
+        iv_shock: IV relative increase (default 0.40 for +40%).
+        risk_free_rate: Risk-free rate for B-S pricing.
+
+    Returns:
+        Stress loss as decimal (e.g., 0.15 for 15% loss), or None if invalid.
+    """
+    if current_nlv is None or current_nlv <= 0:
+        return None
+
+    grid = calc_stress_test_grid(
+        portfolio,
+        spot_shocks=(spot_shock,),
+        iv_shocks=(iv_shock,),
+        risk_free_rate=risk_free_rate,
+    )
+    stressed_portfolio_value = float(grid.stressed_value[0, 0, 0])
 
     # Stressed NLV = Cash + Stressed Portfolio Value
     stressed_nlv = cash_balance + stressed_portfolio_value
 
     # Handle potential nan values
-    if not _is_valid_number(stressed_nlv):
+    if not is_valid_number(stressed_nlv):
         logger.warning(
             f"Stress test produced invalid result: stressed_nlv={stressed_nlv}, "
             f"cash={cash_balance}, portfolio={stressed_portfolio_value}"
@@ -306,21 +367,21 @@ def calc_stress_test_loss(
 
     # Return positive value for loss (ensure non-negative)
     # Return None if result is invalid (nan/inf)
-    if not _is_valid_number(stress_loss):
+    if not is_valid_number(stress_loss):
         logger.warning(f"Stress test loss is invalid: {stress_loss}")
         return None
 
     return max(0.0, stress_loss)
 
 
-def _calc_dte_years(expiry: str) -> float:
-    """Convert expiry string to years remaining.
+def calc_dte_days(expiry: str) -> int:
+    """Convert expiry string to calendar days remaining (at least 1).
 
     Args:
         expiry: Expiry date string (various formats supported).
 
     Returns:
-        Time to expiry in years.
+        Days to expiry, 30 if the string cannot be parsed.
     """
     try:
         # Try different date formats
@@ -331,13 +392,13 @@ def _calc_dte_years(expiry: str) -> float:
             except ValueError:
                 continue
         else:
-            return 30 / 365  # Default 30 days if parsing fails
+            return 30  # Default 30 days if parsing fails
 
         days = (expiry_date - datetime.now()).days
-        return max(days, 1) / 365
+        return max(days, 1)
 
     except Exception:
-        return 30 / 365
+        return 30
 
 
 def _calc_cash_balance_usd(portfolio: ConsolidatedPortfolio) -> float:
@@ -10,6 +10,9 @@ All functions use BSParams for input parameters:
     ...     volatility=0.2, time_to_expiry=1.0, is_call=True
     ... )
     >>> delta = calc_bs_delta(params)
+
+Array-native variants (``*_array``) accept NumPy columns of
+spot/strike/vol/T/rate/is_call and price whole chains in one pass.
 """
 
 from src.engine.bs.core import (
@@ -49,6 +52,18 @@ from src.engine.bs.probability import (
     calc_put_win_prob,
     calc_win_prob,
 )
+from src.engine.bs.vectorized import (
+    BSArrays,
+    calc_bs_greeks_array,
+    calc_bs_params_array,
+    calc_bs_price_array,
+    calc_d1_array,
+    calc_d2_array,
+    calc_d3_array,
+    calc_n_array,
+    calc_n_pdf_array,
+    to_bs_arrays,
+)
 
 __all__ = [
     # Core calculations
@@ -84,4 +99,15 @@ __all__ = [
     "calc_call_itm_prob",
     "calc_put_win_prob",
     "calc_call_win_prob",
+    # Vectorized (NumPy array) calculations
+    "BSArrays",
+    "to_bs_arrays",
+    "calc_d1_array",
+    "calc_d2_array",
+    "calc_d3_array",
+    "calc_n_array",
+    "calc_n_pdf_array",
+    "calc_bs_price_array",
+    "calc_bs_params_array",
+    "calc_bs_greeks_array",
 ]
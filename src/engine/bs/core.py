@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import math
 
-from scipy.stats import norm
+from scipy.special import ndtr
 
 from src.engine.models import BSParams
 
@@ -96,13 +96,17 @@ def calc_d3(params: BSParams, d2: float | None = None) -> float | None:
 def calc_n(d: float) -> float:
     """Calculate cumulative standard normal distribution N(d).
 
+    Uses the ``scipy.special.ndtr`` ufunc shared with the vectorized kernel
+    (see ``src.engine.bs.vectorized``); it is far cheaper per call than
+    ``scipy.stats.norm.cdf``.
+
     Args:
         d: Input value
 
     Returns:
         Cumulative probability N(d)
     """
-    return float(norm.cdf(d))
+    return float(ndtr(d))
 
 
 def calc_bs_call_price(params: BSParams) -> float | None:
@@ -33,11 +33,11 @@ from __future__ import annotations
 
 import math
 
-from scipy.stats import norm
-
 from src.engine.bs.core import calc_d1, calc_d2, calc_n
 from src.engine.models import BSParams
 
+_SQRT_2PI = math.sqrt(2 * math.pi)
+
 
 def _calc_n_pdf(d: float) -> float:
     """Calculate standard normal probability density function n(d).
@@ -50,7 +50,7 @@ def _calc_n_pdf(d: float) -> float:
     Returns:
         PDF value at d.
     """
-    return float(norm.pdf(d))
+    return math.exp(-0.5 * d * d) / _SQRT_2PI
 
 
 def calc_bs_delta(params: BSParams) -> float | None:
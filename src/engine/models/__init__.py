@@ -56,8 +56,8 @@ from src.engine.models.result import (
     VolatilityScore,
 )
 from src.engine.models.pricing import OptionLeg, PricingMetrics, PricingParams
-from src.engine.models.capital import CapitalMetrics
-from src.engine.models.portfolio import PortfolioMetrics
+from src.engine.models.capital import CapitalMetrics, StressTestGrid
+from src.engine.models.portfolio import PortfolioMetrics, RiskScenarios, ScenarioVaR
 
 __all__ = [
     # B-S params
@@ -92,5 +92,8 @@ __all__ = [
     "PricingMetrics",
     # Capital & Portfolio
     "CapitalMetrics",
+    "StressTestGrid",
     "PortfolioMetrics",
+    "RiskScenarios",
+    "ScenarioVaR",
 ]
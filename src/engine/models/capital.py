@@ -10,6 +10,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 @dataclass
 class CapitalMetrics:
@@ -85,3 +88,48 @@ class CapitalMetrics:
 
     # Timestamp
     timestamp: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class StressTestGrid:
+    """Portfolio P&L surface over a spot × IV × time shock grid.
+
+    Computed by calc_stress_test_grid() in metrics.py. Every P&L array has
+    shape (len(days_forward), len(spot_shocks), len(iv_shocks)) and is
+    measured in USD against the current market value of the book.
+
+    Attributes:
+        spot_shocks: Relative spot moves (e.g., -0.15 for -15%).
+        iv_shocks: Relative IV changes (e.g., 0.40 for +40%).
+        days_forward: Calendar days elapsed before revaluation.
+        base_value: Current market value of all positions in USD.
+        pnl: Aggregate P&L surface.
+        pnl_by_underlying: P&L surface per underlying symbol.
+    """
+
+    spot_shocks: NDArray[np.float64]
+    iv_shocks: NDArray[np.float64]
+    days_forward: NDArray[np.int64]
+    base_value: float
+    pnl: NDArray[np.float64]
+    pnl_by_underlying: dict[str, NDArray[np.float64]] = field(default_factory=dict)
+
+    @property
+    def stressed_value(self) -> NDArray[np.float64]:
+        """Position value under each scenario (base_value + pnl)."""
+        return self.base_value + self.pnl
+
+    @property
+    def worst_pnl(self) -> float:
+        """Largest loss (most negative P&L) across the grid."""
+        return float(self.pnl.min())
+
+    @property
+    def worst_scenario(self) -> tuple[int, float, float]:
+        """(days_forward, spot_shock, iv_shock) of the worst grid point."""
+        t, i, j = np.unravel_index(int(np.argmin(self.pnl)), self.pnl.shape)
+        return (
+            int(self.days_forward[t]),
+            float(self.spot_shocks[i]),
+            float(self.iv_shocks[j]),
+        )
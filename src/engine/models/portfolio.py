@@ -10,6 +10,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 @dataclass
 class PortfolioMetrics:
@@ -73,3 +76,62 @@ class PortfolioMetrics:
 
     # Timestamp
     timestamp: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class RiskScenarios:
+    """Joint spot / IV scenarios for full-revaluation VaR.
+
+    Built by build_historical_scenarios() or build_monte_carlo_scenarios()
+    in scenario_var.py. Row s of both matrices is one joint scenario across
+    all underlyings.
+
+    Attributes:
+        underlyings: Underlying symbols, one column each.
+        spot_returns: Log spot returns over the horizon, shape (S, U).
+        iv_changes: Log changes of ATM IV over the horizon, shape (S, U).
+        horizon_days: Trading-day horizon each scenario covers.
+        method: "historical" or "monte_carlo".
+    """
+
+    underlyings: list[str]
+    spot_returns: NDArray[np.float64]
+    iv_changes: NDArray[np.float64]
+    horizon_days: int = 1
+    method: str = "historical"
+
+    @property
+    def n_scenarios(self) -> int:
+        """Number of scenarios (rows)."""
+        return int(self.spot_returns.shape[0])
+
+
+@dataclass
+class ScenarioVaR:
+    """Full-revaluation VaR / Expected Shortfall result.
+
+    Loss figures are positive dollar amounts (0 when the tail is a gain).
+
+    Attributes:
+        var_95: 95% Value at Risk.
+        var_99: 99% Value at Risk.
+        es_95: 95% Expected Shortfall (mean loss beyond VaR).
+        es_99: 99% Expected Shortfall.
+        n_scenarios: Number of scenarios revalued.
+        n_positions: Number of positions included.
+        horizon_days: Horizon of each scenario in trading days.
+        method: Scenario method ("historical" / "monte_carlo").
+        skipped: Symbols of positions excluded for lack of scenario data.
+        pnl: Portfolio P&L per scenario, shape (S,).
+    """
+
+    var_95: float
+    var_99: float
+    es_95: float
+    es_99: float
+    n_scenarios: int
+    n_positions: int
+    horizon_days: int = 1
+    method: str = "historical"
+    skipped: list[str] = field(default_factory=list)
+    pnl: NDArray[np.float64] = field(default_factory=lambda: np.zeros(0), repr=False)
@@ -3,6 +3,7 @@
 This module provides calculations at the portfolio level:
 - Greeks aggregation (delta dollars, gamma dollars, etc.)
 - Risk metrics (VaR, beta, concentration)
+- Full-revaluation scenario VaR / Expected Shortfall
 - Return analysis (Sharpe, Sortino, drawdown, etc.)
 - Composite scores (PREI, SAS)
 - Unified metrics entry point (calc_portfolio_metrics)
@@ -42,6 +43,11 @@ from src.engine.portfolio.risk_metrics import (
     calc_portfolio_tgr,
     calc_portfolio_var,
 )
+from src.engine.portfolio.scenario_var import (
+    build_historical_scenarios,
+    build_monte_carlo_scenarios,
+    calc_scenario_var,
+)
 
 __all__ = [
     # Models
@@ -60,6 +66,10 @@ __all__ = [
     "calc_portfolio_var",
     "calc_portfolio_beta",
     "calc_concentration_risk",
+    # Scenario VaR
+    "build_historical_scenarios",
+    "build_monte_carlo_scenarios",
+    "calc_scenario_var",
     # Return analysis
     "calc_annualized_return",
     "calc_total_return",
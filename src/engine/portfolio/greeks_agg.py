@@ -4,6 +4,7 @@ import logging
 from datetime import date
 from typing import TYPE_CHECKING
 
+from src.data.reference import get_market_reference_cache
 from src.engine.models.position import Position
 
 if TYPE_CHECKING:
@@ -12,6 +13,14 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _convert_from_usd(price: float, base_currency: str) -> float:
+    """Convert a USD price to base_currency using the cached FX rate."""
+    if base_currency == "USD":
+        return price
+    rate = get_market_reference_cache().get_fx_rate("USD", base_currency)
+    return price * rate if rate else price
+
+
 def _get_spy_price(
     base_currency: str = "USD",
     data_provider: "DataProvider | None" = None,
@@ -19,8 +28,8 @@ def _get_spy_price(
     """Get current SPY price for beta-weighted delta calculation.
 
     In backtest mode (data_provider provided), reads from DuckDB.
-    In live mode, uses yfinance to fetch the latest SPY price.
-    If base_currency is not USD, converts the price.
+    In live mode, reads the process-wide reference cache (yfinance behind a
+    short TTL). If base_currency is not USD, converts the price.
 
     Args:
         base_currency: Target currency for the price.
@@ -34,33 +43,20 @@ def _get_spy_price(
         try:
             quote = data_provider.get_stock_quote("SPY")
             if quote and quote.close and quote.close > 0:
-                price = quote.close
-                # Convert to base_currency if not USD
-                if base_currency != "USD":
-                    from src.data.currency import CurrencyConverter
-                    converter = CurrencyConverter()
-                    price = converter.convert(price, "USD", base_currency)
+                price = _convert_from_usd(quote.close, base_currency)
                 logger.debug(f"Fetched SPY price from data_provider: {price:.2f} {base_currency}")
                 return price
         except Exception as e:
             logger.debug(f"Failed to get SPY price from data_provider: {e}")
         return None
 
-    # Live mode: use yfinance
+    # Live mode: cached reference price
     try:
-        import yfinance as yf
-
-        spy = yf.Ticker("SPY")
-        price = spy.fast_info.get("lastPrice")
+        price = get_market_reference_cache().get_price("SPY")
         if not price or price <= 0:
             return None
 
-        # Convert to base_currency if not USD
-        if base_currency != "USD":
-            from src.data.currency import CurrencyConverter
-            converter = CurrencyConverter()
-            price = converter.convert(price, "USD", base_currency)
-
+        price = _convert_from_usd(price, base_currency)
         logger.debug(f"Fetched SPY price: {price:.2f} {base_currency}")
         return price
     except Exception as e:
@@ -76,7 +72,8 @@ def _get_stock_beta(
     """Get stock beta.
 
     In backtest mode (data_provider provided), reads from stock_beta_daily.parquet
-    or stock_beta.parquet. In live mode, uses yfinance.
+    or stock_beta.parquet. In live mode, reads the process-wide reference cache
+    (yfinance behind a daily TTL).
 
     Args:
         symbol: Stock ticker symbol (e.g., "AAPL", "9988.HK").
@@ -99,25 +96,11 @@ def _get_stock_beta(
             logger.debug(f"Failed to get beta for {symbol} from data_provider: {e}")
         return None
 
-    # Live mode: use yfinance
-    try:
-        import yfinance as yf
-
-        # Normalize symbol for yfinance
-        yf_symbol = symbol.upper()
-        # Convert HK format: "9988" -> "9988.HK", "700" -> "0700.HK"
-        if yf_symbol.isdigit():
-            yf_symbol = yf_symbol.zfill(4) + ".HK"
-
-        ticker = yf.Ticker(yf_symbol)
-        beta = ticker.info.get("beta")
-        if beta is not None:
-            logger.debug(f"Fetched beta for {symbol}: {beta:.2f}")
-            return float(beta)
-        return None
-    except Exception as e:
-        logger.debug(f"Failed to fetch beta for {symbol}: {e}")
-        return None
+    # Live mode: cached reference beta
+    beta = get_market_reference_cache().get_beta(symbol)
+    if beta is not None:
+        logger.debug(f"Fetched beta for {symbol}: {beta:.2f}")
+    return beta
 
 
 def calc_portfolio_delta(positions: list[Position]) -> float:
@@ -269,6 +252,16 @@ def calc_beta_weighted_delta(
 
     logger.debug(f"calc_beta_weighted_delta: SPY price={spy_price:.2f}")
 
+    # Live mode: fetch every missing beta in one batch before the loop
+    if data_provider is None:
+        missing = [
+            getattr(pos, "underlying", None) or pos.symbol
+            for pos in positions
+            if pos.beta is None and pos.delta is not None and pos.underlying_price is not None
+        ]
+        if missing:
+            get_market_reference_cache().prefetch_betas(missing)
+
     total_bwd = 0.0
     for pos in positions:
         if pos.delta is None or pos.underlying_price is None:
@@ -282,7 +275,7 @@ def calc_beta_weighted_delta(
             # Use underlying symbol for beta lookup (not option symbol)
             underlying = getattr(pos, "underlying", None) or pos.symbol
             beta = _get_stock_beta(underlying, data_provider=data_provider, as_of_date=as_of_date)
-            beta_source = "data_provider" if data_provider else "yfinance"
+            beta_source = "data_provider" if data_provider else "reference_cache"
         if beta is None:
             logger.debug(f"  {pos.symbol}: SKIP - no beta available")
             continue
@@ -0,0 +1,363 @@
+"""Full-revaluation scenario VaR / Expected Shortfall.
+
+Complements the delta-only parametric calc_portfolio_var() with a scenario
+engine:
+
+1. Scenarios: joint (spot, ATM IV) moves per underlying, either replayed
+   from history (build_historical_scenarios) or drawn from a multivariate
+   normal fitted to that history (build_monte_carlo_scenarios).
+2. Revaluation: every option is repriced with the vectorized B-S kernel
+   over a (scenario, position) array in one pass; stocks move linearly.
+3. Risk: 95% / 99% VaR and Expected Shortfall of the P&L distribution.
+
+10,000 scenarios × 100 positions is a single 10⁶-element B-S evaluation.
+Larger books can split scenarios across a process pool (max_workers).
+
+Example:
+    >>> from src.engine.portfolio.scenario_var import (
+    ...     build_historical_scenarios, build_monte_carlo_scenarios, calc_scenario_var,
+    ... )
+    >>> spot = {s: [(b.timestamp.date(), b.close) for b in provider.get_history_kline(
+    ...     s, KlineType.DAY, start, end)] for s in symbols}
+    >>> iv = {s: provider.get_atm_iv_history(s, start, end) for s in symbols}
+    >>> scenarios = build_monte_carlo_scenarios(
+    ...     build_historical_scenarios(spot, iv), n_scenarios=10_000, seed=7
+    ... )
+    >>> result = calc_scenario_var(portfolio, scenarios)
+    >>> print(f"99% VaR: ${result.var_99:,.0f}, ES: ${result.es_99:,.0f}")
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.data.models.account import AssetType, ConsolidatedPortfolio
+from src.engine.account.metrics import calc_dte_days, is_valid_number
+from src.engine.bs.vectorized import calc_bs_price_array
+from src.engine.models.portfolio import RiskScenarios, ScenarioVaR
+
+logger = logging.getLogger(__name__)
+
+# Minimum aligned observations needed to build scenarios
+MIN_HISTORY_OBSERVATIONS = 20
+
+# Scenario horizons are in trading days; option time decays in calendar days
+CALENDAR_DAYS_PER_TRADING_DAY = 365 / 252
+
+
+class _Book(NamedTuple):
+    """Column arrays of a portfolio, indexed into scenario columns."""
+
+    # Options with full B-S inputs
+    option_idx: NDArray[np.int64]
+    spot: NDArray[np.float64]
+    strike: NDArray[np.float64]
+    iv: NDArray[np.float64]
+    t_horizon: NDArray[np.float64]
+    is_call: NDArray[np.bool_]
+    scale: NDArray[np.float64]
+    base_price: NDArray[np.float64]
+    # Linear exposures: stocks (value) and options without B-S inputs (delta dollars)
+    linear_idx: NDArray[np.int64]
+    linear_value: NDArray[np.float64]
+
+
+def build_historical_scenarios(
+    spot_history: dict[str, list[tuple[date, float]]],
+    iv_history: dict[str, list[tuple[date, float]]] | None = None,
+    horizon_days: int = 1,
+) -> RiskScenarios | None:
+    """Build joint historical scenarios from daily closes and ATM IV.
+
+    Spot series are aligned on the dates common to all underlyings so
+    each scenario keeps the cross-asset correlation of the original day.
+    IV is forward-filled onto those dates; an underlying without IV
+    history gets zero IV change.
+
+    Args:
+        spot_history: {symbol: [(date, close), ...]}.
+        iv_history: {symbol: [(date, atm_iv), ...]}.
+        horizon_days: Return horizon in trading days (overlapping windows).
+
+    Returns:
+        RiskScenarios, or None if fewer than MIN_HISTORY_OBSERVATIONS
+        aligned observations are available.
+    """
+    iv_history = iv_history or {}
+    underlyings = sorted(s.upper() for s in spot_history)
+    series = {s.upper(): dict(rows) for s, rows in spot_history.items()}
+    if not underlyings:
+        return None
+
+    common = set.intersection(*(set(series[s]) for s in underlyings))
+    dates = sorted(d for d in common if all(is_valid_number(series[s][d]) for s in underlyings))
+    if len(dates) <= max(horizon_days, MIN_HISTORY_OBSERVATIONS):
+        logger.warning(
+            f"Not enough aligned history for scenarios: {len(dates)} days "
+            f"across {len(underlyings)} underlyings"
+        )
+        return None
+
+    closes = np.array([[series[s][d] for s in underlyings] for d in dates], dtype=np.float64)
+    ivs = np.column_stack([
+        _forward_fill(iv_history.get(s) or iv_history.get(s.lower()) or [], dates)
+        for s in underlyings
+    ])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spot_returns = np.log(closes[horizon_days:] / closes[:-horizon_days])
+        iv_changes = np.log(ivs[horizon_days:] / ivs[:-horizon_days])
+    iv_changes = np.where(np.isfinite(iv_changes), iv_changes, 0.0)
+
+    return RiskScenarios(
+        underlyings=underlyings,
+        spot_returns=spot_returns,
+        iv_changes=iv_changes,
+        horizon_days=horizon_days,
+        method="historical",
+    )
+
+
+def _forward_fill(rows: list[tuple[date, float]], dates: list[date]) -> NDArray[np.float64]:
+    """Values of a (date, value) series on the given dates, forward-filled (NaN before start)."""
+    out = np.full(len(dates), np.nan)
+    if not rows:
+        return out
+    rows = sorted((d, v) for d, v in rows if is_valid_number(v) and v > 0)
+    row_dates = np.array([d.toordinal() for d, _ in rows])
+    values = np.array([v for _, v in rows], dtype=np.float64)
+    pos = np.searchsorted(row_dates, [d.toordinal() for d in dates], side="right") - 1
+    found = pos >= 0
+    out[found] = values[pos[found]]
+    return out
+
+
+def build_monte_carlo_scenarios(
+    historical: RiskScenarios,
+    n_scenarios: int = 10_000,
+    seed: int | None = None,
+) -> RiskScenarios:
+    """Draw scenarios from a multivariate normal fitted to historical moves.
+
+    The mean and covariance are estimated over all spot and IV columns
+    jointly, so spot/vol correlation (e.g., the leverage effect) and
+    cross-asset correlation are preserved.
+
+    Args:
+        historical: Historical scenarios to fit.
+        n_scenarios: Number of scenarios to draw.
+        seed: Random seed for reproducibility.
+
+    Returns:
+        RiskScenarios with method "monte_carlo".
+    """
+    n_under = len(historical.underlyings)
+    factors = np.hstack([historical.spot_returns, historical.iv_changes])
+    mean = factors.mean(axis=0)
+    cov = np.atleast_2d(np.cov(factors, rowvar=False))
+
+    rng = np.random.default_rng(seed)
+    # eigh handles the singular covariance of constant IV columns
+    draws = rng.multivariate_normal(mean, cov, size=n_scenarios, method="eigh")
+
+    return RiskScenarios(
+        underlyings=list(historical.underlyings),
+        spot_returns=draws[:, :n_under],
+        iv_changes=draws[:, n_under:],
+        horizon_days=historical.horizon_days,
+        method="monte_carlo",
+    )
+
+
+def calc_var_es(pnl: NDArray[np.float64], confidence: float) -> tuple[float, float]:
+    """VaR and Expected Shortfall of a P&L sample.
+
+    Args:
+        pnl: Portfolio P&L per scenario.
+        confidence: Confidence level (e.g., 0.99).
+
+    Returns:
+        (VaR, ES) as positive loss amounts (0 when the tail is a gain).
+    """
+    threshold = np.percentile(pnl, (1 - confidence) * 100)
+    tail = pnl[pnl <= threshold]
+    var = max(0.0, -float(threshold))
+    es = max(0.0, -float(tail.mean())) if tail.size else var
+    return var, es
+
+
+def calc_scenario_var(
+    portfolio: ConsolidatedPortfolio,
+    scenarios: RiskScenarios,
+    risk_free_rate: float = 0.05,
+    max_workers: int | None = None,
+) -> ScenarioVaR | None:
+    """Calculate full-revaluation VaR and ES for a portfolio.
+
+    P&L of an option in scenario s is
+        (BS(S·e^r, σ·e^v, T - h) - BS(S, σ, T)) × Multiplier × Qty
+    i.e., model-to-model over the horizon h, so theta accrues and the
+    market/model basis does not leak into the distribution. Options
+    without strike/IV/spot/expiry fall back to a delta approximation.
+
+    Args:
+        portfolio: Consolidated portfolio with positions.
+        scenarios: Joint spot/IV scenarios.
+        risk_free_rate: Risk-free rate for B-S pricing.
+        max_workers: If > 1, split scenarios across a process pool.
+
+    Returns:
+        ScenarioVaR, or None if no position maps to a scenario underlying.
+    """
+    book, n_positions, skipped = _build_book(portfolio, scenarios, risk_free_rate)
+    if n_positions == 0:
+        logger.warning("No positions with scenario data for VaR")
+        return None
+
+    if max_workers is not None and max_workers > 1 and scenarios.n_scenarios > max_workers:
+        bounds = np.array_split(np.arange(scenarios.n_scenarios), max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunks = executor.map(
+                _revalue,
+                [book] * len(bounds),
+                [scenarios.spot_returns[idx] for idx in bounds],
+                [scenarios.iv_changes[idx] for idx in bounds],
+                [risk_free_rate] * len(bounds),
+            )
+            pnl = np.concatenate(list(chunks))
+    else:
+        pnl = _revalue(book, scenarios.spot_returns, scenarios.iv_changes, risk_free_rate)
+
+    var_95, es_95 = calc_var_es(pnl, 0.95)
+    var_99, es_99 = calc_var_es(pnl, 0.99)
+
+    return ScenarioVaR(
+        var_95=var_95,
+        var_99=var_99,
+        es_95=es_95,
+        es_99=es_99,
+        n_scenarios=scenarios.n_scenarios,
+        n_positions=n_positions,
+        horizon_days=scenarios.horizon_days,
+        method=scenarios.method,
+        skipped=skipped,
+        pnl=pnl,
+    )
+
+
+def _build_book(
+    portfolio: ConsolidatedPortfolio,
+    scenarios: RiskScenarios,
+    risk_free_rate: float,
+) -> tuple[_Book, int, list[str]]:
+    """Flatten portfolio positions into column arrays for revaluation."""
+    column = {s: i for i, s in enumerate(scenarios.underlyings)}
+    options: list[tuple[int, float, float, float, int, bool, float]] = []
+    linear: list[tuple[int, float]] = []
+    skipped: list[str] = []
+
+    for pos in portfolio.positions:
+        if pos.asset_type not in (AssetType.STOCK, AssetType.OPTION):
+            continue
+
+        idx = column.get((pos.underlying or pos.symbol).upper())
+        if idx is None:
+            skipped.append(pos.symbol)
+            continue
+
+        # Get FX rate for currency conversion
+        fx_rate = 1.0
+        if pos.currency != "USD" and pos.currency in portfolio.exchange_rates:
+            fx_rate = portfolio.exchange_rates[pos.currency]
+
+        if pos.asset_type == AssetType.STOCK:
+            price = pos.underlying_price
+            if not is_valid_number(price) and pos.quantity != 0:
+                price = abs(pos.market_value / pos.quantity)
+            value = pos.quantity * price if is_valid_number(price) else pos.market_value
+            linear.append((idx, value * fx_rate))
+            continue
+
+        has_valid_data = all([
+            is_valid_number(pos.strike),
+            is_valid_number(pos.iv),
+            is_valid_number(pos.underlying_price),
+            pos.expiry is not None,
+        ])
+        if has_valid_data:
+            options.append((
+                idx,
+                pos.underlying_price,
+                pos.strike,
+                pos.iv,
+                calc_dte_days(pos.expiry),
+                pos.option_type is not None and pos.option_type.lower() == "call",
+                pos.contract_multiplier * pos.quantity * fx_rate,
+            ))
+        elif is_valid_number(pos.delta) and is_valid_number(pos.underlying_price):
+            # Delta dollars move linearly with spot
+            delta_dollars = pos.delta * pos.underlying_price * pos.contract_multiplier * pos.quantity
+            linear.append((idx, delta_dollars * fx_rate))
+        else:
+            logger.warning(f"Option {pos.symbol}: missing B-S inputs and delta, excluded from VaR")
+            skipped.append(pos.symbol)
+
+    if options:
+        idx, spot, strike, iv, dte, is_call, scale = (np.array(c) for c in zip(*options))
+        dte = dte.astype(np.float64)
+        base_price = calc_bs_price_array(spot, strike, risk_free_rate, iv, dte / 365, is_call)
+        horizon_calendar_days = scenarios.horizon_days * CALENDAR_DAYS_PER_TRADING_DAY
+        t_horizon = np.maximum(dte - horizon_calendar_days, 1) / 365
+    else:
+        idx = np.zeros(0, dtype=np.int64)
+        spot = strike = iv = scale = base_price = t_horizon = np.zeros(0)
+        is_call = np.zeros(0, dtype=bool)
+
+    linear_idx = np.array([i for i, _ in linear], dtype=np.int64)
+    linear_value = np.array([v for _, v in linear], dtype=np.float64)
+
+    book = _Book(
+        option_idx=idx.astype(np.int64),
+        spot=spot,
+        strike=strike,
+        iv=iv,
+        t_horizon=t_horizon,
+        is_call=is_call.astype(bool),
+        scale=scale,
+        base_price=base_price,
+        linear_idx=linear_idx,
+        linear_value=linear_value,
+    )
+    return book, len(options) + len(linear), skipped
+
+
+def _revalue(
+    book: _Book,
+    spot_returns: NDArray[np.float64],
+    iv_changes: NDArray[np.float64],
+    risk_free_rate: float,
+) -> NDArray[np.float64]:
+    """Portfolio P&L for each scenario row (module-level for process pools)."""
+    pnl = np.expm1(spot_returns[:, book.linear_idx]) @ book.linear_value
+
+    if book.option_idx.size:
+        # (scenario, position) arrays
+        prices = calc_bs_price_array(
+            spot=book.spot * np.exp(spot_returns[:, book.option_idx]),
+            strike=book.strike,
+            rate=risk_free_rate,
+            vol=book.iv * np.exp(iv_changes[:, book.option_idx]),
+            t=book.t_horizon,
+            is_call=book.is_call,
+        )
+        # Invalid B-S inputs: position contributes no P&L
+        option_pnl = (prices - book.base_price) * book.scale
+        pnl = pnl + np.where(np.isfinite(option_pnl), option_pnl, 0.0).sum(axis=1)
+
+    return pnl
@@ -75,6 +75,9 @@ from src.engine.position.technical.bollinger_bands import (
     is_squeeze,
 )
 
+# Indicator engine (precomputed series, as-of-date lookup)
+from src.engine.position.technical.indicator_engine import IndicatorEngine
+
 # Moving Average (low-level)
 from src.engine.position.technical.moving_average import (
     MovingAverageResult,
@@ -133,6 +136,8 @@ __all__ = [
     # Deprecated (backward compatibility)
     "evaluate_technical",
     "is_technically_favorable",
+    # === Indicator Engine ===
+    "IndicatorEngine",
     # === Low-level functions ===
     # Moving Average
     "MovingAverageResult",
@@ -0,0 +1,444 @@
+"""Rolling-window indicator engine over a full daily bar series.
+
+Computes SMA/EMA/RSI/ADX/ATR/Bollinger/HV once per symbol as NumPy columns
+and answers "value as of date D" by index lookup, instead of recomputing
+each indicator from a fresh kline window every day.
+
+Every indicator is causal, so the value at bar i equals what the list-based
+functions (calc_sma, calc_rsi, calc_adx, ...) return for the bars up to i.
+``append`` extends the series by one bar using only the recursion state
+(EMA, Wilder averages) and the trailing window, independent of history length.
+
+Example:
+    >>> engine = IndicatorEngine.from_klines(klines, sma_periods=(20, 50, 200))
+    >>> engine.sma(200, as_of=date(2024, 6, 14))
+    >>> engine.append(date(2024, 6, 17), high=545.0, low=540.0, close=543.2)
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import NDArray
+from scipy.signal import lfilter
+
+from src.engine.position.technical.adx import ADXResult
+from src.engine.position.technical.bollinger_bands import BollingerBands
+from src.engine.position.volatility.historical import calc_hv_series
+
+if TYPE_CHECKING:
+    from src.data.models.stock import KlineBar
+
+
+def _recursive_smooth(
+    x: NDArray[np.float64], seed_index: int, seed: float, decay: float, gain: float
+) -> NDArray[np.float64]:
+    """y[seed_index] = seed; y[t] = decay * y[t-1] + gain * x[t] afterwards (NaN before)."""
+    y = np.full(len(x), np.nan)
+    if seed_index >= len(x):
+        return y
+    y[seed_index] = seed
+    tail = x[seed_index + 1 :]
+    if len(tail):
+        y[seed_index + 1 :] = lfilter([gain], [1.0, -decay], tail, zi=[decay * seed])[0]
+    return y
+
+
+def _rolling_sum(x: NDArray[np.float64], window: int) -> NDArray[np.float64]:
+    """Trailing sum over `window` values (NaN for the first window - 1 rows)."""
+    out = np.full(len(x), np.nan)
+    if len(x) >= window:
+        csum = np.concatenate(([0.0], np.cumsum(x)))
+        out[window - 1 :] = csum[window:] - csum[:-window]
+    return out
+
+
+class IndicatorEngine:
+    """Precomputed technical indicator columns for one symbol.
+
+    Columns are stored in growable NumPy buffers with NaN for rows that do
+    not have enough history yet; lookups convert NaN to None.
+
+    Args:
+        dates: Bar dates (oldest to newest, strictly increasing)
+        highs: High prices
+        lows: Low prices
+        closes: Close prices
+        sma_periods: SMA periods to maintain
+        ema_periods: EMA periods to maintain
+        rsi_period: RSI period (Wilder)
+        adx_period: ADX/DI period (Wilder)
+        atr_period: ATR period (Wilder average of True Range)
+        bb_period: Bollinger Bands period
+        bb_std: Bollinger Bands width in standard deviations
+        hv_window: Historical volatility window (log returns, annualized)
+    """
+
+    def __init__(
+        self,
+        dates: Sequence[date],
+        highs: Sequence[float],
+        lows: Sequence[float],
+        closes: Sequence[float],
+        sma_periods: Iterable[int] = (20, 50, 200),
+        ema_periods: Iterable[int] = (20,),
+        rsi_period: int = 14,
+        adx_period: int = 14,
+        atr_period: int = 14,
+        bb_period: int = 20,
+        bb_std: float = 2.0,
+        hv_window: int = 20,
+        trading_days_per_year: int = 252,
+    ) -> None:
+        if not len(dates) == len(highs) == len(lows) == len(closes):
+            raise ValueError("dates, highs, lows and closes must have the same length")
+
+        self.sma_periods = tuple(sorted(set(sma_periods)))
+        self.ema_periods = tuple(sorted(set(ema_periods)))
+        self.rsi_period = rsi_period
+        self.adx_period = adx_period
+        self.atr_period = atr_period
+        self.bb_period = bb_period
+        self.bb_std = bb_std
+        self.hv_window = hv_window
+        self._annualize = math.sqrt(trading_days_per_year)
+
+        self._n = len(dates)
+        self._dates = np.array(dates, dtype="datetime64[D]")
+        self._cols: dict[str, NDArray[np.float64]] = {
+            "high": np.asarray(highs, dtype=np.float64),
+            "low": np.asarray(lows, dtype=np.float64),
+            "close": np.asarray(closes, dtype=np.float64),
+        }
+        if self._n > 1 and np.any(np.diff(self._dates) <= np.timedelta64(0, "D")):
+            raise ValueError("dates must be strictly increasing")
+        self._compute_all()
+
+    @classmethod
+    def from_klines(cls, klines: Sequence[KlineBar], **kwargs) -> IndicatorEngine:
+        """Build an engine from KlineBar objects (oldest to newest)."""
+        return cls(
+            dates=[k.timestamp.date() for k in klines],
+            highs=[k.high for k in klines],
+            lows=[k.low for k in klines],
+            closes=[k.close for k in klines],
+            **kwargs,
+        )
+
+    # ========== Bulk computation ==========
+
+    def _compute_all(self) -> None:
+        """Compute every indicator column over the whole series."""
+        c = self._cols
+        high, low, close = c["high"], c["low"], c["close"]
+        n = self._n
+
+        for p in self.sma_periods:
+            c[f"sma_{p}"] = _rolling_sum(close, p) / p
+        for p in self.ema_periods:
+            k = 2 / (p + 1)
+            seed = close[:p].mean() if n >= p else np.nan
+            c[f"ema_{p}"] = _recursive_smooth(close, p - 1, seed, 1 - k, k)
+
+        # Per-bar moves (row 0 has no previous bar)
+        change = np.full(n, np.nan)
+        tr = np.full(n, np.nan)
+        plus_dm = np.full(n, np.nan)
+        minus_dm = np.full(n, np.nan)
+        if n > 1:
+            change[1:] = np.diff(close)
+            prev_close = close[:-1]
+            tr[1:] = np.maximum.reduce(
+                [high[1:] - low[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)]
+            )
+            up = np.diff(high)
+            down = -np.diff(low)
+            plus_dm[1:] = np.where((up > down) & (up > 0), up, 0.0)
+            minus_dm[1:] = np.where((down > up) & (down > 0), down, 0.0)
+        c["tr"], c["plus_dm"], c["minus_dm"] = tr, plus_dm, minus_dm
+
+        # RSI: Wilder averages of gains/losses seeded with the first `p` changes
+        p = self.rsi_period
+        gain = np.maximum(change, 0.0)
+        loss = np.maximum(-change, 0.0)
+        seeded = n > p
+        c["avg_gain"] = _recursive_smooth(
+            gain, p, gain[1 : p + 1].mean() if seeded else np.nan, (p - 1) / p, 1 / p
+        )
+        c["avg_loss"] = _recursive_smooth(
+            loss, p, loss[1 : p + 1].mean() if seeded else np.nan, (p - 1) / p, 1 / p
+        )
+        c["rsi"] = self._rsi_from_averages(c["avg_gain"], c["avg_loss"])
+
+        # ATR: Wilder average of True Range
+        p = self.atr_period
+        c["atr"] = _recursive_smooth(
+            tr, p, tr[1 : p + 1].mean() if n > p else np.nan, (p - 1) / p, 1 / p
+        )
+
+        # ADX: Wilder-smoothed sums of TR/±DM → DI → DX → Wilder average of DX
+        p = self.adx_period
+        for name in ("tr", "plus_dm", "minus_dm"):
+            x = c[name]
+            seed = x[1 : p + 1].sum() if n > p else np.nan
+            c[f"s_{name}"] = _recursive_smooth(x, p, seed, 1 - 1 / p, 1.0)
+        plus_di, minus_di, dx = self._di_dx(c["s_tr"], c["s_plus_dm"], c["s_minus_dm"])
+        c["plus_di"], c["minus_di"], c["dx"] = plus_di, minus_di, dx
+        first_adx = 2 * p - 1
+        c["adx"] = _recursive_smooth(
+            dx, first_adx, dx[p : first_adx + 1].mean() if n > first_adx else np.nan,
+            (p - 1) / p, 1 / p,
+        )
+
+        # Bollinger Bands: rolling mean and population std
+        p = self.bb_period
+        middle = np.full(n, np.nan)
+        std = np.full(n, np.nan)
+        if n >= p:
+            windows = sliding_window_view(close, p)
+            middle[p - 1 :] = windows.mean(axis=1)
+            std[p - 1 :] = windows.std(axis=1)
+        c["bb_middle"] = middle
+        c["bb_std"] = std
+
+        # HV: sample std of log returns over the trailing window, annualized
+        c["hv"] = calc_hv_series(close, window=self.hv_window, annualize=False) * self._annualize
+
+    @staticmethod
+    def _rsi_from_averages(
+        avg_gain: NDArray[np.float64], avg_loss: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        return np.where(avg_loss == 0, 100.0, rsi)
+
+    @staticmethod
+    def _di_dx(
+        s_tr: NDArray[np.float64], s_plus: NDArray[np.float64], s_minus: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plus_di = np.where(s_tr == 0, 0.0, 100 * s_plus / s_tr)
+            minus_di = np.where(s_tr == 0, 0.0, 100 * s_minus / s_tr)
+            di_sum = plus_di + minus_di
+            dx = np.where(di_sum == 0, 0.0, np.abs(plus_di - minus_di) / di_sum * 100)
+        return plus_di, minus_di, dx
+
+    # ========== Incremental update ==========
+
+    def append(self, bar_date: date, high: float, low: float, close: float) -> None:
+        """Append one bar and update every indicator from the previous row's state.
+
+        Raises:
+            ValueError: If bar_date is not after the last bar.
+        """
+        if self._n and np.datetime64(bar_date, "D") <= self._dates[self._n - 1]:
+            raise ValueError(f"Bar {bar_date} is not after last bar {self.last_date}")
+
+        self._grow()
+        i = self._n
+        self._n += 1
+        self._dates[i] = np.datetime64(bar_date, "D")
+        c = self._cols
+        row: dict[str, float] = dict.fromkeys(c, np.nan)
+        row.update(high=high, low=low, close=close)
+        closes = c["close"][: i + 1]
+        closes[i] = close
+
+        def prev(name: str) -> float:
+            return c[name][i - 1] if i > 0 else np.nan
+
+        def smooth(name: str, seed_index: int, seed, decay: float, gain: float, x: float) -> float:
+            """Next value of a Wilder/EMA recursion (seed exactly at seed_index)."""
+            if i < seed_index:
+                return np.nan
+            if i == seed_index:
+                return seed()
+            return decay * prev(name) + gain * x
+
+        for p in self.sma_periods:
+            if i >= p - 1:
+                row[f"sma_{p}"] = closes[i - p + 1 :].mean()
+        for p in self.ema_periods:
+            k = 2 / (p + 1)
+            row[f"ema_{p}"] = smooth(
+                f"ema_{p}", p - 1, lambda p=p: closes[:p].mean(), 1 - k, k, close
+            )
+
+        if i > 0:
+            prev_close, prev_high, prev_low = closes[i - 1], prev("high"), prev("low")
+            row["tr"] = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            up, down = high - prev_high, prev_low - low
+            row["plus_dm"] = up if (up > down and up > 0) else 0.0
+            row["minus_dm"] = down if (down > up and down > 0) else 0.0
+            change = close - prev_close
+        else:
+            change = np.nan
+        # Write the raw moves first so seeds below can read them
+        for name in ("tr", "plus_dm", "minus_dm"):
+            c[name][i] = row[name]
+
+        p = self.rsi_period
+        changes = np.diff(closes[: p + 1]) if i >= p else None
+        row["avg_gain"] = smooth(
+            "avg_gain", p, lambda: np.maximum(changes, 0).mean(), (p - 1) / p, 1 / p,
+            max(change, 0.0) if i > 0 else np.nan,
+        )
+        row["avg_loss"] = smooth(
+            "avg_loss", p, lambda: np.maximum(-changes, 0).mean(), (p - 1) / p, 1 / p,
+            max(-change, 0.0) if i > 0 else np.nan,
+        )
+        row["rsi"] = float(
+            self._rsi_from_averages(np.array(row["avg_gain"]), np.array(row["avg_loss"]))
+        )
+
+        p = self.atr_period
+        row["atr"] = smooth(
+            "atr", p, lambda: c["tr"][1 : p + 1].mean(), (p - 1) / p, 1 / p, row["tr"]
+        )
+
+        p = self.adx_period
+        for name in ("tr", "plus_dm", "minus_dm"):
+            row[f"s_{name}"] = smooth(
+                f"s_{name}", p, lambda name=name: c[name][1 : p + 1].sum(),
+                1 - 1 / p, 1.0, row[name],
+            )
+        if not math.isnan(row["s_tr"]):
+            plus_di, minus_di, dx = self._di_dx(
+                np.array(row["s_tr"]), np.array(row["s_plus_dm"]), np.array(row["s_minus_dm"])
+            )
+            row["plus_di"], row["minus_di"], row["dx"] = float(plus_di), float(minus_di), float(dx)
+            c["dx"][i] = row["dx"]
+        first_adx = 2 * p - 1
+        row["adx"] = smooth(
+            "adx", first_adx, lambda: c["dx"][p : first_adx + 1].mean(),
+            (p - 1) / p, 1 / p, row["dx"],
+        )
+
+        p = self.bb_period
+        if i >= p - 1:
+            window = closes[i - p + 1 :]
+            row["bb_middle"] = window.mean()
+            row["bb_std"] = window.std()
+
+        w = self.hv_window
+        if i >= w and w >= 2:
+            window = closes[i - w :]
+            if np.all(window > 0):
+                row["hv"] = np.log(window[1:] / window[:-1]).std(ddof=1) * self._annualize
+
+        for name, value in row.items():
+            c[name][i] = value
+
+    def extend(self, klines: Sequence[KlineBar]) -> int:
+        """Append the bars dated after the last bar; returns how many were added."""
+        added = 0
+        last = self.last_date
+        for k in klines:
+            d = k.timestamp.date()
+            if last is None or d > last:
+                self.append(d, k.high, k.low, k.close)
+                last = d
+                added += 1
+        return added
+
+    def _grow(self) -> None:
+        """Ensure capacity for one more row (amortized O(1) doubling)."""
+        capacity = len(self._dates)
+        if self._n < capacity:
+            return
+        new_capacity = max(16, capacity * 2)
+        dates = np.empty(new_capacity, dtype="datetime64[D]")
+        dates[: self._n] = self._dates[: self._n]
+        self._dates = dates
+        for name, col in self._cols.items():
+            grown = np.full(new_capacity, np.nan)
+            grown[: self._n] = col[: self._n]
+            self._cols[name] = grown
+
+    # ========== Lookups ==========
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def last_date(self) -> date | None:
+        """Date of the newest bar (None when empty)."""
+        return self._dates[self._n - 1].item() if self._n else None
+
+    def index_as_of(self, as_of: date) -> int | None:
+        """Index of the last bar dated on or before as_of (None if none)."""
+        i = int(np.searchsorted(self._dates[: self._n], np.datetime64(as_of, "D"), "right")) - 1
+        return i if i >= 0 else None
+
+    def bars_as_of(self, as_of: date) -> int:
+        """Number of bars dated on or before as_of."""
+        i = self.index_as_of(as_of)
+        return 0 if i is None else i + 1
+
+    def _value(self, name: str, as_of: date, bars_ago: int = 0) -> float | None:
+        i = self.index_as_of(as_of)
+        if i is None or i - bars_ago < 0:
+            return None
+        value = self._cols[name][i - bars_ago]
+        return None if math.isnan(value) else float(value)
+
+    def close(self, as_of: date, bars_ago: int = 0) -> float | None:
+        """Close of the bar as of a date, optionally `bars_ago` bars earlier."""
+        return self._value("close", as_of, bars_ago)
+
+    def sma(self, period: int, as_of: date) -> float | None:
+        """SMA as of a date (None with insufficient history)."""
+        if period not in self.sma_periods:
+            raise ValueError(f"SMA period {period} not configured: {self.sma_periods}")
+        return self._value(f"sma_{period}", as_of)
+
+    def ema(self, period: int, as_of: date) -> float | None:
+        """EMA as of a date (None with insufficient history)."""
+        if period not in self.ema_periods:
+            raise ValueError(f"EMA period {period} not configured: {self.ema_periods}")
+        return self._value(f"ema_{period}", as_of)
+
+    def rsi(self, as_of: date) -> float | None:
+        """RSI (0-100) as of a date."""
+        return self._value("rsi", as_of)
+
+    def atr(self, as_of: date) -> float | None:
+        """Average True Range as of a date."""
+        return self._value("atr", as_of)
+
+    def hv(self, as_of: date) -> float | None:
+        """Annualized historical volatility as of a date."""
+        return self._value("hv", as_of)
+
+    def adx(self, as_of: date) -> ADXResult | None:
+        """ADX with +DI/-DI as of a date."""
+        adx = self._value("adx", as_of)
+        if adx is None:
+            return None
+        return ADXResult(
+            adx=adx,
+            plus_di=self._value("plus_di", as_of),
+            minus_di=self._value("minus_di", as_of),
+        )
+
+    def bollinger(self, as_of: date) -> BollingerBands | None:
+        """Bollinger Bands as of a date (same fields as calc_bollinger_bands)."""
+        middle = self._value("bb_middle", as_of)
+        if middle is None:
+            return None
+        std = self._value("bb_std", as_of)
+        price = self._value("close", as_of)
+        upper = middle + self.bb_std * std
+        lower = middle - self.bb_std * std
+        band_width = upper - lower
+        return BollingerBands(
+            upper=upper,
+            middle=middle,
+            lower=lower,
+            bandwidth=band_width / middle if middle != 0 else 0,
+            percent_b=(price - lower) / band_width if band_width != 0 else 0.5,
+        )
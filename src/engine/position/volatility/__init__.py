@@ -4,9 +4,13 @@ Position-level volatility calculations for individual securities.
 """
 
 from src.engine.position.volatility.historical import (
+    calc_garman_klass_hv_series,
     calc_hv,
     calc_hv_from_returns,
+    calc_hv_series,
+    calc_parkinson_hv_series,
     calc_realized_volatility,
+    calc_yang_zhang_hv_series,
 )
 from src.engine.position.volatility.implied import (
     calc_iv_hv_ratio,
@@ -37,6 +41,11 @@ __all__ = [
     "calc_hv",
     "calc_hv_from_returns",
     "calc_realized_volatility",
+    # Rolling HV series (vectorized, one value per bar)
+    "calc_hv_series",
+    "calc_parkinson_hv_series",
+    "calc_garman_klass_hv_series",
+    "calc_yang_zhang_hv_series",
     # Implied volatility (from OptionQuote)
     "get_iv",
     "calc_iv_hv_ratio",
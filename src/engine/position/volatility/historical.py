@@ -1,11 +1,18 @@
 """Historical volatility calculation.
 
 Position-level module for calculating historical volatility from price data.
+
+Scalar functions (calc_hv, ...) return the latest value; the *_series
+functions compute a rolling estimate for every bar of an OHLC array in one
+vectorized pass, aligned to the input (NaN until the window is filled or when
+a price in the window is non-positive), so backtests can look HV up by index.
 """
 
 import math
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import ArrayLike, NDArray
 
 
 def calc_hv(
@@ -38,22 +45,16 @@ def calc_hv(
     if prices is None or len(prices) < window + 1:
         return None
 
-    # Use the most recent 'window + 1' prices to get 'window' returns
-    recent_prices = prices[-(window + 1) :]
-
-    # Calculate log returns
-    log_returns = []
-    for i in range(1, len(recent_prices)):
-        if recent_prices[i - 1] <= 0 or recent_prices[i] <= 0:
-            return None
-        log_returns.append(math.log(recent_prices[i] / recent_prices[i - 1]))
+    if window < 2:
+        return None
 
-    if len(log_returns) < 2:
+    # Use the most recent 'window + 1' prices to get 'window' returns
+    recent_prices = np.asarray(prices[-(window + 1) :], dtype=np.float64)
+    if np.any(recent_prices <= 0):
         return None
 
-    # Calculate standard deviation of log returns
-    returns_array = np.array(log_returns)
-    std_dev = np.std(returns_array, ddof=1)  # Sample standard deviation
+    log_returns = np.diff(np.log(recent_prices))
+    std_dev = np.std(log_returns, ddof=1)  # Sample standard deviation
 
     if annualize:
         return float(std_dev * math.sqrt(trading_days_per_year))
@@ -124,3 +125,155 @@ def calc_realized_volatility(
             result.append(float(std_dev * math.sqrt(trading_days_per_year)))
 
     return result
+
+
+# ========== Rolling series (vectorized) ==========
+
+
+def _rolling_mean(values: NDArray[np.float64], window: int) -> NDArray[np.float64]:
+    """Trailing mean over `window` values via cumulative sums (NaN if any value is NaN)."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        missing = np.isnan(values)
+        csum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values))))
+        means = (csum[window:] - csum[:-window]) / window
+        bad = sliding_window_view(missing, window).any(axis=1)
+        out[window - 1 :] = np.where(bad, np.nan, means)
+    return out
+
+
+def _rolling_var(values: NDArray[np.float64], window: int, ddof: int) -> NDArray[np.float64]:
+    """Trailing variance over `window` values (NaN if any value in the window is NaN)."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window > ddof:
+        out[window - 1 :] = sliding_window_view(values, window).var(axis=1, ddof=ddof)
+    return out
+
+
+def _safe_log_ratio(num: NDArray[np.float64], den: NDArray[np.float64]) -> NDArray[np.float64]:
+    """ln(num / den), NaN where either price is non-positive."""
+    valid = (num > 0) & (den > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(valid, np.log(np.where(valid, num / den, 1.0)), np.nan)
+
+
+def _annualized(variance: NDArray[np.float64], annualize: bool, trading_days_per_year: int) -> NDArray[np.float64]:
+    vol = np.sqrt(variance)
+    return vol * math.sqrt(trading_days_per_year) if annualize else vol
+
+
+def calc_hv_series(
+    closes: ArrayLike,
+    window: int = 20,
+    annualize: bool = True,
+    trading_days_per_year: int = 252,
+    ddof: int = 1,
+) -> NDArray[np.float64]:
+    """Rolling close-to-close volatility for every bar.
+
+    Value at index i equals calc_hv(closes[: i + 1], window) (with ddof=1).
+
+    Args:
+        closes: Closing prices (oldest to newest).
+        window: Number of log returns per estimate.
+        annualize: Whether to annualize the volatility.
+        trading_days_per_year: Number of trading days for annualization.
+        ddof: Delta degrees of freedom for the standard deviation.
+
+    Returns:
+        Array of len(closes); NaN for the first `window` bars.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    out = np.full(len(closes), np.nan)
+    if len(closes) < 2:
+        return out
+    log_returns = _safe_log_ratio(closes[1:], closes[:-1])
+    out[1:] = _annualized(_rolling_var(log_returns, window, ddof), annualize, trading_days_per_year)
+    return out
+
+
+def calc_parkinson_hv_series(
+    highs: ArrayLike,
+    lows: ArrayLike,
+    window: int = 20,
+    annualize: bool = True,
+    trading_days_per_year: int = 252,
+) -> NDArray[np.float64]:
+    """Rolling Parkinson (high-low range) volatility for every bar.
+
+    σ² = mean(ln(H/L)²) / (4 ln 2)
+
+    Returns:
+        Array of len(highs); NaN for the first `window - 1` bars.
+    """
+    hl = _safe_log_ratio(np.asarray(highs, dtype=np.float64), np.asarray(lows, dtype=np.float64))
+    variance = _rolling_mean(hl**2, window) / (4 * math.log(2))
+    return _annualized(variance, annualize, trading_days_per_year)
+
+
+def calc_garman_klass_hv_series(
+    opens: ArrayLike,
+    highs: ArrayLike,
+    lows: ArrayLike,
+    closes: ArrayLike,
+    window: int = 20,
+    annualize: bool = True,
+    trading_days_per_year: int = 252,
+) -> NDArray[np.float64]:
+    """Rolling Garman-Klass (OHLC) volatility for every bar.
+
+    σ² = mean(0.5 ln(H/L)² - (2 ln 2 - 1) ln(C/O)²)
+
+    Returns:
+        Array of len(closes); NaN for the first `window - 1` bars.
+    """
+    opens = np.asarray(opens, dtype=np.float64)
+    closes = np.asarray(closes, dtype=np.float64)
+    hl = _safe_log_ratio(np.asarray(highs, dtype=np.float64), np.asarray(lows, dtype=np.float64))
+    co = _safe_log_ratio(closes, opens)
+    per_bar = 0.5 * hl**2 - (2 * math.log(2) - 1) * co**2
+    variance = np.maximum(_rolling_mean(per_bar, window), 0.0)
+    return _annualized(variance, annualize, trading_days_per_year)
+
+
+def calc_yang_zhang_hv_series(
+    opens: ArrayLike,
+    highs: ArrayLike,
+    lows: ArrayLike,
+    closes: ArrayLike,
+    window: int = 20,
+    annualize: bool = True,
+    trading_days_per_year: int = 252,
+) -> NDArray[np.float64]:
+    """Rolling Yang-Zhang volatility for every bar.
+
+    σ² = σ_overnight² + k σ_open_close² + (1 - k) σ_rogers_satchell²,
+    k = 0.34 / (1.34 + (n + 1) / (n - 1)). Overnight returns need the prior
+    close, so each estimate spans `window + 1` bars.
+
+    Returns:
+        Array of len(closes); NaN for the first `window` bars.
+    """
+    opens = np.asarray(opens, dtype=np.float64)
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    closes = np.asarray(closes, dtype=np.float64)
+    out = np.full(len(closes), np.nan)
+    if len(closes) < 2 or window < 2:
+        return out
+
+    o, h, lo, c = opens[1:], highs[1:], lows[1:], closes[1:]
+    overnight = _safe_log_ratio(o, closes[:-1])
+    open_close = _safe_log_ratio(c, o)
+    rogers_satchell = _safe_log_ratio(h, c) * _safe_log_ratio(h, o) + _safe_log_ratio(
+        lo, c
+    ) * _safe_log_ratio(lo, o)
+
+    k = 0.34 / (1.34 + (window + 1) / (window - 1))
+    variance = (
+        _rolling_var(overnight, window, ddof=1)
+        + k * _rolling_var(open_close, window, ddof=1)
+        + (1 - k) * _rolling_mean(rogers_satchell, window)
+    )
+    out[1:] = _annualized(variance, annualize, trading_days_per_year)
+    return out
@@ -16,6 +16,13 @@ from src.engine.pricing.short_call import ShortCallPricer
 from src.engine.pricing.short_put import ShortPutPricer
 from src.engine.pricing.strangle import ShortStranglePricer
 
+# Chain-level (vectorized) pricing
+from src.engine.pricing.chain import (
+    ChainPricingInput,
+    ChainPricingResult,
+    calc_short_option_chain_metrics,
+)
+
 # Factory pattern
 from src.engine.pricing.factory import (
     PricerInstance,
@@ -38,6 +45,10 @@ __all__ = [
     "ShortStranglePricer",
     "LongPutPricer",
     "LongCallPricer",
+    # Chain pricing
+    "ChainPricingInput",
+    "ChainPricingResult",
+    "calc_short_option_chain_metrics",
     # Factory
     "PricerInstance",
     "create_pricers_from_position",
@@ -6,12 +6,15 @@ For data models, import from src.engine.models directly.
 
 from __future__ import annotations
 
+import functools
 import logging
 import math
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 from src.data.models.option import Greeks
+from src.engine.bs.core import calc_n
 from src.engine.models.pricing import OptionLeg, PricingMetrics, PricingParams
 
 if TYPE_CHECKING:
@@ -19,6 +22,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class PricerCacheInfo(NamedTuple):
+    """Per-pricer memoization statistics (for profiling).
+
+    Attributes:
+        metric_hits: Cached metric lookups served without recomputation
+        metric_misses: Metric computations performed
+        n_hits: Cached N(d) lookups served without recomputation
+        n_misses: N(d) evaluations performed
+    """
+
+    metric_hits: int
+    metric_misses: int
+    n_hits: int
+    n_misses: int
+
+
+def cached_metric(method: _F) -> _F:
+    """Memoize a zero-argument pricer metric on the pricer instance.
+
+    Pricer inputs are fixed at construction, so each decorated metric
+    (expected return, variance, ...) is computed at most once per
+    instance. The cache is cleared when the margin changes
+    (see ``OptionPricer._set_margin_per_share``).
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: OptionPricer) -> Any:
+        cache = self._metric_cache
+        if name in cache:
+            self._metric_hits += 1
+            return cache[name]
+        self._metric_misses += 1
+        value = method(self)
+        cache[name] = value
+        return value
+
+    return wrapper  # type: ignore[return-value]
+
 
 class OptionPricer(ABC):
     """Abstract base class for option pricers.
@@ -43,6 +88,13 @@ class OptionPricer(ABC):
         self.params = params
         self._margin_per_share: float | None = None  # 真实保证金（per-share）
         self._cached_effective_margin: float | None = None  # 缓存的有效保证金
+        # Per-instance memoization (see cached_metric / _calc_n)
+        self._metric_cache: dict[str, Any] = {}
+        self._n_cache: dict[float, float] = {}
+        self._metric_hits = 0
+        self._metric_misses = 0
+        self._n_hits = 0
+        self._n_misses = 0
 
     @property
     def leg(self) -> OptionLeg:
@@ -69,6 +121,37 @@ class OptionPricer(ABC):
         """
         pass
 
+    def _calc_n(self, d: float) -> float:
+        """Cumulative normal N(d), memoized per pricer instance.
+
+        The same N(±d_i) values are used by expected return, variance,
+        win and exercise probability; each is evaluated only once.
+        """
+        value = self._n_cache.get(d)
+        if value is not None:
+            self._n_hits += 1
+            return value
+        self._n_misses += 1
+        value = calc_n(d)
+        self._n_cache[d] = value
+        return value
+
+    def cache_info(self) -> PricerCacheInfo:
+        """Get memoization hit/miss counters for this pricer."""
+        return PricerCacheInfo(
+            metric_hits=self._metric_hits,
+            metric_misses=self._metric_misses,
+            n_hits=self._n_hits,
+            n_misses=self._n_misses,
+        )
+
+    def clear_cache(self) -> None:
+        """Clear memoized metrics and N(d) values (counters are kept)."""
+        self._metric_cache.clear()
+        self._n_cache.clear()
+        self._cached_effective_margin = None
+
+    @cached_metric
     def calc_return_std(self) -> float:
         """Calculate return standard deviation Std[π] = sqrt(Var[π])."""
         variance = self.calc_return_variance()
@@ -94,6 +177,7 @@ class OptionPricer(ABC):
         """Calculate probability of profit."""
         pass
 
+    @cached_metric
     def calc_sharpe_ratio(self) -> float | None:
         """Calculate Sharpe ratio.
 
@@ -174,8 +258,12 @@ class OptionPricer(ABC):
         Args:
             margin_per_share: Real margin per-share from broker API.
         """
+        if margin_per_share == self._margin_per_share:
+            return
         self._margin_per_share = margin_per_share
         self._cached_effective_margin = None  # 清除缓存
+        # Margin-dependent metrics (Sharpe's risk-free leg) must be recomputed
+        self._metric_cache.clear()
 
     def get_effective_margin(self) -> float:
         """Get effective margin for ROC calculations.
@@ -0,0 +1,396 @@
+"""Chain-level pricer for short single-leg options.
+
+Computes the same PricingMetrics as ShortPutPricer / ShortCallPricer for
+every candidate of an option chain in one vectorized pass:
+
+- Input: ChainPricingInput, one NumPy column per pricer argument
+  (struct-of-arrays). Missing optional values are NaN.
+- Output: ChainPricingResult, one NumPy column per PricingMetrics field.
+  Use ``to_pricing_metrics(i)`` to get the scalar dataclass for row i.
+
+Formulas and edge-case handling mirror the scalar pricers exactly
+(see short_put.py / short_call.py and OptionPricer in base.py), so the
+two paths are interchangeable.
+
+Usage:
+    >>> inputs = ChainPricingInput.from_columns(
+    ...     spot_price=100.0,
+    ...     strike_price=[90.0, 95.0],
+    ...     premium=[0.8, 1.9],
+    ...     volatility=[0.28, 0.24],
+    ...     time_to_expiry=30 / 365,
+    ...     is_call=False,
+    ...     hv=0.20,
+    ...     dte=30,
+    ... )
+    >>> result = calc_short_option_chain_metrics(inputs)
+    >>> result.expected_return  # array of 2
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from scipy.special import ndtr
+
+from src.engine.bs.vectorized import calc_d1_array
+from src.engine.models.pricing import PricingMetrics
+
+# Weights shared with calc_prei / calc_sas (position/risk_return.py, option_metrics.py)
+_PREI_WEIGHTS = (0.40, 0.30, 0.30)
+_PREI_GAMMA_K = 1.0
+_PREI_VEGA_K = 10.0
+_SAS_WEIGHTS = (0.35, 0.35, 0.30)
+
+# Short call max loss is unbounded; scalar pricer reports 10x strike
+_SHORT_CALL_MAX_LOSS_MULTIPLIER = 10
+
+
+def _column(value: ArrayLike | None) -> NDArray[np.float64]:
+    """Convert a column (None entries allowed) to a float64 array, None -> NaN."""
+    if value is None:
+        return np.asarray(np.nan)
+    if isinstance(value, (list, tuple)):
+        value = [np.nan if v is None else v for v in value]
+    return np.asarray(value, dtype=np.float64)
+
+
+@dataclass
+class ChainPricingInput:
+    """Struct-of-arrays input for chain pricing.
+
+    All fields are 1-D arrays of equal length (one row per contract).
+    Optional fields use NaN for "not available".
+
+    Attributes:
+        spot_price: Underlying price (S)
+        strike_price: Strike price (K)
+        premium: Premium received per share (C)
+        volatility: Implied volatility (σ)
+        time_to_expiry: Time to expiration in years (T)
+        risk_free_rate: Annual risk-free rate (r)
+        is_call: True for short call, False for short put
+        hv: Historical volatility (NaN if unknown)
+        dte: Days to expiration (NaN if unknown)
+        delta, gamma, theta, vega: Per-share option Greeks (NaN if unknown)
+        margin_per_share: Real broker margin per share (NaN -> Reg T formula)
+    """
+
+    spot_price: NDArray[np.float64]
+    strike_price: NDArray[np.float64]
+    premium: NDArray[np.float64]
+    volatility: NDArray[np.float64]
+    time_to_expiry: NDArray[np.float64]
+    risk_free_rate: NDArray[np.float64]
+    is_call: NDArray[np.bool_]
+    hv: NDArray[np.float64]
+    dte: NDArray[np.float64]
+    delta: NDArray[np.float64]
+    gamma: NDArray[np.float64]
+    theta: NDArray[np.float64]
+    vega: NDArray[np.float64]
+    margin_per_share: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        """Number of contracts."""
+        return len(self.strike_price)
+
+    @classmethod
+    def from_columns(
+        cls,
+        spot_price: ArrayLike,
+        strike_price: ArrayLike,
+        premium: ArrayLike,
+        volatility: ArrayLike,
+        time_to_expiry: ArrayLike,
+        is_call: ArrayLike,
+        risk_free_rate: ArrayLike = 0.03,
+        hv: ArrayLike | None = None,
+        dte: ArrayLike | None = None,
+        delta: ArrayLike | None = None,
+        gamma: ArrayLike | None = None,
+        theta: ArrayLike | None = None,
+        vega: ArrayLike | None = None,
+        margin_per_share: ArrayLike | None = None,
+    ) -> ChainPricingInput:
+        """Build input from columns, broadcasting scalars to the chain length.
+
+        Columns may be scalars, lists (None entries allowed) or arrays.
+        Defaults match the scalar pricers (risk_free_rate=0.03).
+
+        Returns:
+            ChainPricingInput with 1-D float64/bool arrays.
+        """
+        columns = [
+            _column(spot_price),
+            _column(strike_price),
+            _column(premium),
+            _column(volatility),
+            _column(time_to_expiry),
+            _column(risk_free_rate),
+            np.asarray(is_call, dtype=bool),
+            _column(hv),
+            _column(dte),
+            _column(delta),
+            _column(gamma),
+            _column(theta),
+            _column(vega),
+            _column(margin_per_share),
+        ]
+        broadcast = np.broadcast_arrays(*[np.atleast_1d(c) for c in columns])
+        (s, k, c, v, t, r, is_call_arr, hv_, dte_, d, g, th, ve, m) = broadcast
+        return cls(
+            spot_price=s,
+            strike_price=k,
+            premium=c,
+            volatility=v,
+            time_to_expiry=t,
+            risk_free_rate=r,
+            is_call=is_call_arr,
+            hv=hv_,
+            dte=dte_,
+            delta=d,
+            gamma=g,
+            theta=th,
+            vega=ve,
+            margin_per_share=m,
+        )
+
+
+@dataclass
+class ChainPricingResult:
+    """Struct-of-arrays output of chain pricing.
+
+    Each field is a 1-D array aligned with the input rows and corresponds
+    to the PricingMetrics field of the same name. NaN marks values the
+    scalar pricer would report as None.
+    """
+
+    expected_return: NDArray[np.float64]
+    return_std: NDArray[np.float64]
+    return_variance: NDArray[np.float64]
+    max_profit: NDArray[np.float64]
+    max_loss: NDArray[np.float64]
+    breakeven: NDArray[np.float64]
+    win_probability: NDArray[np.float64]
+    sharpe_ratio: NDArray[np.float64]
+    sharpe_ratio_annual: NDArray[np.float64]
+    kelly_fraction: NDArray[np.float64]
+    prei: NDArray[np.float64]
+    sas: NDArray[np.float64]
+    tgr: NDArray[np.float64]
+    roc: NDArray[np.float64]
+    expected_roc: NDArray[np.float64]
+    premium_rate: NDArray[np.float64]
+    theta_margin_ratio: NDArray[np.float64]
+    effective_margin: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        """Number of contracts."""
+        return len(self.expected_return)
+
+    def to_pricing_metrics(self, i: int) -> PricingMetrics:
+        """Convert row i to a PricingMetrics dataclass (NaN -> None).
+
+        Args:
+            i: Row index.
+
+        Returns:
+            PricingMetrics equivalent to ``pricer.calc_metrics()`` for row i.
+        """
+        values = {}
+        for f in fields(PricingMetrics):
+            value = float(getattr(self, f.name)[i])
+            values[f.name] = None if np.isnan(value) else value
+        return PricingMetrics(**values)
+
+    def to_pricing_metrics_list(self) -> list[PricingMetrics]:
+        """Convert all rows to PricingMetrics."""
+        return [self.to_pricing_metrics(i) for i in range(len(self))]
+
+
+def _calc_d1_d2(
+    s: NDArray[np.float64],
+    k: NDArray[np.float64],
+    r: NDArray[np.float64],
+    sigma: NDArray[np.float64],
+    t: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Compute d1, d2 and σ√T, NaN where inputs are invalid."""
+    d1 = calc_d1_array(s, k, r, sigma, t)
+    sigma_sqrt_t = sigma * np.sqrt(np.where(np.isnan(d1), np.nan, t))
+    return d1, d1 - sigma_sqrt_t, sigma_sqrt_t
+
+
+def calc_short_option_chain_metrics(inputs: ChainPricingInput) -> ChainPricingResult:
+    """Calculate short put / short call metrics for a whole chain at once.
+
+    Vectorized equivalent of ``ShortPutPricer(...).calc_metrics()`` and
+    ``ShortCallPricer(...).calc_metrics()``; puts and calls may be mixed.
+
+    - Expected return uses HV-based d1/d2 (physical measure), falling back
+      to IV when HV is unavailable.
+    - Variance, win probability and Greeks-derived scores use IV.
+    - Margin uses margin_per_share when given, else the IBKR Reg T formula.
+
+    Args:
+        inputs: Struct-of-arrays chain input.
+
+    Returns:
+        ChainPricingResult with one value per contract.
+    """
+    s = inputs.spot_price
+    k = inputs.strike_price
+    c = inputs.premium
+    sigma = inputs.volatility
+    t = inputs.time_to_expiry
+    r = inputs.risk_free_rate
+    is_call = inputs.is_call
+    dte = inputs.dte
+
+    # Direction: +1 for call (exercised when S_T > K), -1 for put
+    sign = np.where(is_call, 1.0, -1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        exp_rt = np.exp(r * t)
+
+        # IV-based d1/d2/d3 (risk-neutral, for variance/win probability)
+        d1, d2, sigma_sqrt_t = _calc_d1_d2(s, k, r, sigma, t)
+        d3 = d2 + 2 * sigma_sqrt_t
+        valid = ~np.isnan(d1)
+
+        # HV-based d1/d2 (physical measure, for expected return)
+        sigma_real = np.where(np.isfinite(inputs.hv) & (inputs.hv > 0), inputs.hv, sigma)
+        d1_hv, d2_hv, _ = _calc_d1_d2(s, k, r, sigma_real, t)
+        valid_hv = ~np.isnan(d1_hv)
+
+        # Exercise-region probabilities: N(±d_i) with + for calls, - for puts
+        n1_hv = ndtr(sign * d1_hv)
+        n2_hv = ndtr(sign * d2_hv)
+        n1 = ndtr(sign * d1)
+        n2 = ndtr(sign * d2)
+        n3 = ndtr(sign * d3)
+
+        # E[π] = C - N(±d2)·(±)(E[S_T | exercised] - K)
+        #   put:  C - N(-d2)·(K - e^(rT)·S·N(-d1)/N(-d2))
+        #   call: C - N(d2)·(e^(rT)·S·N(d1)/N(d2) - K)
+        expected_stock = exp_rt * s * n1_hv / n2_hv
+        expected_return = c - n2_hv * sign * (expected_stock - k)
+        expected_return = np.where(n2_hv == 0, c, expected_return)
+        expected_return = np.where(valid_hv, expected_return, 0.0)
+
+        # E[π²]: exercised payoff is C - K + S_T (put) or C + K - S_T (call)
+        exercised_const = c + sign * k
+        e_pi_squared = (
+            c**2 * (1 - n2)
+            + exercised_const**2 * n2
+            - sign * 2 * exercised_const * exp_rt * s * n1
+            + s**2 * np.exp(2 * r * t + sigma**2 * t) * n3
+        )
+        variance = np.where(valid, np.maximum(0.0, e_pi_squared - expected_return**2), 0.0)
+        return_std = np.sqrt(variance)
+
+        # Payoff profile
+        max_profit = c.copy()
+        max_loss = np.where(is_call, _SHORT_CALL_MAX_LOSS_MULTIPLIER * k, k - c)
+        breakeven = np.where(is_call, k + c, k - c)
+
+        # Win probability: put N(d2); call P(S_T < breakeven) = 1 - N(d2_be)
+        _, d2_be, _ = _calc_d1_d2(s, breakeven, r, sigma, t)
+        win_probability = np.where(is_call, 1.0 - ndtr(d2_be), ndtr(d2))
+        win_probability = np.where(np.isnan(win_probability), 0.0, win_probability)
+
+        # Effective margin: real margin per share, else IBKR Reg T formula
+        otm_amount = np.maximum(0.0, sign * (k - s))
+        reg_t_floor = 0.10 * np.where(is_call, s, k)
+        reg_t_margin = c + np.maximum(0.20 * s - otm_amount, reg_t_floor)
+        margin = np.where(
+            np.isnan(inputs.margin_per_share), reg_t_margin, inputs.margin_per_share
+        )
+
+        # Sharpe ratio: (E[π] - Rf) / Std, Rf = margin × (e^(rT) - 1)
+        rf = margin * (exp_rt - 1)
+        sharpe = np.where(return_std > 0, (expected_return - rf) / return_std, np.nan)
+        dte_valid = np.isfinite(dte) & (dte > 0)
+        sharpe_annual = np.where(dte_valid, sharpe * np.sqrt(365 / dte), np.nan)
+
+        # Kelly: E[π] / Var[π], 0 for non-positive expectation
+        kelly = np.where(
+            (variance > 0) & (expected_return > 0), expected_return / variance, 0.0
+        )
+
+        # Position-adjusted Greeks for a single short contract (sign = -1)
+        gamma_pos = -inputs.gamma
+        vega_pos = -inputs.vega
+        theta_pos = -inputs.theta
+
+        # PREI (see risk_return.calc_prei)
+        w1, w2, w3 = _PREI_WEIGHTS
+        abs_gamma = np.abs(gamma_pos)
+        abs_vega = np.abs(vega_pos)
+        prei = (
+            w1 * abs_gamma / (abs_gamma + _PREI_GAMMA_K)
+            + w2 * abs_vega / (abs_vega + _PREI_VEGA_K)
+            + w3 * np.sqrt(1.0 / np.maximum(1.0, dte))
+        ) * 100
+        prei = np.where(np.isfinite(dte), prei, np.nan)
+
+        # SAS (see option_metrics.calc_sas); IV is the strategy volatility
+        hv = inputs.hv
+        sw1, sw2, sw3 = _SAS_WEIGHTS
+        iv_hv_score = np.minimum(2.0, sigma / hv) / 2.0 * 100
+        sharpe_score = np.minimum(3.0, np.maximum(0.0, sharpe)) / 3.0 * 100
+        sas = sw1 * iv_hv_score + sw2 * sharpe_score + sw3 * win_probability * 100
+        sas_valid = (
+            np.isfinite(hv)
+            & (hv > 0)
+            & ~np.isnan(sharpe)
+            & (win_probability >= 0)
+            & (win_probability <= 1)
+        )
+        sas = np.where(sas_valid, sas, np.nan)
+
+        # TGR (see risk_return.calc_tgr): standardized when S and IV are known
+        abs_theta = np.abs(theta_pos)
+        gamma_dollar_vol = abs_gamma * s**2 * sigma / np.sqrt(252)
+        tgr = np.where(
+            (s > 0) & (sigma > 0),
+            np.where(gamma_dollar_vol == 0, np.nan, abs_theta / gamma_dollar_vol * 100),
+            abs_theta / abs_gamma,
+        )
+        tgr = np.where(np.isnan(gamma_pos) | (gamma_pos == 0), np.nan, tgr)
+
+        # ROC on premium and on expected return, annualized by DTE
+        margin_ok = margin > 0
+        roc = np.where(
+            dte_valid & (c > 0) & margin_ok, c / margin * (365 / dte), np.nan
+        )
+        expected_roc = np.where(
+            dte_valid & margin_ok, expected_return / margin * (365 / dte), np.nan
+        )
+
+        premium_rate = np.where((k > 0) & (c > 0), c / k, np.nan)
+        theta_margin_ratio = np.where(margin_ok, abs_theta / margin, np.nan)
+
+    return ChainPricingResult(
+        expected_return=expected_return,
+        return_std=return_std,
+        return_variance=variance,
+        max_profit=max_profit,
+        max_loss=max_loss,
+        breakeven=breakeven,
+        win_probability=win_probability,
+        sharpe_ratio=sharpe,
+        sharpe_ratio_annual=sharpe_annual,
+        kelly_fraction=kelly,
+        prei=prei,
+        sas=sas,
+        tgr=tgr,
+        roc=roc,
+        expected_roc=expected_roc,
+        premium_rate=premium_rate,
+        theta_margin_ratio=theta_margin_ratio,
+        effective_margin=margin,
+    )
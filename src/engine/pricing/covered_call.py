@@ -6,11 +6,11 @@ Own stock + Sell a call option to collect premium.
 import math
 
 from src.data.models.option import Greeks, OptionType
-from src.engine.bs.core import calc_d1, calc_d2, calc_d3, calc_n
+from src.engine.bs.core import calc_d1, calc_d2, calc_d3
 from src.engine.models import BSParams
 from src.engine.models.enums import PositionSide
 from src.engine.models.pricing import OptionLeg, PricingParams
-from src.engine.pricing.base import OptionPricer
+from src.engine.pricing.base import OptionPricer, cached_metric
 
 
 class CoveredCallPricer(OptionPricer):
@@ -120,6 +120,7 @@ class CoveredCallPricer(OptionPricer):
             self._d1_hv = self._d1
             self._d2_hv = self._d2
 
+    @cached_metric
     def calc_expected_return(self) -> float:
         """Calculate expected return for covered call (physical measure).
 
@@ -144,8 +145,8 @@ class CoveredCallPricer(OptionPricer):
         r = self.params.risk_free_rate
         t = self.params.time_to_expiry
 
-        n_d1 = calc_n(self._d1_hv)
-        n_d2 = calc_n(self._d2_hv)
+        n_d1 = self._calc_n(self._d1_hv)
+        n_d2 = self._calc_n(self._d2_hv)
 
         exp_rt = math.exp(r * t)
 
@@ -161,6 +162,7 @@ class CoveredCallPricer(OptionPricer):
 
         return expected_return
 
+    @cached_metric
     def calc_return_variance(self) -> float:
         """Calculate variance of return for covered call.
 
@@ -183,9 +185,9 @@ class CoveredCallPricer(OptionPricer):
         t = self.params.time_to_expiry
         sigma = self.params.volatility
 
-        n_d1 = calc_n(self._d1)
-        n_d2 = calc_n(self._d2)
-        n_minus_d2 = calc_n(-self._d2)
+        n_d1 = self._calc_n(self._d1)
+        n_d2 = self._calc_n(self._d2)
+        n_minus_d2 = self._calc_n(-self._d2)
 
         exp_rt = math.exp(r * t)
         exp_2rt_sigma2t = math.exp(2 * r * t + sigma**2 * t)
@@ -214,11 +216,11 @@ class CoveredCallPricer(OptionPricer):
         d3_for_sq = (
             math.log(s / k) + (r + 1.5 * sigma**2) * t
         ) / (sigma * math.sqrt(t))
-        n_minus_d3_sq = calc_n(-d3_for_sq)
+        n_minus_d3_sq = self._calc_n(-d3_for_sq)
 
         if n_minus_d2 > 0:
             # Conditional expectations
-            e_st_given_below = s * exp_rt * calc_n(-self._d1) / n_minus_d2
+            e_st_given_below = s * exp_rt * self._calc_n(-self._d1) / n_minus_d2
             e_st_sq_given_below = s**2 * exp_2rt_sigma2t * n_minus_d3_sq / n_minus_d2
 
             # E[(C + S_T - S)²] = (C-S)² + 2(C-S)E[S_T] + E[S_T²]
@@ -259,6 +261,7 @@ class CoveredCallPricer(OptionPricer):
         """
         return self.stock_cost_basis - self.leg.premium
 
+    @cached_metric
     def calc_win_probability(self) -> float:
         """Calculate probability of profit.
 
@@ -289,7 +292,7 @@ class CoveredCallPricer(OptionPricer):
             return 0.0
 
         # P(S_T > breakeven) = N(d2)
-        return calc_n(d2_be)
+        return self._calc_n(d2_be)
 
     def calc_assignment_probability(self) -> float:
         """Calculate probability of call being assigned (exercised).
@@ -299,7 +302,7 @@ class CoveredCallPricer(OptionPricer):
         if self._d2 is None:
             return 0.0
 
-        return calc_n(self._d2)
+        return self._calc_n(self._d2)
 
     def _calc_capital_at_risk(self) -> float:
         """Capital at risk is the stock cost basis."""
@@ -7,11 +7,11 @@ Mirror of ShortPutPricer: E[Long Put] = -E[Short Put].
 import math
 
 from src.data.models.option import Greeks, OptionType
-from src.engine.bs.core import calc_d1, calc_d2, calc_d3, calc_n
+from src.engine.bs.core import calc_d1, calc_d2, calc_d3
 from src.engine.models import BSParams
 from src.engine.models.enums import PositionSide
 from src.engine.models.pricing import OptionLeg, PricingParams
-from src.engine.pricing.base import OptionPricer
+from src.engine.pricing.base import OptionPricer, cached_metric
 
 
 class LongPutPricer(OptionPricer):
@@ -108,6 +108,7 @@ class LongPutPricer(OptionPricer):
             self._d1_hv = self._d1
             self._d2_hv = self._d2
 
+    @cached_metric
     def calc_expected_return(self) -> float:
         """Calculate expected return for long put (physical measure).
 
@@ -127,8 +128,8 @@ class LongPutPricer(OptionPricer):
         r = self.params.risk_free_rate
         t = self.params.time_to_expiry
 
-        n_minus_d1 = calc_n(-self._d1_hv)
-        n_minus_d2 = calc_n(-self._d2_hv)
+        n_minus_d1 = self._calc_n(-self._d1_hv)
+        n_minus_d2 = self._calc_n(-self._d2_hv)
 
         if n_minus_d2 == 0:
             # No exercise probability, expected return = -premium
@@ -143,6 +144,7 @@ class LongPutPricer(OptionPricer):
 
         return expected_return
 
+    @cached_metric
     def calc_return_variance(self) -> float:
         """Calculate variance of return for long put.
 
@@ -162,9 +164,9 @@ class LongPutPricer(OptionPricer):
         t = self.params.time_to_expiry
         sigma = self.params.volatility
 
-        n_minus_d1 = calc_n(-self._d1)
-        n_minus_d2 = calc_n(-self._d2)
-        n_minus_d3 = calc_n(-self._d3)
+        n_minus_d1 = self._calc_n(-self._d1)
+        n_minus_d2 = self._calc_n(-self._d2)
+        n_minus_d3 = self._calc_n(-self._d3)
 
         exp_rt = math.exp(r * t)
         exp_2rt_sigma2t = math.exp(2 * r * t + sigma**2 * t)
@@ -197,6 +199,7 @@ class LongPutPricer(OptionPricer):
         """Calculate breakeven price (strike - premium)."""
         return self.leg.strike - self.leg.premium
 
+    @cached_metric
     def calc_win_probability(self) -> float:
         """Calculate probability of profit (stock falls below breakeven).
 
@@ -225,7 +228,7 @@ class LongPutPricer(OptionPricer):
             return 0.0
 
         # P(S_T < breakeven) = N(-d2)
-        return calc_n(-d2_be)
+        return self._calc_n(-d2_be)
 
     def calc_margin_requirement(self) -> float:
         """Long options have no margin — capital = premium paid."""
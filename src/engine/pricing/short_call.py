@@ -7,11 +7,11 @@ High risk strategy with unlimited potential loss.
 import math
 
 from src.data.models.option import Greeks, OptionType
-from src.engine.bs.core import calc_d1, calc_d2, calc_d3, calc_n
+from src.engine.bs.core import calc_d1, calc_d2, calc_d3
 from src.engine.models import BSParams
 from src.engine.models.enums import PositionSide
 from src.engine.models.pricing import OptionLeg, PricingParams
-from src.engine.pricing.base import OptionPricer
+from src.engine.pricing.base import OptionPricer, cached_metric
 
 
 class ShortCallPricer(OptionPricer):
@@ -117,6 +117,7 @@ class ShortCallPricer(OptionPricer):
             self._d1_hv = self._d1
             self._d2_hv = self._d2
 
+    @cached_metric
     def calc_expected_return(self) -> float:
         """Calculate expected return for short call (physical measure).
 
@@ -139,8 +140,8 @@ class ShortCallPricer(OptionPricer):
         r = self.params.risk_free_rate
         t = self.params.time_to_expiry
 
-        n_d1 = calc_n(self._d1_hv)
-        n_d2 = calc_n(self._d2_hv)
+        n_d1 = self._calc_n(self._d1_hv)
+        n_d2 = self._calc_n(self._d2_hv)
 
         if n_d2 == 0:
             # No exercise probability, expected return = premium
@@ -155,6 +156,7 @@ class ShortCallPricer(OptionPricer):
 
         return expected_return
 
+    @cached_metric
     def calc_return_variance(self) -> float:
         """Calculate variance of return for short call.
 
@@ -181,9 +183,9 @@ class ShortCallPricer(OptionPricer):
         t = self.params.time_to_expiry
         sigma = self.params.volatility
 
-        n_d1 = calc_n(self._d1)
-        n_d2 = calc_n(self._d2)
-        n_d3 = calc_n(self._d3)
+        n_d1 = self._calc_n(self._d1)
+        n_d2 = self._calc_n(self._d2)
+        n_d3 = self._calc_n(self._d3)
 
         exp_rt = math.exp(r * t)
         exp_2rt_sigma2t = math.exp(2 * r * t + sigma**2 * t)
@@ -223,6 +225,7 @@ class ShortCallPricer(OptionPricer):
         """Calculate breakeven price (strike + premium)."""
         return self.leg.strike + self.leg.premium
 
+    @cached_metric
     def calc_win_probability(self) -> float:
         """Calculate probability of profit (stock stays below breakeven).
 
@@ -253,14 +256,14 @@ class ShortCallPricer(OptionPricer):
             return 0.0
 
         # P(S_T < breakeven) = 1 - N(d2)
-        return 1.0 - calc_n(d2_be)
+        return 1.0 - self._calc_n(d2_be)
 
     def calc_exercise_probability(self) -> float:
         """Calculate exercise probability N(d2)."""
         if self._d2 is None:
             return 0.0
 
-        return calc_n(self._d2)
+        return self._calc_n(self._d2)
 
     def calc_margin_requirement(self) -> float:
         """Calculate margin requirement using IBKR formula for Short Call.
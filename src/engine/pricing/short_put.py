@@ -8,11 +8,11 @@ Reference: 期权量化指标计算-以卖看跌期权为例.md
 import math
 
 from src.data.models.option import Greeks, OptionType
-from src.engine.bs.core import calc_d1, calc_d2, calc_d3, calc_n
+from src.engine.bs.core import calc_d1, calc_d2, calc_d3
 from src.engine.models import BSParams
 from src.engine.models.enums import PositionSide
 from src.engine.models.pricing import OptionLeg, PricingMetrics, PricingParams
-from src.engine.pricing.base import OptionPricer
+from src.engine.pricing.base import OptionPricer, cached_metric
 
 
 class ShortPutPricer(OptionPricer):
@@ -116,6 +116,7 @@ class ShortPutPricer(OptionPricer):
             self._d1_hv = self._d1
             self._d2_hv = self._d2
 
+    @cached_metric
     def calc_expected_return(self) -> float:
         """Calculate expected return for short put (physical measure).
 
@@ -138,8 +139,8 @@ class ShortPutPricer(OptionPricer):
         r = self.params.risk_free_rate
         t = self.params.time_to_expiry
 
-        n_minus_d1 = calc_n(-self._d1_hv)
-        n_minus_d2 = calc_n(-self._d2_hv)
+        n_minus_d1 = self._calc_n(-self._d1_hv)
+        n_minus_d2 = self._calc_n(-self._d2_hv)
 
         if n_minus_d2 == 0:
             # No exercise probability, expected return = premium
@@ -154,6 +155,7 @@ class ShortPutPricer(OptionPricer):
 
         return expected_return
 
+    @cached_metric
     def calc_return_variance(self) -> float:
         """Calculate variance of return for short put.
 
@@ -177,9 +179,9 @@ class ShortPutPricer(OptionPricer):
         t = self.params.time_to_expiry
         sigma = self.params.volatility
 
-        n_minus_d1 = calc_n(-self._d1)
-        n_minus_d2 = calc_n(-self._d2)
-        n_minus_d3 = calc_n(-self._d3)
+        n_minus_d1 = self._calc_n(-self._d1)
+        n_minus_d2 = self._calc_n(-self._d2)
+        n_minus_d3 = self._calc_n(-self._d3)
 
         exp_rt = math.exp(r * t)
         exp_2rt_sigma2t = math.exp(2 * r * t + sigma**2 * t)
@@ -212,6 +214,7 @@ class ShortPutPricer(OptionPricer):
         """Calculate breakeven price (strike - premium)."""
         return self.leg.strike - self.leg.premium
 
+    @cached_metric
     def calc_win_probability(self) -> float:
         """Calculate probability of profit (stock stays above breakeven).
 
@@ -223,7 +226,7 @@ class ShortPutPricer(OptionPricer):
         if self._d2 is None:
             return 0.0
 
-        return calc_n(self._d2)
+        return self._calc_n(self._d2)
 
     def calc_expected_loss_if_exercised(self) -> float:
         """Calculate expected loss if put is exercised.
@@ -242,8 +245,8 @@ class ShortPutPricer(OptionPricer):
         r = self.params.risk_free_rate
         t = self.params.time_to_expiry
 
-        n_minus_d1 = calc_n(-self._d1)
-        n_minus_d2 = calc_n(-self._d2)
+        n_minus_d1 = self._calc_n(-self._d1)
+        n_minus_d2 = self._calc_n(-self._d2)
 
         if n_minus_d2 == 0:
             return 0.0
@@ -258,7 +261,7 @@ class ShortPutPricer(OptionPricer):
         if self._d2 is None:
             return 0.0
 
-        return calc_n(-self._d2)
+        return self._calc_n(-self._d2)
 
     def calc_margin_requirement(self) -> float:
         """Calculate margin requirement using IBKR formula for Short Put.
@@ -6,11 +6,11 @@ Sell both a put and a call with different strikes to collect premium.
 import math
 
 from src.data.models.option import Greeks, OptionType
-from src.engine.bs.core import calc_d1, calc_d2, calc_n
+from src.engine.bs.core import calc_d1, calc_d2
 from src.engine.models import BSParams
 from src.engine.models.enums import PositionSide
 from src.engine.models.pricing import OptionLeg, PricingParams
-from src.engine.pricing.base import OptionPricer
+from src.engine.pricing.base import OptionPricer, cached_metric
 
 
 class ShortStranglePricer(OptionPricer):
@@ -182,6 +182,7 @@ class ShortStranglePricer(OptionPricer):
         """Total premium received."""
         return self.put_leg.premium + self.call_leg.premium
 
+    @cached_metric
     def calc_expected_return(self) -> float:
         """Calculate expected return for short strangle (physical measure).
 
@@ -209,8 +210,8 @@ class ShortStranglePricer(OptionPricer):
         r = self.params.risk_free_rate
         t = self.params.time_to_expiry
 
-        n_minus_d1 = calc_n(-self._put_d1_hv)
-        n_minus_d2 = calc_n(-self._put_d2_hv)
+        n_minus_d1 = self._calc_n(-self._put_d1_hv)
+        n_minus_d2 = self._calc_n(-self._put_d2_hv)
 
         if n_minus_d2 == 0:
             return c
@@ -231,8 +232,8 @@ class ShortStranglePricer(OptionPricer):
         r = self.params.risk_free_rate
         t = self.params.time_to_expiry
 
-        n_d1 = calc_n(self._call_d1_hv)
-        n_d2 = calc_n(self._call_d2_hv)
+        n_d1 = self._calc_n(self._call_d1_hv)
+        n_d2 = self._calc_n(self._call_d2_hv)
 
         if n_d2 == 0:
             return c
@@ -242,6 +243,7 @@ class ShortStranglePricer(OptionPricer):
 
         return c - n_d2 * (expected_stock_if_exercised - k)
 
+    @cached_metric
     def calc_return_variance(self) -> float:
         """Calculate variance of return for short strangle.
 
@@ -275,14 +277,14 @@ class ShortStranglePricer(OptionPricer):
         exp_rt = math.exp(r * t)
 
         # Probabilities of regions
-        n_minus_d2_put = calc_n(-self._put_d2)  # P(S_T < K_p)
-        n_d2_call = calc_n(self._call_d2)  # P(S_T > K_c)
+        n_minus_d2_put = self._calc_n(-self._put_d2)  # P(S_T < K_p)
+        n_d2_call = self._calc_n(self._call_d2)  # P(S_T > K_c)
         p_middle = 1 - n_minus_d2_put - n_d2_call  # P(K_p <= S_T <= K_c)
 
         # Region 1: S_T < K_p (put exercised)
         # Payoff = C_p + C_c - (K_p - S_T) = C_p + C_c - K_p + S_T
         if n_minus_d2_put > 0:
-            n_minus_d1_put = calc_n(-self._put_d1)
+            n_minus_d1_put = self._calc_n(-self._put_d1)
             e_st_given_below_kp = exp_rt * s * n_minus_d1_put / n_minus_d2_put
 
             # E[(total_c - k_p + S_T)² | S_T < K_p]
@@ -304,7 +306,7 @@ class ShortStranglePricer(OptionPricer):
         # Region 3: S_T > K_c (call exercised)
         # Payoff = C_p + C_c - (S_T - K_c) = C_p + C_c + K_c - S_T
         if n_d2_call > 0:
-            n_d1_call = calc_n(self._call_d1)
+            n_d1_call = self._calc_n(self._call_d1)
             e_st_given_above_kc = exp_rt * s * n_d1_call / n_d2_call
 
             fixed_part = total_c + k_c
@@ -334,7 +336,7 @@ class ShortStranglePricer(OptionPricer):
 
         # d3 for E[S_T²]
         d3 = (math.log(s / strike) + (r + 1.5 * vol**2) * t) / (vol * math.sqrt(t))
-        n_minus_d3 = calc_n(-d3)
+        n_minus_d3 = self._calc_n(-d3)
 
         return s**2 * exp_2rt_vol2t * n_minus_d3
 
@@ -347,7 +349,7 @@ class ShortStranglePricer(OptionPricer):
         exp_2rt_vol2t = math.exp(2 * r * t + vol**2 * t)
 
         d3 = (math.log(s / strike) + (r + 1.5 * vol**2) * t) / (vol * math.sqrt(t))
-        n_d3 = calc_n(d3)
+        n_d3 = self._calc_n(d3)
 
         return s**2 * exp_2rt_vol2t * n_d3
 
@@ -380,6 +382,7 @@ class ShortStranglePricer(OptionPricer):
             self.call_leg.strike + self.total_premium,
         ]
 
+    @cached_metric
     def calc_win_probability(self) -> float:
         """Calculate probability of profit.
 
@@ -428,19 +431,19 @@ class ShortStranglePricer(OptionPricer):
             return 0.0
 
         # P(S_T > Lower BE) - P(S_T > Upper BE)
-        return calc_n(d2_lower) - calc_n(d2_upper)
+        return self._calc_n(d2_lower) - self._calc_n(d2_upper)
 
     def calc_put_exercise_probability(self) -> float:
         """Calculate probability of put being exercised."""
         if self._put_d2 is None:
             return 0.0
-        return calc_n(-self._put_d2)
+        return self._calc_n(-self._put_d2)
 
     def calc_call_exercise_probability(self) -> float:
         """Calculate probability of call being exercised."""
         if self._call_d2 is None:
             return 0.0
-        return calc_n(self._call_d2)
+        return self._calc_n(self._call_d2)
 
     def _calc_capital_at_risk(self) -> float:
         """Capital at risk for strangle.
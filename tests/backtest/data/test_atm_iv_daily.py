@@ -0,0 +1,125 @@
+"""Tests for the atm_iv_daily dataset and rolling IV rank lookup."""
+
+import os
+from datetime import date, timedelta
+
+import pyarrow.parquet as pq
+import pytest
+
+from src.backtest.data.atm_iv_daily import (
+    IVRankWindow,
+    build_atm_iv_daily,
+    constant_maturity_iv,
+    get_atm_iv_daily_path,
+    is_atm_iv_stale,
+    load_atm_iv_series,
+)
+from src.backtest.data.duckdb_provider import DuckDBProvider
+
+
+def _brute_force_rank(dates, ivs, as_of, current_iv, lookback_days=252):
+    start = as_of - timedelta(days=int(lookback_days * 1.5))
+    window = [iv for d, iv in zip(dates, ivs) if start <= d < as_of]
+    return DuckDBProvider._iv_rank_from_history("X", current_iv, window)
+
+
+class TestConstantMaturityIV:
+    def test_interpolates_total_variance(self):
+        iv = constant_maturity_iv([20, 40], [0.20, 0.30])
+        expected = ((0.2**2 * 20 + 0.3**2 * 40) / 2 / 30) ** 0.5
+        assert iv == pytest.approx(expected)
+
+    def test_flat_extrapolation(self):
+        assert constant_maturity_iv([45, 60], [0.25, 0.3]) == 0.25
+        assert constant_maturity_iv([7, 14], [0.25, 0.3]) == 0.3
+        assert constant_maturity_iv([], []) is None
+
+
+class TestIVRankWindow:
+    def test_matches_brute_force_forward_and_backward(self):
+        start = date(2023, 1, 2)
+        dates = [start + timedelta(days=i) for i in range(500)]
+        dates = [d for d in dates if d.weekday() < 5]
+        ivs = [0.2 + 0.1 * ((i * 37) % 17) / 17 for i in range(len(dates))]
+        window = IVRankWindow(dates, ivs)
+
+        as_of_dates = dates[10::7] + [dates[300], dates[40], dates[-1]]
+        for as_of in as_of_dates:
+            assert window.rank(as_of, 0.25) == _brute_force_rank(dates, ivs, as_of, 0.25)
+
+    def test_not_enough_history(self):
+        dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(10)]
+        window = IVRankWindow(dates, [0.2] * 10)
+        assert window.rank(date(2024, 2, 1), 0.2) == (None, None)
+
+
+class TestBuildAtmIVDaily:
+    def test_build_and_incremental_skip(self, temp_data_dir):
+        built = build_atm_iv_daily(temp_data_dir)
+        assert set(built) == {"AAPL", "MSFT", "GOOGL"}
+
+        table = pq.read_table(get_atm_iv_daily_path(temp_data_dir))
+        assert table.column_names == ["symbol", "date", "atm_iv", "iv_30d"]
+        assert not is_atm_iv_stale(temp_data_dir, "AAPL")
+
+        # 期权数据未更新 → 不重建
+        assert build_atm_iv_daily(temp_data_dir) == {}
+
+        # 期权文件更新 → 只重建该标的，其他标的保留
+        option_file = next((temp_data_dir / "option_daily" / "MSFT").glob("*.parquet"))
+        future = get_atm_iv_daily_path(temp_data_dir).stat().st_mtime + 10
+        os.utime(option_file, (future, future))
+        assert is_atm_iv_stale(temp_data_dir, "MSFT")
+        assert list(build_atm_iv_daily(temp_data_dir)) == ["MSFT"]
+        assert pq.read_table(get_atm_iv_daily_path(temp_data_dir)).num_rows == table.num_rows
+
+    def test_partial_rebuild_keeps_other_symbols_stale(self, temp_data_dir):
+        build_atm_iv_daily(temp_data_dir)
+
+        option_file = next((temp_data_dir / "option_daily" / "MSFT").glob("*.parquet"))
+        future = option_file.stat().st_mtime + 10
+        os.utime(option_file, (future, future))
+        assert is_atm_iv_stale(temp_data_dir, "MSFT")
+
+        # 只重建 AAPL (共用的 Parquet 文件被改写) 不影响 MSFT 的过期判断
+        build_atm_iv_daily(temp_data_dir, ["AAPL"], force=True)
+        assert is_atm_iv_stale(temp_data_dir, "MSFT")
+        assert not is_atm_iv_stale(temp_data_dir, "AAPL")
+        assert list(build_atm_iv_daily(temp_data_dir, ["AAPL", "MSFT"])) == ["MSFT"]
+        assert not is_atm_iv_stale(temp_data_dir, "MSFT")
+
+    def test_provider_iv_rank_matches_option_scan(self, temp_data_dir):
+        days = DuckDBProvider(data_dir=temp_data_dir).get_trading_days(
+            date(2024, 3, 1), date(2024, 3, 29)
+        )
+        scan = DuckDBProvider(data_dir=temp_data_dir)
+        expected = []
+        for d in days:
+            scan.set_as_of_date(d)
+            expected.append(scan._calculate_iv_rank("AAPL", 0.3))
+        assert any(r != (None, None) for r in expected)
+
+        build_atm_iv_daily(temp_data_dir)
+        assert load_atm_iv_series(temp_data_dir, "AAPL") is not None
+
+        provider = DuckDBProvider(data_dir=temp_data_dir)
+        actual = []
+        for d in days:
+            provider.set_as_of_date(d)
+            actual.append(provider._calculate_iv_rank("AAPL", 0.3))
+        assert ("AAPL", 252) in provider._iv_rank_windows
+        assert actual == pytest.approx(expected)
+
+    def test_atm_iv_history_matches_option_scan(self, temp_data_dir):
+        as_of = date(2024, 3, 15)
+        start = date(2024, 2, 1)
+        scan = DuckDBProvider(data_dir=temp_data_dir, as_of_date=as_of)
+        expected = scan.get_atm_iv_history("aapl", start, date(2024, 3, 31))
+        assert expected
+        assert all(start <= d <= as_of for d, _ in expected)
+
+        build_atm_iv_daily(temp_data_dir)
+        provider = DuckDBProvider(data_dir=temp_data_dir, as_of_date=as_of)
+        actual = provider.get_atm_iv_history("AAPL", start, date(2024, 3, 31))
+        assert [d for d, _ in actual] == [d for d, _ in expected]
+        assert [iv for _, iv in actual] == pytest.approx([iv for _, iv in expected])
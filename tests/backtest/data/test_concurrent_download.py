@@ -0,0 +1,116 @@
+"""Tests for concurrent downloads against a local stub ThetaData server."""
+
+import json
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pyarrow.parquet as pq
+import pytest
+
+from src.backtest.data.data_downloader import DataDownloader
+from src.backtest.data.schema import get_parquet_path
+from src.backtest.data.thetadata_client import ThetaDataClient, ThetaDataConfig
+
+# 录制的 /stock/history/eod 响应 (按 symbol 替换)
+RECORDED_STOCK_EOD = {
+    "response": [
+        {"symbol": "{symbol}", "created": "2024-03-01T16:00:00", "open": 100, "high": 101,
+         "low": 99, "close": 100.5, "volume": 1000, "count": 10, "bid": 100.4, "ask": 100.6},
+        {"symbol": "{symbol}", "created": "2024-03-04T16:00:00", "open": 100.5, "high": 102,
+         "low": 100, "close": 101.5, "volume": 1200, "count": 12, "bid": 101.4, "ask": 101.6},
+    ]
+}
+
+
+class _StubThetaData(BaseHTTPRequestHandler):
+    delay = 0.2
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_GET(self):  # noqa: N802
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(cls.delay)
+            url = urlparse(self.path)
+            symbol = parse_qs(url.query)["symbol"][0]
+            body = json.dumps(RECORDED_STOCK_EOD).replace("{symbol}", symbol).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _StubThetaData.in_flight = 0
+    _StubThetaData.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubThetaData)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **overrides) -> ThetaDataClient:
+    config = ThetaDataConfig(
+        host="127.0.0.1",
+        port=server.server_address[1],
+        rate_limit_requests=100,
+        min_request_interval=0.0,
+        **overrides,
+    )
+    return ThetaDataClient(config)
+
+
+class TestConcurrentDownload:
+    def test_stocks_keep_multiple_requests_in_flight(self, stub_server, tmp_path):
+        symbols = ["AAPL", "MSFT", "GOOGL", "NVDA"]
+        downloader = DataDownloader(tmp_path, client=_client(stub_server), max_workers=4)
+
+        results = downloader.download_stocks(symbols, date(2024, 3, 1), date(2024, 3, 4))
+
+        assert results == {s: 2 for s in symbols}
+        assert _StubThetaData.max_in_flight > 1
+        table = pq.read_table(get_parquet_path(tmp_path, "stock"))
+        assert sorted(set(table["symbol"].to_pylist())) == sorted(symbols)
+        assert table.num_rows == 8
+
+    def test_sequential_mode_is_default(self, stub_server, tmp_path):
+        downloader = DataDownloader(tmp_path, client=_client(stub_server))
+        downloader.download_stocks(["AAPL", "MSFT"], date(2024, 3, 1), date(2024, 3, 4))
+        assert _StubThetaData.max_in_flight == 1
+
+    def test_rate_limit_budget_shared_across_threads(self, stub_server):
+        client = _client(stub_server, rate_limit_period=1)
+        client._config.rate_limit_requests = 2
+
+        stamps: list[float] = []
+
+        def request() -> None:
+            client._check_rate_limit()
+            stamps.append(time.time())
+
+        threads = [threading.Thread(target=request) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stamps.sort()
+        # 任意 1 秒窗口内不超过 2 次请求
+        assert all(stamps[i + 2] - stamps[i] >= 1.0 - 1e-3 for i in range(len(stamps) - 2))
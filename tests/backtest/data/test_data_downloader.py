@@ -0,0 +1,106 @@
+"""Tests for DataDownloader option storage (monthly partitions, Arrow dedup)."""
+
+from datetime import date
+
+import pyarrow.parquet as pq
+
+from src.backtest.data.data_downloader import DataDownloader
+from src.backtest.data.schema import get_option_parquet_files, get_parquet_path
+from src.backtest.data.thetadata_client import OptionEODGreeks, option_greeks_to_batch
+
+
+def _record(d: date, strike: float, close: float) -> OptionEODGreeks:
+    return OptionEODGreeks(
+        symbol="AAPL",
+        expiration=date(2024, 6, 21),
+        strike=strike,
+        option_type="put",
+        date=d,
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=10,
+        count=1,
+        bid=close - 0.05,
+        ask=close + 0.05,
+        delta=-0.3,
+        gamma=0.02,
+        theta=-0.05,
+        vega=0.1,
+        rho=-0.01,
+        implied_vol=0.25,
+        underlying_price=180.0,
+    )
+
+
+class TestSaveOptionParquet:
+    def test_append_only_touches_month_and_dedups(self, tmp_path):
+        downloader = DataDownloader(data_dir=tmp_path, client=object())
+        downloader._save_option_parquet(
+            "AAPL", 2024, 3, [_record(date(2024, 3, 4), 170.0, 1.0)]
+        )
+        downloader._save_option_parquet(
+            "AAPL", 2024, 4, [_record(date(2024, 4, 1), 170.0, 2.0)]
+        )
+        april = get_parquet_path(tmp_path, "option", "AAPL", 2024, 4)
+        april_mtime = april.stat().st_mtime_ns
+
+        # 同键重复写入 → 保留最新值；其他月份不被重写
+        downloader._save_option_parquet(
+            "AAPL",
+            2024,
+            3,
+            [_record(date(2024, 3, 4), 170.0, 1.5), _record(date(2024, 3, 5), 175.0, 3.0)],
+        )
+        assert april.stat().st_mtime_ns == april_mtime
+
+        march = pq.read_table(get_parquet_path(tmp_path, "option", "AAPL", 2024, 3))
+        assert march["date"].to_pylist() == [date(2024, 3, 4), date(2024, 3, 5)]
+        assert march["close"].to_pylist() == [1.5, 3.0]
+
+    def test_legacy_year_file_is_split(self, tmp_path):
+        downloader = DataDownloader(data_dir=tmp_path, client=object())
+        year_path = get_parquet_path(tmp_path, "option", "AAPL", 2024)
+        year_path.parent.mkdir(parents=True)
+        downloader._save_option_parquet(
+            "AAPL", 2024, 1, [_record(date(2024, 1, 2), 170.0, 1.0)]
+        )
+        # 模拟旧版年度文件
+        get_parquet_path(tmp_path, "option", "AAPL", 2024, 1).rename(year_path)
+
+        downloader._save_option_parquet(
+            "AAPL", 2024, 2, [_record(date(2024, 2, 1), 170.0, 2.0)]
+        )
+        assert not year_path.exists()
+        files = get_option_parquet_files(tmp_path, "AAPL", date(2024, 1, 1), date(2024, 2, 28))
+        assert [f.name for f in files] == ["2024-01.parquet", "2024-02.parquet"]
+        assert get_option_parquet_files(tmp_path, "AAPL", date(2024, 2, 1), date(2024, 2, 1)) == [
+            files[1]
+        ]
+
+    def test_batches_merge_each_month_once(self, tmp_path, monkeypatch):
+        downloader = DataDownloader(data_dir=tmp_path, client=object())
+        batches = [
+            option_greeks_to_batch(
+                [_record(date(2024, 3, 28), 170.0, 1.0), _record(date(2024, 4, 1), 170.0, 2.0)]
+            ),
+            option_greeks_to_batch([_record(date(2024, 4, 2), 170.0, 2.5)]),
+            option_greeks_to_batch([_record(date(2024, 4, 1), 170.0, 2.2)]),
+        ]
+        writes = []
+        save = downloader._save_option_table
+
+        def tracking_save(symbol, year, month, table):
+            writes.append((year, month))
+            save(symbol, year, month, table)
+
+        monkeypatch.setattr(downloader, "_save_option_table", tracking_save)
+
+        # 一个请求块内每个月度分区只合并重写一次
+        assert downloader._save_option_batches("AAPL", iter(batches)) == 4
+        assert writes == [(2024, 3), (2024, 4)]
+
+        april = pq.read_table(get_parquet_path(tmp_path, "option", "AAPL", 2024, 4))
+        assert april["date"].to_pylist() == [date(2024, 4, 1), date(2024, 4, 2)]
+        assert april["close"].to_pylist() == [2.2, 2.5]
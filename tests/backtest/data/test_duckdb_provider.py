@@ -0,0 +1,384 @@
+"""Tests for DuckDBProvider option lookups and the option chain store."""
+
+from datetime import date
+
+import pytest
+
+from src.backtest.data.duckdb_provider import DuckDBProvider
+from src.data.models.option import OptionContract, OptionType
+
+
+@pytest.fixture
+def trading_day(duckdb_provider: DuckDBProvider) -> date:
+    """A trading day that has option data in the sample set."""
+    d = duckdb_provider.get_trading_days(date(2024, 1, 1), date(2024, 3, 31))[5]
+    duckdb_provider.set_as_of_date(d)
+    return d
+
+
+def _sample_contracts(provider: DuckDBProvider, n: int = 6) -> list[OptionContract]:
+    """Pick a handful of real contracts (calls and puts) from the chain."""
+    chain = provider.get_option_chain("AAPL")
+    assert chain is not None
+    quotes = chain.puts[: n // 2] + chain.calls[: n // 2]
+    return [q.contract for q in quotes]
+
+
+def _quote_key(quote) -> tuple:
+    return (
+        quote.contract.expiry_date,
+        quote.contract.strike_price,
+        quote.contract.option_type,
+        quote.close,
+        quote.volume,
+        quote.open_interest,
+        quote.iv,
+    )
+
+
+class TestGetOptionQuotesBatch:
+    """get_option_quotes_batch: cached-chain index and joined-query paths."""
+
+    def test_empty_contracts(self, duckdb_provider, trading_day):
+        assert duckdb_provider.get_option_quotes_batch([]) == []
+
+    def test_query_path_matches_chain_path(self, duckdb_provider, trading_day):
+        contracts = _sample_contracts(duckdb_provider)
+
+        # 全链已缓存 → 走索引
+        from_index = duckdb_provider.get_option_quotes_batch(contracts)
+
+        # 清缓存后 → 走单次 JOIN 查询
+        duckdb_provider.clear_cache()
+        duckdb_provider.set_as_of_date(trading_day)
+        from_query = duckdb_provider.get_option_quotes_batch(contracts)
+
+        assert len(from_index) == len(contracts)
+        assert [_quote_key(q) for q in from_index] == [_quote_key(q) for q in from_query]
+
+    def test_returns_requested_contract_objects(self, duckdb_provider, trading_day):
+        contracts = _sample_contracts(duckdb_provider)
+        duckdb_provider.clear_cache()
+        duckdb_provider.set_as_of_date(trading_day)
+
+        quotes = duckdb_provider.get_option_quotes_batch(contracts)
+        assert [q.contract for q in quotes] == contracts
+        assert all(q.source == "duckdb" for q in quotes)
+
+    def test_missing_contract_is_skipped(self, duckdb_provider, trading_day):
+        contracts = _sample_contracts(duckdb_provider, n=2)
+        missing = OptionContract(
+            symbol="AAPL_MISSING",
+            underlying="AAPL",
+            option_type=contracts[0].option_type,
+            strike_price=99999.0,
+            expiry_date=contracts[0].expiry_date,
+        )
+
+        for reset in (False, True):
+            if reset:
+                duckdb_provider.clear_cache()
+                duckdb_provider.set_as_of_date(trading_day)
+            quotes = duckdb_provider.get_option_quotes_batch([contracts[0], missing, contracts[1]])
+            assert [q.contract for q in quotes] == [contracts[0], contracts[1]]
+
+    def test_min_volume_filter(self, duckdb_provider, trading_day):
+        contracts = _sample_contracts(duckdb_provider)
+        all_quotes = duckdb_provider.get_option_quotes_batch(contracts)
+        threshold = sorted(q.volume or 0 for q in all_quotes)[len(all_quotes) // 2]
+        expected = [q.contract for q in all_quotes if (q.volume or 0) >= threshold]
+
+        assert [
+            q.contract
+            for q in duckdb_provider.get_option_quotes_batch(contracts, min_volume=threshold)
+        ] == expected
+
+        duckdb_provider.clear_cache()
+        duckdb_provider.set_as_of_date(trading_day)
+        assert [
+            q.contract
+            for q in duckdb_provider.get_option_quotes_batch(contracts, min_volume=threshold)
+        ] == expected
+
+    def test_index_invalidated_on_date_change(self, duckdb_provider, trading_day):
+        contracts = _sample_contracts(duckdb_provider)
+        duckdb_provider.get_option_quotes_batch(contracts)
+        assert duckdb_provider._option_chain_frame_cache
+
+        next_day = duckdb_provider.get_trading_days(date(2024, 1, 1), date(2024, 3, 31))[6]
+        duckdb_provider.set_as_of_date(next_day)
+        assert not duckdb_provider._option_chain_frame_cache
+
+        quotes = duckdb_provider.get_option_quotes_batch(contracts)
+        assert all(q.timestamp.date() == next_day for q in quotes)
+
+
+class TestGetOptionQuotesByKey:
+    """get_option_quotes_by_key: per-contract lookups for position updates."""
+
+    def test_matches_chain_and_keeps_order(self, duckdb_provider, trading_day):
+        chain = duckdb_provider.get_option_chain("AAPL")
+        quotes = chain.puts[:3] + chain.calls[:3]
+        keys = [
+            (q.contract.expiry_date, q.contract.strike_price, q.contract.option_type)
+            for q in quotes
+        ]
+        missing = (keys[0][0], 99999.0, keys[0][2])
+
+        found = duckdb_provider.get_option_quotes_by_key("aapl", keys[:3] + [missing] + keys[3:])
+
+        assert found[3] is None
+        assert [_quote_key(q) for q in found[:3] + found[4:]] == [_quote_key(q) for q in quotes]
+
+    def test_missing_symbol(self, duckdb_provider, trading_day):
+        key = (date(2024, 6, 21), 100.0, OptionType.CALL)
+        assert duckdb_provider.get_option_quotes_by_key("ZZZZ", [key]) == [None]
+
+
+class TestOptionChainStore:
+    """Row-group-per-day option chain store and provider integration."""
+
+    @pytest.fixture
+    def store_dir(self, temp_data_dir, tmp_path):
+        from src.backtest.data.option_chain_store import build_option_chain_store
+
+        out = tmp_path / "chain_store"
+        assert build_option_chain_store(temp_data_dir, out, ["AAPL", "MSFT"]) == ["AAPL", "MSFT"]
+        return out
+
+    def test_one_row_group_per_trading_day(self, store_dir, duckdb_provider):
+        import pyarrow.parquet as pq
+
+        from src.backtest.data.option_chain_store import OptionChainStore, get_store_paths
+
+        store = OptionChainStore(store_dir)
+        days = duckdb_provider.get_trading_days(date(2024, 1, 1), date(2024, 3, 31))
+        first, last = store.date_range("AAPL")
+        assert first == days[0] and last == days[-1]
+
+        data_path, _ = get_store_paths(store_dir, "AAPL")
+        assert pq.ParquetFile(data_path).metadata.num_row_groups == len(days)
+
+        table = store.read_day("AAPL", days[3])
+        assert set(table.column("date").to_pylist()) == {days[3]}
+        keys = list(
+            zip(
+                table.column("expiration").to_pylist(),
+                table.column("strike").to_pylist(),
+                table.column("option_type").to_pylist(),
+            )
+        )
+        assert keys == sorted(keys)
+        assert store.read_day("AAPL", date(2024, 1, 6)) is None  # Saturday
+        assert not store.has_symbol("GOOGL")
+
+    def test_provider_chain_matches_parquet_scan(self, duckdb_provider, trading_day, store_dir):
+        scanned = duckdb_provider.get_option_chain("AAPL")
+
+        duckdb_provider.use_option_chain_store(store_dir)
+        duckdb_provider.set_as_of_date(trading_day)
+        stored = duckdb_provider.get_option_chain("AAPL")
+
+        assert stored is not None
+        assert stored.expiry_dates == scanned.expiry_dates
+        assert [_quote_key(q) for q in stored.calls] == [_quote_key(q) for q in scanned.calls]
+        assert [_quote_key(q) for q in stored.puts] == [_quote_key(q) for q in scanned.puts]
+        assert [q.contract for q in stored.puts] == [q.contract for q in scanned.puts]
+
+    def test_provider_falls_back_for_symbols_not_in_store(
+        self, duckdb_provider, trading_day, store_dir
+    ):
+        duckdb_provider.use_option_chain_store(store_dir)
+        duckdb_provider.set_as_of_date(trading_day)
+        # GOOGL 未导入 → 回退 Parquet 扫描
+        chain = duckdb_provider.get_option_chain("GOOGL")
+        assert chain is not None and chain.puts
+
+
+class TestOptionChainFrame:
+    """get_option_chain_frame returns the same data as get_option_chain."""
+
+    def test_frame_matches_chain(self, duckdb_provider, trading_day):
+        frame = duckdb_provider.get_option_chain_frame(
+            "AAPL", expiry_min_days=10, expiry_max_days=60
+        )
+        chain = duckdb_provider.get_option_chain("AAPL", expiry_min_days=10, expiry_max_days=60)
+
+        assert frame.expiry_dates == chain.expiry_dates
+        rebuilt = frame.to_option_chain()
+        assert rebuilt.calls == chain.calls
+        assert rebuilt.puts == chain.puts
+
+    def test_frame_cached_per_day(self, duckdb_provider, trading_day):
+        duckdb_provider.get_option_chain_frame("AAPL")
+        assert ("AAPL", trading_day) in duckdb_provider._option_chain_frame_cache
+
+        duckdb_provider.set_as_of_date(date(2024, 3, 1))
+        assert not duckdb_provider._option_chain_frame_cache
+
+    def test_missing_symbol_returns_none(self, duckdb_provider, trading_day):
+        assert duckdb_provider.get_option_chain_frame("NOPE") is None
+
+
+class TestPrefetch:
+    """prefetch() serves the day loop from memory with identical results."""
+
+    @pytest.fixture
+    def days(self, duckdb_provider):
+        return duckdb_provider.get_trading_days(date(2024, 2, 1), date(2024, 2, 29))
+
+    @pytest.fixture
+    def prefetched(self, temp_data_dir, days):
+        provider = DuckDBProvider(data_dir=temp_data_dir, as_of_date=days[0])
+        stats = provider.prefetch(["AAPL", "MSFT"], days[0], days[-1])
+        assert stats.option_days == 2 * len(days)
+        assert stats.option_rows > 0 and stats.memory_bytes > 0
+        yield provider
+        provider.close()
+
+    def test_matches_unprefetched_provider(self, duckdb_provider, prefetched, days):
+        for d in days[:5]:
+            duckdb_provider.set_as_of_date(d)
+            prefetched.set_as_of_date(d)
+
+            cold = duckdb_provider.get_option_chain("AAPL", expiry_min_days=7, expiry_max_days=60)
+            warm = prefetched.get_option_chain("AAPL", expiry_min_days=7, expiry_max_days=60)
+            assert warm.expiry_dates == cold.expiry_dates
+            assert warm.calls == cold.calls and warm.puts == cold.puts
+
+            contracts = [q.contract for q in cold.puts[:3] + cold.calls[:3]]
+            duckdb_provider.clear_cache()
+            duckdb_provider.set_as_of_date(d)
+            assert [_quote_key(q) for q in prefetched.get_option_quotes_batch(contracts)] == [
+                _quote_key(q) for q in duckdb_provider.get_option_quotes_batch(contracts)
+            ]
+
+            assert prefetched.get_stock_quote("MSFT") == duckdb_provider.get_stock_quote("MSFT")
+            assert prefetched.get_stock_volatility("AAPL") == duckdb_provider.get_stock_volatility("AAPL")
+
+    def test_day_loop_does_not_touch_duckdb(self, prefetched, days, monkeypatch):
+        def fail():
+            raise AssertionError("DuckDB queried after prefetch")
+
+        monkeypatch.setattr(prefetched, "_get_conn", fail)
+        for d in days:
+            prefetched.set_as_of_date(d)
+            assert prefetched.get_option_chain("MSFT") is not None
+            assert prefetched.get_stock_quote("AAPL") is not None
+            prefetched.get_stock_volatility("AAPL")
+            prefetched.get_macro_data("^VIX", d, d)
+
+    def test_max_dte_truncates_chain(self, temp_data_dir, days):
+        provider = DuckDBProvider(data_dir=temp_data_dir, as_of_date=days[0])
+        stats = provider.prefetch(["AAPL"], days[0], days[-1], max_dte=45)
+        assert 0 < stats.option_days <= len(days)
+        for (_, d), frame in provider._prefetched_option_frames.items():
+            assert frame.dte(d).max() <= 45
+
+    def test_max_dte_in_range_does_not_touch_duckdb(self, temp_data_dir, days, monkeypatch):
+        provider = DuckDBProvider(data_dir=temp_data_dir, as_of_date=days[0])
+        provider.prefetch(["AAPL"], days[0], days[-1], max_dte=40)
+
+        def fail():
+            raise AssertionError("DuckDB queried for an expiry inside prefetch_max_dte")
+
+        monkeypatch.setattr(provider, "_get_conn", fail)
+        for d in days[:5]:
+            provider.set_as_of_date(d)
+            chain = provider.get_option_chain("AAPL", expiry_min_days=7, expiry_max_days=40)
+            assert chain is not None and chain.calls
+            assert provider.get_option_chain_frame("AAPL", expiry_max_days=40) is not None
+
+            contracts = [q.contract for q in chain.puts[:2] + chain.calls[:2]]
+            assert len(provider.get_option_quotes_batch(contracts)) == len(contracts)
+            keys = [(c.expiry_date, c.strike_price, c.option_type) for c in contracts]
+            assert all(provider.get_option_quotes_by_key("AAPL", keys))
+        provider.close()
+
+    def test_max_dte_misses_fall_back(self, temp_data_dir, duckdb_provider, days):
+        provider = DuckDBProvider(data_dir=temp_data_dir, as_of_date=days[0])
+        provider.prefetch(["AAPL"], days[0], days[-1], max_dte=40)
+        d = days[3]
+        provider.set_as_of_date(d)
+        duckdb_provider.set_as_of_date(d)
+
+        cold = duckdb_provider.get_option_chain("AAPL")
+        far = [q.contract for q in cold.puts + cold.calls if (q.contract.expiry_date - d).days > 40]
+        assert far
+
+        # 截断范围内的请求仍由预加载数据提供，范围外 (或不限到期日) 回退查询
+        warm = provider.get_option_chain("AAPL", expiry_max_days=30)
+        assert warm.calls == duckdb_provider.get_option_chain("AAPL", expiry_max_days=30).calls
+        full = provider.get_option_chain("AAPL")
+        assert full.expiry_dates == cold.expiry_dates
+        assert full.calls == cold.calls and full.puts == cold.puts
+
+        keys = [(c.expiry_date, c.strike_price, c.option_type) for c in far[:4]]
+        assert [_quote_key(q) for q in provider.get_option_quotes_by_key("AAPL", keys)] == [
+            _quote_key(q) for q in duckdb_provider.get_option_quotes_by_key("AAPL", keys)
+        ]
+
+        provider.clear_cache()
+        provider.prefetch(["AAPL"], days[0], days[-1], max_dte=40)
+        provider.set_as_of_date(d)
+        duckdb_provider.clear_cache()
+        duckdb_provider.set_as_of_date(d)
+        assert [_quote_key(q) for q in provider.get_option_quotes_batch(far[:4])] == [
+            _quote_key(q) for q in duckdb_provider.get_option_quotes_batch(far[:4])
+        ]
+        provider.close()
+
+    def test_outside_range_falls_back(self, prefetched, days):
+        prefetched.set_as_of_date(date(2024, 3, 15))
+        assert prefetched.get_option_chain("AAPL") is not None
+        assert ("AAPL", date(2024, 3, 15)) in prefetched._option_chain_frame_cache
+
+    def test_clear_cache_drops_prefetch(self, prefetched, days):
+        prefetched.clear_cache()
+        assert not prefetched._prefetched_option_frames
+        assert not prefetched._is_prefetched("AAPL")
+
+
+class TestSeriesLookups:
+    """Kline/macro range queries served from the columnar PriceSeries."""
+
+    def test_history_kline_range_and_as_of(self, duckdb_provider, trading_day):
+        from src.data.models.stock import KlineType
+
+        klines = duckdb_provider.get_history_kline(
+            "aapl", KlineType.DAY, date(2024, 1, 1), date(2024, 12, 31)
+        )
+        assert klines
+        assert all(k.timestamp.date() <= trading_day for k in klines)
+        assert klines[-1].timestamp.date() == trading_day
+
+        later = duckdb_provider.get_history_kline(
+            "AAPL", KlineType.DAY, klines[2].timestamp.date(), klines[4].timestamp.date()
+        )
+        assert [k.timestamp for k in later] == [k.timestamp for k in klines[2:5]]
+        assert [k.close for k in later] == [k.close for k in klines[2:5]]
+
+    def test_history_series_matches_klines(self, duckdb_provider, trading_day):
+        from src.data.models.stock import KlineType
+
+        klines = duckdb_provider.get_history_kline(
+            "AAPL", KlineType.DAY, date(2024, 1, 1), trading_day
+        )
+        series = duckdb_provider.get_history_series("AAPL", date(2024, 1, 1))
+
+        assert len(series) == len(klines)
+        assert series.close.tolist() == [k.close for k in klines]
+        assert series.date_at(-1) == trading_day
+
+    def test_macro_data_range(self, duckdb_provider):
+        duckdb_provider._macro_series_cache["^VIX"] = [
+            ("2024-01-02", 13.0, 14.0, 12.5, 13.5),
+            ("2024-01-03", 13.5, 15.0, 13.0, 14.2),
+            ("2024-01-04", 14.2, 14.5, 13.8, 14.0),
+        ]
+        duckdb_provider.set_as_of_date(date(2024, 1, 3))
+
+        data = duckdb_provider.get_macro_data("^VIX", date(2024, 1, 1), date(2024, 1, 31))
+        assert [d.date for d in data] == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert [d.value for d in data] == [13.5, 14.2]
+        assert duckdb_provider.get_macro_data("^VIX", date(2024, 1, 5), date(2024, 1, 31)) == []
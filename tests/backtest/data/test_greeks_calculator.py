@@ -0,0 +1,140 @@
+"""Tests for GreeksCalculator — scalar vs batch implied-vol solver."""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.backtest.data.greeks_calculator import GreeksCalculator
+
+
+@dataclass
+class _EOD:
+    """Minimal OptionEOD stand-in for enrich_options_batch."""
+
+    symbol: str
+    expiration: date
+    strike: float
+    option_type: str
+    date: date
+    bid: float
+    ask: float
+    close: float
+    volume: int = 10
+
+
+def _random_grid(calc: GreeksCalculator, n: int, seed: int = 7):
+    """Random (price, spot, strike, tte, rate, is_call) rows priced off known IVs."""
+    rng = np.random.default_rng(seed)
+    spot = rng.uniform(20, 600, n)
+    strike = spot * rng.uniform(0.6, 1.4, n)
+    tte = rng.uniform(1 / 365, 2.5, n)
+    rate = rng.uniform(0.0, 0.06, n)
+    is_call = rng.random(n) < 0.5
+    vol = rng.uniform(0.05, 1.5, n)
+    price = calc._bs_price_array(spot, strike, tte, rate, vol, is_call)
+    return price, spot, strike, tte, rate, is_call, vol
+
+
+class TestCalculateBatch:
+    @pytest.mark.parametrize("dividend_yield", [0.0, 0.02])
+    def test_matches_scalar_calculate(self, dividend_yield):
+        calc = GreeksCalculator(dividend_yield=dividend_yield)
+        price, spot, strike, tte, rate, is_call, _ = _random_grid(calc, 400)
+
+        batch = calc.calculate_batch(price, spot, strike, tte, rate, is_call)
+
+        assert len(batch) == 400
+        for i in range(400):
+            scalar = calc.calculate(
+                float(price[i]), float(spot[i]), float(strike[i]),
+                float(tte[i]), float(rate[i]), bool(is_call[i]),
+            )
+            row = batch.row(i)
+            assert row.is_valid == scalar.is_valid, (i, row.error_msg, scalar.error_msg)
+            if not scalar.is_valid:
+                assert row.error_msg.split(":")[0] == scalar.error_msg.split(":")[0]
+                continue
+            # 价格几乎不含时间价值时 IV 本身病态，比较重定价误差更有意义
+            assert row.iv == pytest.approx(scalar.iv, abs=1e-4) or calc._bs_price(
+                float(spot[i]), float(strike[i]), float(tte[i]), float(rate[i]), row.iv, bool(is_call[i])
+            ) == pytest.approx(float(price[i]), abs=1e-6)
+            assert row.delta == pytest.approx(scalar.delta, abs=1e-4)
+            assert row.vega == pytest.approx(scalar.vega, abs=1e-4)
+
+    def test_recovers_input_vol(self):
+        calc = GreeksCalculator()
+        spot = np.full(5, 100.0)
+        strike = np.array([80.0, 95.0, 100.0, 105.0, 120.0])
+        vol = np.array([0.15, 0.25, 0.35, 0.5, 0.8])
+        is_call = np.array([False, True, True, False, True])
+        price = calc._bs_price_array(spot, strike, np.full(5, 0.5), np.full(5, 0.04), vol, is_call)
+
+        batch = calc.calculate_batch(price, spot, strike, 0.5, 0.04, is_call)
+
+        assert batch.is_valid.all()
+        np.testing.assert_allclose(batch.iv, vol, atol=1e-7)
+
+    def test_invalid_rows_carry_scalar_messages(self):
+        calc = GreeksCalculator()
+        batch = calc.calculate_batch(
+            option_price=[0.0, 5.0, 1.0, 0.5, 90.0],
+            spot=[100.0, -1.0, 120.0, 100.0, 100.0],
+            strike=[100.0, 100.0, 100.0, 100.0, 100.0],
+            tte=0.25,
+            rate=0.05,
+            is_call=[True, True, True, True, True],
+        )
+
+        assert not batch.is_valid.any()
+        assert batch.error_msgs[0] == "Invalid option price <= 0"
+        assert batch.error_msgs[1] == "Invalid spot or strike <= 0"
+        assert batch.error_msgs[2].startswith("Price below intrinsic value")
+        assert batch.delta[2] == 1.0
+        assert batch.error_msgs[3].startswith("Price too low for IV solve")
+        assert batch.error_msgs[4].startswith("Price too high for IV solve")
+
+    def test_scalar_broadcast(self):
+        calc = GreeksCalculator()
+        batch = calc.calculate_batch(8.0, 100.0, [95.0, 100.0, 105.0], 0.25, 0.05, True)
+        assert len(batch) == 3
+        assert batch.is_valid.all()
+        # 同价格下 strike 越高 IV 越高
+        assert np.all(np.diff(batch.iv) > 0)
+
+
+class TestEnrichOptionsBatch:
+    def test_matches_enrich_option(self):
+        calc = GreeksCalculator()
+        as_of = date(2024, 3, 1)
+        options = [
+            _EOD("SPY", as_of + timedelta(days=30), 480.0, "put", as_of, 4.9, 5.1, 5.0),
+            _EOD("SPY", as_of + timedelta(days=60), 520.0, "call", as_of, 6.0, 6.4, 6.2),
+            _EOD("SPY", as_of + timedelta(days=60), 520.0, "call", as_of, 0.0, 0.0, 0.0),
+            _EOD("SPY", as_of, 500.0, "call", as_of, 1.0, 1.2, 1.1),
+            _EOD("SPY", as_of + timedelta(days=30), 500.0, "call", date(2024, 3, 4), 1.0, 1.2, 1.1),
+        ]
+
+        enriched = calc.enrich_options_batch(options, {as_of: 500.0}, rate=0.045)
+
+        assert len(enriched) == 2
+        for opt, result in zip(options[:2], enriched, strict=True):
+            expected = calc.enrich_option(
+                option_price=(opt.bid + opt.ask) / 2,
+                spot=500.0,
+                strike=opt.strike,
+                expiration=opt.expiration,
+                as_of_date=as_of,
+                rate=0.045,
+                is_call=opt.option_type == "call",
+                symbol=opt.symbol,
+                bid=opt.bid,
+                ask=opt.ask,
+                volume=opt.volume,
+            )
+            assert result.option_type == expected.option_type
+            assert result.dte == expected.dte
+            assert result.iv == pytest.approx(expected.iv, abs=1e-6)
+            assert result.delta == pytest.approx(expected.delta, abs=1e-6)
+            assert result.theta == pytest.approx(expected.theta, abs=1e-6)
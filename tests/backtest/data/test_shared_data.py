@@ -0,0 +1,97 @@
+"""Tests for the shared read-only data plane used by parallel backtests."""
+
+from datetime import date
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from src.backtest.data.atm_iv_daily import build_atm_iv_daily
+from src.backtest.data.duckdb_provider import DuckDBProvider
+from src.backtest.data.shared_data import SharedDataPlane, build_shared_data
+from src.data.models.price_series import PriceSeries
+
+START, END = date(2024, 2, 1), date(2024, 2, 29)
+
+
+@pytest.fixture
+def plane(temp_data_dir, tmp_path):
+    build_shared_data(temp_data_dir, tmp_path / "plane", ["AAPL", "MSFT"], START, END)
+    plane = SharedDataPlane(tmp_path / "plane")
+    yield plane
+    plane.close()
+
+
+@pytest.fixture
+def days(duckdb_provider):
+    return duckdb_provider.get_trading_days(START, END)
+
+
+class TestSharedDataPlane:
+    def test_manifest(self, plane, days):
+        assert plane.symbols == ["AAPL", "MSFT"]
+        assert plane.date_range == (START, END)
+        assert plane.has_options("AAPL") and not plane.has_options("GOOGL")
+        assert plane.option_day("AAPL", date(2024, 2, 3)) is None  # Saturday
+        assert set(plane.option_day("AAPL", days[0]).column("date").to_pylist()) == {days[0]}
+
+    def test_option_day_is_zero_copy(self, plane, days):
+        plane.option_day("AAPL", days[0])  # 首次访问建立内存映射
+        before = pa.total_allocated_bytes()
+        tables = [plane.option_day("AAPL", d) for d in days]
+        assert sum(t.num_rows for t in tables) > 0
+        assert pa.total_allocated_bytes() == before
+
+    def test_series_built_from_mapped_columns(self, plane):
+        rows = plane.stock_rows()
+        series = plane.stock_series()
+        assert set(series) == {s for s, r in rows.items() if r}
+        for symbol, s in series.items():
+            expected = PriceSeries.from_rows(rows[symbol])
+            for field in ("dates", "open", "high", "low", "close", "volume"):
+                np.testing.assert_array_equal(
+                    getattr(s, field), getattr(expected, field)
+                )
+
+        macro_rows = plane.macro_rows() or {}
+        for indicator, s in plane.macro_series().items():
+            expected = PriceSeries.from_rows(macro_rows[indicator])
+            np.testing.assert_array_equal(s.dates, expected.dates)
+            np.testing.assert_array_equal(s.close, expected.close)
+
+    def test_attached_provider_matches_parquet(self, duckdb_provider, temp_data_dir, plane, days):
+        attached = DuckDBProvider(data_dir=temp_data_dir, as_of_date=START)
+        attached.attach_shared_data(plane)
+
+        for d in days[:5]:
+            duckdb_provider.set_as_of_date(d)
+            attached.set_as_of_date(d)
+
+            cold = duckdb_provider.get_option_chain("MSFT", expiry_min_days=7, expiry_max_days=90)
+            warm = attached.get_option_chain("MSFT", expiry_min_days=7, expiry_max_days=90)
+            assert warm.calls == cold.calls and warm.puts == cold.puts
+
+            contracts = [q.contract for q in cold.puts[:2] + cold.calls[:2]]
+            assert attached.get_option_quotes_batch(contracts) == (
+                duckdb_provider.get_option_quotes_batch(contracts)
+            )
+
+            assert attached.get_stock_quote("AAPL") == duckdb_provider.get_stock_quote("AAPL")
+            assert attached.get_stock_volatility("AAPL") == duckdb_provider.get_stock_volatility(
+                "AAPL"
+            )
+
+    def test_day_loop_reads_no_parquet(self, temp_data_dir, plane, days, monkeypatch):
+        build_atm_iv_daily(temp_data_dir)
+        attached = DuckDBProvider(data_dir=temp_data_dir, as_of_date=START)
+        attached.attach_shared_data(plane)
+
+        def fail():
+            raise AssertionError("DuckDB queried with shared data attached")
+
+        monkeypatch.setattr(attached, "_get_conn", fail)
+        for d in days:
+            attached.set_as_of_date(d)
+            assert attached.get_option_chain("AAPL") is not None
+            assert attached.get_stock_quote("MSFT") is not None
+            attached.get_stock_volatility("MSFT")
@@ -296,6 +296,24 @@ class TestSyntheticChain:
         for q in otm:
             assert q.greeks.delta < 0.5, f"Delta={q.greeks.delta} too high for OTM"
 
+    def test_quotes_by_key(self, provider):
+        """Position lookups by (expiry, strike, type) return the synthetic quotes."""
+        chain = provider.get_option_chain("SPY")
+        picked = chain.calls[:2]
+        keys = [
+            (q.contract.expiry_date, q.contract.strike_price, OptionType.CALL)
+            for q in picked
+        ]
+        put_key = (keys[0][0], keys[0][1], OptionType.PUT)
+
+        found = provider.get_option_quotes_by_key("SPY", keys + [put_key])
+
+        assert found[2] is None
+        for quote, expected in zip(found[:2], picked):
+            assert quote.contract.symbol == expected.contract.symbol
+            assert quote.close == expected.close
+            assert quote.greeks.delta == expected.greeks.delta
+
     def test_no_stock_quote_returns_none(self, mock_base_provider):
         """If no stock quote available, returns None."""
         mock_base_provider.get_stock_quote.return_value = None
@@ -454,3 +472,48 @@ class TestCaching:
         v2 = provider._get_vix(d)
         assert v1 == v2
         assert d in provider._vix_cache
+
+    def test_grid_shared_across_symbols_with_same_inputs(self, provider):
+        """Symbols with identical (date, spot, vix, rate) reuse one priced surface."""
+        spy = provider.get_option_chain_frame("SPY")
+        voo = provider.get_option_chain_frame("VOO")
+
+        assert len(provider._grid_cache) == 1
+        assert len(spy) == len(voo)
+        assert voo.option_symbol(0).startswith("VOO_")
+
+
+class TestVectorizedSurface:
+    """The one-shot NumPy surface matches scalar B-S pricing."""
+
+    def test_matches_scalar_bs(self, provider):
+        from src.engine.bs.core import calc_bs_price
+        from src.engine.bs.greeks import calc_bs_greeks
+        from src.engine.models.bs_params import BSParams
+
+        as_of = date(2024, 6, 15)
+        chain = provider.get_option_chain("SPY")
+        for quote in chain.calls[::37]:
+            dte = (quote.contract.expiry_date - as_of).days
+            t = dte / 365.0
+            moneyness = quote.contract.strike_price / 500.0
+            iv = provider._estimate_iv(0.20, dte, moneyness)
+            params = BSParams(
+                spot_price=500.0 * math.exp(-0.013 * t),
+                strike_price=quote.contract.strike_price,
+                risk_free_rate=0.0045,
+                volatility=iv,
+                time_to_expiry=t,
+                is_call=True,
+            )
+            price = calc_bs_price(params)
+            spread = provider._estimate_spread(price, moneyness, dte)
+
+            assert quote.iv == pytest.approx(iv)
+            assert quote.last_price == pytest.approx(price)
+            assert quote.ask == pytest.approx(price + spread / 2)
+            assert quote.greeks.delta == pytest.approx(calc_bs_greeks(params)["delta"])
+            assert quote.contract.symbol == (
+                f"SPY_{quote.contract.expiry_date.strftime('%y%m%d')}_C_"
+                f"{quote.contract.strike_price:.0f}"
+            )
@@ -0,0 +1,149 @@
+"""Tests for ThetaDataClient streaming CSV → Arrow decoding."""
+
+import csv
+import io
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pytest
+
+from src.backtest.data.thetadata_client import (
+    OPTION_GREEKS_ARROW_SCHEMA,
+    StockEOD,
+    ThetaDataClient,
+    ThetaDataConfig,
+    _ByteChunkReader,
+    option_greeks_to_batch,
+)
+
+OPTION_EOD_CSV = """symbol,expiration,strike,right,created,open,high,low,close,volume,count,bid,ask
+"SPY","2024-03-15",480.000,"PUT",2024-03-01T17:18:32.295,2.10,2.40,1.90,2.20,1500,120,2.18,2.22
+"SPY","2024-03-15",520.000,"CALL",2024-03-01T17:18:32.295,1.40,1.60,1.20,1.50,900,80,1.48,1.52
+"SPY","2024-03-15",510.000,"PUT",2024-03-01T17:18:32.295,9.00,9.50,8.80,9.10,300,30,9.05,9.15
+"SPY","2024-04-19",470.000,"PUT",2024-03-04T17:18:32.295,3.10,3.30,2.90,3.00,700,60,0,0
+"SPY","2024-04-19",530.000,"CALL",2024-03-04T17:18:32.295,0,0,0,0,0,0,0,0
+"SPY","2024-04-19",530.000,"OTHER",2024-03-04T17:18:32.295,1,1,1,1,1,1,1,1
+"SPY","2024-03-04",490.000,"PUT",2024-03-04T17:18:32.295,0.5,0.5,0.5,0.5,1,1,0.4,0.6
+"""
+
+
+@pytest.fixture
+def client(monkeypatch) -> ThetaDataClient:
+    client = ThetaDataClient(ThetaDataConfig(skip_greeks_api=True))
+
+    def csv_stream(endpoint, params=None):
+        return [
+            {k.strip().lower(): v for k, v in row.items()}
+            for row in csv.DictReader(io.StringIO(OPTION_EOD_CSV))
+        ]
+
+    def csv_batches(endpoint, params=None, column_types=None, block_size=256):
+        reader = pacsv.open_csv(
+            io.BufferedReader(
+                _ByteChunkReader(iter([OPTION_EOD_CSV.encode()[i:i + 37]
+                                       for i in range(0, len(OPTION_EOD_CSV), 37)]))
+            ),
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            convert_options=pacsv.ConvertOptions(column_types=column_types or {}),
+        )
+        yield from reader
+
+    def stock_eod(symbol, start_date, end_date):
+        return [
+            StockEOD(symbol, date(2024, 3, 1), 500, 502, 498, 500.0, 1000, 10),
+            StockEOD(symbol, date(2024, 3, 4), 501, 503, 499, 501.0, 1000, 10),
+        ]
+
+    monkeypatch.setattr(client, "_request_csv_stream", csv_stream)
+    monkeypatch.setattr(client, "_request_csv_batches", csv_batches)
+    monkeypatch.setattr(client, "get_stock_eod", stock_eod)
+    return client
+
+
+class TestStreamingOptionDecode:
+    def test_eod_batches_match_row_parser(self, client):
+        rows = client.get_option_eod("SPY", date(2024, 3, 1), date(2024, 3, 4))
+        table = pa.Table.from_batches(
+            list(client.get_option_eod_batches("SPY", date(2024, 3, 1), date(2024, 3, 4)))
+        )
+
+        assert table.num_rows == len(rows) == 6
+        assert table["date"].to_pylist() == [r.date for r in rows]
+        assert table["expiration"].to_pylist() == [r.expiration for r in rows]
+        assert table["option_type"].to_pylist() == [r.option_type for r in rows]
+        assert table["strike"].to_pylist() == [r.strike for r in rows]
+
+    def test_greeks_batches_match_record_path(self, client):
+        args = ("SPY", date(2024, 3, 1), date(2024, 3, 4))
+        records = client.get_option_with_greeks(*args)
+        batches = list(client.get_option_with_greeks_batches(*args))
+
+        assert all(b.schema == OPTION_GREEKS_ARROW_SCHEMA for b in batches)
+        streamed = pa.Table.from_batches(batches, schema=OPTION_GREEKS_ARROW_SCHEMA)
+        expected = option_greeks_to_batch(records)
+
+        assert streamed.num_rows == expected.num_rows > 0
+        for name in ("strike", "option_type", "date", "underlying_price"):
+            assert streamed[name].to_pylist() == expected.column(name).to_pylist()
+        for name in ("delta", "implied_vol"):
+            assert streamed[name].to_pylist() == pytest.approx(expected.column(name).to_pylist())
+
+
+OPTION_GREEKS_CSV = """symbol,expiration,strike,right,timestamp,open,high,low,close,volume,count,bid,ask,delta,gamma,theta,vega,rho,implied_vol,iv_error,underlying_price
+"SPY","2024-03-15",480.000,"PUT",2024-03-01T17:18:32.295,2.10,2.40,1.90,2.20,1500,120,2.18,2.22,-0.21,0.012,-0.15,0.42,-0.05,0.18,0.0,500.0
+"SPY","2024-03-15",520.000,"CALL",2024-03-01T17:18:32.295,1.40,1.60,1.20,1.50,900,80,1.48,1.52,0.18,0.010,-0.12,0.39,0.04,0.15,0.002,500.0
+"SPY","2024-04-19",530.000,"OTHER",2024-03-04T17:18:32.295,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,501.0
+"SPY","2024-04-19",470.000,"PUT",2024-03-04T17:18:32.295,3.10,3.30,2.90,3.00,700,60,2.95,3.05,-0.15,0.008,-0.09,0.55,-0.08,0.20,,501.0
+"""
+
+
+class TestStreamingGreeksEndpoint:
+    @pytest.fixture
+    def paid_client(self, monkeypatch) -> ThetaDataClient:
+        client = ThetaDataClient(ThetaDataConfig(skip_greeks_api=False))
+
+        def value(v: str):
+            try:
+                return float(v)
+            except ValueError:
+                return v
+
+        def request(endpoint, params=None):
+            # JSON 响应：数值字段为数字，缺失字段不出现
+            assert endpoint == "/option/history/greeks/eod"
+            return [
+                {k: value(v) for k, v in row.items() if v != ""}
+                for row in csv.DictReader(io.StringIO(OPTION_GREEKS_CSV))
+            ]
+
+        def csv_batches(endpoint, params=None, column_types=None, block_size=256):
+            assert endpoint == "/option/history/greeks/eod"
+            reader = pacsv.open_csv(
+                io.BytesIO(OPTION_GREEKS_CSV.encode()),
+                read_options=pacsv.ReadOptions(block_size=block_size),
+                convert_options=pacsv.ConvertOptions(column_types=column_types or {}),
+            )
+            for batch in reader:
+                yield pa.RecordBatch.from_arrays(
+                    batch.columns, names=[n.lower() for n in batch.schema.names]
+                )
+
+        monkeypatch.setattr(client, "_request", request)
+        monkeypatch.setattr(client, "_request_csv_batches", csv_batches)
+        return client
+
+    def test_greeks_endpoint_streams_batches(self, paid_client):
+        args = ("SPY", date(2024, 3, 1), date(2024, 3, 4))
+        records = paid_client.get_option_eod_greeks(*args)
+        batches = list(paid_client.get_option_with_greeks_batches(*args))
+
+        # 每个 CSV 块单独产出，而不是整体一个 batch
+        assert len(batches) > 1
+        assert all(b.schema == OPTION_GREEKS_ARROW_SCHEMA for b in batches)
+        streamed = pa.Table.from_batches(batches, schema=OPTION_GREEKS_ARROW_SCHEMA)
+        expected = option_greeks_to_batch(records)
+
+        assert streamed.num_rows == expected.num_rows == 3
+        for name in OPTION_GREEKS_ARROW_SCHEMA.names:
+            assert streamed[name].to_pylist() == expected.column(name).to_pylist(), name
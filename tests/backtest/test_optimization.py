@@ -66,6 +66,37 @@ class TestParallelBacktestRunner:
         assert isinstance(result, ParallelRunResult)
         assert result.total_tasks == 2
 
+    def test_run_multi_symbol_shared_data(
+        self,
+        sample_backtest_config: BacktestConfig,
+        temp_data_dir: Path,
+        sample_symbols: list[str],
+        tmp_path: Path,
+    ):
+        """Test shared data plane mode matches per-worker Parquet reads."""
+        symbols = sample_symbols[:2]
+        baseline = ParallelBacktestRunner(max_workers=2, use_processes=False).run_multi_symbol(
+            base_config=sample_backtest_config,
+            symbols=symbols,
+        )
+
+        shared_root = tmp_path / "shm"
+        shared_root.mkdir()
+        runner = ParallelBacktestRunner(
+            max_workers=2,
+            use_processes=False,
+            shared_data=True,
+            shared_data_dir=shared_root,
+        )
+        result = runner.run_multi_symbol(base_config=sample_backtest_config, symbols=symbols)
+
+        assert result.completed_tasks == baseline.completed_tasks == 2
+        for symbol in symbols:
+            assert result.results[symbol].final_nlv == baseline.results[symbol].final_nlv
+            assert result.results[symbol].total_trades == baseline.results[symbol].total_trades
+        # 共享数据目录在任务结束后清理
+        assert list(shared_root.iterdir()) == []
+
     def test_parallel_run_result_aggregation(self):
         """Test result aggregation."""
         result = ParallelRunResult(
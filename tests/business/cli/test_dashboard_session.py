@@ -0,0 +1,112 @@
+"""
+DashboardSession 单元测试
+
+测试自动刷新模式的长连接会话：
+- 多次刷新只建立一次连接
+- 连接失效后重新连接
+- 退出时断开连接
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.business.cli.commands import dashboard as dashboard_cmd
+from src.business.cli.commands.dashboard import DashboardSession, _run_refresh_loop
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def make_connection() -> MagicMock:
+    """模拟 BrokerManager.connect() 返回的连接（IBKR + Futu 均可用）"""
+    conn = MagicMock()
+    conn.ibkr.is_available = True
+    conn.futu.is_available = True
+    conn.any_connected = True
+    return conn
+
+
+@pytest.fixture
+def broker():
+    """替换 BrokerManager / UnifiedDataProvider / MonitoringDataBridge，每次 connect 返回新连接"""
+    connections: list[MagicMock] = []
+
+    def connect(**kwargs):
+        connections.append(make_connection())
+        return connections[-1]
+
+    with patch("src.data.providers.broker_manager.BrokerManager") as manager_cls, \
+            patch("src.data.providers.unified_provider.UnifiedDataProvider"), \
+            patch("src.business.monitoring.data_bridge.MonitoringDataBridge"), \
+            patch("src.engine.account.metrics.calc_capital_metrics"), \
+            patch.object(dashboard_cmd, "MonitoringPipeline"):
+        manager_cls.return_value.connect.side_effect = connect
+        manager_cls.connections = connections
+        yield manager_cls
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestDashboardSession:
+    """测试会话连接复用"""
+
+    def test_single_connect_across_refreshes(self, broker):
+        with DashboardSession("paper") as session:
+            for _ in range(5):
+                session.refresh()
+
+        assert broker.return_value.connect.call_count == 1
+        conn = broker.connections[0]
+        conn.ibkr.disconnect.assert_called_once()
+        conn.futu.disconnect.assert_called_once()
+
+    def test_reconnects_when_provider_unavailable(self, broker):
+        with DashboardSession("paper") as session:
+            session.refresh()
+            first = broker.connections[0]
+            first.ibkr.is_available = False
+
+            session.refresh()
+            session.refresh()
+
+        assert broker.return_value.connect.call_count == 2
+        first.ibkr.disconnect.assert_called_once()
+        broker.connections[1].ibkr.disconnect.assert_called_once()
+
+    def test_sample_data_does_not_connect(self, broker):
+        with DashboardSession(None) as session:
+            session.refresh()
+
+        broker.return_value.connect.assert_not_called()
+
+
+class TestRefreshLoop:
+    """测试自动刷新循环"""
+
+    def test_loop_reuses_session_and_closes_on_exit(self, broker):
+        refreshes = 4
+        sleeps = MagicMock(side_effect=[None] * (refreshes - 1) + [KeyboardInterrupt])
+
+        with patch.object(dashboard_cmd.time, "sleep", sleeps), \
+                patch.object(dashboard_cmd.os, "system"), \
+                patch.object(dashboard_cmd.click, "echo"):
+            with pytest.raises(KeyboardInterrupt):
+                _run_refresh_loop(
+                    renderer=MagicMock(),
+                    account_type="paper",
+                    ibkr_only=False,
+                    futu_only=False,
+                    interval=1,
+                )
+
+        assert sleeps.call_count == refreshes
+        assert broker.return_value.connect.call_count == 1
+        conn = broker.connections[0]
+        conn.ibkr.disconnect.assert_called_once()
+        conn.futu.disconnect.assert_called_once()
@@ -0,0 +1,144 @@
+"""
+MonitoringDataBridge 预获取单元测试
+
+测试补充数据预获取逻辑：
+- 按 provider 分组并发获取
+- IBKR 请求留在调用线程
+- TTL 缓存与失败保留
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.business.monitoring.data_bridge import MonitoringDataBridge
+from src.data.models.enums import DataType
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class StubProvider:
+    """模拟 UnifiedDataProvider：US 走 IBKR，HK 走 Futu，基本面走 Yahoo"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[tuple[str, str, str]] = []  # (method, symbol, thread)
+        self._lock = threading.Lock()
+
+    def route_names(self, data_type: DataType, symbol: str) -> list[str]:
+        if data_type == DataType.FUNDAMENTAL:
+            return ["yahoo"]
+        return ["futu", "yahoo"] if symbol.isdigit() else ["ibkr", "futu", "yahoo"]
+
+    def _record(self, method: str, symbol: str) -> None:
+        with self._lock:
+            self.calls.append((method, symbol, threading.current_thread().name))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+
+    def get_stock_volatility(self, symbol):
+        self._record("volatility", symbol)
+        return f"vol-{symbol}"
+
+    def get_history_kline(self, symbol):
+        self._record("kline", symbol)
+        return []
+
+    def get_fundamental(self, symbol):
+        self._record("fundamental", symbol)
+        return None
+
+
+@pytest.fixture
+def provider() -> StubProvider:
+    return StubProvider()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestPrefetch:
+    """测试并发预获取"""
+
+    def test_fetches_every_symbol_and_kind(self, provider):
+        bridge = MonitoringDataBridge(data_provider=provider)
+        bridge._prefetch_data({"AAPL", "700"})
+
+        assert {(m, s) for m, s, _ in provider.calls} == {
+            (m, s) for m in ("volatility", "kline", "fundamental") for s in ("AAPL", "700")
+        }
+        assert bridge._volatility_cache == {"AAPL": "vol-AAPL", "700": "vol-700"}
+        assert set(bridge.prefetch_latency) == {
+            (s, k) for s in ("AAPL", "700") for k in ("volatility", "technical", "fundamental")
+        }
+
+    def test_ibkr_routed_requests_stay_on_caller_thread(self, provider):
+        bridge = MonitoringDataBridge(data_provider=provider)
+        bridge._prefetch_data({"AAPL", "700"})
+
+        caller = threading.current_thread().name
+        threads = {(m, s): t for m, s, t in provider.calls}
+        assert threads[("volatility", "AAPL")] == caller
+        assert threads[("volatility", "700")] == caller
+        assert threads[("kline", "AAPL")] == caller
+        assert threads[("kline", "700")].startswith("prefetch-futu")
+        assert threads[("fundamental", "AAPL")].startswith("prefetch-yahoo")
+
+    def test_pooled_requests_overlap(self):
+        provider = StubProvider(delay=0.2)
+        symbols = {"700", "9988", "3690", "1810"}
+        bridge = MonitoringDataBridge(
+            data_provider=provider, prefetch_concurrency={"futu": 4, "yahoo": 4}
+        )
+
+        started = time.monotonic()
+        bridge._prefetch_data(symbols)
+        elapsed = time.monotonic() - started
+
+        # 4 个 volatility 在调用线程顺序执行 (0.8s)，kline/fundamental 并行
+        assert elapsed < 0.2 * len(symbols) * 3 * 0.6
+
+    def test_ttl_skips_fresh_symbols(self, provider):
+        bridge = MonitoringDataBridge(data_provider=provider, cache_ttl_seconds=300)
+        bridge._prefetch_data({"AAPL"})
+        first = len(provider.calls)
+
+        bridge._prefetch_data({"AAPL"})
+        assert len(provider.calls) == first
+
+        bridge._prefetch_data({"AAPL", "MSFT"})
+        assert {s for _, s, _ in provider.calls[first:]} == {"MSFT"}
+
+    def test_failed_refetch_keeps_previous_value(self, provider):
+        bridge = MonitoringDataBridge(data_provider=provider, cache_ttl_seconds=0)
+        bridge._prefetch_data({"AAPL"})
+
+        provider.fail = True
+        bridge._prefetch_data({"AAPL"})
+
+        assert bridge._volatility_cache["AAPL"] == "vol-AAPL"
+
+    def test_failed_symbols_retried_within_ttl(self, provider):
+        bridge = MonitoringDataBridge(data_provider=provider, cache_ttl_seconds=300)
+        provider.fail = True
+        bridge._prefetch_data({"AAPL"})
+        assert "AAPL" not in bridge._volatility_cache
+
+        provider.fail = False
+        first = len(provider.calls)
+        bridge._prefetch_data({"AAPL"})
+        assert len(provider.calls) > first
+        assert bridge._volatility_cache["AAPL"] == "vol-AAPL"
+
+        # 成功后在 TTL 内不再重复获取
+        second = len(provider.calls)
+        bridge._prefetch_data({"AAPL"})
+        assert len(provider.calls) == second
@@ -0,0 +1,249 @@
+"""Daily Trade Limits Unit Tests.
+
+测试 DailyTradeTracker 的增量台账：
+- 首次查询从 OrderStore 加载，之后不再扫描
+- record_order 增量更新（含状态变化）
+- 台账持久化与恢复（含多进程 / 重启场景）
+
+Usage:
+    pytest tests/business/trading/test_daily_limits.py -v
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.business.trading.daily_limits import DailyLimitsConfig, DailyTradeTracker
+from src.business.trading.models.order import (
+    AssetClass,
+    OrderRecord,
+    OrderRequest,
+    OrderStatus,
+)
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+class FakeOrderStore:
+    """内存订单存储，记录 get_recent 调用次数"""
+
+    def __init__(self, records: list[OrderRecord] | None = None):
+        self.records = {r.order.order_id: r for r in records or []}
+        self.scans = 0
+
+    def save(self, record: OrderRecord) -> None:
+        self.records[record.order.order_id] = record
+
+    def get_recent(self, days: int = 7) -> list[OrderRecord]:
+        self.scans += 1
+        first_day = date.today() - timedelta(days=days - 1)
+        return [r for r in self.records.values() if r.order.created_at.date() >= first_day]
+
+    def get_daily_statuses(self, target_date: date) -> dict[str, OrderStatus]:
+        return {
+            order_id: r.order.status
+            for order_id, r in self.records.items()
+            if r.order.created_at.date() == target_date
+        }
+
+
+def make_record(
+    order_id: str,
+    underlying: str = "AAPL",
+    quantity: int = -1,
+    decision_type: str = "open",
+    status: OrderStatus = OrderStatus.SUBMITTED,
+    created_at: datetime | None = None,
+) -> OrderRecord:
+    """创建订单记录（limit 2.0 x 100 = 200/张）"""
+    return OrderRecord(
+        order=OrderRequest(
+            order_id=order_id,
+            decision_id="DEC-001",
+            symbol=f"{underlying} 250221P00200000",
+            underlying=underlying,
+            asset_class=AssetClass.OPTION,
+            quantity=quantity,
+            limit_price=2.0,
+            decision_type=decision_type,
+            status=status,
+            created_at=created_at or datetime.now(),
+        )
+    )
+
+
+@pytest.fixture
+def store() -> FakeOrderStore:
+    return FakeOrderStore([
+        make_record("O-1", "AAPL", -2, "open"),
+        make_record("O-2", "US.AAPL", 1, "close", OrderStatus.FILLED),
+        make_record("O-3", "AAPL", -3, "open", OrderStatus.CANCELLED),
+        make_record("O-4", "TSLA", -1, "roll"),
+        make_record("O-5", "AAPL", -4, "open", created_at=datetime.now() - timedelta(days=2)),
+    ])
+
+
+@pytest.fixture
+def config() -> DailyLimitsConfig:
+    return DailyLimitsConfig.from_dict({})
+
+
+# ============================================================
+# Tests
+# ============================================================
+
+
+class TestDailyTradeTracker:
+    """增量台账"""
+
+    def test_daily_stats_from_store(self, store, config):
+        tracker = DailyTradeTracker(store, config)
+        stats = tracker.get_daily_stats("AAPL")
+
+        assert stats.underlying == "AAPL"
+        assert stats.order_count == 2
+        assert stats.open_quantity == 2
+        assert stats.close_quantity == 1
+        assert stats.total_quantity == 3
+        assert stats.total_value == pytest.approx(600.0)
+        # 全账户总市值包含所有当日订单（含已取消）
+        assert tracker.get_total_daily_value() == pytest.approx(1400.0)
+
+    def test_filled_only(self, store):
+        tracker = DailyTradeTracker(store, DailyLimitsConfig.from_dict({"include_pending_orders": False}))
+        stats = tracker.get_daily_stats("AAPL")
+
+        assert stats.order_count == 1
+        assert stats.close_quantity == 1
+        assert tracker.get_total_daily_value() == pytest.approx(200.0)
+
+    def test_store_scanned_once_per_day(self, store, config):
+        tracker = DailyTradeTracker(store, config)
+        for _ in range(50):
+            tracker.check_limits("AAPL", quantity=-1, value=100.0, nlv=100000.0, decision_type="open")
+        tracker.get_daily_stats("TSLA")
+
+        assert store.scans == 1
+
+    def test_record_order_updates_incrementally(self, store, config):
+        tracker = DailyTradeTracker(store, config)
+        tracker.get_daily_stats("AAPL")
+
+        record = make_record("O-6", "AAPL", -2, "open")
+        store.save(record)
+        tracker.record_order(record)
+        assert tracker.get_daily_stats("AAPL").open_quantity == 4
+
+        # 状态变化：取消后不再计入单标的统计
+        record.order.status = OrderStatus.CANCELLED
+        store.save(record)
+        tracker.record_order(record)
+        assert tracker.get_daily_stats("AAPL").open_quantity == 2
+        assert store.scans == 1
+
+    def test_matches_full_rebuild(self, store, config):
+        tracker = DailyTradeTracker(store, config)
+        tracker.get_daily_stats("AAPL")
+
+        for i, status in enumerate([OrderStatus.SUBMITTED, OrderStatus.FILLED, OrderStatus.REJECTED]):
+            record = make_record(f"N-{i}", "TSLA", -1, "open", status)
+            store.save(record)
+            tracker.record_order(record)
+
+        rebuilt = DailyTradeTracker(store, config)
+        assert tracker.get_daily_stats("TSLA") == rebuilt.get_daily_stats("TSLA")
+        assert tracker.get_total_daily_value() == pytest.approx(rebuilt.get_total_daily_value())
+
+    def test_check_limits_sees_recorded_orders(self, store, config):
+        tracker = DailyTradeTracker(store, config)
+        allowed, _ = tracker.check_limits("AAPL", -3, 600.0, 100000.0, "open")
+        assert allowed
+
+        record = make_record("O-6", "AAPL", -3, "open")
+        store.save(record)
+        tracker.record_order(record)
+
+        allowed, reason = tracker.check_limits("AAPL", -1, 200.0, 100000.0, "open")
+        assert not allowed
+        assert "OPEN" in reason
+
+
+class TestLedgerPersistence:
+    """台账持久化"""
+
+    def test_restore_without_scanning(self, store, config, tmp_path):
+        tracker = DailyTradeTracker(store, config, state_dir=tmp_path)
+        tracker.get_daily_stats("AAPL")
+        record = make_record("O-6", "AAPL", -1, "open")
+        store.save(record)
+        tracker.record_order(record)
+
+        restored_store = FakeOrderStore(list(store.records.values()))
+        restored = DailyTradeTracker(restored_store, config, state_dir=tmp_path)
+
+        assert restored.get_daily_stats("AAPL") == tracker.get_daily_stats("AAPL")
+        assert restored_store.scans == 0
+
+    def test_invalidate_cache_rebuilds(self, store, config, tmp_path):
+        tracker = DailyTradeTracker(store, config, state_dir=tmp_path)
+        tracker.get_daily_stats("AAPL")
+
+        # 绕过监听器写入的订单
+        store.save(make_record("O-6", "AAPL", -1, "open"))
+        assert tracker.get_daily_stats("AAPL").open_quantity == 2
+
+        tracker.invalidate_cache()
+        assert tracker.get_daily_stats("AAPL").open_quantity == 3
+        assert store.scans == 2
+
+    def test_sync_only_process_appends_to_ledger(self, store, tmp_path):
+        """进程 1 提交，进程 2 只同步状态，进程 3 重启后看到成交"""
+        config = DailyLimitsConfig.from_dict({"include_pending_orders": False})
+
+        # 进程 1: 加载台账并提交订单
+        submitter = DailyTradeTracker(store, config, state_dir=tmp_path)
+        baseline = submitter.get_daily_stats("AAPL").total_quantity
+        record = make_record("O-6", "AAPL", -2, "open")
+        store.save(record)
+        submitter.record_order(record)
+
+        # 进程 2: 未加载台账，只同步订单状态
+        syncer = DailyTradeTracker(store, config, state_dir=tmp_path)
+        filled = make_record("O-6", "AAPL", -2, "open", OrderStatus.FILLED)
+        store.save(filled)
+        syncer.record_order(filled)
+
+        # 进程 3: 从台账文件恢复，无需扫描订单存储
+        restored_store = FakeOrderStore(list(store.records.values()))
+        restored = DailyTradeTracker(restored_store, config, state_dir=tmp_path)
+        assert restored.get_daily_stats("AAPL").total_quantity == baseline + 2
+        assert restored_store.scans == 0
+
+    def test_stale_ledger_rebuilt_from_store(self, store, tmp_path):
+        """台账文件落后于订单存储（绕过监听器写入）时重建"""
+        config = DailyLimitsConfig.from_dict({"include_pending_orders": False})
+        tracker = DailyTradeTracker(store, config, state_dir=tmp_path)
+        tracker.get_daily_stats("AAPL")
+        record = make_record("O-6", "AAPL", -2, "open")
+        store.save(record)
+        tracker.record_order(record)
+
+        # 其他进程直接写入订单存储，未通知任何 tracker
+        store.save(make_record("O-6", "AAPL", -2, "open", OrderStatus.FILLED))
+
+        restored_store = FakeOrderStore(list(store.records.values()))
+        restored = DailyTradeTracker(restored_store, config, state_dir=tmp_path)
+        rebuilt = DailyTradeTracker(FakeOrderStore(list(store.records.values())), config)
+
+        assert restored.get_daily_stats("AAPL") == rebuilt.get_daily_stats("AAPL")
+        assert restored.get_daily_stats("AAPL").total_quantity == 3
+        assert restored_store.scans == 1
+
+        # 重建后的快照可以直接恢复
+        again_store = FakeOrderStore(list(store.records.values()))
+        again = DailyTradeTracker(again_store, config, state_dir=tmp_path)
+        assert again.get_daily_stats("AAPL") == rebuilt.get_daily_stats("AAPL")
+        assert again_store.scans == 0
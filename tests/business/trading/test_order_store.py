@@ -0,0 +1,180 @@
+"""Order Store Unit Tests.
+
+测试 SQLiteOrderStore 与 JSON OrderStore 的查询结果一致，以及 JSON -> SQLite 迁移。
+
+Usage:
+    pytest tests/business/trading/test_order_store.py -v
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.business.trading.config.order_config import OrderConfig
+from src.business.trading.models.order import (
+    AssetClass,
+    OrderRecord,
+    OrderRequest,
+    OrderStatus,
+)
+from src.business.trading.order.sqlite_store import SQLiteOrderStore
+from src.business.trading.order.store import OrderStore, create_order_store
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+
+def make_record(
+    order_id: str,
+    underlying: str = "AAPL",
+    status: OrderStatus = OrderStatus.SUBMITTED,
+    created_at: datetime | None = None,
+    decision_id: str = "DEC-001",
+) -> OrderRecord:
+    """创建订单记录"""
+    return OrderRecord(
+        order=OrderRequest(
+            order_id=order_id,
+            decision_id=decision_id,
+            symbol=f"{underlying} 250221P00200000",
+            underlying=underlying,
+            asset_class=AssetClass.OPTION,
+            quantity=-1,
+            limit_price=2.5,
+            status=status,
+            decision_type="open",
+            created_at=created_at or datetime.now(),
+        )
+    )
+
+
+@pytest.fixture
+def config(tmp_path) -> OrderConfig:
+    return OrderConfig.from_dict({"storage_path": str(tmp_path / "orders")})
+
+
+@pytest.fixture
+def records() -> list[OrderRecord]:
+    now = datetime.now()
+    return [
+        make_record("O-1", "AAPL", OrderStatus.SUBMITTED, now),
+        make_record("O-2", "US.AAPL", OrderStatus.FILLED, now, decision_id="DEC-002"),
+        make_record("O-3", "AAPL", OrderStatus.CANCELLED, now),
+        make_record("O-4", "TSLA", OrderStatus.PARTIAL_FILLED, now),
+        make_record("O-5", "AAPL", OrderStatus.FILLED, now - timedelta(days=3)),
+    ]
+
+
+def ids(records: list[OrderRecord]) -> set[str]:
+    return {r.order.order_id for r in records}
+
+
+# ============================================================
+# Tests
+# ============================================================
+
+
+class TestSQLiteOrderStore:
+    """SQLiteOrderStore 与 OrderStore 行为一致"""
+
+    @pytest.fixture
+    def stores(self, config, tmp_path, records):
+        json_store = OrderStore(config)
+        sqlite_store = SQLiteOrderStore(config, db_path=tmp_path / "orders.db")
+        for record in records:
+            json_store.save(record)
+            sqlite_store.save(record)
+        yield json_store, sqlite_store
+        sqlite_store.close()
+
+    def test_get(self, stores):
+        json_store, sqlite_store = stores
+        record = sqlite_store.get("O-2")
+        assert record is not None
+        assert record.to_dict() == json_store.get("O-2").to_dict()
+        assert sqlite_store.get("missing") is None
+
+    def test_save_overwrites(self, stores):
+        _, sqlite_store = stores
+        record = sqlite_store.get("O-1")
+        record.order.status = OrderStatus.FILLED
+        sqlite_store.save(record)
+
+        assert sqlite_store.get("O-1").order.status == OrderStatus.FILLED
+        assert "O-1" not in ids(sqlite_store.get_by_status(OrderStatus.SUBMITTED))
+
+    @pytest.mark.parametrize(
+        "status", [OrderStatus.SUBMITTED, OrderStatus.FILLED, OrderStatus.REJECTED]
+    )
+    def test_get_by_status(self, stores, status):
+        json_store, sqlite_store = stores
+        assert ids(sqlite_store.get_by_status(status)) == ids(json_store.get_by_status(status))
+
+    def test_get_open_orders(self, stores):
+        json_store, sqlite_store = stores
+        assert ids(sqlite_store.get_open_orders()) == ids(json_store.get_open_orders()) == {"O-1", "O-4"}
+
+    def test_get_by_decision(self, stores):
+        json_store, sqlite_store = stores
+        assert ids(sqlite_store.get_by_decision("DEC-002")) == ids(json_store.get_by_decision("DEC-002")) == {"O-2"}
+
+    @pytest.mark.parametrize("days", [1, 7])
+    def test_get_recent(self, stores, days):
+        json_store, sqlite_store = stores
+        recent = sqlite_store.get_recent(days)
+        assert ids(recent) == ids(json_store.get_recent(days))
+        assert [r.order.created_at for r in recent] == sorted(
+            (r.order.created_at for r in recent), reverse=True
+        )
+
+    @pytest.mark.parametrize("include_pending", [True, False])
+    @pytest.mark.parametrize("underlying", ["AAPL", "US.AAPL", "tsla"])
+    def test_get_daily_orders_by_underlying(self, stores, underlying, include_pending):
+        json_store, sqlite_store = stores
+        kwargs = dict(underlying=underlying, target_date=date.today(), include_pending=include_pending)
+        assert ids(sqlite_store.get_daily_orders_by_underlying(**kwargs)) == ids(
+            json_store.get_daily_orders_by_underlying(**kwargs)
+        )
+
+    @pytest.mark.parametrize("days_ago", [0, 3, 5])
+    def test_get_daily_statuses(self, stores, records, days_ago):
+        json_store, sqlite_store = stores
+        target_date = date.today() - timedelta(days=days_ago)
+        expected = {
+            r.order.order_id: r.order.status
+            for r in records
+            if r.order.created_at.date() == target_date
+        }
+        assert sqlite_store.get_daily_statuses(target_date) == expected
+        assert json_store.get_daily_statuses(target_date) == expected
+
+    def test_daily_orders_by_underlying_filters(self, stores):
+        _, sqlite_store = stores
+        orders = sqlite_store.get_daily_orders_by_underlying("AAPL", date.today())
+        assert ids(orders) == {"O-1", "O-2"}
+
+
+class TestMigration:
+    """JSON -> SQLite 迁移"""
+
+    def test_import_json(self, config, tmp_path, records):
+        json_store = OrderStore(config)
+        for record in records:
+            json_store.save(record)
+
+        store = SQLiteOrderStore(config, db_path=tmp_path / "migrated.db")
+        assert store.import_json() == len(records)
+        # 重复导入不产生重复记录
+        assert store.import_json() == len(records)
+        assert ids(store.get_recent(30)) == ids(records)
+        store.close()
+
+    def test_create_order_store(self, config):
+        assert type(create_order_store(config)) is OrderStore
+
+        config.storage_format = "sqlite"
+        store = create_order_store(config)
+        assert isinstance(store, SQLiteOrderStore)
+        store.close()
@@ -0,0 +1,131 @@
+"""Tests for the market reference data TTL cache."""
+
+import pytest
+
+from src.data.reference import MarketReferenceCache, YFinanceReferenceBackend
+
+
+class StubBackend:
+    """Local reference backend that records every request."""
+
+    def __init__(self, betas=None, price=450.0, fx=7.8):
+        self.betas = betas or {}
+        self.price = price
+        self.fx = fx
+        self.beta_batches: list[list[str]] = []
+        self.price_calls = 0
+        self.fx_calls = 0
+
+    def fetch_betas(self, symbols):
+        self.beta_batches.append(list(symbols))
+        return {s: self.betas.get(s) for s in symbols}
+
+    def fetch_price(self, symbol):
+        self.price_calls += 1
+        return self.price
+
+    def fetch_fx_rate(self, from_currency, to_currency):
+        self.fx_calls += 1
+        return self.fx
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestMarketReferenceCache:
+    def test_prefetch_batches_missing_betas_once(self, clock):
+        backend = StubBackend(betas={"AAPL": 1.2, "NVDA": 1.8})
+        cache = MarketReferenceCache(backend, clock=clock)
+
+        result = cache.prefetch_betas(["aapl", "NVDA", "AAPL", "XYZ"])
+        assert result == {"AAPL": 1.2, "NVDA": 1.8, "XYZ": None}
+        assert backend.beta_batches == [["AAPL", "NVDA", "XYZ"]]
+
+        # 缓存命中 (包括无 beta 的 symbol) → 不再请求
+        assert cache.get_beta("NVDA") == 1.8
+        assert cache.get_beta("XYZ") is None
+        cache.prefetch_betas(["AAPL", "MSFT"])
+        assert backend.beta_batches[-1] == ["MSFT"]
+
+    def test_beta_expires_after_ttl(self, clock):
+        backend = StubBackend(betas={"AAPL": 1.2})
+        cache = MarketReferenceCache(backend, beta_ttl=86400, clock=clock)
+
+        cache.get_beta("AAPL")
+        clock.now += 86399
+        cache.get_beta("AAPL")
+        assert len(backend.beta_batches) == 1
+
+        clock.now += 2
+        cache.get_beta("AAPL")
+        assert len(backend.beta_batches) == 2
+
+    def test_price_and_fx_short_ttl(self, clock):
+        backend = StubBackend()
+        cache = MarketReferenceCache(backend, price_ttl=15, fx_ttl=60, clock=clock)
+
+        assert cache.get_price("SPY") == 450.0
+        assert cache.get_fx_rate("USD", "HKD") == 7.8
+        assert cache.get_fx_rate("USD", "usd") == 1.0
+        clock.now += 10
+        cache.get_price("SPY")
+        cache.get_fx_rate("USD", "HKD")
+        assert (backend.price_calls, backend.fx_calls) == (1, 1)
+
+        clock.now += 10
+        cache.get_price("SPY")
+        cache.get_fx_rate("USD", "HKD")
+        assert (backend.price_calls, backend.fx_calls) == (2, 1)
+
+    def test_backend_failure_is_not_cached(self, clock):
+        backend = StubBackend()
+        calls = []
+
+        def failing(symbols):
+            calls.append(symbols)
+            raise ConnectionError("offline")
+
+        backend.fetch_betas = failing
+        cache = MarketReferenceCache(backend, clock=clock)
+
+        assert cache.get_beta("AAPL") is None
+        assert cache.get_beta("AAPL") is None
+        assert len(calls) == 2
+
+    def test_failed_symbols_are_not_cached(self, clock):
+        class PartialBackend(StubBackend):
+            def fetch_betas(self, symbols):
+                # 请求失败的 symbol 被省略，XYZ 是真正没有 beta
+                betas = super().fetch_betas(symbols)
+                return {s: beta for s, beta in betas.items() if s != "NVDA"}
+
+        backend = PartialBackend(betas={"AAPL": 1.2})
+        cache = MarketReferenceCache(backend, clock=clock)
+
+        result = cache.prefetch_betas(["AAPL", "NVDA", "XYZ"])
+        assert result == {"AAPL": 1.2, "NVDA": None, "XYZ": None}
+        cache.prefetch_betas(["AAPL", "NVDA", "XYZ"])
+        assert backend.beta_batches == [["AAPL", "NVDA", "XYZ"], ["NVDA"]]
+
+    def test_yfinance_backend_omits_failed_symbols(self, monkeypatch):
+        yf = pytest.importorskip("yfinance")
+
+        class FakeTicker:
+            def __init__(self, symbol):
+                if symbol == "NVDA":
+                    raise ConnectionError("offline")
+                self.info = {"beta": 1.2} if symbol == "AAPL" else {}
+
+        monkeypatch.setattr(yf, "Ticker", FakeTicker)
+        betas = YFinanceReferenceBackend().fetch_betas(["AAPL", "NVDA", "XYZ"])
+        assert betas == {"AAPL": 1.2, "XYZ": None}
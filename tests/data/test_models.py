@@ -9,6 +9,7 @@ from src.data.models import (
     KlineBar,
     MacroData,
     OptionChain,
+    OptionChainFrame,
     OptionQuote,
     StockQuote,
 )
@@ -195,6 +196,86 @@ class TestOptionModels:
 
         assert len(chain.calls) == 1
         assert len(chain.puts) == 1
+        assert chain.find_quote(OptionType.CALL, 150, date(2024, 1, 20)) is call
+        assert chain.find_quote(OptionType.PUT, 150.0, date(2024, 1, 20)) is put
+        assert chain.find_quote(OptionType.PUT, 155.0, date(2024, 1, 20)) is None
+
+
+class TestOptionChainFrame:
+    """Tests for the columnar OptionChainFrame model."""
+
+    @staticmethod
+    def _chain() -> OptionChain:
+        def quote(symbol, option_type, strike, expiry, delta, oi):
+            return OptionQuote(
+                contract=OptionContract(
+                    symbol=symbol,
+                    underlying="AAPL",
+                    option_type=option_type,
+                    strike_price=strike,
+                    expiry_date=expiry,
+                ),
+                timestamp=datetime(2024, 1, 2),
+                last_price=2.0,
+                bid=1.9,
+                ask=2.1,
+                volume=10,
+                open_interest=oi,
+                iv=0.3,
+                greeks=Greeks(delta=delta, gamma=0.01),
+                close=2.0,
+            )
+
+        return OptionChain(
+            underlying="AAPL",
+            timestamp=datetime(2024, 1, 2),
+            expiry_dates=[date(2024, 2, 16), date(2024, 3, 15)],
+            calls=[quote("C1", OptionType.CALL, 160.0, date(2024, 2, 16), 0.3, 500)],
+            puts=[
+                quote("P1", OptionType.PUT, 140.0, date(2024, 2, 16), -0.2, None),
+                quote("P2", OptionType.PUT, 130.0, date(2024, 3, 15), None, 200),
+            ],
+        )
+
+    def test_round_trip_from_chain(self):
+        """Frame built from a chain materializes the same quotes."""
+        chain = self._chain()
+        frame = OptionChainFrame.from_chain(chain)
+
+        assert len(frame) == 3
+        assert frame.expiry_dates == [date(2024, 2, 16), date(2024, 3, 15)]
+
+        rebuilt = frame.to_option_chain()
+        assert rebuilt.calls == chain.calls
+        assert rebuilt.puts == chain.puts
+
+    def test_nan_becomes_none(self):
+        """Missing values are NaN in columns and None on quotes."""
+        frame = OptionChainFrame.from_chain(self._chain())
+
+        quote = frame.to_quote(0)
+        assert quote.open_interest is None
+        assert quote.greeks.rho is None
+        assert frame.to_quote(1).greeks.delta is None
+
+    def test_filter_and_find(self):
+        """Masks select rows; find locates a contract by key."""
+        frame = OptionChainFrame.from_chain(self._chain())
+
+        near = frame.filter_by_expiry_range(expiry_end=date(2024, 2, 29))
+        assert len(near) == 2
+        assert near.dte(date(2024, 1, 2)).tolist() == [45, 45]
+        assert [q.contract.symbol for q in near.to_quotes()] == ["P1", "C1"]
+
+        assert frame.find(date(2024, 3, 15), 130.0, is_call=False) == 1
+        assert frame.find(date(2024, 3, 15), 130.0, is_call=True) is None
+
+    def test_generated_symbol(self):
+        """Without explicit symbols the OCC-style symbol is generated."""
+        frame = OptionChainFrame.from_chain(self._chain())
+        frame.symbols = None
+
+        assert frame.option_symbol(2) == "AAPL240216C00160000"
 
 
 class TestFundamental:
@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from src.engine.models import BSParams
@@ -23,6 +24,13 @@ from src.engine.bs import (
     calc_bs_theta,
     calc_bs_vega,
     calc_bs_rho,
+    calc_bs_greeks_array,
+    calc_bs_params_array,
+    calc_bs_price_array,
+    calc_d1_array,
+    calc_d2_array,
+    calc_d3_array,
+    calc_n_array,
 )
 
 
@@ -500,3 +508,94 @@ class TestBSParamsFunctions:
         vega2 = calc_bs_vega(new_params)
         assert vega1 is not None
         assert vega2 is not None
+
+
+class TestBSVectorized:
+    """Tests for array-native B-S calculations."""
+
+    @pytest.fixture
+    def chain(self):
+        """A small mixed call/put chain with one invalid row."""
+        return {
+            "spot": 100.0,
+            "strike": [80.0, 95.0, 100.0, 105.0, 120.0, 100.0],
+            "rate": 0.05,
+            "vol": [0.35, 0.25, 0.20, 0.22, 0.30, 0.0],
+            "t": [0.1, 0.25, 1.0, 0.5, 2.0, 0.5],
+            "is_call": [False, False, True, True, False, True],
+        }
+
+    def _scalar_params(self, chain):
+        n = len(chain["strike"])
+        return [
+            BSParams(
+                spot_price=chain["spot"],
+                strike_price=chain["strike"][i],
+                risk_free_rate=chain["rate"],
+                volatility=chain["vol"][i],
+                time_to_expiry=chain["t"][i],
+                is_call=chain["is_call"][i],
+            )
+            for i in range(n)
+        ]
+
+    def test_d_values_match_scalar(self, chain):
+        """d1/d2/d3 arrays match scalar functions; invalid rows are NaN."""
+        args = (chain["spot"], chain["strike"], chain["rate"], chain["vol"], chain["t"])
+        d1 = calc_d1_array(*args)
+        d2 = calc_d2_array(*args)
+        d3 = calc_d3_array(*args)
+        for i, params in enumerate(self._scalar_params(chain)):
+            expected = calc_d1(params)
+            if expected is None:
+                assert math.isnan(d1[i]) and math.isnan(d2[i]) and math.isnan(d3[i])
+                continue
+            assert d1[i] == pytest.approx(expected, rel=1e-12)
+            assert d2[i] == pytest.approx(calc_d2(params), rel=1e-12)
+            assert d3[i] == pytest.approx(calc_d3(params), rel=1e-12)
+
+    def test_n_array_matches_scalar(self):
+        """N(d) array matches scalar calc_n."""
+        d = np.array([-3.0, -0.5, 0.0, 0.35, 2.5])
+        result = calc_n_array(d)
+        for i, value in enumerate(d):
+            assert result[i] == pytest.approx(calc_n(value), abs=1e-15)
+
+    def test_price_matches_scalar(self, chain):
+        """Mixed call/put prices match calc_bs_price row by row."""
+        prices = calc_bs_price_array(**chain)
+        for i, params in enumerate(self._scalar_params(chain)):
+            expected = calc_bs_price(params)
+            if expected is None:
+                assert math.isnan(prices[i])
+            else:
+                assert prices[i] == pytest.approx(expected, rel=1e-10)
+
+    def test_greeks_match_scalar(self, chain):
+        """All Greeks match the scalar functions with the same units."""
+        greeks = calc_bs_greeks_array(**chain)
+        for i, params in enumerate(self._scalar_params(chain)):
+            expected = calc_bs_greeks(params)
+            for name in ("delta", "gamma", "theta", "vega", "rho"):
+                if expected[name] is None:
+                    assert math.isnan(greeks[name][i])
+                else:
+                    assert greeks[name][i] == pytest.approx(expected[name], rel=1e-10)
+
+    def test_params_array_put_call_parity_terms(self, chain):
+        """N(d) + N(-d) = 1 for every valid row."""
+        args = (chain["spot"], chain["strike"], chain["rate"], chain["vol"], chain["t"])
+        result = calc_bs_params_array(*args)
+        valid = np.isfinite(result["d1"])
+        assert valid.sum() == 5
+        np.testing.assert_allclose(
+            (result["n_d2"] + result["n_minus_d2"])[valid], 1.0, rtol=1e-12
+        )
+
+    def test_broadcasting_scalar_inputs(self):
+        """Scalar inputs broadcast against array columns."""
+        strikes = np.linspace(80, 120, 41)
+        prices = calc_bs_price_array(100.0, strikes, 0.05, 0.2, 0.5, is_call=True)
+        assert prices.shape == (41,)
+        # Call prices decrease with strike
+        assert np.all(np.diff(prices) < 0)
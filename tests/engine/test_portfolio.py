@@ -493,3 +493,43 @@ class TestCompositeMetrics:
         # dte_risk = sqrt(1/1) = 1.0
         # PREI = (0.4*0.5 + 0.3*0.5 + 0.3*1.0) * 100 = 65
         assert 60 <= prei <= 70
+
+
+class TestBetaWeightedDeltaLiveMode:
+    """Live mode reads beta/SPY from the process-wide reference cache."""
+
+    @pytest.fixture
+    def backend(self):
+        from src.data.reference import MarketReferenceCache, set_market_reference_cache
+
+        class Backend:
+            def __init__(self):
+                self.beta_batches = []
+                self.price_calls = 0
+
+            def fetch_betas(self, symbols):
+                self.beta_batches.append(list(symbols))
+                return {"NVDA": 1.8, "AAPL": 1.2}
+
+            def fetch_price(self, symbol):
+                self.price_calls += 1
+                return 450.0
+
+            def fetch_fx_rate(self, from_currency, to_currency):
+                return 1.0
+
+        backend = Backend()
+        set_market_reference_cache(MarketReferenceCache(backend))
+        yield backend
+        set_market_reference_cache(None)
+
+    def test_betas_fetched_in_one_batch_and_reused(self, backend):
+        positions = [
+            Position(symbol="NVDA", quantity=1, greeks=Greeks(delta=0.5), underlying_price=500.0),
+            Position(symbol="AAPL", quantity=2, greeks=Greeks(delta=0.6), underlying_price=150.0),
+        ]
+
+        assert calc_beta_weighted_delta(positions) == pytest.approx(148.0)
+        assert calc_beta_weighted_delta(positions) == pytest.approx(148.0)
+        assert backend.beta_batches == [["NVDA", "AAPL"]]
+        assert backend.price_calls == 1
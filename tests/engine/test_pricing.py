@@ -5,6 +5,7 @@ import math
 import pytest
 
 from src.engine.pricing import (
+    ChainPricingInput,
     CoveredCallPricer,
     LongCallPricer,
     LongPutPricer,
@@ -16,6 +17,7 @@ from src.engine.pricing import (
     ShortStranglePricer,
     PricingMetrics,
     PricingParams,
+    calc_short_option_chain_metrics,
 )
 
 
@@ -1005,3 +1007,128 @@ class TestLongCallPricer:
         assert metrics.sas is None
         assert metrics.premium_rate is None
         assert metrics.theta_margin_ratio is None
+
+
+class TestChainPricing:
+    """Tests for vectorized chain-level short option pricing."""
+
+    ROWS = [
+        # (is_call, kwargs)
+        (False, dict(spot_price=580, strike_price=550, premium=6.5, volatility=0.20,
+                     time_to_expiry=30 / 365, hv=0.18, dte=30,
+                     gamma=0.004, theta=-0.15, vega=0.45)),
+        (False, dict(spot_price=580, strike_price=520, premium=2.1, volatility=0.26,
+                     time_to_expiry=45 / 365, hv=None, dte=45,
+                     gamma=None, theta=None, vega=None, margin_per_share=60.0)),
+        (True, dict(spot_price=333.1, strike_price=350, premium=8.0, volatility=0.30,
+                    time_to_expiry=21 / 365, hv=0.25, dte=21,
+                    gamma=0.01, theta=-0.2, vega=0.3)),
+        (True, dict(spot_price=100, strike_price=140, premium=0.01, volatility=0.15,
+                    time_to_expiry=7 / 365, hv=0.1, dte=None,
+                    gamma=0.0, theta=-0.001, vega=0.01)),
+        (False, dict(spot_price=0, strike_price=90, premium=1.0, volatility=0.3,
+                     time_to_expiry=30 / 365, hv=0.2, dte=30)),
+    ]
+
+    @pytest.fixture
+    def chain_input(self):
+        keys = [
+            "spot_price", "strike_price", "premium", "volatility", "time_to_expiry",
+            "hv", "dte", "gamma", "theta", "vega", "margin_per_share",
+        ]
+        return ChainPricingInput.from_columns(
+            is_call=[is_call for is_call, _ in self.ROWS],
+            **{k: [row.get(k) for _, row in self.ROWS] for k in keys},
+        )
+
+    def test_matches_scalar_pricers(self, chain_input):
+        """Every row matches ShortPutPricer/ShortCallPricer.calc_metrics()."""
+        result = calc_short_option_chain_metrics(chain_input)
+        assert len(result) == len(self.ROWS)
+
+        for i, (is_call, kwargs) in enumerate(self.ROWS):
+            pricer_cls = ShortCallPricer if is_call else ShortPutPricer
+            expected = pricer_cls(**kwargs).calc_metrics()
+            actual = result.to_pricing_metrics(i)
+            for name, value in vars(expected).items():
+                got = getattr(actual, name)
+                if value is None:
+                    assert got is None, f"row {i} {name}"
+                else:
+                    assert got == pytest.approx(value, rel=1e-9, abs=1e-12), f"row {i} {name}"
+
+    def test_scalar_broadcast(self):
+        """Scalar spot/vol broadcast across a strike column."""
+        inputs = ChainPricingInput.from_columns(
+            spot_price=100.0,
+            strike_price=[85.0, 90.0, 95.0],
+            premium=[0.5, 1.0, 2.0],
+            volatility=0.25,
+            time_to_expiry=30 / 365,
+            is_call=False,
+            dte=30,
+        )
+        result = calc_short_option_chain_metrics(inputs)
+        assert len(inputs) == 3
+        # Deeper OTM puts have higher win probability
+        assert result.win_probability[0] > result.win_probability[1] > result.win_probability[2]
+
+
+class TestPricerMemoization:
+    """Tests for per-pricer metric and N(d) memoization."""
+
+    @pytest.fixture
+    def pricer(self):
+        return ShortPutPricer(
+            spot_price=580,
+            strike_price=550,
+            premium=6.5,
+            volatility=0.20,
+            time_to_expiry=30 / 365,
+            hv=0.18,
+            dte=30,
+            gamma=0.004,
+            theta=-0.15,
+            vega=0.45,
+        )
+
+    def test_metrics_computed_once(self, pricer):
+        """calc_metrics reuses expected return / variance across metrics."""
+        first = pricer.calc_metrics()
+        info = pricer.cache_info()
+        assert info.metric_hits > 0
+        # expected_return, variance, std, win_probability, sharpe
+        assert info.metric_misses == 5
+
+        second = pricer.calc_metrics()
+        assert second == first
+        assert pricer.cache_info().metric_misses == 5
+
+    def test_n_values_computed_once(self, pricer):
+        """Each distinct N(±d_i) is evaluated once per instance."""
+        pricer.calc_metrics()
+        pricer.calc_expected_loss_if_exercised()
+        pricer.calc_exercise_probability()
+        info = pricer.cache_info()
+        # N(-d1_hv), N(-d2_hv), N(-d1), N(-d2), N(-d3), N(d2)
+        assert info.n_misses == 6
+        assert info.n_hits >= 3
+
+    def test_margin_change_invalidates_sharpe(self, pricer):
+        """Setting a different margin recomputes margin-dependent metrics."""
+        sharpe_reg_t = pricer.calc_sharpe_ratio()
+        pricer._set_margin_per_share(100.0)
+        sharpe_real = pricer.calc_sharpe_ratio()
+        assert sharpe_real != sharpe_reg_t
+
+        fresh = ShortPutPricer(
+            spot_price=580,
+            strike_price=550,
+            premium=6.5,
+            volatility=0.20,
+            time_to_expiry=30 / 365,
+            hv=0.18,
+            dte=30,
+            margin_per_share=100.0,
+        )
+        assert sharpe_real == pytest.approx(fresh.calc_sharpe_ratio())
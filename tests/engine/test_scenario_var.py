@@ -0,0 +1,212 @@
+"""Tests for full-revaluation scenario VaR / Expected Shortfall."""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.data.models.account import AccountPosition, AssetType, ConsolidatedPortfolio
+from src.data.models.enums import Market
+from src.engine.bs.core import calc_bs_price
+from src.engine.models import RiskScenarios
+from src.engine.models.bs_params import BSParams
+from src.engine.portfolio import (
+    build_historical_scenarios,
+    build_monte_carlo_scenarios,
+    calc_scenario_var,
+)
+from src.engine.portfolio.scenario_var import calc_var_es
+
+START = date(2024, 1, 1)
+
+
+def _series(values: list[float], skip: set[int] | None = None) -> list[tuple[date, float]]:
+    return [
+        (START + timedelta(days=i), v)
+        for i, v in enumerate(values)
+        if not skip or i not in skip
+    ]
+
+
+def _stock(symbol: str, qty: float, price: float) -> AccountPosition:
+    return AccountPosition(
+        symbol=symbol,
+        asset_type=AssetType.STOCK,
+        market=Market.US,
+        quantity=qty,
+        avg_cost=price,
+        market_value=qty * price,
+        unrealized_pnl=0.0,
+        currency="USD",
+        underlying_price=price,
+    )
+
+
+def _option(underlying: str, qty: float, strike: float, option_type: str, **kwargs) -> AccountPosition:
+    fields = {
+        "expiry": (datetime.now() + timedelta(days=60)).strftime("%Y-%m-%d"),
+        "iv": 0.30,
+        "underlying_price": 100.0,
+        **kwargs,
+    }
+    return AccountPosition(
+        symbol=f"{underlying}_{option_type}_{strike}",
+        asset_type=AssetType.OPTION,
+        market=Market.US,
+        quantity=qty,
+        avg_cost=1.0,
+        market_value=0.0,
+        unrealized_pnl=0.0,
+        currency="USD",
+        underlying=underlying,
+        strike=strike,
+        option_type=option_type,
+        contract_multiplier=100,
+        **fields,
+    )
+
+
+def _portfolio(positions: list[AccountPosition]) -> ConsolidatedPortfolio:
+    return ConsolidatedPortfolio(
+        positions=positions,
+        cash_balances=[],
+        total_value_usd=100_000.0,
+        total_unrealized_pnl_usd=0.0,
+        by_broker={},
+    )
+
+
+def _scenarios(
+    spot_returns: list[float], iv_changes: list[float] | None = None, horizon_days: int = 1
+) -> RiskScenarios:
+    spot = np.array(spot_returns)[:, None]
+    iv = np.zeros_like(spot) if iv_changes is None else np.array(iv_changes)[:, None]
+    return RiskScenarios(
+        underlyings=["AAPL"], spot_returns=spot, iv_changes=iv, horizon_days=horizon_days
+    )
+
+
+@pytest.fixture
+def history() -> RiskScenarios:
+    rng = np.random.default_rng(3)
+    aapl = 100 * np.exp(np.cumsum(0.02 * rng.standard_normal(120)))
+    msft = 300 * np.exp(np.cumsum(0.015 * rng.standard_normal(120)))
+    iv = 0.3 * np.exp(np.cumsum(0.03 * rng.standard_normal(120)))
+    return build_historical_scenarios(
+        {"AAPL": _series(list(aapl)), "MSFT": _series(list(msft), skip={10, 11})},
+        {"AAPL": _series(list(iv))},
+    )
+
+
+class TestScenarioBuilders:
+    """Tests for historical and Monte Carlo scenario construction."""
+
+    def test_historical_alignment(self, history):
+        # MSFT is missing two days: 120 - 2 aligned closes → 117 one-day returns
+        assert history.underlyings == ["AAPL", "MSFT"]
+        assert history.spot_returns.shape == (117, 2)
+        assert history.iv_changes.shape == (117, 2)
+        # No IV history for MSFT → zero IV change
+        assert not history.iv_changes[:, 1].any()
+        assert history.iv_changes[:, 0].any()
+
+    def test_historical_returns_are_log_returns(self):
+        closes = [100.0 * 1.01**i for i in range(30)]
+        scenarios = build_historical_scenarios({"aapl": _series(closes)}, horizon_days=5)
+
+        assert scenarios.underlyings == ["AAPL"]
+        assert scenarios.spot_returns.shape == (25, 1)
+        np.testing.assert_allclose(scenarios.spot_returns, 5 * np.log(1.01))
+
+    def test_insufficient_history(self):
+        assert build_historical_scenarios({"AAPL": _series([100.0] * 10)}) is None
+        assert build_historical_scenarios({}) is None
+
+    def test_monte_carlo_preserves_moments(self, history):
+        mc = build_monte_carlo_scenarios(history, n_scenarios=20_000, seed=1)
+
+        assert mc.method == "monte_carlo"
+        assert mc.spot_returns.shape == (20_000, 2)
+        np.testing.assert_allclose(
+            mc.spot_returns.std(axis=0), history.spot_returns.std(axis=0, ddof=1), rtol=0.05
+        )
+        again = build_monte_carlo_scenarios(history, n_scenarios=20_000, seed=1)
+        np.testing.assert_array_equal(mc.spot_returns, again.spot_returns)
+
+
+class TestCalcScenarioVaR:
+    """Tests for calc_scenario_var."""
+
+    def test_stock_pnl_is_exact(self):
+        returns = np.linspace(-0.1, 0.1, 201)
+        result = calc_scenario_var(_portfolio([_stock("AAPL", 100, 50.0)]), _scenarios(list(returns)))
+
+        np.testing.assert_allclose(result.pnl, 5000.0 * np.expm1(returns))
+        assert result.var_99 == pytest.approx(-np.percentile(result.pnl, 1))
+        assert result.es_99 >= result.var_99 >= result.var_95 > 0
+        assert result.n_positions == 1 and result.n_scenarios == 201
+
+    @pytest.mark.parametrize("horizon_days", [1, 5])
+    def test_option_full_revaluation(self, horizon_days):
+        pos = _option("AAPL", -2, 95.0, "put")
+        result = calc_scenario_var(
+            _portfolio([pos]), _scenarios([-0.1, 0.0, 0.05], [0.2, 0.0, -0.1], horizon_days)
+        )
+
+        dte = (datetime.strptime(pos.expiry, "%Y-%m-%d") - datetime.now()).days
+
+        def price(spot: float, vol: float, days: float) -> float:
+            return calc_bs_price(BSParams(
+                spot_price=spot,
+                strike_price=95.0,
+                risk_free_rate=0.05,
+                volatility=vol,
+                time_to_expiry=days / 365,
+                is_call=False,
+            ))
+
+        base = price(100.0, 0.30, dte)
+        # Horizon is in trading days; the option ages by the equivalent calendar days
+        aged = dte - horizon_days * 365 / 252
+        expected = [
+            (price(100.0 * np.exp(r), 0.30 * np.exp(v), aged) - base) * -200
+            for r, v in [(-0.1, 0.2), (0.0, 0.0), (0.05, -0.1)]
+        ]
+        np.testing.assert_allclose(result.pnl, expected, rtol=1e-9)
+        # Short put: crash + vol spike is the loss, flat day earns theta
+        assert result.pnl[0] < 0 < result.pnl[1]
+
+    def test_delta_fallback_and_skipped(self):
+        fallback = _option("AAPL", 1, 100.0, "call", iv=None, delta=0.5)
+        no_data = _option("AAPL", 1, 100.0, "call", iv=None, delta=None)
+        other = _stock("TSLA", 10, 200.0)
+        result = calc_scenario_var(_portfolio([fallback, no_data, other]), _scenarios([-0.1, 0.1]))
+
+        np.testing.assert_allclose(result.pnl, 0.5 * 100 * 100 * np.expm1([-0.1, 0.1]))
+        assert result.skipped == [no_data.symbol, "TSLA"]
+        assert result.n_positions == 1
+
+    def test_no_mapped_positions(self):
+        assert calc_scenario_var(_portfolio([_stock("TSLA", 1, 200.0)]), _scenarios([0.0])) is None
+
+    def test_process_pool_matches_single_process(self, history):
+        portfolio = _portfolio([
+            _stock("MSFT", 50, 300.0),
+            _option("AAPL", -3, 90.0, "put"),
+            _option("AAPL", 1, 110.0, "call"),
+        ])
+        mc = build_monte_carlo_scenarios(history, n_scenarios=2_000, seed=5)
+
+        single = calc_scenario_var(portfolio, mc)
+        pooled = calc_scenario_var(portfolio, mc, max_workers=2)
+
+        np.testing.assert_allclose(pooled.pnl, single.pnl)
+        assert pooled.var_99 == single.var_99
+
+
+def test_calc_var_es():
+    pnl = np.arange(-50.0, 50.0)  # 100 equally likely outcomes
+    var, es = calc_var_es(pnl, 0.95)
+    assert var == pytest.approx(-np.percentile(pnl, 5))
+    assert es == pytest.approx(-pnl[pnl <= np.percentile(pnl, 5)].mean())
+    assert calc_var_es(np.ones(10), 0.99) == (0.0, 0.0)
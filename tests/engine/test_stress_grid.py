@@ -0,0 +1,153 @@
+"""Tests for the vectorized portfolio stress-test grid."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.data.models.account import AccountPosition, AssetType, ConsolidatedPortfolio
+from src.data.models.enums import Market
+from src.engine.account import calc_stress_test_grid
+from src.engine.account.metrics import calc_stress_test_loss
+from src.engine.bs.core import calc_bs_price
+from src.engine.models.bs_params import BSParams
+
+
+def _expiry(days: int) -> str:
+    return (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _stock(symbol: str, qty: float, price: float) -> AccountPosition:
+    return AccountPosition(
+        symbol=symbol,
+        asset_type=AssetType.STOCK,
+        market=Market.US,
+        quantity=qty,
+        avg_cost=price,
+        market_value=qty * price,
+        unrealized_pnl=0.0,
+        currency="USD",
+        underlying_price=price,
+    )
+
+
+def _option(
+    underlying: str,
+    qty: float,
+    strike: float,
+    option_type: str,
+    spot: float,
+    iv: float | None = 0.30,
+    market_value: float = -500.0,
+    delta: float | None = None,
+) -> AccountPosition:
+    return AccountPosition(
+        symbol=f"{underlying}_{option_type}_{strike}",
+        asset_type=AssetType.OPTION,
+        market=Market.US,
+        quantity=qty,
+        avg_cost=5.0,
+        market_value=market_value,
+        unrealized_pnl=0.0,
+        currency="USD",
+        underlying=underlying,
+        strike=strike,
+        expiry=_expiry(45),
+        option_type=option_type,
+        contract_multiplier=100,
+        delta=delta,
+        iv=iv,
+        underlying_price=spot,
+    )
+
+
+def _portfolio(positions: list[AccountPosition]) -> ConsolidatedPortfolio:
+    return ConsolidatedPortfolio(
+        positions=positions,
+        cash_balances=[],
+        total_value_usd=100_000.0,
+        total_unrealized_pnl_usd=0.0,
+        by_broker={},
+    )
+
+
+@pytest.fixture
+def portfolio() -> ConsolidatedPortfolio:
+    return _portfolio([
+        _stock("AAPL", 100, 180.0),
+        _option("AAPL", -2, 170.0, "put", 180.0),
+        _option("MSFT", -1, 420.0, "call", 400.0, market_value=-800.0),
+        _option("MSFT", 1, 380.0, "put", 400.0, iv=None, market_value=300.0, delta=-0.25),
+    ])
+
+
+class TestStressTestGrid:
+    """Tests for calc_stress_test_grid."""
+
+    def test_shape_and_per_underlying_sum(self, portfolio):
+        grid = calc_stress_test_grid(
+            portfolio,
+            spot_shocks=[-0.2, -0.1, 0.0, 0.1],
+            iv_shocks=[0.0, 0.5],
+            days_forward=[0, 7, 30],
+        )
+
+        assert grid.pnl.shape == (3, 4, 2)
+        assert set(grid.pnl_by_underlying) == {"AAPL", "MSFT"}
+        np.testing.assert_allclose(sum(grid.pnl_by_underlying.values()), grid.pnl)
+        assert grid.base_value == pytest.approx(18000.0 - 500.0 - 800.0 + 300.0)
+
+    def test_matches_scalar_revaluation(self):
+        pos = _option("AAPL", -2, 170.0, "put", 180.0)
+        grid = calc_stress_test_grid(
+            _portfolio([pos]), spot_shocks=[-0.15], iv_shocks=[0.40], days_forward=[10]
+        )
+
+        dte_days = (datetime.strptime(pos.expiry, "%Y-%m-%d") - datetime.now()).days
+        price = calc_bs_price(BSParams(
+            spot_price=180.0 * 0.85,
+            strike_price=170.0,
+            risk_free_rate=0.05,
+            volatility=0.30 * 1.40,
+            time_to_expiry=(dte_days - 10) / 365,
+            is_call=False,
+        ))
+        assert grid.pnl[0, 0, 0] == pytest.approx(price * 100 * -2 + 500.0)
+
+    def test_short_put_surface_is_monotonic(self):
+        grid = calc_stress_test_grid(
+            _portfolio([_option("AAPL", -1, 170.0, "put", 180.0)]),
+            spot_shocks=[-0.2, -0.1, 0.0],
+            iv_shocks=[0.0, 0.5, 1.0],
+            days_forward=[0, 20],
+        )
+
+        # Spot drop and IV rise both deepen a short put loss; OTM it earns theta over time
+        assert np.all(np.diff(grid.pnl, axis=1) > 0)
+        assert np.all(np.diff(grid.pnl, axis=2) < 0)
+        assert np.all(grid.pnl[1, 2] > grid.pnl[0, 2])
+        assert grid.worst_scenario == (0, -0.2, 1.0)
+        assert grid.worst_pnl == grid.pnl[0, 0, 2]
+
+    def test_delta_fallback_is_linear_in_spot(self):
+        pos = _option("MSFT", 1, 380.0, "put", 400.0, iv=None, market_value=300.0, delta=-0.25)
+        grid = calc_stress_test_grid(_portfolio([pos]), spot_shocks=[-0.1, 0.1], iv_shocks=[0.4])
+
+        # Long put gains |delta| × |shock| × notional when spot drops
+        assert grid.pnl[0, :, 0] == pytest.approx([0.25 * 0.1 * 38000, -0.25 * 0.1 * 38000])
+
+    def test_stress_loss_reads_grid(self, portfolio):
+        grid = calc_stress_test_grid(portfolio, spot_shocks=[-0.15], iv_shocks=[0.40])
+        stressed_nlv = 10_000.0 + grid.stressed_value[0, 0, 0]
+        current_nlv = 10_000.0 + grid.base_value
+
+        loss = calc_stress_test_loss(portfolio, current_nlv, 10_000.0)
+
+        assert loss == pytest.approx(max(0.0, (current_nlv - stressed_nlv) / current_nlv))
+        assert loss > 0
+
+    def test_empty_portfolio(self):
+        grid = calc_stress_test_grid(_portfolio([]), spot_shocks=[-0.1, 0.0], iv_shocks=[0.0])
+        assert grid.pnl.shape == (1, 2, 1)
+        assert not grid.pnl.any()
+        assert grid.pnl_by_underlying == {}
@@ -1,5 +1,8 @@
 """Tests for technical analysis calculations."""
 
+import math
+from datetime import date, timedelta
+
 import pytest
 
 from src.engine.models.enums import TrendSignal
@@ -35,7 +38,10 @@ from src.engine.position.technical import (
     is_squeeze,
     interpret_bb_position,
     is_favorable_for_selling,
+    # Indicator engine
+    IndicatorEngine,
 )
+from src.engine.position.volatility.historical import calc_hv
 
 
 class TestRSI:
@@ -410,3 +416,120 @@ class TestBollingerBands:
         assert is_favorable_for_selling(0.1) is False  # Too low
         assert is_favorable_for_selling(0.9) is False  # Too high
         assert is_favorable_for_selling(1.1) is False  # Above upper
+
+
+def _ohlc_series(n: int) -> tuple[list[date], list[float], list[float], list[float]]:
+    """Deterministic wavy price path with an upward drift."""
+    start = date(2023, 1, 2)
+    dates = [start + timedelta(days=i) for i in range(n)]
+    closes = [100 + i * 0.2 + 5 * math.sin(i / 3) + 2 * math.cos(i * 1.7) for i in range(n)]
+    highs = [c + 1 + abs(math.sin(i)) for i, c in enumerate(closes)]
+    lows = [c - 1 - abs(math.cos(i)) for i, c in enumerate(closes)]
+    return dates, highs, lows, closes
+
+
+def _assert_same(actual: float | None, expected: float | None) -> None:
+    if expected is None:
+        assert actual is None
+    else:
+        assert actual == pytest.approx(expected)
+
+
+class TestIndicatorEngine:
+    """Tests for IndicatorEngine (precomputed series + as-of lookup)."""
+
+    N = 80
+    KW = dict(sma_periods=(5, 20), ema_periods=(10,), bb_period=20, hv_window=20)
+
+    def test_matches_list_functions_as_of_each_date(self):
+        """Every as-of value equals the list-based function on the prefix."""
+        dates, highs, lows, closes = _ohlc_series(self.N)
+        engine = IndicatorEngine(dates, highs, lows, closes, **self.KW)
+
+        for i in range(self.N):
+            d = dates[i]
+            h, lo, c = highs[: i + 1], lows[: i + 1], closes[: i + 1]
+            _assert_same(engine.sma(20, d), calc_sma(c, 20))
+            _assert_same(engine.sma(5, d), calc_sma(c, 5))
+            _assert_same(engine.ema(10, d), calc_ema(c, 10))
+            _assert_same(engine.rsi(d), calc_rsi(c, 14))
+            _assert_same(engine.hv(d), calc_hv(c, 20))
+
+            expected_adx = calc_adx(h, lo, c, period=14)
+            result = engine.adx(d)
+            if expected_adx is None:
+                assert result is None
+            else:
+                assert result.adx == pytest.approx(expected_adx.adx)
+                assert result.plus_di == pytest.approx(expected_adx.plus_di)
+                assert result.minus_di == pytest.approx(expected_adx.minus_di)
+
+            expected_bb = calc_bollinger_bands(c, period=20, num_std=2.0)
+            bb = engine.bollinger(d)
+            if expected_bb is None:
+                assert bb is None
+            else:
+                assert bb.upper == pytest.approx(expected_bb.upper)
+                assert bb.lower == pytest.approx(expected_bb.lower)
+                assert bb.percent_b == pytest.approx(expected_bb.percent_b)
+
+    def test_atr_is_wilder_average_of_true_range(self):
+        dates, highs, lows, closes = _ohlc_series(30)
+        engine = IndicatorEngine(dates, highs, lows, closes, atr_period=14)
+
+        trs = [calc_true_range(highs[i], lows[i], closes[i - 1]) for i in range(1, 30)]
+        atr = sum(trs[:14]) / 14
+        for tr in trs[14:]:
+            atr = (atr * 13 + tr) / 14
+
+        assert engine.atr(dates[13]) is None
+        assert engine.atr(dates[-1]) == pytest.approx(atr)
+
+    def test_append_matches_bulk(self):
+        """O(1) append path produces the same columns as a bulk rebuild."""
+        dates, highs, lows, closes = _ohlc_series(self.N)
+        bulk = IndicatorEngine(dates, highs, lows, closes, **self.KW)
+        live = IndicatorEngine(dates[:3], highs[:3], lows[:3], closes[:3], **self.KW)
+        for i in range(3, self.N):
+            live.append(dates[i], highs[i], lows[i], closes[i])
+
+        assert len(live) == self.N
+        assert live.last_date == dates[-1]
+        for d in dates[::7] + [dates[-1]]:
+            for name in ("rsi", "atr", "hv"):
+                _assert_same(getattr(live, name)(d), getattr(bulk, name)(d))
+            _assert_same(live.sma(20, d), bulk.sma(20, d))
+            _assert_same(live.ema(10, d), bulk.ema(10, d))
+            live_adx, bulk_adx = live.adx(d), bulk.adx(d)
+            _assert_same(live_adx and live_adx.adx, bulk_adx and bulk_adx.adx)
+            _assert_same(live_adx and live_adx.plus_di, bulk_adx and bulk_adx.plus_di)
+
+    def test_as_of_lookup_between_bars(self):
+        dates, highs, lows, closes = _ohlc_series(30)
+        weekdays = [i for i, d in enumerate(dates) if d.weekday() < 5]
+        engine = IndicatorEngine(
+            [dates[i] for i in weekdays],
+            [highs[i] for i in weekdays],
+            [lows[i] for i in weekdays],
+            [closes[i] for i in weekdays],
+            sma_periods=(5,),
+        )
+        saturday = next(d for d in dates if d.weekday() == 5)
+        friday = saturday - timedelta(days=1)
+
+        assert engine.sma(5, saturday) == engine.sma(5, friday)
+        assert engine.close(saturday) == closes[dates.index(friday)]
+        assert engine.close(date(2022, 12, 1)) is None
+        assert engine.bars_as_of(date(2022, 12, 1)) == 0
+
+    def test_append_rejects_stale_bar(self):
+        dates, highs, lows, closes = _ohlc_series(5)
+        engine = IndicatorEngine(dates, highs, lows, closes)
+        with pytest.raises(ValueError):
+            engine.append(dates[-1], 1.0, 1.0, 1.0)
+
+    def test_unconfigured_period_raises(self):
+        dates, highs, lows, closes = _ohlc_series(5)
+        engine = IndicatorEngine(dates, highs, lows, closes, sma_periods=(5,))
+        with pytest.raises(ValueError):
+            engine.sma(50, dates[-1])
@@ -1,9 +1,16 @@
 """Tests for volatility calculations."""
 
+import math
+
+import numpy as np
 import pytest
 
 from src.engine.position.volatility import (
+    calc_garman_klass_hv_series,
     calc_hv,
+    calc_hv_series,
+    calc_parkinson_hv_series,
+    calc_yang_zhang_hv_series,
     calc_iv_hv_ratio,
     calc_iv_percentile,
     calc_iv_rank,
@@ -48,6 +55,68 @@ class TestHistoricalVolatility:
         assert hv_annual > hv_daily  # Annualized should be higher
 
 
+def _ohlc(n: int = 60) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    i = np.arange(n)
+    closes = 100 + 0.3 * i + 4 * np.sin(i / 2.5)
+    opens = closes - np.cos(i)
+    highs = np.maximum(opens, closes) + 1 + np.abs(np.sin(i))
+    lows = np.minimum(opens, closes) - 1 - np.abs(np.cos(i * 1.3))
+    return opens, highs, lows, closes
+
+
+class TestHVSeries:
+    """Tests for rolling (vectorized) HV estimators."""
+
+    def test_close_to_close_matches_calc_hv(self):
+        _, _, _, closes = _ohlc()
+        series = calc_hv_series(closes, window=20)
+
+        assert len(series) == len(closes)
+        assert np.isnan(series[:20]).all()
+        for i in range(20, len(closes)):
+            assert series[i] == pytest.approx(calc_hv(list(closes[: i + 1]), window=20))
+
+    def test_non_positive_price_invalidates_window(self):
+        closes = np.array([100.0 + i for i in range(30)])
+        closes[10] = 0.0
+        series = calc_hv_series(closes, window=5)
+
+        assert np.isnan(series[10:16]).all()
+        assert not np.isnan(series[16])
+
+    def test_parkinson_constant_range(self):
+        highs = np.full(30, 101.0)
+        lows = np.full(30, 99.0)
+        series = calc_parkinson_hv_series(highs, lows, window=10)
+
+        expected = math.log(101 / 99) / math.sqrt(4 * math.log(2)) * math.sqrt(252)
+        assert np.isnan(series[:9]).all()
+        assert series[9:] == pytest.approx(np.full(21, expected))
+
+    def test_garman_klass_reduces_to_range_term_without_drift(self):
+        opens, highs, lows, _ = _ohlc()
+        series = calc_garman_klass_hv_series(opens, highs, lows, opens, window=10)
+
+        hl2 = np.log(highs / lows) ** 2
+        expected = math.sqrt(0.5 * hl2[-10:].mean()) * math.sqrt(252)
+        assert series[-1] == pytest.approx(expected)
+
+    def test_yang_zhang_matches_direct_formula(self):
+        opens, highs, lows, closes = _ohlc()
+        n = 20
+        series = calc_yang_zhang_hv_series(opens, highs, lows, closes, window=n)
+
+        o, h, lo, c = opens[-n:], highs[-n:], lows[-n:], closes[-n:]
+        overnight = np.log(o / closes[-n - 1 : -1])
+        open_close = np.log(c / o)
+        rs = np.log(h / c) * np.log(h / o) + np.log(lo / c) * np.log(lo / o)
+        k = 0.34 / (1.34 + (n + 1) / (n - 1))
+        var = overnight.var(ddof=1) + k * open_close.var(ddof=1) + (1 - k) * rs.mean()
+
+        assert np.isnan(series[:n]).all()
+        assert series[-1] == pytest.approx(math.sqrt(var * 252))
+
+
 class TestImpliedVolatility:
     """Tests for implied volatility functions."""
 